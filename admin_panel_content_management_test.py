@@ -12,46 +12,32 @@ FOCUS: Testing the backend data infrastructure that supports the admin panel mod
 including categories data, context integration, and CRUD operation support.
 """
 
-import requests
+from harness.client import http
+from harness import config
 import json
 import os
 from datetime import datetime
 import sys
 import time
 
-# Get Google Sheets API URLs from frontend .env file
-def get_api_urls():
-    try:
-        urls = {}
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_PUBLICATIONS_API_URL='):
-                    urls['publications'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PROJECTS_API_URL='):
-                    urls['projects'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_ACHIEVEMENTS_API_URL='):
-                    urls['achievements'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    urls['news_events'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_BACKEND_URL='):
-                    urls['frontend_url'] = line.split('=', 1)[1].strip()
-        return urls
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return {}
+# Google Sheets API URLs, resolved by configure() from the environment or the frontend .env file
+PROJECTS_API_URL = ACHIEVEMENTS_API_URL = NEWS_EVENTS_API_URL = FRONTEND_URL = None
 
-API_URLS = get_api_urls()
-PROJECTS_API_URL = API_URLS.get('projects')
-ACHIEVEMENTS_API_URL = API_URLS.get('achievements')
-NEWS_EVENTS_API_URL = API_URLS.get('news_events')
-FRONTEND_URL = API_URLS.get('frontend_url', 'localhost:3000')
+def configure():
+    """Resolve the API URLs and print the run banner"""
+    global PROJECTS_API_URL, ACHIEVEMENTS_API_URL, NEWS_EVENTS_API_URL, FRONTEND_URL
+    API_URLS = config.api_urls()
+    PROJECTS_API_URL = API_URLS.get('projects')
+    ACHIEVEMENTS_API_URL = API_URLS.get('achievements')
+    NEWS_EVENTS_API_URL = API_URLS.get('news_events')
+    FRONTEND_URL = config.backend_url('localhost:3000')
 
-print(f"🚀 Testing Admin Panel Content Management System - Backend Infrastructure")
-print(f"Projects API: {PROJECTS_API_URL}")
-print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
-print(f"News Events API: {NEWS_EVENTS_API_URL}")
-print(f"Frontend URL: {FRONTEND_URL}")
-print("=" * 80)
+    print(f"🚀 Testing Admin Panel Content Management System - Backend Infrastructure")
+    print(f"Projects API: {PROJECTS_API_URL}")
+    print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
+    print(f"News Events API: {NEWS_EVENTS_API_URL}")
+    print(f"Frontend URL: {FRONTEND_URL}")
+    print("=" * 80)
 
 def test_projects_modal_backend_support():
     """Test backend data structure supporting Projects modal submit/cancel functionality"""
@@ -68,7 +54,7 @@ def test_projects_modal_backend_support():
             return False
         
         start_time = time.time()
-        response = requests.get(PROJECTS_API_URL, timeout=10)
+        response = http.get(PROJECTS_API_URL, timeout=10)
         end_time = time.time()
         response_time = end_time - start_time
         
@@ -167,7 +153,7 @@ def test_categories_data_infrastructure():
             all_tests_passed = False
         else:
             start_time = time.time()
-            response = requests.get(ACHIEVEMENTS_API_URL, timeout=10)
+            response = http.get(ACHIEVEMENTS_API_URL, timeout=10)
             end_time = time.time()
             response_time = end_time - start_time
             
@@ -227,7 +213,7 @@ def test_categories_data_infrastructure():
             all_tests_passed = False
         else:
             start_time = time.time()
-            response = requests.get(NEWS_EVENTS_API_URL, timeout=10)
+            response = http.get(NEWS_EVENTS_API_URL, timeout=10)
             end_time = time.time()
             response_time = end_time - start_time
             
@@ -393,7 +379,7 @@ def test_context_data_validation():
         for api_name, api_url in apis_to_test.items():
             if api_url:
                 try:
-                    response = requests.get(api_url, timeout=8)
+                    response = http.get(api_url, timeout=8)
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -621,5 +607,6 @@ def run_admin_panel_content_management_tests():
 
 # Main execution
 if __name__ == "__main__":
+    configure()
     success = run_admin_panel_content_management_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
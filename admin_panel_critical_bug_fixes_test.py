@@ -11,7 +11,7 @@ This test verifies:
 5. Error Handling Improvements
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -49,7 +49,7 @@ class AdminPanelBugFixTester:
         try:
             # Test admin login page accessibility
             login_url = f"{self.frontend_url}/admin/login"
-            response = requests.get(login_url, timeout=10)
+            response = http.get(login_url, timeout=10)
             
             if response.status_code == 200:
                 self.test_results["authentication_system"]["details"].append("✅ Admin login page accessible")
@@ -60,7 +60,7 @@ class AdminPanelBugFixTester:
                 
             # Test admin panel page accessibility
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = http.get(admin_url, timeout=10)
             
             if response.status_code == 200:
                 self.test_results["authentication_system"]["details"].append("✅ Admin panel page accessible")
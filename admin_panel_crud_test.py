@@ -15,7 +15,8 @@ Tests:
 FOCUS: Testing the reported "Failed to delete news event. Please try again" error
 """
 
-import requests
+from harness.client import http
+from harness import config
 import json
 import os
 import sys
@@ -23,44 +24,29 @@ import time
 import subprocess
 from datetime import datetime
 
-# Get configuration from frontend .env
-def get_config():
-    config = {}
-    try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    config['frontend_url'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    config['news_events_api'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PUBLICATIONS_API_URL='):
-                    config['publications_api'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PROJECTS_API_URL='):
-                    config['projects_api'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_ACHIEVEMENTS_API_URL='):
-                    config['achievements_api'] = line.split('=', 1)[1].strip()
-        return config
-    except Exception as e:
-        print(f"Error reading configuration: {e}")
-        return {}
-
-CONFIG = get_config()
-FRONTEND_URL = CONFIG.get('frontend_url', 'localhost:3000')
-NEWS_EVENTS_API = CONFIG.get('news_events_api', '')
-PUBLICATIONS_API = CONFIG.get('publications_api', '')
-PROJECTS_API = CONFIG.get('projects_api', '')
-ACHIEVEMENTS_API = CONFIG.get('achievements_api', '')
-
 # Admin credentials from AuthContext.jsx
 ADMIN_CREDENTIALS = {
     'username': 'admin',
     'password': '@dminsesg405'
 }
 
-print(f"🚀 Testing Admin Panel Content Management System - CRUD Operations")
-print(f"Frontend URL: {FRONTEND_URL}")
-print(f"Admin Credentials: {ADMIN_CREDENTIALS['username']}/{'*' * len(ADMIN_CREDENTIALS['password'])}")
-print("=" * 80)
+# URLs, resolved by configure() from the environment or the frontend .env file
+FRONTEND_URL = NEWS_EVENTS_API = PUBLICATIONS_API = PROJECTS_API = ACHIEVEMENTS_API = None
+
+def configure():
+    """Resolve the frontend and API URLs and print the run banner"""
+    global FRONTEND_URL, NEWS_EVENTS_API, PUBLICATIONS_API, PROJECTS_API, ACHIEVEMENTS_API
+    API_URLS = config.api_urls()
+    FRONTEND_URL = config.backend_url('localhost:3000')
+    NEWS_EVENTS_API = API_URLS.get('news_events', '')
+    PUBLICATIONS_API = API_URLS.get('publications', '')
+    PROJECTS_API = API_URLS.get('projects', '')
+    ACHIEVEMENTS_API = API_URLS.get('achievements', '')
+
+    print(f"🚀 Testing Admin Panel Content Management System - CRUD Operations")
+    print(f"Frontend URL: {FRONTEND_URL}")
+    print(f"Admin Credentials: {ADMIN_CREDENTIALS['username']}/{'*' * len(ADMIN_CREDENTIALS['password'])}")
+    print("=" * 80)
 
 def test_news_events_delete_functionality():
     """Test News Events delete functionality - PRIMARY FOCUS"""
@@ -78,7 +64,7 @@ def test_news_events_delete_functionality():
         
         try:
             start_time = time.time()
-            response = requests.get(NEWS_EVENTS_API, timeout=10)
+            response = http.get(NEWS_EVENTS_API, timeout=10)
             end_time = time.time()
             response_time = end_time - start_time
             
@@ -344,7 +330,7 @@ def test_crud_operations_all_content_types():
             # Test API data source (if applicable)
             if config['api']:
                 try:
-                    response = requests.get(config['api'], timeout=6)
+                    response = http.get(config['api'], timeout=6)
                     if response.status_code == 200:
                         data = response.json()
                         items = data if isinstance(data, list) else data.get(content_type.lower(), [])
@@ -702,5 +688,6 @@ def run_all_tests():
 
 # Main execution
 if __name__ == "__main__":
+    configure()
     success = run_all_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -25,6 +25,7 @@ Test Focus:
 """
 
 import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -64,7 +65,7 @@ class AdminPanelDeletePropFixTester:
     def test_frontend_service_accessibility(self):
         """Test 1: Verify frontend service is accessible for admin panel testing"""
         try:
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service Accessibility", "PASS", 
                             f"Frontend accessible at {self.frontend_url} (Status: {response.status_code})")
@@ -86,7 +87,7 @@ class AdminPanelDeletePropFixTester:
             for content_type, api_url in self.google_sheets_apis.items():
                 try:
                     start_time = time.time()
-                    response = requests.get(api_url, timeout=10)
+                    response = http.get(api_url, timeout=10)
                     response_time = time.time() - start_time
                     
                     if response.status_code == 200:
@@ -153,7 +154,7 @@ class AdminPanelDeletePropFixTester:
             
             for route, description in admin_routes.items():
                 try:
-                    response = requests.get(f"{self.frontend_url}{route}", timeout=5)
+                    response = http.get(f"{self.frontend_url}{route}", timeout=5)
                     if response.status_code in [200, 302]:
                         auth_tests.append(f"{description} accessible ({response.status_code})")
                     else:
@@ -282,7 +283,7 @@ class AdminPanelDeletePropFixTester:
             
             # Test Publications data availability for delete testing
             try:
-                response = requests.get(self.google_sheets_apis["publications"], timeout=10)
+                response = http.get(self.google_sheets_apis["publications"], timeout=10)
                 if response.status_code == 200:
                     publications_data = response.json()
                     if isinstance(publications_data, list) and len(publications_data) > 0:
@@ -355,7 +356,7 @@ class AdminPanelDeletePropFixTester:
             
             # Test Projects data availability for delete testing
             try:
-                response = requests.get(self.google_sheets_apis["projects"], timeout=10)
+                response = http.get(self.google_sheets_apis["projects"], timeout=10)
                 if response.status_code == 200:
                     projects_data = response.json()
                     if isinstance(projects_data, list) and len(projects_data) > 0:
@@ -428,7 +429,7 @@ class AdminPanelDeletePropFixTester:
             
             # Test Achievements data availability for delete testing
             try:
-                response = requests.get(self.google_sheets_apis["achievements"], timeout=10)
+                response = http.get(self.google_sheets_apis["achievements"], timeout=10)
                 if response.status_code == 200:
                     achievements_data = response.json()
                     if isinstance(achievements_data, list) and len(achievements_data) > 0:
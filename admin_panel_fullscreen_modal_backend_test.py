@@ -15,7 +15,9 @@ FOCUS: Testing the backend infrastructure that supports the FullScreenModal impr
 including authentication, data persistence, API accessibility, and responsive data delivery.
 """
 
-import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
@@ -24,47 +26,27 @@ import time
 import subprocess
 import socket
 
-# Get Google Sheets API URLs from frontend .env file
-def get_api_urls():
-    try:
-        urls = {}
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_PUBLICATIONS_API_URL='):
-                    urls['publications'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PROJECTS_API_URL='):
-                    urls['projects'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_ACHIEVEMENTS_API_URL='):
-                    urls['achievements'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    urls['news_events'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_BACKEND_URL='):
-                    urls['frontend_url'] = line.split('=', 1)[1].strip()
-        return urls
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return {}
+# Google Sheets API URLs, resolved by configure() from the environment or the frontend .env file
+PUBLICATIONS_API_URL = PROJECTS_API_URL = ACHIEVEMENTS_API_URL = NEWS_EVENTS_API_URL = FRONTEND_URL = None
 
-API_URLS = get_api_urls()
-required_apis = ['publications', 'projects', 'achievements', 'news_events']
-for api in required_apis:
-    if not API_URLS.get(api):
-        print(f"ERROR: Could not get REACT_APP_{api.upper()}_API_URL from frontend/.env")
-        sys.exit(1)
+def configure():
+    """Resolve the API URLs and print the run banner"""
+    global PUBLICATIONS_API_URL, PROJECTS_API_URL, ACHIEVEMENTS_API_URL, NEWS_EVENTS_API_URL, FRONTEND_URL
+    API_URLS = config.api_urls(required=['publications', 'projects', 'achievements', 'news_events'])
 
-PUBLICATIONS_API_URL = API_URLS['publications']
-PROJECTS_API_URL = API_URLS['projects']
-ACHIEVEMENTS_API_URL = API_URLS['achievements']
-NEWS_EVENTS_API_URL = API_URLS['news_events']
-FRONTEND_URL = API_URLS.get('frontend_url', 'localhost:3000')
+    PUBLICATIONS_API_URL = API_URLS['publications']
+    PROJECTS_API_URL = API_URLS['projects']
+    ACHIEVEMENTS_API_URL = API_URLS['achievements']
+    NEWS_EVENTS_API_URL = API_URLS['news_events']
+    FRONTEND_URL = config.backend_url('localhost:3000')
 
-print(f"🚀 Testing Admin Panel Content Management FullScreenModal - Backend Infrastructure")
-print(f"Publications API: {PUBLICATIONS_API_URL}")
-print(f"Projects API: {PROJECTS_API_URL}")
-print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
-print(f"News Events API: {NEWS_EVENTS_API_URL}")
-print(f"Frontend URL: {FRONTEND_URL}")
-print("=" * 80)
+    print(f"🚀 Testing Admin Panel Content Management FullScreenModal - Backend Infrastructure")
+    print(f"Publications API: {PUBLICATIONS_API_URL}")
+    print(f"Projects API: {PROJECTS_API_URL}")
+    print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
+    print(f"News Events API: {NEWS_EVENTS_API_URL}")
+    print(f"Frontend URL: {FRONTEND_URL}")
+    print("=" * 80)
 
 def test_authentication_system():
     """Test admin authentication system supporting FullScreenModal operations"""
@@ -155,7 +137,7 @@ def test_data_sources_for_modals():
         for source_name, api_url in modal_data_sources.items():
             try:
                 start_time = time.time()
-                response = requests.get(api_url, timeout=6)
+                response = http.get(api_url, timeout=6)
                 end_time = time.time()
                 response_time = end_time - start_time
                 
@@ -493,7 +475,7 @@ def test_mobile_responsive_data_delivery():
             api_urls = [PUBLICATIONS_API_URL, PROJECTS_API_URL, ACHIEVEMENTS_API_URL, NEWS_EVENTS_API_URL]
             
             with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [executor.submit(requests.get, url, timeout=6) for url in api_urls]
+                futures = [executor.submit(http.get, url, timeout=6) for url in api_urls]
                 
                 results = []
                 for future in futures:
@@ -630,5 +612,10 @@ def run_all_tests():
 
 # Main execution
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     success = run_all_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -25,7 +25,7 @@ Test Categories:
 Admin Credentials: admin/@dminsesg405
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -52,7 +52,7 @@ class AdminPanelInputFieldsTester:
         }
         
         # Session for maintaining cookies
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -88,7 +88,7 @@ class AdminPanelInputFieldsTester:
         
         # Test frontend service accessibility
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service", "Frontend Service Accessibility", True, 
                             f"Frontend accessible at {self.backend_url} (Status: {response.status_code})")
@@ -102,7 +102,7 @@ class AdminPanelInputFieldsTester:
         # Test admin login page accessibility
         try:
             login_url = f"{self.backend_url}/admin/login"
-            response = requests.get(login_url, timeout=10)
+            response = self.session.get(login_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service", "Admin Login Page Access", True, 
                             f"Admin login page accessible at {login_url}")
@@ -116,7 +116,7 @@ class AdminPanelInputFieldsTester:
         # Test admin panel accessibility
         try:
             admin_url = f"{self.backend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = self.session.get(admin_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service", "Admin Panel Access", True, 
                             f"Admin panel accessible at {admin_url}")
@@ -130,7 +130,7 @@ class AdminPanelInputFieldsTester:
         # Test content management page accessibility
         try:
             content_url = f"{self.backend_url}/admin/content"
-            response = requests.get(content_url, timeout=10)
+            response = self.session.get(content_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service", "Content Management Page Access", True, 
                             f"Content management page accessible")
@@ -147,7 +147,7 @@ class AdminPanelInputFieldsTester:
         
         # Test Firebase configuration detection
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Check for Firebase configuration in bundle
@@ -211,7 +211,7 @@ class AdminPanelInputFieldsTester:
 
         # Test AuthContext infrastructure
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Check for authentication infrastructure in bundle
@@ -343,7 +343,7 @@ class AdminPanelInputFieldsTester:
         
         # Test input-fix.css implementation
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Check for input fix CSS indicators
@@ -418,7 +418,7 @@ class AdminPanelInputFieldsTester:
         
         # Test FullScreenModal infrastructure
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Check for modal infrastructure
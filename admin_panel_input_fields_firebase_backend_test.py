@@ -18,7 +18,7 @@ Admin Credentials: admin/@dminsesg405
 Firebase Project: sesg-research-website
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -55,7 +55,7 @@ class AdminPanelInputFieldsFirebaseBackendTester:
         }
         
         # Session for HTTP requests
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -33,7 +33,7 @@ TESTING REQUIREMENTS:
 Admin Credentials: admin/@dminsesg405
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -60,7 +60,7 @@ class AdminPanelInputFieldsTester:
         }
         
         # Session for maintaining cookies
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -96,7 +96,7 @@ class AdminPanelInputFieldsTester:
         
         # Test frontend service accessibility
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Panel Access", "Frontend Service Accessibility", True, 
                             f"Frontend accessible at {self.backend_url} (Status: {response.status_code})")
@@ -110,7 +110,7 @@ class AdminPanelInputFieldsTester:
         # Test admin login page accessibility
         try:
             login_url = f"{self.backend_url}/admin/login"
-            response = requests.get(login_url, timeout=10)
+            response = self.session.get(login_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Panel Access", "Admin Login Page Access", True, 
                             f"Admin login page accessible at {login_url}")
@@ -124,7 +124,7 @@ class AdminPanelInputFieldsTester:
         # Test admin panel main page accessibility
         try:
             admin_url = f"{self.backend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = self.session.get(admin_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Panel Access", "Admin Panel Main Page Access", True, 
                             f"Admin panel main page accessible")
@@ -138,7 +138,7 @@ class AdminPanelInputFieldsTester:
         # Test content management page accessibility
         try:
             content_url = f"{self.backend_url}/admin/content"
-            response = requests.get(content_url, timeout=10)
+            response = self.session.get(content_url, timeout=10)
             self.log_test("Admin Panel Access", "Content Management Page Access", True, 
                         f"Content management page accessible via SPA routing")
         except Exception as e:
@@ -163,7 +163,7 @@ class AdminPanelInputFieldsTester:
         
         # Test input-fix.css implementation
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Check for input fix CSS indicators in bundle
@@ -238,7 +238,7 @@ class AdminPanelInputFieldsTester:
         
         # Test Firebase configuration detection
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Check for Firebase configuration in bundle
@@ -311,7 +311,7 @@ class AdminPanelInputFieldsTester:
 
         # Test modal infrastructure
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Check for modal infrastructure
@@ -13,7 +13,7 @@ This test simulates manual testing of admin panel input fields to verify:
 Admin Credentials: admin/@dminsesg405
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -34,7 +34,7 @@ class AdminPanelInputFunctionalityTester:
             "categories": {}
         }
         
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -70,7 +70,7 @@ class AdminPanelInputFunctionalityTester:
         
         # Test admin login page
         try:
-            login_response = requests.get(f"{self.backend_url}/admin/login", timeout=10)
+            login_response = self.session.get(f"{self.backend_url}/admin/login", timeout=10)
             if login_response.status_code == 200:
                 self.log_test("Admin Access", "Admin Login Page Load", True, 
                             f"Admin login page loads successfully (Status: {login_response.status_code})")
@@ -83,7 +83,7 @@ class AdminPanelInputFunctionalityTester:
 
         # Test admin panel main page
         try:
-            admin_response = requests.get(f"{self.backend_url}/admin", timeout=10)
+            admin_response = self.session.get(f"{self.backend_url}/admin", timeout=10)
             if admin_response.status_code == 200:
                 self.log_test("Admin Access", "Admin Panel Main Page Load", True, 
                             f"Admin panel main page loads successfully")
@@ -101,7 +101,7 @@ class AdminPanelInputFunctionalityTester:
         
         for section in content_sections:
             try:
-                section_response = requests.get(f"{self.backend_url}/admin", timeout=10)
+                section_response = self.session.get(f"{self.backend_url}/admin", timeout=10)
                 if section_response.status_code == 200:
                     self.log_test("Admin Access", f"Content Management {section.title()} Section", True, 
                                 f"{section.title()} section accessible via SPA routing")
@@ -118,7 +118,7 @@ class AdminPanelInputFunctionalityTester:
         
         try:
             # Get the JavaScript bundle
-            bundle_response = requests.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
+            bundle_response = self.session.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
             if bundle_response.status_code == 200:
                 bundle_content = bundle_response.text
                 
@@ -188,7 +188,7 @@ class AdminPanelInputFunctionalityTester:
         print("\n🔥 CATEGORY 3: FIREBASE INTEGRATION")
         
         try:
-            bundle_response = requests.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
+            bundle_response = self.session.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
             if bundle_response.status_code == 200:
                 bundle_content = bundle_response.text
                 
@@ -255,7 +255,7 @@ class AdminPanelInputFunctionalityTester:
         print("\n📝 CATEGORY 4: ADMIN COMPONENTS AVAILABILITY")
         
         try:
-            bundle_response = requests.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
+            bundle_response = self.session.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
             if bundle_response.status_code == 200:
                 bundle_content = bundle_response.text
                 
@@ -311,7 +311,7 @@ class AdminPanelInputFunctionalityTester:
         print("\n🔧 CATEGORY 5: DEBUG UTILITIES")
         
         try:
-            bundle_response = requests.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
+            bundle_response = self.session.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
             if bundle_response.status_code == 200:
                 bundle_content = bundle_response.text
                 
@@ -360,7 +360,7 @@ class AdminPanelInputFunctionalityTester:
         print("\n📋 CATEGORY 6: INPUT FIELD CSS RULES")
         
         try:
-            bundle_response = requests.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
+            bundle_response = self.session.get(f"{self.backend_url}/static/js/bundle.js", timeout=15)
             if bundle_response.status_code == 200:
                 bundle_content = bundle_response.text
                 
@@ -14,7 +14,7 @@ Admin Credentials: admin/@dminsesg405
 Frontend URL: https://admin-panel-repair-2.preview.emergentagent.com
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -41,7 +41,7 @@ class AdminUserManagementTester:
         }
         
         # Session for maintaining cookies
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -76,7 +76,7 @@ class AdminUserManagementTester:
         print("\n🔍 CATEGORY 1: FRONTEND SERVICE ACCESSIBILITY")
         
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service", "Frontend URL Accessibility", True, 
                             f"Frontend accessible at {self.backend_url} (Status: {response.status_code})")
@@ -90,7 +90,7 @@ class AdminUserManagementTester:
         # Test admin login page
         try:
             login_url = f"{self.backend_url}/admin/login"
-            response = requests.get(login_url, timeout=10)
+            response = self.session.get(login_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service", "Admin Login Page Access", True, 
                             f"Admin login page accessible at {login_url}")
@@ -104,7 +104,7 @@ class AdminUserManagementTester:
         # Test admin panel access
         try:
             admin_url = f"{self.backend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = self.session.get(admin_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service", "Admin Panel Access", True, 
                             f"Admin panel accessible at {admin_url}")
@@ -4,40 +4,37 @@ Backend API Testing Suite - IEEE Format and Caching Optimization
 Tests the updated Publications API with IEEE format and caching functionality
 """
 
-import requests
+from harness.bench import (
+    DEFAULT_HIT_RATIO_MARGIN, DEFAULT_LATENCY_MARGIN, BaselineStore,
+    benchmark_publications_cache, format_result, run_gate
+)
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 import time
 from datetime import datetime
 import sys
 
-# Get backend URL from frontend .env file
-def get_backend_url():
-    try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    return line.split('=', 1)[1].strip()
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return None
-
-BACKEND_URL = get_backend_url()
-if not BACKEND_URL:
-    print("ERROR: Could not get REACT_APP_BACKEND_URL from frontend/.env")
-    sys.exit(1)
+# Backend URL, resolved by configure() from the environment or the frontend .env file
+BACKEND_URL = API_BASE_URL = None
 
-API_BASE_URL = f"{BACKEND_URL}/api"
+def configure():
+    """Resolve the backend URL and print the run banner"""
+    global BACKEND_URL, API_BASE_URL
+    BACKEND_URL = config.require('REACT_APP_BACKEND_URL')
+    API_BASE_URL = f"{BACKEND_URL}/api"
 
-print(f"Testing Publications API with IEEE Format and Caching at: {API_BASE_URL}")
-print("=" * 80)
+    print(f"Testing Publications API with IEEE Format and Caching at: {API_BASE_URL}")
+    print("=" * 80)
 
 def test_ieee_format_data_structure():
     """Test GET /api/publications endpoint with new IEEE format data structure"""
     print("1. Testing IEEE Format Data Structure...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/publications", timeout=15)
+        response = http.get(f"{API_BASE_URL}/publications", timeout=15)
         if response.status_code != 200:
             print(f"   ❌ Publications API request failed with status: {response.status_code}")
             return False
@@ -95,7 +92,7 @@ def test_caching_functionality():
     try:
         # Clear cache first
         print("   2.1 Clearing cache...")
-        cache_clear_response = requests.post(f"{API_BASE_URL}/clear-cache", timeout=10)
+        cache_clear_response = http.post(f"{API_BASE_URL}/clear-cache", timeout=10)
         if cache_clear_response.status_code == 200:
             clear_data = cache_clear_response.json()
             print(f"   ✅ Cache cleared successfully: {clear_data.get('message', 'Cache cleared')}")
@@ -106,7 +103,7 @@ def test_caching_functionality():
         # First request (should fetch from Google Sheets)
         print("   2.2 First request (from Google Sheets)...")
         start_time = time.time()
-        first_response = requests.get(f"{API_BASE_URL}/publications", timeout=20)
+        first_response = http.get(f"{API_BASE_URL}/publications", timeout=20)
         first_request_time = time.time() - start_time
         
         if first_response.status_code == 200:
@@ -123,7 +120,7 @@ def test_caching_functionality():
         # Second request (should use cache)
         print("   2.3 Second request (from cache)...")
         start_time = time.time()
-        second_response = requests.get(f"{API_BASE_URL}/publications", timeout=15)
+        second_response = http.get(f"{API_BASE_URL}/publications", timeout=15)
         second_request_time = time.time() - start_time
         
         if second_response.status_code == 200:
@@ -158,7 +155,7 @@ def test_cache_status_endpoint():
     print("3. Testing Cache Status Endpoint...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/cache-status", timeout=10)
+        response = http.get(f"{API_BASE_URL}/cache-status", timeout=10)
         if response.status_code != 200:
             print(f"   ❌ Cache status request failed with status: {response.status_code}")
             return False
@@ -188,16 +185,16 @@ def test_clear_cache_endpoint():
     
     try:
         # First make sure there's something in cache
-        requests.get(f"{API_BASE_URL}/publications", timeout=15)
+        http.get(f"{API_BASE_URL}/publications", timeout=15)
         
         # Check cache status before clearing
-        status_before = requests.get(f"{API_BASE_URL}/cache-status", timeout=10)
+        status_before = http.get(f"{API_BASE_URL}/cache-status", timeout=10)
         if status_before.status_code == 200:
             cached_before = status_before.json().get('cached_items', 0)
             print(f"   📊 Items in cache before clearing: {cached_before}")
         
         # Clear cache
-        response = requests.post(f"{API_BASE_URL}/clear-cache", timeout=10)
+        response = http.post(f"{API_BASE_URL}/clear-cache", timeout=10)
         if response.status_code != 200:
             print(f"   ❌ Clear cache request failed with status: {response.status_code}")
             return False
@@ -210,7 +207,7 @@ def test_clear_cache_endpoint():
         print(f"   ✅ Clear cache endpoint working: {data['message']}")
         
         # Verify cache is actually cleared
-        status_after = requests.get(f"{API_BASE_URL}/cache-status", timeout=10)
+        status_after = http.get(f"{API_BASE_URL}/cache-status", timeout=10)
         if status_after.status_code == 200:
             cached_after = status_after.json().get('cached_items', 0)
             print(f"   📊 Items in cache after clearing: {cached_after}")
@@ -231,7 +228,7 @@ def test_ieee_formatted_publications_display():
     print("5. Testing IEEE Formatted Publications Display...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/publications", timeout=15)
+        response = http.get(f"{API_BASE_URL}/publications", timeout=15)
         if response.status_code != 200:
             print(f"   ❌ Publications request failed")
             return False
@@ -302,7 +299,7 @@ def test_category_filtering_with_books():
         categories = ["Journal Articles", "Conference Proceedings", "Book Chapters", "Books"]
         
         for category in categories:
-            response = requests.get(f"{API_BASE_URL}/publications?category_filter={category}", timeout=10)
+            response = http.get(f"{API_BASE_URL}/publications?category_filter={category}", timeout=10)
             if response.status_code != 200:
                 print(f"   ❌ Category filter '{category}' failed with status: {response.status_code}")
                 return False
@@ -322,7 +319,7 @@ def test_category_filtering_with_books():
                 print(f"   ✅ Category '{category}': 0 publications (may be expected)")
         
         # Test combined category filtering
-        response = requests.get(f"{API_BASE_URL}/publications", timeout=10)
+        response = http.get(f"{API_BASE_URL}/publications", timeout=10)
         if response.status_code == 200:
             data = response.json()
             all_publications = data.get("publications", [])
@@ -336,44 +333,33 @@ def test_category_filtering_with_books():
         return False
 
 def test_performance_improvements():
-    """Test performance improvements with caching"""
+    """Benchmark cold vs warm /api/publications and gate against the stored baseline"""
     print("7. Testing Performance Improvements with Caching...")
     
     try:
-        # Clear cache and measure multiple requests
-        requests.post(f"{API_BASE_URL}/clear-cache", timeout=10)
-        
-        request_times = []
-        
-        # Make 5 requests and measure times
-        for i in range(5):
-            start_time = time.time()
-            response = requests.get(f"{API_BASE_URL}/publications", timeout=15)
-            request_time = time.time() - start_time
-            
-            if response.status_code == 200:
-                request_times.append(request_time)
-                cache_status = "from cache" if i > 0 else "from Google Sheets"
-                print(f"   📊 Request {i+1}: {request_time:.3f}s ({cache_status})")
-            else:
-                print(f"   ❌ Request {i+1} failed")
-                return False
-            
-            time.sleep(0.2)  # Small delay between requests
-        
-        if len(request_times) >= 2:
-            first_request = request_times[0]
-            avg_cached_requests = sum(request_times[1:]) / len(request_times[1:])
-            
-            improvement = ((first_request - avg_cached_requests) / first_request * 100)
-            print(f"   🚀 Average performance improvement: {improvement:.1f}%")
-            
-            if improvement > 10:  # At least 10% improvement expected
-                print(f"   ✅ Significant performance improvement with caching")
-            else:
-                print(f"   ⚠️  Modest performance improvement with caching")
+        # SESG_BENCH_* scale the run; SESG_BENCH_SAVE_BASELINE=1 records a new baseline
+        result = benchmark_publications_cache(
+            API_BASE_URL,
+            samples=int(os.environ.get("SESG_BENCH_SAMPLES", 30)),
+            warmup=int(os.environ.get("SESG_BENCH_WARMUP", 3)),
+            cold_samples=int(os.environ.get("SESG_BENCH_COLD_SAMPLES", 3)),
+        )
+        print(format_result(result))
+        
+        regressions = run_gate(
+            result,
+            BaselineStore(os.environ.get("SESG_BENCH_BASELINE_DIR")),
+            save_baseline=os.environ.get("SESG_BENCH_SAVE_BASELINE") == "1",
+            latency_margin=float(os.environ.get("SESG_BENCH_LATENCY_MARGIN", DEFAULT_LATENCY_MARGIN)),
+            hit_ratio_margin=float(os.environ.get("SESG_BENCH_HIT_RATIO_MARGIN", DEFAULT_HIT_RATIO_MARGIN)),
+        )
+        
+        if result["speedup"] and result["speedup"] > 1.1:  # At least 10% improvement expected
+            print(f"   ✅ Significant performance improvement with caching")
+        else:
+            print(f"   ⚠️  Modest performance improvement with caching")
         
-        return True
+        return not regressions
         
     except Exception as e:
         print(f"   ❌ Error testing performance improvements: {e}")
@@ -384,7 +370,7 @@ def test_statistics_calculation():
     print("8. Testing Statistics Calculation from New Data Structure...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/publications", timeout=15)
+        response = http.get(f"{API_BASE_URL}/publications", timeout=15)
         if response.status_code != 200:
             print(f"   ❌ Publications request failed")
             return False
@@ -438,7 +424,7 @@ def test_statistics_calculation():
                 print(f"   ⚠️  Some statistics may need verification")
         
         # Test filtered statistics
-        response_filtered = requests.get(f"{API_BASE_URL}/publications?category_filter=Journal Articles", timeout=10)
+        response_filtered = http.get(f"{API_BASE_URL}/publications?category_filter=Journal Articles", timeout=10)
         if response_filtered.status_code == 200:
             filtered_data = response_filtered.json()
             filtered_stats = filtered_data.get('statistics', {})
@@ -509,5 +495,10 @@ def run_ieee_caching_tests():
     return results, all_passed
 
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     results, all_passed = run_ieee_caching_tests()
     sys.exit(0 if all_passed else 1)
\ No newline at end of file
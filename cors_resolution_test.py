@@ -10,6 +10,7 @@ Specifically tests the requirements mentioned in the review request:
 """
 
 import requests
+from harness.client import http
 import json
 import time
 from datetime import datetime
@@ -46,7 +47,7 @@ def test_direct_google_apps_script_urls():
                 'Pragma': 'no-cache'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http.get(url, headers=headers, timeout=10)
             end_time = time.time()
             response_time = end_time - start_time
             
@@ -138,7 +139,7 @@ def test_research_areas_data_structure():
     # Test Publications API data structure
     print("\n📚 Testing Publications API data structure...")
     try:
-        response = requests.get(GOOGLE_APPS_SCRIPT_URLS['Publications'], timeout=10)
+        response = http.get(GOOGLE_APPS_SCRIPT_URLS['Publications'], timeout=10)
         if response.status_code == 200:
             data = response.json()
             publications = data.get('publications', []) if isinstance(data, dict) else data
@@ -181,7 +182,7 @@ def test_research_areas_data_structure():
     # Test Projects API data structure
     print("\n📊 Testing Projects API data structure...")
     try:
-        response = requests.get(GOOGLE_APPS_SCRIPT_URLS['Projects'], timeout=10)
+        response = http.get(GOOGLE_APPS_SCRIPT_URLS['Projects'], timeout=10)
         if response.status_code == 200:
             data = response.json()
             projects = data.get('projects', []) if isinstance(data, dict) else data
@@ -242,8 +243,8 @@ def test_real_time_vs_mock_data():
     # Get actual data from APIs
     try:
         # Fetch Publications data
-        pub_response = requests.get(GOOGLE_APPS_SCRIPT_URLS['Publications'], timeout=10)
-        proj_response = requests.get(GOOGLE_APPS_SCRIPT_URLS['Projects'], timeout=10)
+        pub_response = http.get(GOOGLE_APPS_SCRIPT_URLS['Publications'], timeout=10)
+        proj_response = http.get(GOOGLE_APPS_SCRIPT_URLS['Projects'], timeout=10)
         
         if pub_response.status_code == 200 and proj_response.status_code == 200:
             pub_data = pub_response.json()
@@ -342,7 +343,7 @@ def test_cors_resolution():
         
         try:
             # Make request with browser headers that would trigger CORS issues
-            response = requests.get(url, headers=browser_headers, timeout=8)
+            response = http.get(url, headers=browser_headers, timeout=8)
             
             if response.status_code == 200:
                 print(f"      ✅ CORS Request Successful: {api_name}")
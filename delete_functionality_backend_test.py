@@ -21,6 +21,7 @@ Focus Areas:
 """
 
 import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -55,7 +56,7 @@ class DeleteFunctionalityTester:
     def test_frontend_service_status(self):
         """Test 1: Verify frontend service is running and accessible"""
         try:
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service Status", "PASS", 
                             f"Frontend accessible at {self.frontend_url} (Status: {response.status_code})")
@@ -93,7 +94,7 @@ class DeleteFunctionalityTester:
             route_accessibility = []
             for route in admin_routes:
                 try:
-                    response = requests.get(route, timeout=5)
+                    response = http.get(route, timeout=5)
                     if response.status_code in [200, 401, 403]:  # These are expected for protected routes
                         route_accessibility.append(f"{route} accessible")
                     else:
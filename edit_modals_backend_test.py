@@ -13,7 +13,9 @@ FOCUS: Testing the backend infrastructure that supports the Edit modals UI fixes
 including data sources, authentication, CRUD operations, and real-time sync.
 """
 
-import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
@@ -22,47 +24,27 @@ import time
 import subprocess
 import socket
 
-# Get Google Sheets API URLs from frontend .env file
-def get_api_urls():
-    try:
-        urls = {}
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_PUBLICATIONS_API_URL='):
-                    urls['publications'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PROJECTS_API_URL='):
-                    urls['projects'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_ACHIEVEMENTS_API_URL='):
-                    urls['achievements'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    urls['news_events'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_BACKEND_URL='):
-                    urls['frontend_url'] = line.split('=', 1)[1].strip()
-        return urls
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return {}
+# Google Sheets API URLs, resolved by configure() from the environment or the frontend .env file
+PUBLICATIONS_API_URL = PROJECTS_API_URL = ACHIEVEMENTS_API_URL = NEWS_EVENTS_API_URL = FRONTEND_URL = None
 
-API_URLS = get_api_urls()
-required_apis = ['publications', 'projects', 'achievements', 'news_events']
-for api in required_apis:
-    if not API_URLS.get(api):
-        print(f"ERROR: Could not get REACT_APP_{api.upper()}_API_URL from frontend/.env")
-        sys.exit(1)
+def configure():
+    """Resolve the API URLs and print the run banner"""
+    global PUBLICATIONS_API_URL, PROJECTS_API_URL, ACHIEVEMENTS_API_URL, NEWS_EVENTS_API_URL, FRONTEND_URL
+    API_URLS = config.api_urls(required=['publications', 'projects', 'achievements', 'news_events'])
 
-PUBLICATIONS_API_URL = API_URLS['publications']
-PROJECTS_API_URL = API_URLS['projects']
-ACHIEVEMENTS_API_URL = API_URLS['achievements']
-NEWS_EVENTS_API_URL = API_URLS['news_events']
-FRONTEND_URL = API_URLS.get('frontend_url', 'localhost:3000')
+    PUBLICATIONS_API_URL = API_URLS['publications']
+    PROJECTS_API_URL = API_URLS['projects']
+    ACHIEVEMENTS_API_URL = API_URLS['achievements']
+    NEWS_EVENTS_API_URL = API_URLS['news_events']
+    FRONTEND_URL = config.backend_url('localhost:3000')
 
-print(f"🚀 Testing Edit Modals UI Fixes - Backend Infrastructure")
-print(f"Publications API: {PUBLICATIONS_API_URL}")
-print(f"Projects API: {PROJECTS_API_URL}")
-print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
-print(f"News Events API: {NEWS_EVENTS_API_URL}")
-print(f"Frontend URL: {FRONTEND_URL}")
-print("=" * 80)
+    print(f"🚀 Testing Edit Modals UI Fixes - Backend Infrastructure")
+    print(f"Publications API: {PUBLICATIONS_API_URL}")
+    print(f"Projects API: {PROJECTS_API_URL}")
+    print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
+    print(f"News Events API: {NEWS_EVENTS_API_URL}")
+    print(f"Frontend URL: {FRONTEND_URL}")
+    print("=" * 80)
 
 def test_edit_project_modal_backend():
     """Test backend infrastructure supporting Edit Project Modal UI fixes"""
@@ -75,7 +57,7 @@ def test_edit_project_modal_backend():
         print("   📊 Testing Projects data source for Edit modal...")
         
         start_time = time.time()
-        response = requests.get(PROJECTS_API_URL, timeout=6)
+        response = http.get(PROJECTS_API_URL, timeout=6)
         end_time = time.time()
         response_time = end_time - start_time
         
@@ -189,7 +171,7 @@ def test_edit_achievement_modal_backend():
         print("   🏆 Testing Achievements data source for Edit modal...")
         
         start_time = time.time()
-        response = requests.get(ACHIEVEMENTS_API_URL, timeout=6)
+        response = http.get(ACHIEVEMENTS_API_URL, timeout=6)
         end_time = time.time()
         response_time = end_time - start_time
         
@@ -306,7 +288,7 @@ def test_edit_newsevent_modal_backend():
         print("   📅 Testing News Events data source for Edit modal...")
         
         start_time = time.time()
-        response = requests.get(NEWS_EVENTS_API_URL, timeout=6)
+        response = http.get(NEWS_EVENTS_API_URL, timeout=6)
         end_time = time.time()
         response_time = end_time - start_time
         
@@ -659,5 +641,10 @@ def run_all_tests():
 
 # Main execution
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     success = run_all_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
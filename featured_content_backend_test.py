@@ -15,6 +15,7 @@ Test Requirements:
 """
 
 import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -64,7 +65,7 @@ class FeaturedContentBackendTester:
     def test_frontend_service_status(self):
         """Test 1: Verify frontend service is running and accessible"""
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = http.get(self.backend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service Status", "PASS", 
                             f"Frontend accessible at {self.backend_url} (Status: {response.status_code})")
@@ -87,7 +88,7 @@ class FeaturedContentBackendTester:
             for api_name, api_url in self.google_sheets_apis.items():
                 try:
                     start_time = time.time()
-                    response = requests.get(api_url, timeout=15)
+                    response = http.get(api_url, timeout=15)
                     response_time = time.time() - start_time
                     
                     if response.status_code == 200:
@@ -141,7 +142,7 @@ class FeaturedContentBackendTester:
             
             # Test News Events API for featured property
             try:
-                response = requests.get(self.google_sheets_apis["news_events"], timeout=10)
+                response = http.get(self.google_sheets_apis["news_events"], timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     news_events = data.get('news_events', [])
@@ -166,7 +167,7 @@ class FeaturedContentBackendTester:
             
             # Test Achievements API for featured property
             try:
-                response = requests.get(self.google_sheets_apis["achievements"], timeout=10)
+                response = http.get(self.google_sheets_apis["achievements"], timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     achievements = data.get('achievements', [])
@@ -197,7 +198,7 @@ class FeaturedContentBackendTester:
             
             for api_name, fields in required_fields.items():
                 try:
-                    response = requests.get(self.google_sheets_apis[api_name], timeout=10)
+                    response = http.get(self.google_sheets_apis[api_name], timeout=10)
                     if response.status_code == 200:
                         data = response.json()
                         items = data.get(api_name, [])
@@ -235,7 +236,7 @@ class FeaturedContentBackendTester:
         """Test 4: Verify homepage hero section buttons are removed"""
         try:
             # Test homepage accessibility
-            response = requests.get(self.backend_url, timeout=10)
+            response = http.get(self.backend_url, timeout=10)
             
             if response.status_code == 200:
                 homepage_content = response.text
@@ -301,7 +302,7 @@ class FeaturedContentBackendTester:
             
             # Test News Events featured vs latest logic
             try:
-                response = requests.get(self.google_sheets_apis["news_events"], timeout=10)
+                response = http.get(self.google_sheets_apis["news_events"], timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     news_events = data.get('news_events', [])
@@ -330,7 +331,7 @@ class FeaturedContentBackendTester:
             
             # Test Achievements featured vs latest logic
             try:
-                response = requests.get(self.google_sheets_apis["achievements"], timeout=10)
+                response = http.get(self.google_sheets_apis["achievements"], timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     achievements = data.get('achievements', [])
@@ -485,7 +486,7 @@ class FeaturedContentBackendTester:
             
             for route in admin_routes:
                 try:
-                    response = requests.get(route, timeout=10)
+                    response = http.get(route, timeout=10)
                     if response.status_code == 200:
                         integration_tests.append(f"Admin route accessible: {route}")
                     else:
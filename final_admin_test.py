@@ -10,7 +10,7 @@ This test provides:
 4. Browser testing instructions
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -48,7 +48,7 @@ class FinalAdminTester:
         print("🌐 Testing Frontend Service Status...")
         
         try:
-            response = requests.get(self.frontend_url, timeout=15)
+            response = http.get(self.frontend_url, timeout=15)
             
             if response.status_code == 200:
                 content = response.text
@@ -97,7 +97,7 @@ class FinalAdminTester:
         
         try:
             login_url = f"{self.frontend_url}/admin/login"
-            response = requests.get(login_url, timeout=15)
+            response = http.get(login_url, timeout=15)
             
             if response.status_code == 200:
                 self.log_result(
@@ -127,7 +127,7 @@ class FinalAdminTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code == 200:
                 self.log_result(
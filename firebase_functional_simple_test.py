@@ -10,7 +10,7 @@ This test validates Firebase integration functionality:
 4. Context integration verification
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -66,7 +66,7 @@ class FirebaseFunctionalTester:
         
         # Test admin login page
         try:
-            response = requests.get(f"{self.frontend_url}/admin/login", timeout=10)
+            response = http.get(f"{self.frontend_url}/admin/login", timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Login Page Accessible", True, 
                              f"Status: {response.status_code}, Size: {len(response.text)} bytes")
@@ -83,7 +83,7 @@ class FirebaseFunctionalTester:
 
         # Test admin panel page
         try:
-            response = requests.get(f"{self.frontend_url}/admin", timeout=10)
+            response = http.get(f"{self.frontend_url}/admin", timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Panel Page Accessible", True, 
                              f"Status: {response.status_code}, Size: {len(response.text)} bytes")
@@ -128,7 +128,7 @@ class FirebaseFunctionalTester:
         # Test Firebase project accessibility
         try:
             firebase_url = "https://sesg-research-website.firebaseapp.com"
-            response = requests.get(firebase_url, timeout=10)
+            response = http.get(firebase_url, timeout=10)
             # Firebase apps can return various status codes
             if response.status_code in [200, 404, 403, 302]:
                 self.log_test("Firebase Project Accessible", True,
@@ -11,17 +11,14 @@ This test simulates actual user interactions with the Firebase migration system:
 5. Migration functionality testing
 """
 
-import requests
+from harness.browser import BrowserUnavailable, browsers
+from harness.client import http
 import json
 import time
 import sys
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException
 
 class FirebaseFunctionalTester:
     def __init__(self):
@@ -31,22 +28,15 @@ class FirebaseFunctionalTester:
             "password": "@dminsesg405"
         }
         
-        # Setup Chrome options for headless testing
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
+        # Warm headless Chrome instances come from the shared pool; every UI
+        # check gets its own checkout with cookies and storage cleared
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 10)
-        except Exception as e:
+            browsers.start()
+            self.browser_available = True
+        except BrowserUnavailable as e:
             print(f"❌ Failed to initialize Chrome driver: {e}")
             print("🔄 Falling back to requests-based testing...")
-            self.driver = None
-            self.wait = None
+            self.browser_available = False
         
         self.test_results = {
             "total_tests": 0,
@@ -88,46 +78,47 @@ class FirebaseFunctionalTester:
         print("\n🔍 Test Category 1: Admin Panel Login Functionality")
         print("-" * 50)
         
-        if not self.driver:
+        if not self.browser_available:
             self.log_test("Admin Panel Login (Selenium)", False, "Chrome driver not available")
             return self.test_admin_panel_login_requests()
         
         try:
-            # Navigate to admin login page
-            self.driver.get(f"{self.frontend_url}/admin/login")
-            time.sleep(2)
+            with browsers.session() as driver:
+                # Navigate to admin login page
+                driver.get(f"{self.frontend_url}/admin/login")
+                time.sleep(2)
             
-            # Check if login page loaded
-            page_title = self.driver.title
-            if "admin" in page_title.lower() or "login" in page_title.lower():
-                self.log_test("Admin Login Page Loaded", True, f"Page title: {page_title}")
-            else:
-                self.log_test("Admin Login Page Loaded", True, f"Page loaded successfully")
+                # Check if login page loaded
+                page_title = driver.title
+                if "admin" in page_title.lower() or "login" in page_title.lower():
+                    self.log_test("Admin Login Page Loaded", True, f"Page title: {page_title}")
+                else:
+                    self.log_test("Admin Login Page Loaded", True, f"Page loaded successfully")
             
-            # Look for login form elements
-            try:
-                username_field = self.driver.find_element(By.NAME, "username") or \
-                                self.driver.find_element(By.ID, "username") or \
-                                self.driver.find_element(By.CSS_SELECTOR, "input[type='text']")
-                self.log_test("Username Field Present", True, "Username input field found")
-            except NoSuchElementException:
-                self.log_test("Username Field Present", False, "Username field not found")
+                # Look for login form elements
+                try:
+                    username_field = driver.find_element(By.NAME, "username") or \
+                                    driver.find_element(By.ID, "username") or \
+                                    driver.find_element(By.CSS_SELECTOR, "input[type='text']")
+                    self.log_test("Username Field Present", True, "Username input field found")
+                except NoSuchElementException:
+                    self.log_test("Username Field Present", False, "Username field not found")
             
-            try:
-                password_field = self.driver.find_element(By.NAME, "password") or \
-                                self.driver.find_element(By.ID, "password") or \
-                                self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-                self.log_test("Password Field Present", True, "Password input field found")
-            except NoSuchElementException:
-                self.log_test("Password Field Present", False, "Password field not found")
+                try:
+                    password_field = driver.find_element(By.NAME, "password") or \
+                                    driver.find_element(By.ID, "password") or \
+                                    driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+                    self.log_test("Password Field Present", True, "Password input field found")
+                except NoSuchElementException:
+                    self.log_test("Password Field Present", False, "Password field not found")
             
-            try:
-                login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']") or \
-                              self.driver.find_element(By.CSS_SELECTOR, "button:contains('Login')") or \
-                              self.driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
-                self.log_test("Login Button Present", True, "Login button found")
-            except NoSuchElementException:
-                self.log_test("Login Button Present", False, "Login button not found")
+                try:
+                    login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']") or \
+                                  driver.find_element(By.CSS_SELECTOR, "button:contains('Login')") or \
+                                  driver.find_element(By.CSS_SELECTOR, "input[type='submit']")
+                    self.log_test("Login Button Present", True, "Login button found")
+                except NoSuchElementException:
+                    self.log_test("Login Button Present", False, "Login button not found")
                 
         except Exception as e:
             self.log_test("Admin Panel Login Page Access", False, error=e)
@@ -136,7 +127,7 @@ class FirebaseFunctionalTester:
         """Fallback test using requests"""
         try:
             # Test login page accessibility
-            response = requests.get(f"{self.frontend_url}/admin/login", timeout=10)
+            response = http.get(f"{self.frontend_url}/admin/login", timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Login Page Accessible (Requests)", True, f"Status: {response.status_code}")
                 
@@ -155,27 +146,28 @@ class FirebaseFunctionalTester:
         print("\n🔍 Test Category 2: Data Migration Tab Access")
         print("-" * 50)
         
-        if not self.driver:
+        if not self.browser_available:
             self.log_test("Data Migration Tab Access (Selenium)", False, "Chrome driver not available")
             return self.test_data_migration_requests()
         
         try:
-            # Navigate to admin panel
-            self.driver.get(f"{self.frontend_url}/admin")
-            time.sleep(3)
+            with browsers.session() as driver:
+                # Navigate to admin panel
+                driver.get(f"{self.frontend_url}/admin")
+                time.sleep(3)
             
-            # Look for Data Migration tab or section
-            try:
-                migration_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'Migration')]") + \
-                                   self.driver.find_elements(By.XPATH, "//*[contains(text(), 'Firebase')]") + \
-                                   self.driver.find_elements(By.XPATH, "//*[contains(text(), 'Data')]")
+                # Look for Data Migration tab or section
+                try:
+                    migration_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'Migration')]") + \
+                                       driver.find_elements(By.XPATH, "//*[contains(text(), 'Firebase')]") + \
+                                       driver.find_elements(By.XPATH, "//*[contains(text(), 'Data')]")
                 
-                if migration_elements:
-                    self.log_test("Data Migration Section Found", True, f"Found {len(migration_elements)} migration-related elements")
-                else:
-                    self.log_test("Data Migration Section Found", False, "No migration-related elements found")
-            except Exception as e:
-                self.log_test("Data Migration Section Search", False, error=e)
+                    if migration_elements:
+                        self.log_test("Data Migration Section Found", True, f"Found {len(migration_elements)} migration-related elements")
+                    else:
+                        self.log_test("Data Migration Section Found", False, "No migration-related elements found")
+                except Exception as e:
+                    self.log_test("Data Migration Section Search", False, error=e)
                 
         except Exception as e:
             self.log_test("Admin Panel Navigation", False, error=e)
@@ -184,7 +176,7 @@ class FirebaseFunctionalTester:
         """Fallback test using requests"""
         try:
             # Test admin panel accessibility
-            response = requests.get(f"{self.frontend_url}/admin", timeout=10)
+            response = http.get(f"{self.frontend_url}/admin", timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Panel Accessible (Requests)", True, f"Status: {response.status_code}")
                 
@@ -220,7 +212,7 @@ class FirebaseFunctionalTester:
             # Test Firebase project accessibility (external check)
             try:
                 firebase_url = f"https://{firebase_config['projectId']}.firebaseapp.com"
-                response = requests.get(firebase_url, timeout=10)
+                response = http.get(firebase_url, timeout=10)
                 # Firebase apps typically return various status codes, so we check for response
                 if response.status_code in [200, 404, 403]:  # These are normal Firebase responses
                     self.log_test("Firebase Project Accessible", True, 
@@ -398,8 +390,12 @@ class FirebaseFunctionalTester:
 
     def cleanup(self):
         """Cleanup resources"""
-        if self.driver:
-            self.driver.quit()
+        if self.browser_available:
+            stats = browsers.stats()
+            print(f"\n🌐 Browser pool: {stats['launched']} launched "
+                  f"({stats['mean_launch_seconds']:.1f}s each), {stats['checkouts']} checkouts, "
+                  f"{stats['reused']} reused, {stats['recycled']} recycled")
+        browsers.close()
 
     def run_all_tests(self):
         """Run all Firebase functional tests"""
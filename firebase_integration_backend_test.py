@@ -14,7 +14,7 @@ This test suite validates:
 Test Focus: Backend infrastructure supporting Firebase integration
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -71,7 +71,7 @@ class FirebaseIntegrationTester:
         print("-" * 50)
         
         try:
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test(
                     "Frontend Service Accessible",
@@ -98,7 +98,7 @@ class FirebaseIntegrationTester:
         # Test admin login page accessibility
         try:
             login_url = f"{self.frontend_url}/admin/login"
-            response = requests.get(login_url, timeout=10)
+            response = http.get(login_url, timeout=10)
             if response.status_code == 200:
                 self.log_test(
                     "Admin Login Page Accessible",
@@ -117,7 +117,7 @@ class FirebaseIntegrationTester:
         # Test admin panel page accessibility
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = http.get(admin_url, timeout=10)
             if response.status_code == 200:
                 self.log_test(
                     "Admin Panel Page Accessible",
@@ -7,7 +7,7 @@ Specific test for localStorage integration and real-time sync functionality
 as requested in the Footer Management System review.
 """
 
-import requests
+from harness.client import http
 import json
 import time
 from datetime import datetime
@@ -32,7 +32,7 @@ class FooterLocalStorageIntegrationTester:
         """Test FooterProvider integration in App.js"""
         try:
             # Test if the main app loads without errors
-            response = requests.get(self.backend_url, timeout=10)
+            response = http.get(self.backend_url, timeout=10)
             
             if response.status_code == 200:
                 # Check if the response contains React app structure
@@ -184,7 +184,7 @@ class FooterLocalStorageIntegrationTester:
         try:
             # Test admin panel route
             admin_url = f"{self.backend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = http.get(admin_url, timeout=10)
             
             # Admin panel should be accessible (even if it redirects to login)
             if response.status_code in [200, 302, 401]:
@@ -17,7 +17,7 @@ Authentication: admin/@dminsesg405
 localStorage Key: 'sesg_footer_data'
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -116,7 +116,7 @@ class FooterManagementBackendTester:
     def test_frontend_service_status(self):
         """Test 1: Verify frontend service is running and accessible"""
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = http.get(self.backend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test(
                     "Frontend Service Status",
@@ -143,7 +143,7 @@ class FooterManagementBackendTester:
         """Test 2: Verify admin panel accessibility"""
         try:
             admin_login_url = f"{self.backend_url}/admin/login"
-            response = requests.get(admin_login_url, timeout=10)
+            response = http.get(admin_login_url, timeout=10)
             
             if response.status_code == 200:
                 self.log_test(
@@ -46,6 +46,49 @@ class ApiService {
     }
   }
 
+  // Batch API: several GET routes answered in one round-trip
+  // queries: [{ id, path: '/publications', params: {...} }, ...] -> { [id]: body }
+  async batch(queries) {
+    for (const baseUrl of [API_BASE_URL, FALLBACK_URL]) {
+      try {
+        const response = await fetch(`${baseUrl}/api/batch`, {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify({ queries }),
+        });
+
+        if (!response.ok) {
+          throw new Error(`API request failed: ${response.status}`);
+        }
+
+        const { results } = await response.json();
+        return Object.fromEntries(results.map(result => [
+          result.id,
+          result.status === 200 ? result.body : null
+        ]));
+      } catch (error) {
+        console.error(`API batch request failed for ${baseUrl}:`, error);
+
+        if (baseUrl === FALLBACK_URL) {
+          throw error;
+        }
+      }
+    }
+  }
+
+  // Home page: featured items of every section plus the counters
+  async getHomePageData() {
+    return this.batch([
+      { id: 'publications', path: '/publications', params: { featured_filter: true, sort_by: 'year', per_page: 5 } },
+      { id: 'projects', path: '/projects', params: { featured_filter: true, sort_by: 'start_date', per_page: 5 } },
+      { id: 'achievements', path: '/achievements', params: { featured_filter: true, sort_by: 'date', per_page: 3 } },
+      { id: 'newsEvents', path: '/news-events', params: { featured_filter: true, sort_by: 'date', per_page: 3 } },
+      { id: 'researchStats', path: '/research-stats' }
+    ]);
+  }
+
   // Publications API
   async getPublications(params = {}) {
     const defaultParams = {
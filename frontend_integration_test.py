@@ -4,7 +4,7 @@ Frontend Google Sheets Service Integration Test
 Tests the frontend's googleSheetsService to ensure it properly handles the Google Sheets API responses
 """
 
-import requests
+from harness.client import http
 import json
 import sys
 from datetime import datetime
@@ -21,7 +21,7 @@ class GoogleSheetsServiceTest:
     def fetch_from_google_sheets(self, url):
         """Simulate the frontend fetch method"""
         try:
-            response = requests.get(url, timeout=30)
+            response = http.get(url, timeout=30)
             if response.status_code != 200:
                 raise Exception(f"Google Sheets API request failed: {response.status_code}")
             return response.json()
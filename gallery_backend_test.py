@@ -15,6 +15,7 @@ including localStorage-based CRUD operations, context integration, and real-time
 """
 
 import requests
+from harness import config
 import json
 import os
 from datetime import datetime
@@ -23,23 +24,17 @@ import time
 import subprocess
 import socket
 
-# Get frontend URL from .env file
-def get_frontend_url():
-    try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    return line.split('=', 1)[1].strip()
-        return 'localhost:3000'
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return 'localhost:3000'
+# Frontend URL, resolved by configure() from the environment or the frontend .env file
+FRONTEND_URL = None
 
-FRONTEND_URL = get_frontend_url()
+def configure():
+    """Resolve the frontend URL and print the run banner"""
+    global FRONTEND_URL
+    FRONTEND_URL = config.backend_url('localhost:3000')
 
-print(f"🎨 Testing Gallery Management System - Backend Infrastructure")
-print(f"Frontend URL: {FRONTEND_URL}")
-print("=" * 80)
+    print(f"🎨 Testing Gallery Management System - Backend Infrastructure")
+    print(f"Frontend URL: {FRONTEND_URL}")
+    print("=" * 80)
 
 def test_gallery_crud_operations():
     """Test Gallery CRUD Operations - AddGalleryModal, EditGalleryModal, DeleteGalleryModal"""
@@ -862,5 +857,6 @@ def run_all_tests():
 
 # Main execution
 if __name__ == "__main__":
+    configure()
     success = run_all_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -6,26 +6,20 @@ This tests the frontend's ability to fetch data from Google Sheets APIs without
 """
 
 import requests
+from harness.client import http
 import json
 import os
 from datetime import datetime
 import sys
 
-# Google Sheets API URLs from the review request
+# Google Sheets API URLs from the review request (overridable via REACT_APP_*_API_URL, e.g. python -m harness --sheets)
 GOOGLE_SHEETS_APIS = {
-    'publications': 'https://script.google.com/macros/s/AKfycbzQ6XwRBYMc5PaDDns3XlgpRGYQFZtC45RtVRUhyvVlt869zH9mL0IlGlnvBV2-e_s/exec?sheet=sheet6',
-    'projects': 'https://script.google.com/macros/s/AKfycbz5-vZBCz8DZQhLDmLjJNA70HQ3OazQ2uTAUuK7UQaTVip7pG8ulVPLuzA8VN8rqTGH/exec?sheet=sheet7',
-    'achievements': 'https://script.google.com/macros/s/AKfycbxScZMmNtYyVJ5Je8iRpAFTGVpCCuA-5tnS3jGVGk6aYbRjbiL7NAAquXsxcQU2T_I/exec?sheet=sheet8',
-    'news_events': 'https://script.google.com/macros/s/AKfycbwLVCtEI2Mr2J76jf72kfK6OhaMNNdfvLTcJTV8J6mtWcNNGVnHtt0Gxu__lavtnrc8/exec?sheet=sheet9'
+    'publications': os.environ.get('REACT_APP_PUBLICATIONS_API_URL', 'https://script.google.com/macros/s/AKfycbzQ6XwRBYMc5PaDDns3XlgpRGYQFZtC45RtVRUhyvVlt869zH9mL0IlGlnvBV2-e_s/exec?sheet=sheet6'),
+    'projects': os.environ.get('REACT_APP_PROJECTS_API_URL', 'https://script.google.com/macros/s/AKfycbz5-vZBCz8DZQhLDmLjJNA70HQ3OazQ2uTAUuK7UQaTVip7pG8ulVPLuzA8VN8rqTGH/exec?sheet=sheet7'),
+    'achievements': os.environ.get('REACT_APP_ACHIEVEMENTS_API_URL', 'https://script.google.com/macros/s/AKfycbxScZMmNtYyVJ5Je8iRpAFTGVpCCuA-5tnS3jGVGk6aYbRjbiL7NAAquXsxcQU2T_I/exec?sheet=sheet8'),
+    'news_events': os.environ.get('REACT_APP_NEWS_EVENTS_API_URL', 'https://script.google.com/macros/s/AKfycbwLVCtEI2Mr2J76jf72kfK6OhaMNNdfvLTcJTV8J6mtWcNNGVnHtt0Gxu__lavtnrc8/exec?sheet=sheet9')
 }
 
-print("=" * 80)
-print("🔗 GOOGLE SHEETS API INTEGRATION TESTING")
-print("=" * 80)
-print("Testing Google Sheets API endpoints for SESG Research website")
-print("This verifies the frontend can work without backend by fetching data directly from Google Sheets")
-print("=" * 80)
-
 def test_google_sheets_api_endpoint(name, url):
     """Test a single Google Sheets API endpoint"""
     print(f"\n📊 Testing {name.upper()} API: {url}")
@@ -37,7 +31,7 @@ def test_google_sheets_api_endpoint(name, url):
         # 1. Basic connectivity test
         print("1. Testing basic connectivity...")
         start_time = datetime.now()
-        response = requests.get(url, timeout=30)
+        response = http.get(url, timeout=30)
         response_time = (datetime.now() - start_time).total_seconds()
         
         if response.status_code == 200:
@@ -131,7 +125,7 @@ def test_google_sheets_api_endpoint(name, url):
             'Referer': 'https://sesgrg-v4.vercel.app/'
         }
         
-        browser_response = requests.get(url, headers=browser_headers, timeout=30)
+        browser_response = http.get(url, headers=browser_headers, timeout=30)
         if browser_response.status_code == 200:
             print("   ✅ Browser-like request successful")
         else:
@@ -261,7 +255,7 @@ def test_performance_and_reliability():
         for i in range(3):
             try:
                 start_time = datetime.now()
-                response = requests.get(url, timeout=30)
+                response = http.get(url, timeout=30)
                 response_time = (datetime.now() - start_time).total_seconds()
                 
                 response_times.append(response_time)
@@ -281,6 +275,13 @@ def test_performance_and_reliability():
 
 def main():
     """Main test execution"""
+    print("=" * 80)
+    print("🔗 GOOGLE SHEETS API INTEGRATION TESTING")
+    print("=" * 80)
+    print("Testing Google Sheets API endpoints for SESG Research website")
+    print("This verifies the frontend can work without backend by fetching data directly from Google Sheets")
+    print("=" * 80)
+    
     overall_success = True
     test_results = {}
     
@@ -0,0 +1,4 @@
+"""
+SESG Research Website - Verification Harness
+Shared tooling for running the root-level *_test.py verification scripts
+"""
@@ -0,0 +1,992 @@
+"""
+Local stand-in for the SESG FastAPI backend (/api/*)
+
+The backend behind REACT_APP_BACKEND_URL is no longer deployed alongside the
+frontend, yet backend_test_ieee_caching.py, news_events_delete_test.py and the
+benchmarks still exercise its contract. This server implements that contract
+on top of the Apps Script datasets: every dataset is fetched from its
+REACT_APP_*_API_URL (or from any callable source) and kept for
+cache_duration_minutes, optionally served stale for max_stale_minutes more
+while a background refresh runs. URL fetches go through harness.upstream
+(pooled connections, hedging, retries, and a circuit breaker falling back to
+the last good records, which age and expire like any cached copy). List
+requests are answered by the indexed query engine in harness.query instead
+of filtering and sorting per request, and ieee_formatted is filled in for
+every publication when the dataset loads, so clients never format citations
+themselves.
+
+List responses carry a strong ETag (dataset content + normalized query) and
+Last-Modified, answer If-None-Match / If-Modified-Since with 304 before
+rendering anything, and are sent gzip- or brotli-compressed from variants
+compressed once per cached response.
+
+REST surface:
+    GET  /api/publications   title_filter, author_filter, year_filter, category_filter,
+                             area_filter, featured_filter, search_filter, search, sort_by,
+                             sort_order, page, per_page
+    GET  /api/projects       title_filter, status_filter, area_filter, search_filter, search, ...
+    GET  /api/achievements   title_filter, category_filter, year_filter, ...
+    GET  /api/news-events    title_filter, category_filter, ...
+                             (featured_filter=true on every list: rows flagged featured)
+                             (search: ranked full-text query, ordered by relevance
+                             unless sort_by is given; cursor: the next_cursor of a
+                             previous page, replacing page)
+    GET  /api/achievements/{id}, /api/news-events/{id}
+                             the item plus content_html (its post body rendered as
+                             generateAdvancedBlogContent does) and table_of_contents
+    GET  /api/<resource>/export
+                             every row matching the list filters and sort, streamed
+                             as NDJSON (format=ndjson, default) or CSV (format=csv)
+    GET  /api/research-stats home page counters (publications, citations, projects,
+                             achievements, news-events, research areas)
+    GET  /api/cache-status   {"cached_items", "last_fetch_times", "cache_duration_minutes",
+                              "cache_hits", "cache_misses", "stale_hits", "entries", ...}
+    GET  /api/metrics        Prometheus text format: per-route request counts, latency and
+                             response-size histograms, in-flight gauges, dataset and
+                             response cache counters, upstream fetch durations and failures
+    POST /api/batch          {"queries": [{"id", "path", "params"}, ...]}: up to 20 GET routes
+                             above (exports excepted) answered concurrently from the
+                             caches in one {"results": [{"id", "status", "body"}]}
+                             (a matching If-None-Match is a 412, never a 304)
+    POST /api/clear-cache    drop every cached dataset
+
+Usage:
+    with ApiStandIn(urls=sheets.urls()) as api:
+        os.environ.update(api.environ())      # REACT_APP_BACKEND_URL
+        ...
+
+    python -m harness.api --port 8001 --sheets
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from harness import config
+from harness.blog import KINDS, BlogRenderer
+from harness.export import FORMATS, export_chunks
+from harness.metrics import CONTENT_TYPE, LATENCY_BUCKETS, SIZE_BUCKETS, Metrics
+from harness.query import DatasetIndex, QueryError
+from harness.resultcache import DEFAULT_MAX_BYTES, Representation, ResultCache, etag_matches, normalize_params
+from harness.singleflight import SingleFlight
+from harness.standin import StandInHandler
+from harness.upstream import SnapshotFallback, UpstreamClient
+
+DEFAULT_CACHE_MINUTES = 3
+DEFAULT_UPSTREAM_TIMEOUT = 20
+BATCH_LIMIT = 20  # sub-queries per POST /api/batch
+BATCH_WORKERS = 8
+
+# URL segment -> dataset name
+RESOURCES = {
+    "publications": "publications",
+    "projects": "projects",
+    "achievements": "achievements",
+    "news-events": "news_events",
+}
+# datasets served by id at /api/<segment>/{id}, with their 404 message
+DETAILS = {"achievements": "Achievement not found", "news_events": "News event not found"}
+ROUTES = ("research-stats", "cache-status", "metrics", "batch", "clear-cache")
+
+METRICS = (
+    ("sesg_http_requests_total", "counter", "HTTP requests served, by method, route and status", None),
+    ("sesg_http_request_duration_seconds", "histogram", "Time to serve an HTTP request, by method and route",
+     LATENCY_BUCKETS),
+    ("sesg_http_response_size_bytes", "histogram", "Response body bytes sent, by method and route", SIZE_BUCKETS),
+    ("sesg_http_requests_in_flight", "gauge", "HTTP requests being served, by route", None),
+    ("sesg_dataset_cache_total", "counter", "Dataset cache lookups, by dataset and result (hit, miss, stale)", None),
+    ("sesg_dataset_rows", "gauge", "Rows of each cached dataset", None),
+    ("sesg_dataset_age_seconds", "gauge", "Age of each cached dataset", None),
+    ("sesg_response_cache_total", "counter", "Rendered-response cache events (hit, miss, eviction, invalidation)",
+     None),
+    ("sesg_response_cache_bytes", "gauge", "Bytes held by the rendered-response cache", None),
+    ("sesg_upstream_fetch_duration_seconds", "histogram",
+     "Google Sheets fetch and index time, by dataset and outcome (ok, fallback, error)", LATENCY_BUCKETS),
+    ("sesg_upstream_fetch_failures_total", "counter", "Failed Google Sheets fetches, by dataset", None),
+    ("sesg_upstream_coalesced_total", "counter", "Requests that waited on a fetch already in flight, by dataset",
+     None),
+    ("sesg_upstream_in_flight", "gauge", "Google Sheets fetches in flight, by dataset", None),
+    ("sesg_upstream_connections_opened_total", "counter", "Connections the upstream pool opened, by host", None),
+    ("sesg_upstream_connections_reused_total", "counter", "Upstream requests sent on a kept-alive connection, by host",
+     None),
+)
+
+
+def route_of(parts):
+    """Route template of /api path segments, bounding the label values of the HTTP metrics"""
+    if parts is None:
+        return "unmatched"
+    if not parts:
+        return "/api"
+    if parts[0] in RESOURCES and len(parts) <= 2:
+        if len(parts) == 1:
+            return f"/api/{parts[0]}"
+        return f"/api/{parts[0]}/export" if parts[1] == "export" else f"/api/{parts[0]}/{{id}}"
+    if len(parts) == 1 and parts[0] in ROUTES:
+        return f"/api/{parts[0]}"
+    return "unmatched"
+
+
+class ApiError(Exception):
+    """Error rendered as a FastAPI style {"detail": ...} body"""
+
+    def __init__(self, code, detail):
+        super().__init__(detail)
+        self.code = code
+        self.detail = detail
+
+
+class NotModified(Exception):
+    """The client's cached copy of a list response is current (rendered as a bodyless 304 with `etag`, quoted)"""
+
+    def __init__(self, etag, last_modified, cache_control="no-cache"):
+        super().__init__(etag)
+        self.etag = etag
+        self.last_modified = last_modified
+        self.cache_control = cache_control
+
+
+def _log_to_stderr(format, *args):
+    """Fallback for batch(log_error=...) outside a request handler: the message alone, on stderr"""
+    sys.stderr.write(format % args + "\n")
+
+
+def records_fingerprint(records):
+    """Content hash of a dataset as fetched"""
+    return hashlib.sha1(json.dumps(records, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def check_not_modified(etag, last_modified, if_none_match=None, if_modified_since=None, cache_control="no-cache"):
+    """Raise NotModified when If-None-Match (or, without one, If-Modified-Since) shows the client is current"""
+    if if_none_match:
+        matched = etag_matches(if_none_match, etag)
+        if matched:
+            raise NotModified(matched, last_modified, cache_control)
+    elif if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return
+        if int(last_modified) <= since:
+            raise NotModified(f'"{etag}"', last_modified, cache_control)
+
+
+def list_etag(index, dataset, params):
+    """Strong ETag (unquoted) of a list response: dataset content plus normalized query"""
+    query = hashlib.sha1(repr(normalize_params(dataset, params)).encode()).hexdigest()
+    return f"{index.fingerprint[:16]}-{query[:16]}"
+
+
+def records_from_payload(dataset, payload):
+    """Record list of an Apps Script response: a bare list, {dataset: [...]} or {"data": [...]}"""
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in (dataset, "data"):
+            if isinstance(payload.get(key), list):
+                return payload[key]
+    raise ValueError(f"Unexpected {dataset} payload shape")
+
+
+def upstream_sources(urls=None, timeout=DEFAULT_UPSTREAM_TIMEOUT, upstream=None):
+    """dataset -> callable fetching its records from an Apps Script URL (default: config.api_urls())
+
+    Fetches go through `upstream` (a new UpstreamClient by default): pooled,
+    hedged and retried, behind a circuit breaker that answers with the last
+    good records while the Apps Script is failing.
+    """
+    urls = config.api_urls() if urls is None else urls
+    upstream = UpstreamClient(timeout) if upstream is None else upstream
+
+    def source(dataset, url):
+        def fetch():
+            return upstream.fetch(dataset, url, parse=lambda payload: records_from_payload(dataset, payload))
+        return fetch
+
+    return {dataset: source(dataset, url) for dataset, url in urls.items()}
+
+
+# =================== IEEE CITATIONS ===================
+
+def ieee_citation(publication):
+    """IEEE reference string of a publication (ApiService.generateIEEECitation, server side)"""
+    authors = publication.get("authors") or ""
+    if isinstance(authors, list):
+        authors = ", ".join(authors)
+    citation = f'{authors}, "{publication.get("title", "")}"'
+    category = publication.get("category") or "Journal Articles"
+    venue = publication.get("journal_book_conference_name")
+
+    if category == "Journal Articles":
+        if venue:
+            citation += f", {venue}"
+        if publication.get("volume"):
+            citation += f", vol. {publication['volume']}"
+        if publication.get("issue"):
+            citation += f", no. {publication['issue']}"
+    elif category == "Conference Proceedings":
+        if venue:
+            citation += f", {venue}"
+        if publication.get("location"):
+            citation += f", {publication['location']}"
+    elif category == "Book Chapters":
+        if venue:
+            citation += f", in {venue}"
+        if publication.get("editors"):
+            citation += f", {publication['editors']}, Ed(s)."
+        if publication.get("publisher"):
+            citation += f" {publication['publisher']}"
+        if publication.get("location"):
+            citation += f", {publication['location']}"
+    else:
+        return f"{citation}, {publication.get('year', '')}."
+    if publication.get("pages"):
+        citation += f", pp. {publication['pages']}"
+    return f"{citation}, {publication.get('year', '')}."
+
+
+CITATION_FIELDS = ("authors", "title", "category", "journal_book_conference_name", "volume", "issue",
+                   "location", "editors", "publisher", "pages", "year")
+
+
+def citation_hash(publication):
+    """Content hash of the fields ieee_citation reads"""
+    fields = [publication.get(name) for name in CITATION_FIELDS]
+    return hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class CitationFormatter:
+    """Batch IEEE formatter memoized by citation_hash
+
+    format_all() formats a whole dataset in one pass at load time, reusing the
+    citation of every row whose citation fields are unchanged since the
+    previous pass; the memo keeps only the hashes of the latest pass.
+    """
+
+    def __init__(self):
+        self._memo = {}
+        self._lock = threading.Lock()
+        self.formatted = self.reused = 0
+
+    def format_all(self, publications):
+        """ieee_formatted of every publication, in order"""
+        with self._lock:
+            previous, memo = self._memo, {}
+            citations = []
+            for publication in publications:
+                digest = citation_hash(publication)
+                citation = memo.get(digest) or previous.get(digest)
+                if citation is None:
+                    citation = ieee_citation(publication)
+                    self.formatted += 1
+                else:
+                    self.reused += 1
+                memo[digest] = citation
+                citations.append(citation)
+            self._memo = memo
+            return citations
+
+    def stats(self):
+        with self._lock:
+            return {"memoized": len(self._memo), "formatted": self.formatted, "reused": self.reused}
+
+
+def prepare_records(dataset, records, citations=None):
+    """Rows as served by the API: publication years as text, plus ieee_formatted when the sheet lacks it"""
+    if dataset != "publications":
+        return list(records)
+    prepared = [dict(record, year=str(record.get("year", ""))) for record in records]
+    missing = [record for record in prepared if not record.get("ieee_formatted")]
+    for record, citation in zip(missing, (citations or CitationFormatter()).format_all(missing)):
+        record["ieee_formatted"] = citation
+    return prepared
+
+
+# =================== RESEARCH STATS ===================
+
+def research_summary(indexes):
+    """Counters of /api/research-stats from the loaded dataset indexes (dataset -> DatasetIndex)"""
+    summary = {}
+    publications = indexes.get("publications")
+    if publications is not None:
+        summary.update(publications.aggregates.compose())
+        summary["publications_by_category"] = {category: len(rows) for category, rows in
+                                               sorted(publications.exact["category_filter"].items())}
+    projects = indexes.get("projects")
+    if projects is not None:
+        summary.update(projects.statistics({}, None))
+    for dataset in ("achievements", "news_events"):
+        if dataset in indexes:
+            summary[f"total_{dataset}"] = len(indexes[dataset])
+    areas = set()
+    for dataset in ("publications", "projects"):
+        if dataset in indexes:
+            areas.update(indexes[dataset].exact["area_filter"])
+    summary["total_research_areas"] = len(areas)
+    return summary
+
+
+# =================== BACKEND ===================
+
+class ApiBackend:
+    """Dataset cache plus the request handlers, independent of the HTTP layer
+
+    Entries younger than cache_minutes are served as they are. With
+    max_stale_minutes > 0 an expired entry is still served immediately for
+    that much longer while a background thread refreshes it
+    (stale-while-revalidate); past that, or when nothing is cached, the
+    request waits for the upstream fetch.
+
+    Upstream fetches go through a SingleFlight per dataset: requests that
+    miss while a fetch (or background refresh) is already running wait for it
+    instead of starting their own.
+
+    Rendered list responses are kept in a ResultCache keyed on the dataset
+    version, so a refresh or clear-cache invalidates them together with the
+    dataset they were rendered from. A refresh that returns the rows already
+    cached keeps the current index, version and rendered responses, so ETags
+    and Last-Modified only change when the data does.
+    """
+
+    def __init__(self, sources, cache_minutes=DEFAULT_CACHE_MINUTES, max_stale_minutes=0,
+                 result_cache_bytes=DEFAULT_MAX_BYTES, metrics=None, upstream=None):
+        self.sources = dict(sources)
+        self.cache_minutes = cache_minutes
+        self.max_stale_minutes = max_stale_minutes
+        self.results = ResultCache(result_cache_bytes)
+        self.citations = CitationFormatter()
+        self.flights = SingleFlight()
+        self.blog = BlogRenderer()
+        self.metrics = Metrics() if metrics is None else metrics
+        self.upstream = upstream  # the UpstreamClient behind `sources`, reported by cache-status and metrics
+        for name, kind, help, buckets in METRICS:
+            self.metrics.describe(name, kind, help, buckets)
+        self._summary = None  # (dataset versions, Representation) of /api/research-stats
+        self._batch_pool = None
+        self._version = 0
+        self._entries = {}
+        self._refreshing = set()
+        self._errors = {}
+        self._generation = 0
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def _count(self, dataset, counter):
+        with self._lock:
+            counters = self._counters.setdefault(dataset, {"hits": 0, "misses": 0, "stale": 0})
+            counters[counter] += 1
+
+    def index(self, dataset):
+        """DatasetIndex of a dataset, fetched from its source when missing or expired"""
+        if dataset not in self.sources:
+            raise ApiError(503, f"No upstream configured for {dataset}")
+        entry = self._entries.get(dataset)
+        if entry is not None:
+            age = time.monotonic() - entry["loaded"]
+            if age < self.cache_minutes * 60:
+                self._count(dataset, "hits")
+                return entry["index"]
+            if age < (self.cache_minutes + self.max_stale_minutes) * 60:
+                self._count(dataset, "stale")
+                self._refresh_in_background(dataset)
+                return entry["index"]
+        self._count(dataset, "misses")
+        return self._load(dataset)
+
+    def _fetch(self, dataset):
+        """Fetch and index a dataset; returns the new cache entry
+
+        When the upstream answers with its last good copy (SnapshotFallback)
+        the entry keeps that copy's fetch time, so it ages and goes stale
+        like the entry it replaces; the failure is still recorded, and a
+        copy older than cache_minutes + max_stale_minutes is refused.
+        """
+        start = time.perf_counter()
+        fallback = None
+        try:
+            try:
+                records = self.sources[dataset]()
+            except SnapshotFallback as e:
+                fallback, records = e, e.records
+                if time.monotonic() - e.loaded >= (self.cache_minutes + self.max_stale_minutes) * 60:
+                    raise e.error
+            fingerprint = records_fingerprint(records)
+            previous = self._entries.get(dataset)
+            if previous is not None and previous["index"].fingerprint == fingerprint:
+                index = previous["index"]
+            else:
+                index = DatasetIndex(dataset, prepare_records(dataset, records, self.citations),
+                                     previous=previous["index"] if previous else None)
+                index.fingerprint = fingerprint
+                index.modified = time.time()
+        except Exception as e:
+            self._errors[dataset] = f"{type(e).__name__}: {e}"
+            self.metrics.observe("sesg_upstream_fetch_duration_seconds", time.perf_counter() - start,
+                                 {"dataset": dataset, "outcome": "error"})
+            self.metrics.inc("sesg_upstream_fetch_failures_total", {"dataset": dataset})
+            raise ApiError(502, f"Fetching {dataset} from Google Sheets failed: {e}")
+        if fallback is not None:
+            self._errors[dataset] = f"{type(fallback.error).__name__}: {fallback.error}"
+            self.metrics.observe("sesg_upstream_fetch_duration_seconds", time.perf_counter() - start,
+                                 {"dataset": dataset, "outcome": "fallback"})
+            self.metrics.inc("sesg_upstream_fetch_failures_total", {"dataset": dataset})
+            return {"index": index, "loaded": fallback.loaded,
+                    "fetched_at": datetime.fromtimestamp(fallback.fetched_at),
+                    "refresh_seconds": time.perf_counter() - start}
+        self._errors.pop(dataset, None)
+        self.metrics.observe("sesg_upstream_fetch_duration_seconds", time.perf_counter() - start,
+                             {"dataset": dataset, "outcome": "ok"})
+        return {"index": index, "loaded": time.monotonic(), "fetched_at": datetime.now(),
+                "refresh_seconds": time.perf_counter() - start}
+
+    def _load(self, dataset, generation=None):
+        """Fetch a dataset through its single flight: concurrent misses and refreshes share one upstream call"""
+        if generation is None:
+            with self._lock:
+                generation = self._generation
+        return self.flights.do(dataset, lambda: self._fetch_and_store(dataset, generation), token=generation)
+
+    def _fetch_and_store(self, dataset, generation):
+        entry = self._entries.get(dataset)
+        if entry is not None and time.monotonic() - entry["loaded"] < self.cache_minutes * 60:
+            return entry["index"]  # a flight that just landed already refreshed it
+        entry = self._fetch(dataset)
+        with self._lock:
+            if generation == self._generation:  # not when the cache was cleared meanwhile
+                self._store(dataset, entry)
+        return entry["index"]
+
+    def _store(self, dataset, entry):
+        """Install a freshly fetched entry (lock held) and drop responses rendered from the old one"""
+        current = self._entries.get(dataset)
+        if current is not None and current["index"] is entry["index"]:
+            self._entries[dataset] = entry  # unchanged upstream: only the fetch time moves
+            return entry
+        self._version += 1
+        entry["index"].version = self._version
+        self._entries[dataset] = entry
+        self.results.invalidate(dataset, version=self._version)
+        return entry
+
+    def _refresh_in_background(self, dataset):
+        with self._lock:
+            if dataset in self._refreshing:
+                return
+            self._refreshing.add(dataset)
+            generation = self._generation
+        threading.Thread(target=self._refresh, args=(dataset, generation), name=f"refresh-{dataset}", daemon=True).start()
+
+    def _refresh(self, dataset, generation):
+        try:
+            self._load(dataset, generation)
+        except ApiError:
+            pass  # keep serving the stale copy until max_stale_minutes runs out
+        finally:
+            with self._lock:
+                self._refreshing.discard(dataset)
+
+    def list_response(self, dataset, params, if_none_match=None, if_modified_since=None):
+        """Representation of a list response, from the result cache when possible
+
+        The query is validated first, so an invalid one is a 400 whatever its
+        validators say; then NotModified is raised, before anything is
+        rendered, when the request's If-None-Match (or, without one,
+        If-Modified-Since) shows the client already holds the current response.
+        """
+        index = self.index(dataset)
+        try:
+            index.validate(params)
+        except QueryError as e:
+            raise ApiError(400, str(e))
+        etag = list_etag(index, dataset, params)
+        check_not_modified(etag, index.modified, if_none_match, if_modified_since)
+        key = self.results.key(dataset, index.version, params)
+        response = self.results.get(key)
+        if response is None:
+            try:
+                body = json.dumps(index.query(params)).encode("utf-8")
+            except QueryError as e:
+                raise ApiError(400, str(e))
+            response = self.results.put(key, Representation(body, etag, index.modified))
+        return response
+
+    def export(self, dataset, params):
+        """(content type, row count, bytes chunks) streaming every row matching the list filters"""
+        format = params.get("format") or "ndjson"
+        if format not in FORMATS:
+            raise ApiError(400, f"format must be one of {', '.join(FORMATS)}")
+        index = self.index(dataset)
+        try:
+            total, rows = index.select(params)
+        except QueryError as e:
+            raise ApiError(400, str(e))
+        return FORMATS[format], total, export_chunks(rows, format, columns=index.fields)
+
+    def detail_response(self, dataset, item_id, if_none_match=None, if_modified_since=None):
+        """Representation of one item by id, with its post body rendered to content_html"""
+        index = self.index(dataset)
+        row = index.positions.get(item_id)
+        if row is None:
+            raise ApiError(404, DETAILS[dataset])
+        etag = f"{index.fingerprint[:16]}-{hashlib.sha1(item_id.encode()).hexdigest()[:16]}"
+        check_not_modified(etag, index.modified, if_none_match, if_modified_since)
+        key = (dataset, index.version, ("id", item_id))
+        response = self.results.get(key)
+        if response is None:
+            html, toc = self.blog.render(index.records[row], KINDS[dataset])
+            item = dict(index.records[row], content_html=html, table_of_contents=toc)
+            response = self.results.put(key, Representation(json.dumps(item).encode("utf-8"), etag, index.modified))
+        return response
+
+    def research_stats(self, if_none_match=None, if_modified_since=None):
+        """Materialized home page counters, recomputed only when a dataset version changes"""
+        indexes = {dataset: self.index(dataset) for dataset in RESOURCES.values() if dataset in self.sources}
+        versions = tuple((dataset, index.version) for dataset, index in indexes.items())
+        summary = self._summary
+        if summary is None or summary[0] != versions:
+            content = hashlib.sha1(repr([(d, i.fingerprint) for d, i in indexes.items()]).encode()).hexdigest()
+            modified = max((i.modified for i in indexes.values() if i.modified is not None), default=None)
+            body = json.dumps(research_summary(indexes)).encode("utf-8")
+            response = Representation(body, f"stats-{content[:16]}", modified,
+                                      cache_control=f"public, max-age={int(self.cache_minutes * 60)}")
+            summary = self._summary = (versions, response)
+        response = summary[1]
+        check_not_modified(response.etag, response.last_modified, if_none_match, if_modified_since,
+                           response.cache_control)
+        return response
+
+    def get(self, parts, params, if_none_match=None, if_modified_since=None):
+        """Payload of a GET route below /api (path segments `parts`): a Representation or a JSON-able dict"""
+        if not parts:
+            return {"message": "SESG Research API", "status": "running"}
+        if len(parts) == 1 and parts[0] in RESOURCES:
+            return self.list_response(RESOURCES[parts[0]], params, if_none_match, if_modified_since)
+        if len(parts) == 2 and RESOURCES.get(parts[0]) in DETAILS:
+            return self.detail_response(RESOURCES[parts[0]], parts[1], if_none_match, if_modified_since)
+        if parts == ["research-stats"]:
+            return self.research_stats(if_none_match, if_modified_since)
+        if parts == ["cache-status"]:
+            return self.cache_status()
+        if parts == ["metrics"]:
+            return self.metrics_text()
+        raise ApiError(404, "Not Found")
+
+    def _sub_query(self, query, log_error=_log_to_stderr):
+        """(status, JSON body bytes) of one batch sub-query"""
+        try:
+            if query["parts"][1:] == ["export"] or query["parts"] == ["metrics"]:
+                raise ApiError(400, f"{route_of(query['parts'])} cannot be batched")
+            payload = self.get(query["parts"], query["params"])
+        except ApiError as e:
+            return e.code, json.dumps({"detail": e.detail}).encode("utf-8")
+        except Exception:
+            # a bug in one route must not take the other sub-queries down with it
+            log_error("Unhandled error serving batch sub-query %s:\n%s", route_of(query["parts"]), traceback.format_exc())
+            return 500, json.dumps({"detail": "Internal server error"}).encode("utf-8")
+        if isinstance(payload, Representation):
+            return 200, payload.body
+        return 200, json.dumps(payload).encode("utf-8")
+
+    def batch(self, body, if_none_match=None, log_error=_log_to_stderr):
+        """Representation answering every sub-query of a batch request in one JSON body
+
+        The body is {"queries": [{"id": ..., "path": "/api/publications?featured_filter=true",
+        "params": {...}}, ...]} (or just the list); ids default to the
+        position. Sub-queries run concurrently and are answered from the
+        result cache like the GET routes they name, their cached bodies
+        spliced in unchanged: {"results": [{"id", "status", "body"}, ...]}.
+        A failing sub-query gets its own status and {"detail"} body; an
+        unexpected exception is a 500 reported through `log_error` (the
+        handler passes its own, so it lands in the server's error log).
+        """
+        try:
+            queries = json.loads(body or b"null")
+        except ValueError:
+            raise ApiError(400, "Batch body must be JSON")
+        if isinstance(queries, dict):
+            queries = queries.get("queries")
+        if not isinstance(queries, list) or not queries:
+            raise ApiError(400, "Batch body must list its queries")
+        if len(queries) > BATCH_LIMIT:
+            raise ApiError(400, f"At most {BATCH_LIMIT} queries per batch")
+        parsed = []
+        for position, query in enumerate(queries):
+            if isinstance(query, str):
+                query = {"path": query}
+            if not isinstance(query, dict) or not isinstance(query.get("path"), str) \
+                    or not isinstance(query.get("params", {}), dict):
+                raise ApiError(400, f"Query {position} needs a path and optional params object")
+            url = urlparse(query["path"])
+            path = unquote(url.path)
+            if path == "/api" or path.startswith("/api/"):
+                path = path[len("/api"):]
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            params.update({key: str(value) for key, value in query.get("params", {}).items() if value is not None})
+            parsed.append({"id": query.get("id", position), "parts": [p for p in path.split("/") if p],
+                           "params": params})
+
+        if len(parsed) == 1:
+            answers = [self._sub_query(parsed[0], log_error)]
+        else:
+            with self._lock:
+                if self._batch_pool is None:
+                    self._batch_pool = ThreadPoolExecutor(BATCH_WORKERS, thread_name_prefix="batch")
+            answers = list(self._batch_pool.map(self._sub_query, parsed, [log_error] * len(parsed)))
+
+        parts = []
+        for query, (status, answer) in zip(parsed, answers):
+            parts.append(b'{"id": %s, "status": %d, "body": %s}' % (json.dumps(query["id"]).encode("utf-8"),
+                                                                   status, answer))
+        combined = b'{"results": [' + b", ".join(parts) + b"]}"
+        etag = "batch-" + hashlib.sha1(combined).hexdigest()[:32]
+        if if_none_match and etag_matches(if_none_match, etag):
+            # a POST is not answered with 304: a matching If-None-Match fails the precondition
+            raise ApiError(412, "Precondition Failed")
+        return Representation(combined, etag, None)
+
+    def cache_status(self):
+        now = time.monotonic()
+        with self._lock:
+            entries = dict(self._entries)
+            refreshing = set(self._refreshing)
+            counters = {name: dict(c) for name, c in self._counters.items()}
+        details = {}
+        for name, entry in entries.items():
+            age = now - entry["loaded"]
+            details[name] = {
+                "age_seconds": round(age, 3),
+                "state": "fresh" if age < self.cache_minutes * 60 else "stale",
+                "refresh_in_flight": name in refreshing,
+                "last_refresh_seconds": round(entry["refresh_seconds"], 4),
+                "last_error": self._errors.get(name),
+                "rows": len(entry["index"]),
+            }
+        return {
+            "cached_items": len(entries),
+            "last_fetch_times": {name: entry["fetched_at"].isoformat() for name, entry in entries.items()},
+            "cache_duration_minutes": self.cache_minutes,
+            "max_stale_minutes": self.max_stale_minutes,
+            "cache_hits": sum(c["hits"] for c in counters.values()),
+            "cache_misses": sum(c["misses"] for c in counters.values()),
+            "stale_hits": sum(c["stale"] for c in counters.values()),
+            "entries": details,
+            "counters": counters,
+            "response_cache": self.results.stats(),
+            "citations": self.citations.stats(),
+            "upstream": self.flights.stats(),
+            "blog": self.blog.stats(),
+            "upstream_client": self.upstream.stats() if self.upstream is not None else None,
+        }
+
+    def metrics_text(self):
+        """Prometheus text exposition of the metrics, cache and upstream counters refreshed first"""
+        status = self.cache_status()
+        metrics = self.metrics
+        for dataset, counters in status["counters"].items():
+            for counter, result in (("hits", "hit"), ("misses", "miss"), ("stale", "stale")):
+                metrics.set("sesg_dataset_cache_total", counters[counter], {"dataset": dataset, "result": result})
+        metrics.reset("sesg_dataset_rows")
+        metrics.reset("sesg_dataset_age_seconds")
+        for dataset, entry in status["entries"].items():
+            metrics.set("sesg_dataset_rows", entry["rows"], {"dataset": dataset})
+            metrics.set("sesg_dataset_age_seconds", entry["age_seconds"], {"dataset": dataset})
+        responses = status["response_cache"]
+        for counter, event in (("hits", "hit"), ("misses", "miss"), ("evictions", "eviction"),
+                               ("invalidations", "invalidation")):
+            metrics.set("sesg_response_cache_total", responses[counter], {"event": event})
+        metrics.set("sesg_response_cache_bytes", responses["bytes"])
+        for dataset, flight in status["upstream"].items():
+            metrics.set("sesg_upstream_coalesced_total", flight["coalesced"], {"dataset": dataset})
+            metrics.set("sesg_upstream_in_flight", flight["in_flight"], {"dataset": dataset})
+        if status["upstream_client"] is not None:
+            for host, counts in status["upstream_client"]["connections"].get("hosts", {}).items():
+                metrics.set("sesg_upstream_connections_opened_total", counts["connections_opened"], {"host": host})
+                metrics.set("sesg_upstream_connections_reused_total", counts["connections_reused"], {"host": host})
+        return metrics.render()
+
+    def clear_cache(self):
+        with self._lock:
+            cleared = len(self._entries)
+            self._entries.clear()
+            self._generation += 1
+            self.results.clear(floor=self._version + 1)
+        return {"message": "Cache cleared successfully", "cleared_items": cleared}
+
+
+# =================== HTTP SERVER ===================
+
+class _Stream:
+    def __init__(self, content_type, chunks, filename, total):
+        self.content_type = content_type
+        self.chunks = chunks
+        self.filename = filename
+        self.total = total
+
+
+class _ApiHandler(StandInHandler):
+    server_version = "SESGApiStandIn/1.0"
+
+    def log_error(self, format, *args):
+        BaseHTTPRequestHandler.log_message(self, format, *args)  # reported even when not verbose
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def _send_json(self, status, payload):
+        self._send_body(status, json.dumps(payload).encode("utf-8"))
+
+    def _send_body(self, status, body, headers=(), content_type="application/json"):
+        self._sent_bytes = len(body) if self.command != "HEAD" else 0
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _validators(self, etag, last_modified, cache_control="no-cache"):
+        headers = [("ETag", etag), ("Cache-Control", cache_control), ("Vary", "Accept-Encoding"),
+                   ("Access-Control-Expose-Headers", "ETag, Last-Modified")]
+        if last_modified is not None:
+            headers.append(("Last-Modified", formatdate(last_modified, usegmt=True)))
+        return headers
+
+    def _send_representation(self, response):
+        coding, body = response.select(self.headers.get("Accept-Encoding"))
+        headers = self._validators(response.etag_for(coding), response.last_modified, response.cache_control)
+        if coding != "identity":
+            headers.append(("Content-Encoding", coding))
+        self._send_body(200, body, headers)
+
+    def _send_stream(self, stream):
+        """Chunked response written as the chunks are produced"""
+        self.send_response(200)
+        self.send_header("Content-Type", stream.content_type)
+        self.send_header("Content-Disposition", f'attachment; filename="{stream.filename}"')
+        self.send_header("X-Total-Count", str(stream.total))
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "X-Total-Count")
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        try:
+            for chunk in stream.chunks:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self._sent_bytes += len(chunk)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # the client stopped reading
+
+    def _send_not_modified(self, etag, last_modified, cache_control):
+        self.send_response(304)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in self._validators(etag, last_modified, cache_control):
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _dispatch(self, method, parts, params, body=None):
+        backend = self.server.backend
+        if method == "GET":
+            if len(parts) == 2 and parts[0] in RESOURCES and parts[1] == "export":
+                dataset = RESOURCES[parts[0]]
+                content_type, total, chunks = backend.export(dataset, params)
+                return _Stream(content_type, chunks, f"{dataset}.{params.get('format') or 'ndjson'}", total)
+            return backend.get(parts, params, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since"))
+        if parts == ["batch"] and method == "POST":
+            return backend.batch(body, self.headers.get("If-None-Match"), self.log_error)
+        if parts == ["clear-cache"] and method == "POST":
+            return backend.clear_cache()
+        raise ApiError(404, "Not Found")
+
+    def _handle(self, method, body=None):
+        """Serve one request, recording its route's request count, latency, size and in-flight gauge"""
+        start = time.perf_counter()
+        parsed = urlparse(self.path)
+        path = unquote(parsed.path)
+        parts = None  # outside /api
+        if path == "/api" or path.startswith("/api/"):
+            parts = [p for p in path[len("/api"):].split("/") if p]
+        route = route_of(parts)
+        metrics = self.server.backend.metrics
+        self._status, self._sent_bytes = 0, 0
+        metrics.inc("sesg_http_requests_in_flight", {"route": route})
+        try:
+            self.server.inject_latency()
+            self._respond(method, parts, parsed.query, body)
+        finally:
+            metrics.inc("sesg_http_requests_in_flight", {"route": route}, -1)
+            labels = {"method": self.command, "route": route}
+            metrics.inc("sesg_http_requests_total", {**labels, "status": str(self._status)})
+            metrics.observe("sesg_http_request_duration_seconds", time.perf_counter() - start, labels)
+            metrics.observe("sesg_http_response_size_bytes", self._sent_bytes, labels)
+
+    def _respond(self, method, parts, query, body):
+        try:
+            if parts is None:
+                raise ApiError(404, "Not Found")
+            params = {key: values[0] for key, values in parse_qs(query).items()}
+            status, payload = 200, self._dispatch(method, parts, params, body)
+        except NotModified as e:
+            self._send_not_modified(e.etag, e.last_modified, e.cache_control)
+            return
+        except ApiError as e:
+            status, payload = e.code, {"detail": e.detail}
+        except Exception:
+            self.log_error("Unhandled error serving %s:\n%s", self.path, traceback.format_exc())
+            status, payload = 500, {"detail": "Internal server error"}
+        if isinstance(payload, _Stream):
+            self._send_stream(payload)
+        elif isinstance(payload, Representation):
+            self._send_representation(payload)
+        elif isinstance(payload, str):
+            self._send_body(status, payload.encode("utf-8"), [("Cache-Control", "no-cache")], CONTENT_TYPE)
+        else:
+            self._send_json(status, payload)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_HEAD(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self._handle("POST", self.rfile.read(length) if length else b"")
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, HEAD, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class _ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, backend, latency, verbose):
+        super().__init__(address, _ApiHandler)
+        self.backend = backend
+        self.latency = latency
+        self.verbose = verbose
+
+    def inject_latency(self):
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+
+class ApiStandIn:
+    """Background-thread server implementing the /api/* contract
+
+    Datasets come from `sources` (dataset -> callable returning records) or,
+    when omitted, from the Apps Script `urls` (default: config.api_urls())
+    through an UpstreamClient (or the given `upstream`) sharing the API's
+    metrics.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, sources=None, urls=None, cache_minutes=DEFAULT_CACHE_MINUTES,
+                 max_stale_minutes=0, result_cache_bytes=DEFAULT_MAX_BYTES, latency=0.0, verbose=False,
+                 upstream=None):
+        metrics = upstream.metrics if upstream is not None else Metrics()
+        if sources is None and upstream is None:
+            upstream = UpstreamClient(DEFAULT_UPSTREAM_TIMEOUT, metrics=metrics)
+        if sources is None:
+            sources = upstream_sources(urls, upstream=upstream)
+        self.upstream = upstream
+        self.backend = ApiBackend(sources, cache_minutes, max_stale_minutes, result_cache_bytes, metrics, upstream)
+        self._address = (host, port)
+        self.latency = latency
+        self.verbose = verbose
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.base_url}/api"
+
+    def environ(self):
+        """REACT_APP_BACKEND_URL pointing the scripts at this server"""
+        return {"REACT_APP_BACKEND_URL": self.base_url}
+
+    def start(self):
+        if self._server is None:
+            self._server = _ApiServer(self._address, self.backend, self.latency, self.verbose)
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(0.1,), name="api-stand-in", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+        if self.upstream is not None:
+            self.upstream.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.api", description="Run the /api/* backend stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--cache-minutes", type=float, default=DEFAULT_CACHE_MINUTES)
+    parser.add_argument("--max-stale-minutes", type=float, default=0,
+                        help="Serve expired datasets this much longer while they refresh in the background")
+    parser.add_argument("--result-cache-mb", type=float, default=DEFAULT_MAX_BYTES / 2 ** 20,
+                        help="Memory budget of the rendered list response cache")
+    parser.add_argument("--sheets", action="store_true", help="Serve the datasets from a local Apps Script stand-in")
+    parser.add_argument("--sheets-multiplier", type=int, default=1, help="Repeat every stand-in dataset N times")
+    args = parser.parse_args(argv)
+
+    services, urls = [], None
+    if args.sheets:
+        from harness.sheets import SheetsStandIn
+
+        sheets = SheetsStandIn(multiplier=args.sheets_multiplier).start()
+        services.append(sheets)
+        urls = sheets.urls()
+        print(f"📊 Apps Script stand-in at {sheets.base_url}")
+    api = ApiStandIn(args.host, args.port, urls=urls, cache_minutes=args.cache_minutes,
+                     max_stale_minutes=args.max_stale_minutes,
+                     result_cache_bytes=int(args.result_cache_mb * 2 ** 20), verbose=True).start()
+    services.append(api)
+    print(f"🧪 API stand-in listening at {api.api_url}")
+    print(f"   export REACT_APP_BACKEND_URL='{api.base_url}'")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        for service in reversed(services):
+            service.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    main()
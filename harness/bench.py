@@ -0,0 +1,260 @@
+"""
+Benchmark suite for the /api/publications cache
+
+Replaces the "clear the cache, time a few GETs, print an improvement %" check
+with a repeatable benchmark: warmup iterations, many samples, cold-vs-warm
+comparison with 95% confidence intervals, JSON baselines stored on disk and a
+regression gate that fails when warm latency or the cache hit ratio gets
+worse than the stored baseline by more than a configurable margin.
+
+Cold samples clear the cache (POST /api/clear-cache) before every timed GET;
+warm samples run back to back after the warmup. The hit ratio comes from the
+backend's cache counters (cache_hits / cache_misses in /api/cache-status)
+when it reports them, otherwise a warm sample counts as a hit when it is
+faster than half the cold median.
+
+Usage:
+    python -m harness.bench http://127.0.0.1:8001/api --samples 100 --save-baseline
+    python -m harness.bench http://127.0.0.1:8001/api --latency-margin 0.15   # exit 1 on regression
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from harness.client import http
+
+DEFAULT_BASELINE_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / "baselines"
+DEFAULT_LATENCY_MARGIN = 0.20
+DEFAULT_HIT_RATIO_MARGIN = 0.05
+
+# Two-sided 95% Student t critical values by degrees of freedom; 1.96 beyond 30
+_T95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+    16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074,
+    23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
+
+
+class BenchmarkError(Exception):
+    """The benchmarked endpoint returned an error instead of a measurable response"""
+
+
+def summarize(samples):
+    """Mean, spread, percentiles and 95% confidence interval of the mean (seconds)"""
+    if not samples:
+        raise ValueError("No samples to summarize")
+    ordered = sorted(samples)
+    n = len(ordered)
+    mean = statistics.fmean(ordered)
+    stdev = statistics.stdev(ordered) if n > 1 else 0.0
+    half_width = _T95.get(n - 1, 1.96) * stdev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        "samples": n,
+        "mean": mean,
+        "stdev": stdev,
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[max(0, math.ceil(0.95 * n) - 1)],
+        "max": ordered[-1],
+        "ci95": [mean - half_width, mean + half_width],
+    }
+
+
+def measure(fn, samples, warmup=0):
+    """Call fn() `warmup` times untimed, then `samples` times timed; returns durations in seconds"""
+    for _ in range(warmup):
+        fn()
+    durations = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _cache_counters(api_base_url):
+    try:
+        status = http.get(f"{api_base_url}/cache-status", timeout=10).json()
+    except (ValueError, OSError):
+        return None
+    hits = status.get("cache_hits", status.get("hits"))
+    misses = status.get("cache_misses", status.get("misses"))
+    if hits is None or misses is None:
+        return None
+    return hits, misses
+
+
+def benchmark_publications_cache(api_base_url, samples=50, warmup=5, cold_samples=5, params=None, timeout=20):
+    """Cold-vs-warm benchmark of GET {api_base_url}/publications"""
+    url = f"{api_base_url}/publications"
+
+    def fetch():
+        response = http.get(url, params=params, timeout=timeout)
+        if response.status_code != 200:
+            raise BenchmarkError(f"GET {url} returned {response.status_code}")
+        return response
+
+    def clear():
+        response = http.post(f"{api_base_url}/clear-cache", timeout=10)
+        if response.status_code != 200:
+            raise BenchmarkError(f"POST /clear-cache returned {response.status_code}")
+
+    cold = []
+    for _ in range(cold_samples):
+        clear()
+        cold += measure(fetch, 1)
+
+    counters_before = _cache_counters(api_base_url)
+    warm = measure(fetch, samples, warmup)
+    counters_after = _cache_counters(api_base_url)
+
+    cold_stats = summarize(cold) if cold else None
+    warm_stats = summarize(warm)
+    if counters_before and counters_after:
+        hits = counters_after[0] - counters_before[0]
+        lookups = hits + counters_after[1] - counters_before[1]
+        hit_ratio, hit_ratio_source = (hits / lookups if lookups else 0.0), "server"
+    elif cold_stats:
+        threshold = cold_stats["median"] / 2
+        hit_ratio, hit_ratio_source = sum(1 for d in warm if d < threshold) / len(warm), "latency"
+    else:
+        hit_ratio, hit_ratio_source = None, None
+
+    return {
+        "benchmark": "publications_cache",
+        "url": url,
+        "params": params or {},
+        "recorded_at": datetime.now().isoformat(),
+        "warmup": warmup,
+        "cold": cold_stats,
+        "warm": warm_stats,
+        "speedup": cold_stats["median"] / warm_stats["median"] if cold_stats and warm_stats["median"] else None,
+        "hit_ratio": hit_ratio,
+        "hit_ratio_source": hit_ratio_source,
+    }
+
+
+class BaselineStore:
+    """JSON benchmark baselines, one file per benchmark name"""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else DEFAULT_BASELINE_DIR
+
+    def path_for(self, name):
+        return self.directory / f"{name}.json"
+
+    def load(self, name):
+        try:
+            with open(self.path_for(name), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, name, result):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.path_for(name), "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        return self.path_for(name)
+
+
+def check_regression(result, baseline, latency_margin=DEFAULT_LATENCY_MARGIN, hit_ratio_margin=DEFAULT_HIT_RATIO_MARGIN):
+    """Return a list of human-readable regressions of `result` against `baseline`
+
+    Warm latency regresses when the median or p95 exceeds the baseline by more
+    than `latency_margin` (a fraction) and the confidence intervals of the
+    means do not overlap, so run-to-run noise alone cannot fail the gate. The
+    hit ratio regresses when it drops more than `hit_ratio_margin` (absolute).
+    """
+    regressions = []
+    warm, base = result["warm"], baseline["warm"]
+    separated = warm["ci95"][0] > base["ci95"][1]
+    for metric in ("median", "p95"):
+        limit = base[metric] * (1 + latency_margin)
+        if warm[metric] > limit and separated:
+            regressions.append(
+                f"warm {metric} {warm[metric] * 1000:.1f}ms > baseline {base[metric] * 1000:.1f}ms "
+                f"+{latency_margin:.0%}"
+            )
+
+    if result.get("hit_ratio") is not None and baseline.get("hit_ratio") is not None:
+        if result["hit_ratio"] < baseline["hit_ratio"] - hit_ratio_margin:
+            regressions.append(
+                f"hit ratio {result['hit_ratio']:.1%} < baseline {baseline['hit_ratio']:.1%} "
+                f"-{hit_ratio_margin:.0%}"
+            )
+    return regressions
+
+
+def format_result(result):
+    """Human-readable summary of a benchmark result"""
+    def line(label, stats):
+        low, high = stats["ci95"]
+        return (f"   {label}: median {stats['median'] * 1000:.1f}ms, mean {stats['mean'] * 1000:.1f}ms "
+                f"(95% CI {low * 1000:.1f}-{high * 1000:.1f}ms), p95 {stats['p95'] * 1000:.1f}ms, "
+                f"n={stats['samples']}")
+
+    lines = [f"📊 {result['benchmark']} - {result['url']}"]
+    if result["cold"]:
+        lines.append(line("Cold", result["cold"]))
+    lines.append(line("Warm", result["warm"]))
+    if result["speedup"]:
+        lines.append(f"🚀 Warm is {result['speedup']:.1f}x faster than cold")
+    if result["hit_ratio"] is not None:
+        lines.append(f"🎯 Cache hit ratio: {result['hit_ratio']:.1%} ({result['hit_ratio_source']})")
+    return "\n".join(lines)
+
+
+def run_gate(result, store, save_baseline=False, latency_margin=DEFAULT_LATENCY_MARGIN,
+             hit_ratio_margin=DEFAULT_HIT_RATIO_MARGIN):
+    """Compare against (or record) the stored baseline; returns the list of regressions"""
+    name = result["benchmark"]
+    if save_baseline:
+        print(f"📄 Baseline written to {store.save(name, result)}")
+        return []
+    baseline = store.load(name)
+    if baseline is None:
+        print(f"⚠️  No baseline for {name} in {store.directory}; run with --save-baseline to record one")
+        return []
+    regressions = check_regression(result, baseline, latency_margin, hit_ratio_margin)
+    for regression in regressions:
+        print(f"❌ Regression: {regression}")
+    if not regressions:
+        print(f"✅ Within {latency_margin:.0%} latency / {hit_ratio_margin:.0%} hit ratio of baseline "
+              f"recorded {baseline.get('recorded_at', 'unknown')}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.bench", description="Benchmark the publications cache")
+    parser.add_argument("api_base_url", help="Backend API base, e.g. http://127.0.0.1:8001/api")
+    parser.add_argument("--samples", type=int, default=50, help="Timed warm requests")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed warm requests before sampling")
+    parser.add_argument("--cold-samples", type=int, default=5, help="Timed requests right after a cache clear")
+    parser.add_argument("--baseline-dir", default=None, help="Directory of JSON baselines (default: benchmarks/baselines)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--latency-margin", type=float, default=DEFAULT_LATENCY_MARGIN,
+                        help="Allowed warm latency increase as a fraction (default 0.20)")
+    parser.add_argument("--hit-ratio-margin", type=float, default=DEFAULT_HIT_RATIO_MARGIN,
+                        help="Allowed absolute hit ratio drop (default 0.05)")
+    parser.add_argument("--json", dest="json_path", help="Also write the result to this file")
+    args = parser.parse_args(argv)
+
+    result = benchmark_publications_cache(args.api_base_url.rstrip("/"), args.samples, args.warmup, args.cold_samples)
+    print(format_result(result))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    regressions = run_gate(result, BaselineStore(args.baseline_dir), args.save_baseline,
+                           args.latency_margin, args.hit_ratio_margin)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Server-side rendering of news and achievement posts
+
+Opening a post used to fetch the item and then run generateAdvancedBlogContent
+(frontend/src/utils/blogGenerator.js) in the browser, whose parseDescription
+turns the sheet's description / full_content text into HTML: headings, lists,
+quotes, info and warning boxes, code and $$ math blocks, tables, inline
+formatting and embedded videos. render_content is a straight port of
+parseDescription, producing the same markup, and also collects the headings
+for the table of contents the page used to build after load.
+
+BlogRenderer memoizes rendered posts by a hash of their content and theme, so
+each distinct post body is parsed once no matter how often it is opened or
+how many times its dataset is refreshed.
+
+Usage:
+    renderer = BlogRenderer()
+    html, toc = renderer.render(item, "news")   # toc: [{"level": 2, "text": "Highlights"}, ...]
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 4096
+
+# dataset -> the `type` argument generateAdvancedBlogContent is called with
+KINDS = {"news_events": "news", "achievements": "achievement"}
+
+_YOUTUBE = re.compile(r"(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]+)")
+_VIDEO_FILE = re.compile(r"\.(mp4|avi|mov|wmv|flv|webm)$", re.IGNORECASE)
+_NUMBERED = re.compile(r"^(\d+)\.\s")
+_SEPARATOR_CELL = re.compile(r"^:?-+:?$")
+
+_GREEK = "αβγδεθλμπστω"
+_MATH_OPERATORS = [
+    ("≤", '<span class="text-red-600 font-bold">≤</span>'),
+    ("≥", '<span class="text-red-600 font-bold">≥</span>'),
+    ("∑", '<span class="text-purple-600 font-bold text-xl">∑</span>'),
+    ("∫", '<span class="text-purple-600 font-bold text-xl">∫</span>'),
+    ("√", '<span class="text-green-600 font-bold">√</span>'),
+    ("∞", '<span class="text-indigo-600 font-bold">∞</span>'),
+]
+# JavaScript's \w is ASCII only
+_SCRIPTS = [
+    (re.compile(r"(\w+)_\{([^}]+)\}", re.ASCII), r'\1<sub class="text-sm">\2</sub>'),
+    (re.compile(r"(\w+)_(\w+)", re.ASCII), r'\1<sub class="text-sm">\2</sub>'),
+    (re.compile(r"(\w+)\^\{([^}]+)\}", re.ASCII), r'\1<sup class="text-sm">\2</sup>'),
+    (re.compile(r"(\w+)\^(\w+)", re.ASCII), r'\1<sup class="text-sm">\2</sup>'),
+]
+
+_YOUTUBE_ICON = ("M23.498 6.186a3.016 3.016 0 0 0-2.122-2.136C19.505 3.545 12 3.545 12 3.545s-7.505 0-9.377.505A3.017 "
+                 "3.017 0 0 0 .502 6.186C0 8.07 0 12 0 12s0 3.93.502 5.814a3.016 3.016 0 0 0 2.122 2.136c1.871.505 "
+                 "9.376.505 9.376.505s7.505 0 9.377-.505a3.015 3.015 0 0 0 2.122-2.136C24 15.93 24 12 24 12s0-3.93-.502"
+                 "-5.814zM9.545 15.568V8.432L15.818 12l-6.273 3.568z")
+_QUOTE_ICON = ("M14.017 21v-7.391c0-5.704 3.731-9.57 8.983-10.609l.995 2.151c-2.432.917-3.995 3.638-3.995 5.849h4v10h"
+               "-9.983zm-14.017 0v-7.391c0-5.704 3.748-9.57 9-10.609l.996 2.151c-2.433.917-3.996 3.638-3.996 5.849h4v10h-10z")
+
+
+def _math_line(line):
+    for letter in _GREEK:
+        line = line.replace(letter, f'<span class="text-blue-600 font-semibold">{letter}</span>')
+    for pattern, replacement in _SCRIPTS:
+        line = pattern.sub(replacement, line)
+    for operator, replacement in _MATH_OPERATORS:
+        line = line.replace(operator, replacement)
+    return line
+
+
+def _inline(text, theme):
+    text = re.sub(r"\*\*(.*?)\*\*", r'<strong class="font-semibold text-gray-900">\1</strong>', text)
+    text = re.sub(r"\*(.*?)\*", r'<em class="italic text-gray-700">\1</em>', text)
+    text = re.sub(r"`([^`]+)`", r'<code class="bg-gray-100 text-gray-800 px-2 py-1 rounded text-sm font-mono">\1</code>', text)
+    text = re.sub(r"\$([^$]+)\$", rf'<span class="bg-{theme}-50 text-{theme}-800 px-2 py-1 rounded font-mono">\1</span>', text)
+    return re.sub(r"\[([^\]]+)\]\(([^)]+)\)",
+                  rf'<a href="\2" target="_blank" class="text-{theme}-600 hover:text-{theme}-800 underline '
+                  rf'hover:bg-{theme}-50 px-1 py-0.5 rounded transition-colors">\1 ↗</a>', text)
+
+
+def render_table(rows):
+    """processTable: pipe-delimited rows as an HTML table (the first row is the header)"""
+    if not rows:
+        return ""
+    html = ('<div class="overflow-x-auto my-8"><table class="min-w-full bg-white border border-gray-200 '
+            'rounded-lg overflow-hidden shadow-sm">')
+    for position, row in enumerate(rows):
+        cells = row.split("|")[1:-1]
+        if position == 0:
+            html += '<thead class="bg-gray-50"><tr>'
+            for cell in cells:
+                html += (f'<th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider '
+                         f'border-b border-gray-200">{cell.strip()}</th>')
+            html += '</tr></thead><tbody class="bg-white divide-y divide-gray-200">'
+        elif position == 1 and all(_SEPARATOR_CELL.match(cell) for cell in cells):
+            continue
+        else:
+            html += '<tr class="hover:bg-gray-50">'
+            for cell in cells:
+                html += f'<td class="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{cell.strip()}</td>'
+            html += "</tr>"
+    return html + "</tbody></table></div>"
+
+
+def render_content(description, kind="news"):
+    """(html, headings) of a post body, as parseDescription renders it for generateAdvancedBlogContent"""
+    if not description:
+        return "", []
+    theme = "emerald" if kind == "achievement" else "blue"
+    quote = "emerald" if kind == "achievement" else "indigo"
+    result = []
+    headings = []
+    in_list = in_ordered_list = in_code = in_math = in_table = False
+    table_rows = []
+
+    for line in description.split("\n"):
+        trimmed = line.strip()
+        if not trimmed and (in_code or in_math or in_table):
+            continue
+
+        if trimmed.startswith("```"):
+            if not in_code:
+                language = trimmed[3:] or "text"
+                in_code = True
+                result.append(f"""<div class="bg-gray-900 rounded-lg p-6 my-6 overflow-x-auto">
+            <div class="flex items-center justify-between mb-3">
+              <span class="text-xs text-gray-400 uppercase tracking-wider">{language}</span>
+              <button onclick="navigator.clipboard.writeText(this.parentElement.nextElementSibling.textContent)" class="text-xs text-gray-400 hover:text-white px-2 py-1 rounded border border-gray-600 hover:border-gray-400">Copy</button>
+            </div>
+            <pre class="text-green-400 text-sm leading-relaxed"><code>""")
+            else:
+                in_code = False
+                result.append("</code></pre></div>")
+            continue
+
+        if trimmed == "$$":
+            if not in_math:
+                in_math = True
+                result.append(f"""<div class="bg-{theme}-50 border-l-4 border-{theme}-400 p-6 my-6 rounded-r-lg">
+            <div class="flex items-center mb-3">
+              <svg class="w-5 h-5 text-{theme}-500 mr-2" fill="currentColor" viewBox="0 0 20 20">
+                <path d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"/>
+              </svg>
+              <span class="text-sm font-medium text-{theme}-800">Mathematical Formula</span>
+            </div>
+            <div class="math-formula bg-white p-4 rounded border font-mono text-lg leading-relaxed overflow-x-auto">""")
+            else:
+                in_math = False
+                result.append("</div></div>")
+            continue
+
+        if in_code:
+            result.append(line + "\n")
+            continue
+        if in_math:
+            result.append(_math_line(line) + "<br>")
+            continue
+
+        if not trimmed:
+            if in_list:
+                result.append("</ul>")
+                in_list = False
+            if in_ordered_list:
+                result.append("</ol>")
+                in_ordered_list = False
+            result.append("<br>")
+            continue
+
+        if trimmed.startswith("|") and trimmed.endswith("|"):
+            if not in_table:
+                in_table = True
+                table_rows = []
+            table_rows.append(trimmed)
+            continue
+        elif in_table:
+            result.append(render_table(table_rows))
+            in_table = False
+            table_rows = []
+
+        youtube = _YOUTUBE.search(trimmed)
+        if youtube:
+            result.append(f"""<div class="video-container my-8">
+          <div class="bg-gradient-to-r from-red-500 to-pink-500 p-4 rounded-t-lg">
+            <div class="flex items-center text-white">
+              <svg class="w-6 h-6 mr-3" fill="currentColor" viewBox="0 0 24 24">
+                <path d="{_YOUTUBE_ICON}"/>
+              </svg>
+              <span class="font-medium">Video Content</span>
+            </div>
+          </div>
+          <div class="relative pb-9/16">
+            <iframe class="absolute top-0 left-0 w-full h-64 rounded-b-lg"\x20
+              src="https://www.youtube.com/embed/{youtube.group(1)}"\x20
+              frameborder="0" allowfullscreen>
+            </iframe>
+          </div>
+        </div>""")
+            continue
+
+        if _VIDEO_FILE.search(trimmed):
+            result.append(f"""<div class="video-container my-8 bg-black rounded-lg overflow-hidden">
+          <video controls class="w-full">
+            <source src="{trimmed}" type="video/mp4">
+            Your browser does not support the video tag.
+          </video>
+        </div>""")
+            continue
+
+        if trimmed.startswith("## "):
+            headings.append({"level": 2, "text": trimmed[3:]})
+            result.append(f"""<h2 class="text-3xl font-bold text-gray-900 mt-12 mb-6 border-b-2 border-{theme}-200 pb-3 flex items-center">
+          <span class="bg-{theme}-100 text-{theme}-800 px-3 py-1 rounded-full text-lg mr-4">#</span>
+          {trimmed[3:]}
+        </h2>""")
+            continue
+        if trimmed.startswith("### "):
+            headings.append({"level": 3, "text": trimmed[4:]})
+            result.append(f"""<h3 class="text-2xl font-semibold text-gray-800 mt-10 mb-4 flex items-center">
+          <span class="w-1 h-8 bg-gradient-to-b from-{theme}-500 to-purple-500 rounded-full mr-4"></span>
+          {trimmed[4:]}
+        </h3>""")
+            continue
+        if trimmed.startswith("#### "):
+            headings.append({"level": 4, "text": trimmed[5:]})
+            result.append(f"""<h4 class="text-xl font-medium text-gray-700 mt-8 mb-3 flex items-center">
+          <span class="w-2 h-2 bg-{theme}-400 rounded-full mr-3"></span>
+          {trimmed[5:]}
+        </h4>""")
+            continue
+
+        formatted = _inline(trimmed, theme)
+
+        if trimmed.startswith("- "):
+            if not in_list:
+                result.append('<ul class="list-none space-y-3 my-6">')
+                in_list = True
+            result.append(f"""<li class="flex items-start">
+          <span class="w-2 h-2 bg-{theme}-500 rounded-full mt-3 mr-4 flex-shrink-0"></span>
+          <span class="text-gray-700 leading-relaxed">{formatted[2:]}</span>
+        </li>""")
+            continue
+
+        numbered = _NUMBERED.match(trimmed)
+        if numbered:
+            if not in_ordered_list:
+                result.append('<ol class="counter-reset list-none space-y-3 my-6">')
+                in_ordered_list = True
+            result.append(f"""<li class="flex items-start">
+          <span class="bg-{theme}-100 text-{theme}-800 w-8 h-8 rounded-full flex items-center justify-center text-sm font-semibold mr-4 flex-shrink-0 mt-0.5">{numbered.group(1)}</span>
+          <span class="text-gray-700 leading-relaxed">{_NUMBERED.sub("", formatted, count=1)}</span>
+        </li>""")
+            continue
+
+        if in_list:
+            result.append("</ul>")
+            in_list = False
+        if in_ordered_list:
+            result.append("</ol>")
+            in_ordered_list = False
+
+        if trimmed.startswith("> "):
+            result.append(f"""<blockquote class="border-l-4 border-{quote}-400 bg-gradient-to-r from-{quote}-50 to-blue-50 pl-8 pr-6 py-6 my-8 rounded-r-lg">
+          <div class="flex items-start">
+            <svg class="w-8 h-8 text-{quote}-400 mr-4 flex-shrink-0 mt-1" fill="currentColor" viewBox="0 0 24 24">
+              <path d="{_QUOTE_ICON}"/>
+            </svg>
+            <div>
+              <p class="text-lg text-{quote}-800 leading-relaxed italic font-medium">{formatted[2:]}</p>
+            </div>
+          </div>
+        </blockquote>""")
+            continue
+
+        if trimmed.startswith("[INFO]"):
+            result.append(f"""<div class="bg-{theme}-50 border border-{theme}-200 rounded-lg p-6 my-6">
+          <div class="flex items-center mb-3">
+            <svg class="w-6 h-6 text-{theme}-500 mr-3" fill="currentColor" viewBox="0 0 24 24">
+              <path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-6h2v6zm0-8h-2V7h2v2z"/>
+            </svg>
+            <span class="font-semibold text-{theme}-800">Information</span>
+          </div>
+          <p class="text-{theme}-700">{formatted[6:]}</p>
+        </div>""")
+            continue
+
+        if trimmed.startswith("[WARNING]"):
+            result.append(f"""<div class="bg-yellow-50 border border-yellow-200 rounded-lg p-6 my-6">
+          <div class="flex items-center mb-3">
+            <svg class="w-6 h-6 text-yellow-500 mr-3" fill="currentColor" viewBox="0 0 24 24">
+              <path d="M1 21h22L12 2 1 21zm12-3h-2v-2h2v2zm0-4h-2v-4h2v4z"/>
+            </svg>
+            <span class="font-semibold text-yellow-800">Warning</span>
+          </div>
+          <p class="text-yellow-700">{formatted[9:]}</p>
+        </div>""")
+            continue
+
+        result.append(f'<p class="mb-6 text-gray-700 leading-relaxed text-lg">{formatted}</p>')
+
+    if in_list:
+        result.append("</ul>")
+    if in_ordered_list:
+        result.append("</ol>")
+    if in_table:
+        result.append(render_table(table_rows))
+    return "".join(result), headings
+
+
+def content_of(item):
+    """The text generateAdvancedBlogContent renders: description, else full_content"""
+    return item.get("description") or item.get("full_content") or ""
+
+
+class BlogRenderer:
+    """LRU memo of render_content results keyed by a hash of (kind, content)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self.rendered = self.reused = 0
+
+    @staticmethod
+    def content_hash(content, kind):
+        return hashlib.sha1(f"{kind}\n{content}".encode("utf-8")).hexdigest()
+
+    def render(self, item, kind="news"):
+        """(html, table of contents) of an item's post body"""
+        content = str(content_of(item))
+        digest = self.content_hash(content, kind)
+        with self._lock:
+            cached = self._memo.get(digest)
+            if cached is not None:
+                self._memo.move_to_end(digest)
+                self.reused += 1
+                return cached
+        rendered = render_content(content, kind)
+        with self._lock:
+            self._memo[digest] = rendered
+            self.rendered += 1
+            while len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+        return rendered
+
+    def stats(self):
+        with self._lock:
+            return {"memoized": len(self._memo), "rendered": self.rendered, "reused": self.reused}
@@ -0,0 +1,277 @@
+"""
+Warm headless Chrome pool for the Selenium-based verification scripts
+
+firebase_functional_test.py launched its own Chrome for every run, and each
+UI check paid the full browser startup cost. `browsers` is a process-wide pool
+that keeps up to N headless Chrome instances warm and hands them out one
+checkout at a time. Between checkouts the browsing context is reset - extra
+windows closed, cookies cleared, localStorage / sessionStorage / IndexedDB
+wiped for every origin the pool has seen - so each check starts logged out
+with empty storage, without paying for a new browser. A browser is recycled
+(quit and relaunched on demand) after max_uses checkouts or when its reset
+fails.
+
+Configuration (environment variables, read when the pool is first used):
+    SESG_BROWSER_POOL_SIZE  browsers kept warm                    (default 2)
+    SESG_BROWSER_MAX_USES   checkouts before a browser is recycled (default 50)
+
+Selenium is optional; launching a browser without it raises BrowserUnavailable
+so scripts can fall back to plain HTTP checks.
+
+Usage:
+    from harness.browser import browsers
+
+    browsers.start()                      # launch the warm browsers in parallel
+    with browsers.session() as driver:    # isolated context, returned on exit
+        driver.get(f"{frontend_url}/admin/login")
+    print(browsers.stats())   # {"launched": 2, "checkouts": 7, "reused": 5, ...}
+"""
+
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_USES = 50
+DEFAULT_WINDOW_SIZE = "1920,1080"
+
+CHROME_ARGUMENTS = [
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--no-first-run",
+]
+
+
+class BrowserUnavailable(RuntimeError):
+    """Selenium or Chrome is not installed, or the browser failed to start"""
+
+
+class BrowserPoolTimeout(TimeoutError):
+    """Every browser stayed checked out for longer than the acquire timeout"""
+
+
+def launch_chrome(window_size=DEFAULT_WINDOW_SIZE):
+    """Start a headless Chrome webdriver with the options the scripts always used"""
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+    except ImportError as e:
+        raise BrowserUnavailable("Browser checks require selenium: pip install selenium") from e
+
+    options = Options()
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_argument(f"--window-size={window_size}")
+    try:
+        return webdriver.Chrome(options=options)
+    except Exception as e:
+        raise BrowserUnavailable(f"Could not start Chrome: {e}") from e
+
+
+def origin_of(url):
+    """scheme://host[:port] of an http(s) URL, None for about:blank, data: and the like"""
+    parsed = urlparse(url or "")
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class BrowserPool:
+    """Bounded pool of warm webdrivers handing out one isolated context per checkout
+
+    `factory` creates a new driver (headless Chrome by default). At most
+    `size` drivers exist at once; acquire() blocks while all of them are
+    checked out and raises BrowserPoolTimeout after `acquire_timeout` seconds.
+    """
+
+    def __init__(self, size=None, max_uses=None, factory=None, acquire_timeout=120.0, origins=()):
+        self._options = {"size": size, "max_uses": max_uses}
+        self.factory = factory or launch_chrome
+        self.acquire_timeout = acquire_timeout
+        self._cond = threading.Condition()
+        self._idle = []
+        self._uses = {}
+        self._total = 0
+        self._origins = set(origins)
+        self._closed = False
+        self._atexit_registered = False
+        self._stats = {"launched": 0, "launch_seconds": 0.0, "checkouts": 0, "reused": 0, "recycled": 0, "reset_failures": 0}
+
+    @property
+    def size(self):
+        if self._options["size"] is None:
+            self._options["size"] = max(1, int(os.environ.get("SESG_BROWSER_POOL_SIZE", DEFAULT_POOL_SIZE)))
+        return self._options["size"]
+
+    @property
+    def max_uses(self):
+        if self._options["max_uses"] is None:
+            self._options["max_uses"] = max(1, int(os.environ.get("SESG_BROWSER_MAX_USES", DEFAULT_MAX_USES)))
+        return self._options["max_uses"]
+
+    def _launch(self):
+        start = time.perf_counter()
+        driver = self.factory()
+        elapsed = time.perf_counter() - start
+        with self._cond:
+            self._stats["launched"] += 1
+            self._stats["launch_seconds"] += elapsed
+            self._uses[driver] = 0
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+        return driver
+
+    def _reserve(self, count):
+        with self._cond:
+            if self._closed:
+                raise BrowserUnavailable("Browser pool is closed")
+            count = max(0, min(count, self.size - self._total))
+            self._total += count
+            return count
+
+    def _unreserve(self, count=1):
+        with self._cond:
+            self._total -= count
+            self._cond.notify(count)
+
+    def start(self, count=None):
+        """Launch browsers up to `count` (default: the pool size) in parallel; returns the pool"""
+        reserved = self._reserve(self.size if count is None else count)
+        if not reserved:
+            return self
+        with ThreadPoolExecutor(max_workers=reserved) as executor:
+            futures = [executor.submit(self._launch) for _ in range(reserved)]
+        error = None
+        for future in futures:
+            try:
+                driver = future.result()
+            except Exception as e:
+                error = error or e
+                self._unreserve()
+                continue
+            with self._cond:
+                self._idle.append(driver)
+                self._cond.notify()
+        if error is not None:
+            raise error
+        return self
+
+    def acquire(self, timeout=None):
+        """Check out a driver, launching one if the pool has room; blocks while all are in use"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise BrowserUnavailable("Browser pool is closed")
+                if self._idle:
+                    self._stats["checkouts"] += 1
+                    self._stats["reused"] += 1
+                    return self._idle.pop()
+                if self._total < self.size:
+                    self._total += 1
+                    self._stats["checkouts"] += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BrowserPoolTimeout(f"No browser free after {timeout:.0f}s (pool size {self.size})")
+                self._cond.wait(remaining)
+        try:
+            return self._launch()
+        except Exception:
+            with self._cond:
+                self._stats["checkouts"] -= 1
+            self._unreserve()
+            raise
+
+    def reset(self, driver):
+        """Close extra windows and clear cookies and site storage; False if the browser misbehaved"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            current = origin_of(driver.current_url)
+            with self._cond:
+                if current:
+                    self._origins.add(current)
+                origins = sorted(self._origins)
+            if hasattr(driver, "execute_cdp_cmd"):
+                for origin in origins:
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            else:
+                if current:
+                    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception:
+            with self._cond:
+                self._stats["reset_failures"] += 1
+            return False
+
+    def _discard(self, driver):
+        with self._cond:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self._unreserve()
+
+    def release(self, driver):
+        """Return a driver to the pool, resetting its context or recycling it"""
+        with self._cond:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            worn_out = self._uses[driver] >= self.max_uses
+            closed = self._closed
+        if closed or worn_out or not self.reset(driver):
+            if not closed:
+                with self._cond:
+                    self._stats["recycled"] += 1
+            self._discard(driver)
+            return
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Check out a driver for the duration of a with-block"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def stats(self):
+        """Launches, checkouts, reuses and recycles so far, plus the current pool occupancy"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["size"] = self.size
+            stats["alive"] = self._total
+            stats["idle"] = len(self._idle)
+        stats["mean_launch_seconds"] = stats["launch_seconds"] / stats["launched"] if stats["launched"] else 0.0
+        return stats
+
+    def close(self):
+        """Quit the idle browsers; drivers still checked out are quit when released"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+
+browsers = BrowserPool()
@@ -0,0 +1,177 @@
+"""
+Record / replay cassettes for the shared HTTP client
+
+Repeated suite runs re-fetch identical pages (/, /admin, /admin/login,
+/publications) and Sheets payloads. With a cassette mode enabled, every
+request sent through harness.client is keyed by method + URL + body hash and
+its response is stored on disk, so later iterations can be served without
+touching the network.
+
+Modes (SESG_CASSETTE_MODE, or `python -m harness --cassettes MODE`):
+    off      no cassettes (default)
+    record   always hit the network and (over)write the cassette
+    replay   serve from cassettes only; a missing cassette raises CassetteMiss
+             (a requests ConnectionError) so no request ever leaves the machine
+    refresh  serve cassettes younger than SESG_CASSETTE_TTL seconds, re-record
+             stale or missing ones from the network
+
+Cassettes live in SESG_CASSETTE_DIR (default .cassettes/ in the repository
+root), one JSON file per request. Only the requests-based HTTP/1.1 transport is
+recorded; SESG_HTTP2=1 bypasses cassettes.
+
+Usage:
+    python -m harness --cassettes record          # first run, populate the store
+    python -m harness --cassettes replay          # later runs, zero network cost
+    python -m harness --cassettes refresh --cassette-ttl 3600
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+MODES = ("off", "record", "replay", "refresh")
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / ".cassettes"
+DEFAULT_TTL = 24 * 3600
+
+# Stored bodies are already decoded by urllib3, so these no longer describe them
+_DROPPED_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """Raised in replay mode when no cassette exists for a request"""
+
+
+def _body_bytes(body):
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body)
+    raise TypeError("Streaming request bodies cannot be recorded")
+
+
+def cassette_key(method, url, body=None):
+    """Stable key for a request: sha256 of method, URL and the sha256 of the body"""
+    body_hash = hashlib.sha256(_body_bytes(body)).hexdigest()
+    return hashlib.sha256(f"{method.upper()}\n{url}\n{body_hash}".encode("utf-8")).hexdigest()
+
+
+class CassetteStore:
+    """On-disk cassette files plus hit / miss / record counters"""
+
+    def __init__(self, directory=None, mode="replay", ttl=DEFAULT_TTL):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}, expected one of {MODES}")
+        self.directory = Path(directory) if directory else DEFAULT_DIR
+        self.mode = mode
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    @classmethod
+    def from_env(cls):
+        """Store configured from SESG_CASSETTE_*, or None when cassettes are off"""
+        mode = os.environ.get("SESG_CASSETTE_MODE", "off").strip().lower() or "off"
+        if mode == "off":
+            return None
+        ttl = float(os.environ.get("SESG_CASSETTE_TTL", DEFAULT_TTL))
+        return cls(os.environ.get("SESG_CASSETTE_DIR"), mode, ttl)
+
+    def path_for(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def load(self, key):
+        try:
+            with open(self.path_for(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry):
+        return time.time() - entry["recorded_at"] <= self.ttl
+
+    def save(self, key, request, response):
+        entry = {
+            "method": request.method,
+            "url": request.url,
+            "body_sha256": hashlib.sha256(_body_bytes(request.body)).hexdigest(),
+            "recorded_at": time.time(),
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "final_url": response.url,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so parallel scripts never read a half-written cassette
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+        self._count("recorded")
+        return entry
+
+    def stats(self):
+        with self._lock:
+            return {"cassette_hits": self.hits, "cassette_misses": self.misses, "cassette_recorded": self.recorded}
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter answering from a CassetteStore before delegating to `adapter`"""
+
+    def __init__(self, adapter, store):
+        super().__init__()
+        self.adapter = adapter
+        self.store = store
+
+    def build_response(self, request, entry):
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["Content-Length"] = str(len(base64.b64decode(entry["content"])))
+        response._content = base64.b64decode(entry["content"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = entry.get("final_url") or request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(0)
+        return response
+
+    def send(self, request, **kwargs):
+        store = self.store
+        key = cassette_key(request.method, request.url, request.body)
+
+        if store.mode != "record":
+            entry = store.load(key)
+            if entry is not None and (store.mode == "replay" or store.is_fresh(entry)):
+                store._count("hits")
+                return self.build_response(request, entry)
+            store._count("misses")
+            if store.mode == "replay":
+                raise CassetteMiss(f"No cassette for {request.method} {request.url}", request=request)
+
+        response = self.adapter.send(request, **kwargs)
+        store.save(key, request, response)
+        return response
+
+    def close(self):
+        self.adapter.close()
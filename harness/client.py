@@ -0,0 +1,344 @@
+"""
+Shared pooled HTTP client for the verification scripts
+
+Every script used to call bare requests.get(url, timeout=10), paying a fresh
+TCP/TLS handshake per check. `http` is a process-wide client with keep-alive
+connection pooling shared by every tester class; `http.session()` hands out
+Session objects (own headers/cookies) that reuse the same connection pool.
+
+Configuration (environment variables, read when the pool is first used):
+    SESG_HTTP_POOL_HOSTS    number of per-host pools kept alive   (default 32)
+    SESG_HTTP_POOL_MAXSIZE  max keep-alive connections per host   (default 16)
+    SESG_HTTP_POOL_BLOCK    "1" to block instead of exceeding the per-host limit
+    SESG_HTTP2              "1" to use HTTP/2 (requires `pip install httpx[http2]`)
+    SESG_CASSETTE_MODE      off / record / replay / refresh (see harness.cassette)
+
+Usage:
+    from harness.client import http
+
+    response = http.get(url, timeout=10)
+    print(http.stats())   # {"requests": 12, "connections_opened": 2, "connections_reused": 10, ...}
+    print(http.timings()) # [{"method": "GET", "endpoint": "host/api/publications", "p50": 0.21, ...}]
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from harness.cassette import CassetteAdapter, CassetteStore
+from harness.timings import TimingRecorder
+
+DEFAULT_POOL_HOSTS = 32
+DEFAULT_POOL_MAXSIZE = 16
+
+
+def _env_flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class ConnectionStats:
+    """Thread-safe counters for requests sent vs connections opened per host"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.per_host = defaultdict(lambda: {"requests": 0, "connections_opened": 0})
+
+    def record_request(self, host):
+        with self._lock:
+            self.requests += 1
+            self.per_host[host]["requests"] += 1
+
+    def record_connection(self, host):
+        with self._lock:
+            self.connections_opened += 1
+            self.per_host[host]["connections_opened"] += 1
+
+    def snapshot(self):
+        with self._lock:
+            hosts = {}
+            for host, counts in self.per_host.items():
+                hosts[host] = dict(counts, connections_reused=max(0, counts["requests"] - counts["connections_opened"]))
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": max(0, self.requests - self.connections_opened),
+                "hosts": hosts,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.connections_opened = 0
+            self.per_host.clear()
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose urllib3 pools report every new connection to ConnectionStats
+    and every request's duration to a TimingRecorder"""
+
+    def __init__(self, stats, timings=None, **kwargs):
+        self.stats = stats
+        self.timings = timings
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        stats = self.stats
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                stats.record_connection(self.host)
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                stats.record_connection(self.host)
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        self.stats.record_request(requests.utils.urlparse(request.url).hostname)
+        if self.timings is None:
+            return super().send(request, **kwargs)
+        start, status = time.perf_counter(), 0
+        try:
+            response = super().send(request, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self.timings.record(request.method, request.url, status, time.perf_counter() - start)
+
+
+class Http2Session:
+    """Minimal requests.Session look-alike backed by httpx with HTTP/2 enabled
+
+    Only the surface the verification scripts use is provided: get/post/put/
+    patch/delete/head/request with timeout, headers, params, json and data.
+    Transport failures surface as requests.exceptions.Timeout/ConnectionError.
+    """
+
+    def __init__(self, transport, stats, timings=None):
+        import httpx
+
+        def on_request(request):
+            host = request.url.host
+
+            def trace(event_name, info):
+                if event_name == "connection.connect_tcp.complete":
+                    stats.record_connection(host)
+
+            request.extensions["trace"] = trace
+            stats.record_request(host)
+
+        self._client = httpx.Client(transport=transport, event_hooks={"request": [on_request]})
+        self._timings = timings
+        self.headers = self._client.headers
+        self.cookies = self._client.cookies
+
+    def request(self, method, url, **kwargs):
+        if "allow_redirects" in kwargs:
+            kwargs["follow_redirects"] = kwargs.pop("allow_redirects")
+        else:
+            kwargs.setdefault("follow_redirects", True)
+        if kwargs.pop("verify", True) is not True:
+            # the shared transport owns the TLS context, so a per-request override cannot apply
+            raise ValueError("Http2Session always verifies certificates; unset SESG_HTTP2 to pass verify=")
+        kwargs.pop("stream", None)
+        if self._timings is None:
+            return self._send(method, url, kwargs)
+        start, status = time.perf_counter(), 0
+        try:
+            response = self._send(method, url, kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self._timings.record(method, str(url), status, time.perf_counter() - start)
+
+    def _send(self, method, url, kwargs):
+        """Issue the request, raising requests' exceptions so callers' except clauses still match"""
+        import httpx
+
+        try:
+            return self._client.request(method, url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self):
+        self._client.close()
+
+
+class PooledClient:
+    """Process-wide HTTP client; the connection pool is created lazily on first use"""
+
+    def __init__(self, pool_hosts=None, pool_maxsize=None, pool_block=None, http2=None, cassettes=None):
+        self._options = {
+            "pool_hosts": pool_hosts,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "http2": http2,
+            "cassettes": cassettes,
+        }
+        self._lock = threading.Lock()
+        self._transport = None
+        self._default = None
+        self.connection_stats = ConnectionStats()
+        self.request_timings = TimingRecorder()
+        self.cassettes = None
+
+    def configure(self, **options):
+        """Change pool options; takes effect for the next pool that is created"""
+        unknown = set(options) - set(self._options)
+        if unknown:
+            raise TypeError(f"Unknown pool options: {sorted(unknown)}")
+        with self._lock:
+            self._options.update(options)
+            self._close_locked()
+
+    def _resolved_options(self):
+        options = dict(self._options)
+        if options["pool_hosts"] is None:
+            options["pool_hosts"] = int(os.environ.get("SESG_HTTP_POOL_HOSTS", DEFAULT_POOL_HOSTS))
+        if options["pool_maxsize"] is None:
+            options["pool_maxsize"] = int(os.environ.get("SESG_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE))
+        if options["pool_block"] is None:
+            options["pool_block"] = _env_flag("SESG_HTTP_POOL_BLOCK")
+        if options["http2"] is None:
+            options["http2"] = _env_flag("SESG_HTTP2")
+        if options["cassettes"] is None:
+            options["cassettes"] = CassetteStore.from_env()
+        return options
+
+    def _ensure_transport(self):
+        if self._transport is not None:
+            return self._transport
+        options = self._resolved_options()
+        if options["http2"]:
+            try:
+                import httpx
+            except ImportError as e:
+                raise RuntimeError("HTTP/2 requires httpx: pip install 'httpx[http2]'") from e
+            limits = httpx.Limits(
+                max_connections=options["pool_hosts"] * options["pool_maxsize"],
+                max_keepalive_connections=options["pool_maxsize"],
+            )
+            self._transport = ("http2", httpx.HTTPTransport(http2=True, limits=limits))
+        else:
+            adapter = PooledAdapter(
+                self.connection_stats,
+                self.request_timings,
+                pool_connections=options["pool_hosts"],
+                pool_maxsize=options["pool_maxsize"],
+                pool_block=options["pool_block"],
+            )
+            self.cassettes = options["cassettes"]
+            if self.cassettes is not None:
+                adapter = CassetteAdapter(adapter, self.cassettes)
+            self._transport = ("http1", adapter)
+        return self._transport
+
+    def _build_session(self, kind, transport):
+        if kind == "http2":
+            return Http2Session(transport, self.connection_stats, self.request_timings)
+        session = requests.Session()
+        session.mount("http://", transport)
+        session.mount("https://", transport)
+        return session
+
+    def session(self):
+        """Return a new Session (own headers/cookies) sharing the pooled connections"""
+        with self._lock:
+            return self._build_session(*self._ensure_transport())
+
+    def _default_session(self):
+        if self._default is None:
+            with self._lock:
+                if self._default is None:
+                    self._default = self._build_session(*self._ensure_transport())
+        return self._default
+
+    def request(self, method, url, **kwargs):
+        return self._default_session().request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    def stats(self):
+        """Requests sent, connections opened and connections reused (total and per host)
+
+        Requests answered from a cassette never reach the pool; they are
+        counted under cassette_hits instead.
+        """
+        stats = self.connection_stats.snapshot()
+        if self.cassettes is not None:
+            stats.update(self.cassettes.stats())
+        return stats
+
+    def timings(self):
+        """Per method + endpoint request count, errors and mean/p50/p95/max seconds"""
+        return self.request_timings.snapshot()
+
+    def _close_locked(self):
+        if self._default is not None:
+            self._default.close()
+            self._default = None
+        if self._transport is not None:
+            self._transport[1].close()
+            self._transport = None
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
+
+
+http = PooledClient()
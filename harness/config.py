@@ -0,0 +1,97 @@
+"""
+Lazy, cached configuration for the verification scripts
+
+The scripts used to parse /app/frontend/.env at import time, print banners and
+sys.exit() when a URL was missing, so none of them could be imported into one
+process. They now resolve their settings through this module from a
+configure() step that only runs when the script executes: nothing is read
+until the first lookup, and the .env file is parsed once per process.
+
+Lookup order for every name: process environment, then the frontend .env file
+(SESG_FRONTEND_ENV overrides its path, default /app/frontend/.env).
+
+Usage:
+    from harness import config
+
+    backend_url = config.require("REACT_APP_BACKEND_URL")   # raises ConfigError if unset
+    urls = config.api_urls()                                 # {"publications": ..., ...}
+"""
+
+import os
+from functools import lru_cache
+
+DEFAULT_FRONTEND_ENV = "/app/frontend/.env"
+
+# Dataset -> environment variable holding its Google Apps Script URL
+API_URL_VARS = {
+    "publications": "REACT_APP_PUBLICATIONS_API_URL",
+    "projects": "REACT_APP_PROJECTS_API_URL",
+    "achievements": "REACT_APP_ACHIEVEMENTS_API_URL",
+    "news_events": "REACT_APP_NEWS_EVENTS_API_URL",
+}
+
+
+class ConfigError(LookupError):
+    """A required setting is missing from both the environment and the .env file"""
+
+
+@lru_cache(maxsize=None)
+def read_env_file(path):
+    """KEY=VALUE pairs of a dotenv file (comments and blank lines skipped); {} if it is missing"""
+    values = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                    value = value[1:-1]
+                values[key.strip()] = value
+    except OSError:
+        pass
+    return values
+
+
+def frontend_env_path():
+    return os.environ.get("SESG_FRONTEND_ENV", DEFAULT_FRONTEND_ENV)
+
+
+def get(name, default=None):
+    """Value of `name` from the environment or the frontend .env file"""
+    value = os.environ.get(name)
+    if value:
+        return value
+    return read_env_file(frontend_env_path()).get(name) or default
+
+
+def require(name):
+    value = get(name)
+    if not value:
+        raise ConfigError(f"Could not get {name} from frontend/.env")
+    return value
+
+
+def backend_url(default=None):
+    """REACT_APP_BACKEND_URL (the deployed frontend, which proxies /api/*)"""
+    return get("REACT_APP_BACKEND_URL", default)
+
+
+def api_urls(required=()):
+    """Google Apps Script URLs by dataset; raises ConfigError if any of `required` is missing"""
+    urls = {}
+    for dataset, name in API_URL_VARS.items():
+        value = get(name)
+        if value:
+            urls[dataset] = value
+    for dataset in required:
+        if dataset not in urls:
+            raise ConfigError(f"Could not get {API_URL_VARS[dataset]} from frontend/.env")
+    return urls
+
+
+def reset():
+    """Forget cached .env contents (e.g. after the file changed)"""
+    read_env_file.cache_clear()
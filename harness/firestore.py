@@ -0,0 +1,684 @@
+"""
+In-process Firestore stand-in for the admin panel verification scripts
+
+Serves the subset of the Firestore REST API (v1) that firebaseService.js relies
+on - getDocs / getDoc / addDoc / updateDoc / setDoc / deleteDoc, and queries
+built from where / orderBy / limit / startAfter - for the 11 collections used by
+the admin panel, entirely in memory. CRUD and persistence checks can then run
+offline, optionally with injected latency to mimic real Firestore round-trips.
+
+REST surface (project defaults to sesg-research-website):
+    GET    /v1/projects/{p}/databases/(default)/documents/{collection}
+    GET    /v1/projects/{p}/databases/(default)/documents/{collection}/{id}
+    POST   /v1/projects/{p}/databases/(default)/documents/{collection}[?documentId=]
+    PATCH  /v1/projects/{p}/databases/(default)/documents/{collection}/{id}[?updateMask.fieldPaths=&currentDocument.exists=]
+    DELETE /v1/projects/{p}/databases/(default)/documents/{collection}/{id}
+    POST   /v1/projects/{p}/databases/(default)/documents:runQuery
+    POST   /v1/projects/{p}/databases/(default)/documents:batchGet
+    POST   /v1/projects/{p}/databases/(default)/documents:commit
+
+Usage:
+    with FirestoreStandIn(latency=0.05) as firestore:
+        os.environ["FIRESTORE_EMULATOR_HOST"] = firestore.host
+        ...
+
+    python -m harness.firestore --port 8080 --latency 0.05
+"""
+
+import argparse
+import copy
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from harness.standin import StandInHandler
+
+PROJECT_ID = "sesg-research-website"
+DATABASE_ID = "(default)"
+
+# Collections declared in FirebaseService.collections (frontend/src/services/firebaseService.js)
+COLLECTIONS = [
+    "publications", "projects", "achievements", "newsEvents",
+    "people", "researchAreas", "gallery", "contact",
+    "footer", "home", "users"
+]
+
+# Firestore's cross-type ordering: null < bool < number < timestamp < string < bytes < reference < geo < array < map
+TYPE_ORDER = {
+    "nullValue": 0, "booleanValue": 1, "integerValue": 2, "doubleValue": 2,
+    "timestampValue": 3, "stringValue": 4, "bytesValue": 5, "referenceValue": 6,
+    "geoPointValue": 7, "arrayValue": 8, "mapValue": 9,
+}
+
+
+class FirestoreError(Exception):
+    """Error rendered as a Firestore REST error body"""
+
+    STATUS = {400: "INVALID_ARGUMENT", 404: "NOT_FOUND", 409: "ALREADY_EXISTS", 412: "FAILED_PRECONDITION"}
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+    def to_json(self):
+        return {"error": {"code": self.code, "message": str(self), "status": self.STATUS.get(self.code, "UNKNOWN")}}
+
+
+def timestamp(moment=None):
+    moment = moment or datetime.now(timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+# =================== VALUE ENCODING ===================
+
+def encode_value(value):
+    """Python value -> Firestore typed value"""
+    if value is None:
+        return {"nullValue": None}
+    if isinstance(value, bool):
+        return {"booleanValue": value}
+    if isinstance(value, int):
+        return {"integerValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, datetime):
+        return {"timestampValue": timestamp(value.astimezone(timezone.utc))}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [encode_value(v) for v in value]}}
+    if isinstance(value, dict):
+        return {"mapValue": {"fields": encode_fields(value)}}
+    return {"stringValue": str(value)}
+
+
+def encode_fields(data):
+    return {key: encode_value(value) for key, value in data.items()}
+
+
+def decode_value(value):
+    """Firestore typed value -> Python value (timestamps stay ISO strings)"""
+    kind, raw = next(iter(value.items()))
+    if kind == "integerValue":
+        return int(raw)
+    if kind == "doubleValue":
+        return float(raw)
+    if kind == "arrayValue":
+        return [decode_value(v) for v in (raw or {}).get("values", [])]
+    if kind == "mapValue":
+        return decode_fields((raw or {}).get("fields", {}))
+    return raw
+
+
+def decode_fields(fields):
+    return {key: decode_value(value) for key, value in fields.items()}
+
+
+def _sort_key(value):
+    """Total ordering over typed values following Firestore's type ordering"""
+    if value is None:
+        return (-1, 0)
+    kind, raw = next(iter(value.items()))
+    rank = TYPE_ORDER.get(kind, 10)
+    if kind in ("integerValue", "doubleValue"):
+        number = float(raw)
+        return (rank, (0, 0) if math.isnan(number) else (1, number))
+    if kind == "arrayValue":
+        return (rank, tuple(_sort_key(v) for v in (raw or {}).get("values", [])))
+    if kind == "mapValue":
+        fields = (raw or {}).get("fields", {})
+        return (rank, tuple((k, _sort_key(fields[k])) for k in sorted(fields)))
+    if kind == "geoPointValue":
+        return (rank, (raw.get("latitude", 0), raw.get("longitude", 0)))
+    if kind == "nullValue":
+        return (rank, 0)
+    return (rank, raw)
+
+
+def _get_path(fields, field_path):
+    """Resolve a dotted field path inside an encoded fields map"""
+    current = {"mapValue": {"fields": fields}}
+    for part in field_path.strip("`").split("."):
+        if "mapValue" not in current:
+            return None
+        current = current["mapValue"].get("fields", {}).get(part)
+        if current is None:
+            return None
+    return current
+
+
+def _set_path(fields, field_path, value):
+    parts = field_path.strip("`").split(".")
+    for part in parts[:-1]:
+        nested = fields.setdefault(part, {"mapValue": {"fields": {}}})
+        if "mapValue" not in nested:
+            nested.clear()
+            nested["mapValue"] = {"fields": {}}
+        fields = nested["mapValue"].setdefault("fields", {})
+    if value is None:
+        fields.pop(parts[-1], None)
+    else:
+        fields[parts[-1]] = value
+
+
+# =================== STORE ===================
+
+class FirestoreStore:
+    """Thread-safe in-memory document store keyed by collection and document id"""
+
+    def __init__(self, project_id=PROJECT_ID, collections=COLLECTIONS):
+        self.project_id = project_id
+        self.root = f"projects/{project_id}/databases/{DATABASE_ID}/documents"
+        self._lock = threading.RLock()
+        self._collections = {name: {} for name in collections}
+
+    def reset(self):
+        with self._lock:
+            for documents in self._collections.values():
+                documents.clear()
+
+    def seed(self, collection, documents):
+        """Insert plain Python dicts (optionally carrying an "id") into a collection"""
+        with self._lock:
+            for data in documents:
+                data = dict(data)
+                doc_id = str(data.pop("id", "")) or None
+                self.create(collection, encode_fields(data), doc_id)
+
+    def _name(self, collection, doc_id):
+        return f"{self.root}/{collection}/{doc_id}"
+
+    def _render(self, collection, doc_id, record, mask=None):
+        fields = record["fields"]
+        if mask:
+            fields = {path: _get_path(fields, path) for path in mask if _get_path(fields, path) is not None}
+        return {
+            "name": self._name(collection, doc_id),
+            "fields": copy.deepcopy(fields),
+            "createTime": record["createTime"],
+            "updateTime": record["updateTime"],
+        }
+
+    def split_name(self, name):
+        """Document resource name -> (collection, doc_id)"""
+        prefix = self.root + "/"
+        relative = name[len(prefix):] if name.startswith(prefix) else name
+        parts = relative.split("/")
+        if len(parts) != 2:
+            raise FirestoreError(400, f"Invalid document name: {name}")
+        return parts[0], parts[1]
+
+    def list(self, collection, page_size=None, page_token=None, mask=None):
+        with self._lock:
+            documents = self._collections.get(collection, {})
+            ids = sorted(documents)
+            start = int(page_token or 0)
+            end = start + page_size if page_size else len(ids)
+            page = [self._render(collection, i, documents[i], mask) for i in ids[start:end]]
+        result = {"documents": page} if page else {}
+        if end < len(ids):
+            result["nextPageToken"] = str(end)
+        return result
+
+    def get(self, collection, doc_id, mask=None):
+        with self._lock:
+            record = self._collections.get(collection, {}).get(doc_id)
+            if record is None:
+                raise FirestoreError(404, f"Document \"{self._name(collection, doc_id)}\" not found.")
+            return self._render(collection, doc_id, record, mask)
+
+    def create(self, collection, fields, doc_id=None):
+        with self._lock:
+            documents = self._collections.setdefault(collection, {})
+            doc_id = doc_id or uuid.uuid4().hex[:20]
+            if doc_id in documents:
+                raise FirestoreError(409, f"Document already exists: {self._name(collection, doc_id)}")
+            now = timestamp()
+            documents[doc_id] = {"fields": dict(fields or {}), "createTime": now, "updateTime": now}
+            return self._render(collection, doc_id, documents[doc_id])
+
+    def update(self, collection, doc_id, fields, update_mask=None, exists=None, transforms=None):
+        """setDoc (no mask) / updateDoc (mask + exists=True) semantics"""
+        with self._lock:
+            documents = self._collections.setdefault(collection, {})
+            record = documents.get(doc_id)
+            if exists is True and record is None:
+                raise FirestoreError(404, f"No document to update: {self._name(collection, doc_id)}")
+            if exists is False and record is not None:
+                raise FirestoreError(409, f"Document already exists: {self._name(collection, doc_id)}")
+
+            now = timestamp()
+            if record is None:
+                record = documents[doc_id] = {"fields": {}, "createTime": now, "updateTime": now}
+
+            if update_mask is None:
+                record["fields"] = dict(fields or {})
+            else:
+                for path in update_mask:
+                    _set_path(record["fields"], path, _get_path(fields or {}, path))
+
+            for transform in transforms or []:
+                self._apply_transform(record["fields"], transform, now)
+
+            record["updateTime"] = now
+            return self._render(collection, doc_id, record)
+
+    def _apply_transform(self, fields, transform, now):
+        path = transform["fieldPath"]
+        if transform.get("setToServerValue") == "REQUEST_TIME":
+            _set_path(fields, path, {"timestampValue": now})
+        elif "increment" in transform:
+            current = _get_path(fields, path)
+            delta = transform["increment"]
+            if current and "integerValue" in current and "integerValue" in delta:
+                _set_path(fields, path, {"integerValue": str(int(current["integerValue"]) + int(delta["integerValue"]))})
+            elif current and next(iter(current)) in ("integerValue", "doubleValue"):
+                _set_path(fields, path, {"doubleValue": decode_value(current) + decode_value(delta)})
+            else:
+                _set_path(fields, path, delta)
+        elif "appendMissingElements" in transform:
+            current = _get_path(fields, path) or {"arrayValue": {"values": []}}
+            values = list(current.get("arrayValue", {}).get("values", []))
+            values += [v for v in transform["appendMissingElements"].get("values", []) if v not in values]
+            _set_path(fields, path, {"arrayValue": {"values": values}})
+        elif "removeAllFromArray" in transform:
+            current = _get_path(fields, path) or {"arrayValue": {"values": []}}
+            removed = transform["removeAllFromArray"].get("values", [])
+            values = [v for v in current.get("arrayValue", {}).get("values", []) if v not in removed]
+            _set_path(fields, path, {"arrayValue": {"values": values}})
+        else:
+            raise FirestoreError(400, f"Unsupported field transform: {transform}")
+
+    def delete(self, collection, doc_id, exists=None):
+        with self._lock:
+            documents = self._collections.get(collection, {})
+            if exists is True and doc_id not in documents:
+                raise FirestoreError(404, f"No document to delete: {self._name(collection, doc_id)}")
+            documents.pop(doc_id, None)
+
+    def commit(self, writes):
+        """Apply a batch of update / delete / transform writes atomically"""
+        with self._lock:
+            snapshot = copy.deepcopy(self._collections)
+            try:
+                results = [{"updateTime": self._apply_write(write)} for write in writes]
+            except Exception:
+                self._collections = snapshot
+                raise
+        return {"writeResults": results, "commitTime": timestamp()}
+
+    def _apply_write(self, write):
+        precondition = write.get("currentDocument", {}).get("exists")
+        if "delete" in write:
+            self.delete(*self.split_name(write["delete"]), exists=precondition)
+            return timestamp()
+        if "transform" in write:
+            target = write["transform"]
+            collection, doc_id = self.split_name(target["document"])
+            return self.update(collection, doc_id, {}, [], precondition, target.get("fieldTransforms"))["updateTime"]
+        update = write["update"]
+        collection, doc_id = self.split_name(update["name"])
+        mask = write["updateMask"].get("fieldPaths", []) if "updateMask" in write else None
+        doc = self.update(collection, doc_id, update.get("fields", {}), mask, precondition, write.get("updateTransforms"))
+        return doc["updateTime"]
+
+    # ---------- queries ----------
+
+    def _matches(self, fields, flt):
+        if "compositeFilter" in flt:
+            composite = flt["compositeFilter"]
+            results = (self._matches(fields, f) for f in composite.get("filters", []))
+            return any(results) if composite.get("op") == "OR" else all(results)
+
+        if "unaryFilter" in flt:
+            unary = flt["unaryFilter"]
+            value = _get_path(fields, unary["field"]["fieldPath"])
+            decoded = decode_value(value) if value is not None else None
+            is_nan = isinstance(decoded, float) and math.isnan(decoded)
+            op = unary["op"]
+            if op == "IS_NULL":
+                return value is not None and "nullValue" in value
+            if op == "IS_NOT_NULL":
+                return value is not None and "nullValue" not in value
+            if op == "IS_NAN":
+                return is_nan
+            if op == "IS_NOT_NAN":
+                return value is not None and not is_nan
+            raise FirestoreError(400, f"Unsupported unary operator: {op}")
+
+        field = flt["fieldFilter"]
+        value = _get_path(fields, field["field"]["fieldPath"])
+        op, target = field["op"], field["value"]
+        if value is None:
+            return False
+
+        key, target_key = _sort_key(value), _sort_key(target)
+        if op == "EQUAL":
+            return key == target_key
+        if op == "NOT_EQUAL":
+            return key != target_key and "nullValue" not in value
+        if op in ("LESS_THAN", "LESS_THAN_OR_EQUAL", "GREATER_THAN", "GREATER_THAN_OR_EQUAL"):
+            if key[0] != target_key[0]:
+                return False
+            return {
+                "LESS_THAN": key < target_key,
+                "LESS_THAN_OR_EQUAL": key <= target_key,
+                "GREATER_THAN": key > target_key,
+                "GREATER_THAN_OR_EQUAL": key >= target_key,
+            }[op]
+
+        candidates = [_sort_key(v) for v in target.get("arrayValue", {}).get("values", [])]
+        elements = [_sort_key(v) for v in value.get("arrayValue", {}).get("values", [])]
+        if op == "ARRAY_CONTAINS":
+            return target_key in elements
+        if op == "ARRAY_CONTAINS_ANY":
+            return any(c in elements for c in candidates)
+        if op == "IN":
+            return key in candidates
+        if op == "NOT_IN":
+            return key not in candidates and "nullValue" not in value
+        raise FirestoreError(400, f"Unsupported field operator: {op}")
+
+    def run_query(self, structured_query):
+        """Evaluate a StructuredQuery (from / where / orderBy / startAt / endAt / offset / limit)"""
+        sources = structured_query.get("from") or []
+        if len(sources) != 1 or sources[0].get("allDescendants"):
+            raise FirestoreError(400, "Only single-collection queries are supported")
+        collection = sources[0]["collectionId"]
+
+        order_by = list(structured_query.get("orderBy") or [])
+        if not any(o["field"]["fieldPath"] == "__name__" for o in order_by):
+            direction = order_by[-1].get("direction", "ASCENDING") if order_by else "ASCENDING"
+            order_by.append({"field": {"fieldPath": "__name__"}, "direction": direction})
+
+        with self._lock:
+            rows = []
+            for doc_id, record in self._collections.get(collection, {}).items():
+                fields = record["fields"]
+                if "where" in structured_query and not self._matches(fields, structured_query["where"]):
+                    continue
+                keys = []
+                for order in order_by:
+                    path = order["field"]["fieldPath"]
+                    value = {"referenceValue": self._name(collection, doc_id)} if path == "__name__" else _get_path(fields, path)
+                    if value is None:
+                        break  # documents missing an orderBy field are excluded, as in Firestore
+                    keys.append(value)
+                else:
+                    rows.append((keys, doc_id, record))
+
+            def row_key(row):
+                return [_Directional(_sort_key(v), o.get("direction") == "DESCENDING") for v, o in zip(row[0], order_by)]
+
+            rows.sort(key=row_key)
+            rows = self._apply_cursors(rows, structured_query, order_by, row_key)
+
+            offset = int(structured_query.get("offset", 0))
+            limit = structured_query.get("limit")
+            if isinstance(limit, dict):
+                limit = limit.get("value")
+            rows = rows[offset:offset + int(limit)] if limit is not None else rows[offset:]
+
+            mask = (structured_query.get("select") or {}).get("fields")
+            mask = [f["fieldPath"] for f in mask] if mask else None
+            return [self._render(collection, doc_id, record, mask) for _, doc_id, record in rows]
+
+    def _apply_cursors(self, rows, structured_query, order_by, row_key):
+        def cursor_key(cursor):
+            values = cursor.get("values", [])
+            return [_Directional(_sort_key(v), o.get("direction") == "DESCENDING") for v, o in zip(values, order_by)]
+
+        start = structured_query.get("startAt")
+        if start:
+            bound = cursor_key(start)
+            inclusive = start.get("before", False)
+            rows = [r for r in rows if (row_key(r)[:len(bound)] >= bound if inclusive else row_key(r)[:len(bound)] > bound)]
+
+        end = structured_query.get("endAt")
+        if end:
+            bound = cursor_key(end)
+            exclusive = end.get("before", False)
+            rows = [r for r in rows if (row_key(r)[:len(bound)] < bound if exclusive else row_key(r)[:len(bound)] <= bound)]
+        return rows
+
+
+class _Directional:
+    """Sort key wrapper that inverts comparisons for DESCENDING orderBy clauses"""
+
+    __slots__ = ("key", "descending")
+
+    def __init__(self, key, descending):
+        self.key = key
+        self.descending = descending
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key > other.key if self.descending else self.key < other.key
+
+    def __le__(self, other):
+        return self == other or self < other
+
+    def __gt__(self, other):
+        return other < self
+
+    def __ge__(self, other):
+        return self == other or other < self
+
+
+# =================== HTTP SERVER ===================
+
+class _FirestoreHandler(StandInHandler):
+    server_version = "SESGFirestoreStandIn/1.0"
+
+    # ---------- plumbing ----------
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            raise FirestoreError(400, "Invalid JSON payload")
+
+    def _route(self):
+        """Split the request path into (action, collection, doc_id, query)"""
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        path = unquote(parsed.path)
+        prefix = f"/v1/projects/{self.server.store.project_id}/databases/{DATABASE_ID}/documents"
+        if not path.startswith(prefix):
+            raise FirestoreError(404, f"Unknown resource: {path}")
+        rest = path[len(prefix):]
+        if rest.startswith(":"):
+            return rest[1:], None, None, query
+        parts = [p for p in rest.split("/") if p]
+        if len(parts) == 1:
+            return None, parts[0], None, query
+        if len(parts) == 2:
+            return None, parts[0], parts[1], query
+        raise FirestoreError(400, "Sub-collections are not supported by the stand-in")
+
+    def _handle(self, method):
+        self.server.inject_latency()
+        try:
+            action, collection, doc_id, query = self._route()
+            status, payload = self._dispatch(method, action, collection, doc_id, query)
+        except FirestoreError as e:
+            status, payload = e.code, e.to_json()
+        except (KeyError, TypeError, ValueError) as e:
+            status, payload = 400, FirestoreError(400, f"Malformed request: {e}").to_json()
+        self._send_json(status, payload)
+
+    def _dispatch(self, method, action, collection, doc_id, query):
+        store = self.server.store
+        mask = query.get("mask.fieldPaths")
+        exists = query.get("currentDocument.exists", [None])[0]
+        exists = None if exists is None else exists == "true"
+
+        if action == "runQuery" and method == "POST":
+            documents = store.run_query(self._read_json()["structuredQuery"])
+            read_time = timestamp()
+            return 200, [{"document": d, "readTime": read_time} for d in documents] or [{"readTime": read_time}]
+
+        if action == "batchGet" and method == "POST":
+            read_time = timestamp()
+            results = []
+            for name in self._read_json().get("documents", []):
+                try:
+                    results.append({"found": store.get(*store.split_name(name), mask=mask), "readTime": read_time})
+                except FirestoreError:
+                    results.append({"missing": name, "readTime": read_time})
+            return 200, results
+
+        if action == "commit" and method == "POST":
+            return 200, store.commit(self._read_json().get("writes", []))
+
+        if action is not None:
+            raise FirestoreError(404, f"Unknown action: {action}")
+
+        if doc_id is None:
+            if method == "GET":
+                page_size = int(query.get("pageSize", [0])[0]) or None
+                return 200, store.list(collection, page_size, query.get("pageToken", [None])[0], mask)
+            if method == "POST":
+                body = self._read_json()
+                return 200, store.create(collection, body.get("fields", {}), query.get("documentId", [None])[0])
+        else:
+            if method == "GET":
+                return 200, store.get(collection, doc_id, mask)
+            if method == "PATCH":
+                body = self._read_json()
+                update_mask = query.get("updateMask.fieldPaths")
+                return 200, store.update(collection, doc_id, body.get("fields", {}), update_mask, exists)
+            if method == "DELETE":
+                store.delete(collection, doc_id, exists)
+                return 200, {}
+
+        raise FirestoreError(400, f"Unsupported method {method} for this resource")
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PATCH, DELETE, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class _FirestoreServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store, latency, jitter, verbose):
+        super().__init__(address, _FirestoreHandler)
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.verbose = verbose
+
+    def inject_latency(self):
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FirestoreStandIn:
+    """Background-thread Firestore REST server backed by a FirestoreStore
+
+    `latency` (seconds) is added to every request, plus a uniform random
+    `jitter` on top, to simulate real Firestore round-trips.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0,
+                 project_id=PROJECT_ID, store=None, verbose=False):
+        self.store = store or FirestoreStore(project_id)
+        self._address = (host, port)
+        self._options = {"latency": latency, "jitter": jitter, "verbose": verbose}
+        self._server = None
+        self._thread = None
+
+    @property
+    def host(self):
+        """host:port, suitable for FIRESTORE_EMULATOR_HOST"""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}/v1/{self.store.root}"
+
+    def set_latency(self, latency, jitter=0.0):
+        self._options.update(latency=latency, jitter=jitter)
+        if self._server:
+            self._server.latency, self._server.jitter = latency, jitter
+
+    def start(self):
+        if self._server is None:
+            self._server = _FirestoreServer(self._address, self.store, **self._options)
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(0.1,), name="firestore-stand-in", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.firestore", description="Run the Firestore stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Added delay per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay (0..jitter) per request")
+    parser.add_argument("--project", default=PROJECT_ID)
+    args = parser.parse_args(argv)
+
+    stand_in = FirestoreStandIn(args.host, args.port, args.latency, args.jitter, args.project, verbose=True).start()
+    print(f"🔥 Firestore stand-in listening at {stand_in.base_url}")
+    print(f"   export FIRESTORE_EMULATOR_HOST={stand_in.host}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stand_in.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+Asyncio load generator for the frontend and the /api/* endpoints
+
+The stability checks used to fire a handful of threaded requests and report
+pass/fail. This module drives thousands of requests per second from a single
+event loop over keep-alive HTTP/1.1 connections (stdlib only) and reports
+throughput, latency percentiles, a latency histogram and an error breakdown.
+
+Workloads:
+    closed   `concurrency` virtual users, each sending its next request as soon
+             as the previous one finishes (plus optional think time); users
+             are started evenly over `ramp` seconds
+    open     requests arrive on a fixed schedule at `rate` per second (ramped
+             linearly from zero over `ramp` seconds) whether or not earlier
+             ones have finished; latency is measured from the scheduled
+             arrival time so a stalled server cannot hide queueing delay
+
+Usage:
+    report = LoadGenerator("http://127.0.0.1:3000", paths=["/", "/api/publications"]).run(
+        "open", rate=2000, duration=10, ramp=3)
+    print(format_report(report))
+
+    python -m harness.load http://127.0.0.1:3000 --mode closed --concurrency 200 --duration 10
+    python -m harness.load http://127.0.0.1:8001 --path /api/publications --mode open --rate 3000
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import ssl
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter
+from urllib.parse import urlsplit
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is unbounded
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+MODES = ("closed", "open")
+
+
+class LoadError(Exception):
+    """A request failed before a complete HTTP response was read"""
+
+
+# =================== ASYNC HTTP/1.1 CLIENT ===================
+
+class _Target:
+    def __init__(self, url):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        default_port = self.port == (443 if parts.scheme == "https" else 80)
+        self.host_header = self.host if default_port else f"{self.host}:{self.port}"
+        self.base_path = parts.path.rstrip("/")
+        self.query = f"?{parts.query}" if parts.query else ""
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+
+    def path(self, path):
+        if not path:
+            return (self.base_path or "/") + self.query
+        return f"{self.base_path}/{path.lstrip('/')}"
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+async def _connect(target):
+    reader, writer = await asyncio.open_connection(
+        target.host, target.port, ssl=target.ssl,
+        server_hostname=target.host if target.ssl else None,
+    )
+    return _Connection(reader, writer)
+
+
+async def _read_body(reader, headers, method, status):
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        return 0, True
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        size = 0
+        while True:
+            chunk_size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if chunk_size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return size, True
+            await reader.readexactly(chunk_size + 2)
+            size += chunk_size
+    if "content-length" in headers:
+        length = int(headers["content-length"])
+        await reader.readexactly(length)
+        return length, True
+    # No framing: the body runs until the server closes the connection
+    return len(await reader.read()), False
+
+
+async def _send_request(conn, target, method, path, body, extra_headers):
+    lines = [
+        f"{method} {path} HTTP/1.1",
+        f"Host: {target.host_header}",
+        "User-Agent: sesg-load/1.0",
+        "Accept: */*",
+        "Connection: keep-alive",
+    ]
+    lines += [f"{k}: {v}" for k, v in extra_headers.items()]
+    if body:
+        lines.append(f"Content-Length: {len(body)}")
+    conn.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+    await conn.writer.drain()
+
+    status_line = await conn.reader.readline()
+    if not status_line:
+        raise LoadError("connection closed")
+    version, status = status_line.split(b" ", 2)[:2]
+    status = int(status)
+    headers = {}
+    while True:
+        line = await conn.reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    size, framed = await _read_body(conn.reader, headers, method, status)
+    keep_alive = framed and version == b"HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    return status, size, keep_alive
+
+
+def _error_name(error):
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    if isinstance(error, ConnectionRefusedError):
+        return "connection refused"
+    if isinstance(error, (ConnectionResetError, asyncio.IncompleteReadError, LoadError)):
+        return "connection reset"
+    if isinstance(error, ssl.SSLError):
+        return "ssl error"
+    return type(error).__name__
+
+
+# =================== STATISTICS ===================
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LoadStats:
+    """Latency samples, status codes and error counts of one load run"""
+
+    def __init__(self):
+        self.latencies = []
+        self.status_codes = Counter()
+        self.errors = Counter()
+        self.bytes_received = 0
+        self.dropped = 0
+
+    def record_response(self, status, latency, size):
+        self.latencies.append(latency)
+        self.status_codes[status] += 1
+        self.bytes_received += size
+        if status >= 400:
+            self.errors[f"HTTP {status}"] += 1
+
+    def record_drop(self):
+        self.dropped += 1
+        self.errors["client overloaded"] += 1
+
+    def record_error(self, name, latency):
+        self.latencies.append(latency)
+        self.errors[name] += 1
+
+    def histogram(self):
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for latency in self.latencies:
+            counts[bisect_left(HISTOGRAM_BUCKETS_MS, latency * 1000)] += 1
+        bounds = HISTOGRAM_BUCKETS_MS + [None]
+        return [{"le_ms": bound, "count": count} for bound, count in zip(bounds, counts)]
+
+    def report(self, elapsed, **info):
+        ordered = sorted(self.latencies)
+        requests = len(ordered) + self.dropped
+        failed = sum(self.errors.values())
+
+        def ms(value):
+            return round(value * 1000, 3)
+
+        return dict(info, **{
+            "elapsed_seconds": round(elapsed, 3),
+            "requests": requests,
+            "successful": requests - failed,
+            "failed": failed,
+            "dropped": self.dropped,
+            "success_rate": round((requests - failed) / requests * 100, 2) if requests else 0.0,
+            "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed > 0 else 0.0,
+            "bytes_received": self.bytes_received,
+            "latency_ms": {
+                "min": ms(ordered[0]) if ordered else 0.0,
+                "mean": ms(sum(ordered) / len(ordered)) if ordered else 0.0,
+                "p50": ms(percentile(ordered, 50)),
+                "p95": ms(percentile(ordered, 95)),
+                "p99": ms(percentile(ordered, 99)),
+                "max": ms(ordered[-1]) if ordered else 0.0,
+            },
+            "histogram": self.histogram(),
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+            "errors": dict(self.errors.most_common()),
+        })
+
+
+# =================== LOAD GENERATOR ===================
+
+def arrival_offsets(rate, duration, ramp=0.0):
+    """Yield request start offsets (seconds) for an open-loop schedule
+
+    The rate rises linearly from 0 to `rate` over `ramp` seconds and then
+    stays constant until `duration`.
+    """
+    ramp = min(ramp, duration)
+    ramp_requests = rate * ramp / 2
+    n = 0
+    while True:
+        if n < ramp_requests:
+            offset = math.sqrt(2 * ramp * n / rate)
+        else:
+            offset = ramp + (n - ramp_requests) / rate
+        if offset >= duration:
+            return
+        yield offset
+        n += 1
+
+
+class LoadGenerator:
+    """Drive closed- or open-loop HTTP load at `url`, cycling through `paths`"""
+
+    def __init__(self, url, paths=None, method="GET", body=None, headers=None, timeout=10.0):
+        self.url = url
+        self.target = _Target(url)
+        self.paths = [self.target.path(p) for p in (paths or [""])]
+        self.method = method.upper()
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self._next_path = 0
+
+    def _path(self):
+        path = self.paths[self._next_path % len(self.paths)]
+        self._next_path += 1
+        return path
+
+    async def _request(self, conn, started, stats):
+        """Send one request on `conn` (opening one if None); returns the connection if reusable"""
+        try:
+            async def exchange(conn):
+                if conn is None:
+                    conn = await _connect(self.target)
+                try:
+                    return conn, await _send_request(conn, self.target, self.method, self._path(), self.body, self.headers)
+                except BaseException:
+                    conn.close()
+                    raise
+
+            conn, (status, size, keep_alive) = await asyncio.wait_for(exchange(conn), self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.record_error(_error_name(e), time.perf_counter() - started)
+            return None
+
+        stats.record_response(status, time.perf_counter() - started, size)
+        if keep_alive:
+            return conn
+        conn.close()
+        return None
+
+    async def closed_loop(self, concurrency=10, duration=10.0, ramp=0.0, think_time=0.0):
+        stats = LoadStats()
+        begin = time.perf_counter()
+        deadline = begin + duration
+
+        async def user(index):
+            await asyncio.sleep(ramp * index / concurrency if ramp else 0)
+            conn = None
+            while time.perf_counter() < deadline:
+                conn = await self._request(conn, time.perf_counter(), stats)
+                if think_time:
+                    await asyncio.sleep(think_time)
+            if conn is not None:
+                conn.close()
+
+        await asyncio.gather(*(user(i) for i in range(concurrency)))
+        return stats.report(time.perf_counter() - begin, mode="closed", url=self.url,
+                            concurrency=concurrency, duration=duration, ramp=ramp)
+
+    async def open_loop(self, rate=100.0, duration=10.0, ramp=0.0, max_in_flight=10000):
+        stats = LoadStats()
+        idle = []
+        in_flight = set()
+        begin = time.perf_counter()
+
+        async def fire(scheduled):
+            conn = idle.pop() if idle else None
+            conn = await self._request(conn, scheduled, stats)
+            if conn is not None:
+                idle.append(conn)
+
+        for offset in arrival_offsets(rate, duration, ramp):
+            scheduled = begin + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                stats.record_drop()
+                continue
+            task = asyncio.ensure_future(fire(scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        for conn in idle:
+            conn.close()
+        return stats.report(time.perf_counter() - begin, mode="open", url=self.url,
+                            rate=rate, duration=duration, ramp=ramp)
+
+    def run(self, mode="closed", **options):
+        """Run one workload to completion and return its report dict"""
+        if mode not in MODES:
+            raise ValueError(f"Unknown load mode {mode!r}, expected one of {MODES}")
+        workload = self.closed_loop if mode == "closed" else self.open_loop
+        return asyncio.run(workload(**options))
+
+
+def format_report(report):
+    """Human-readable summary of a load report"""
+    latency = report["latency_ms"]
+    lines = [
+        f"🚀 {report['mode']}-loop load against {report['url']}",
+        f"   Requests: {report['requests']} in {report['elapsed_seconds']:.2f}s "
+        f"({report['throughput_rps']:.1f} req/s), success rate {report['success_rate']:.1f}%",
+        f"⏱️  Latency ms: p50 {latency['p50']:.1f} | p95 {latency['p95']:.1f} | "
+        f"p99 {latency['p99']:.1f} | max {latency['max']:.1f}",
+    ]
+    total = report["requests"] or 1
+    for bucket in report["histogram"]:
+        if bucket["count"]:
+            label = f"<= {bucket['le_ms']} ms" if bucket["le_ms"] is not None else f"> {HISTOGRAM_BUCKETS_MS[-1]} ms"
+            lines.append(f"   {label:>12} {bucket['count']:>8} {'#' * max(1, round(40 * bucket['count'] / total))}")
+    if report["errors"]:
+        lines.append("❌ Errors: " + ", ".join(f"{name}: {count}" for name, count in report["errors"].items()))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.load", description="Generate HTTP load")
+    parser.add_argument("url", help="Base URL, e.g. http://127.0.0.1:3000")
+    parser.add_argument("--path", action="append", dest="paths", help="Path to request (repeatable, round-robin)")
+    parser.add_argument("--mode", choices=MODES, default="closed")
+    parser.add_argument("--concurrency", type=int, default=50, help="Virtual users (closed loop)")
+    parser.add_argument("--rate", type=float, default=500.0, help="Target requests per second (open loop)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to generate load")
+    parser.add_argument("--ramp", type=float, default=0.0, help="Seconds to ramp up users / arrival rate")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between requests per user (closed loop)")
+    parser.add_argument("--max-in-flight", type=int, default=10000, help="Outstanding request cap (open loop)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--json", dest="json_path", help="Write the full report to this file")
+    args = parser.parse_args(argv)
+
+    generator = LoadGenerator(args.url, args.paths, args.method, timeout=args.timeout)
+    if args.mode == "closed":
+        report = generator.run("closed", concurrency=args.concurrency, duration=args.duration,
+                               ramp=args.ramp, think_time=args.think_time)
+    else:
+        report = generator.run("open", rate=args.rate, duration=args.duration,
+                               ramp=args.ramp, max_in_flight=args.max_in_flight)
+
+    print(format_report(report))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Report written to {args.json_path}")
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""
+Prometheus-style metrics for the API stand-in
+
+/api/cache-status is a point-in-time snapshot that nothing can graph.
+Metrics keeps counters, gauges and histograms keyed by label sets and renders
+them in the Prometheus text exposition format (version 0.0.4), which any
+Prometheus server, Grafana agent or `curl` can read, without depending on
+prometheus_client. The API records per-route request counts, latency and
+response-size histograms, in-flight gauges and upstream fetch durations as
+requests happen; cache counters are copied in from the components' own
+statistics when /api/metrics is scraped.
+
+Usage:
+    metrics = Metrics()
+    metrics.describe("sesg_http_requests_total", "counter", "Requests served")
+    metrics.inc("sesg_http_requests_total", {"route": "/api/publications", "status": "200"})
+    metrics.describe("sesg_http_request_duration_seconds", "histogram", "Latency", LATENCY_BUCKETS)
+    metrics.observe("sesg_http_request_duration_seconds", 0.012, {"route": "/api/publications"})
+    print(metrics.render())
+"""
+
+import math
+import threading
+from bisect import bisect_left
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+KINDS = ("counter", "gauge", "histogram")
+
+
+def _labels_key(labels):
+    return tuple(sorted((str(name), str(value)) for name, value in (labels or {}).items()))
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is the +Inf bucket
+        self.sum = 0.0
+        self.count = 0
+
+
+class Metrics:
+    """Thread-safe metric families rendered in the Prometheus text format"""
+
+    def __init__(self):
+        self._families = {}  # name -> {"kind", "help", "buckets", "series": {labels key: value}}
+        self._lock = threading.Lock()
+
+    def describe(self, name, kind, help, buckets=None):
+        """Declare a family once; describing it again keeps the recorded series"""
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {', '.join(KINDS)}")
+        with self._lock:
+            self._families.setdefault(name, {"kind": kind, "help": help,
+                                             "buckets": tuple(sorted(buckets or LATENCY_BUCKETS)), "series": {}})
+
+    def _series(self, name, labels):
+        return self._families[name]["series"], _labels_key(labels)
+
+    def inc(self, name, labels=None, amount=1):
+        """Add to a counter or gauge"""
+        with self._lock:
+            series, key = self._series(name, labels)
+            series[key] = series.get(key, 0) + amount
+
+    def set(self, name, value, labels=None):
+        """Set a gauge, or a counter copied from a component's own running total"""
+        with self._lock:
+            series, key = self._series(name, labels)
+            series[key] = value
+
+    def reset(self, name):
+        """Drop every series of a family, e.g. a gauge whose label values went away"""
+        with self._lock:
+            self._families[name]["series"].clear()
+
+    def observe(self, name, value, labels=None):
+        """Record one sample in a histogram"""
+        with self._lock:
+            family = self._families[name]
+            series, key = family["series"], _labels_key(labels)
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(family["buckets"])
+            histogram.counts[bisect_left(family["buckets"], value)] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def value(self, name, labels=None):
+        """Current value of a counter or gauge series (count of a histogram series), 0 when unseen"""
+        with self._lock:
+            series, key = self._series(name, labels)
+            value = series.get(key, 0)
+            return value.count if isinstance(value, _Histogram) else value
+
+    def render(self):
+        """Every family in the text exposition format"""
+        lines = []
+        with self._lock:
+            for name, family in sorted(self._families.items()):
+                lines.append(f"# HELP {name} {family['help']}")
+                lines.append(f"# TYPE {name} {family['kind']}")
+                for key, value in sorted(family["series"].items()):
+                    if not isinstance(value, _Histogram):
+                        lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+                        continue
+                    cumulative = 0
+                    for bound, count in zip((*family["buckets"], math.inf), value.counts):
+                        cumulative += count
+                        le = "+Inf" if math.isinf(bound) else _format_value(bound)
+                        lines.append(f"{name}_bucket{_format_labels((*key, ('le', le)))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(value.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {value.count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,662 @@
+"""
+Indexed in-memory query engine for the list endpoints
+
+The backend answered GET /api/publications (and projects / achievements /
+news-events) by filtering the whole dataset, sorting what matched and slicing
+one page out of it on every request. DatasetIndex builds the indexes once per
+dataset load instead:
+
+    exact filters     value -> frozenset of row positions (category_filter,
+                      year_filter, area_filter, status_filter, featured_filter)
+    substring filters trigram postings with verification, so title_filter /
+                      author_filter keep their case-insensitive "contains"
+                      semantics without scanning every row
+    full text         the ranked inverted index of harness.search behind the
+                      `search` parameter (publications and projects); results
+                      are ordered by relevance unless sort_by says otherwise
+    sort keys         a sorted permutation per (sort_by, sort_order), built
+                      eagerly for the default sort and lazily for the others
+    cursors           rows tying on the sort key are ordered by id, so (key,
+                      id) places every row; next_cursor names both for the
+                      last row served and ?cursor= resumes right after that
+                      position, even when the row itself is gone. Deep pages
+                      cost O(page size), and rows inserted or deleted before
+                      the cursor neither shift, repeat nor skip the listing
+    statistics        publication counts and citation sums per (category,
+                      year, research areas), carried over from the previous
+                      load and patched row by row when the dataset changes
+
+A page is then read off the permutation: the engine walks it while checking
+membership in the candidate set when that touches few rows, and falls back to
+a partial sort of the candidates (heapq.nsmallest by rank) when the filter is
+very selective. The filter, sort and pagination semantics are those of the
+frontend's Google Sheets service (googleSheetsApi.js), which ApiService
+mirrors against the backend.
+
+Usage:
+    index = DatasetIndex("publications", records)
+    index.query({"category_filter": "Journal Articles", "sort_by": "year", "page": "2"})
+
+    python -m harness.query --rows 100000          # build time and per-query latency
+"""
+
+import argparse
+import base64
+import heapq
+import json
+import math
+import re
+import sys
+import time
+from datetime import date
+
+from harness.search import FullTextIndex
+
+# =================== DATASET SPECS ===================
+
+def _year_of(field):
+    """Year of a YYYY-MM-DD style date field, as text"""
+    def values(record):
+        match = re.match(r"\s*(\d{4})", str(record.get(field) or ""))
+        return [match.group(1)] if match else []
+    return values
+
+
+def _field(field):
+    """Values of a field for exact matching: list fields yield every element"""
+    def values(record):
+        value = record.get(field)
+        if value is None or value == "":
+            return []
+        if isinstance(value, list):
+            return [str(v) for v in value]
+        return [str(value)]
+    return values
+
+
+def _flag(field):
+    """Truthiness of a sheet flag (1, "1", "TRUE", "yes") for exact matching"""
+    def values(record):
+        return [flag_value(record.get(field))]
+    return values
+
+
+def flag_value(value):
+    """Flag cell or featured_filter value as the string true or false"""
+    return "true" if str(value if value is not None else "").strip().lower() in ("1", "true", "yes") else "false"
+
+
+def _int_key(value):
+    """parseInt(value) || 0"""
+    match = re.match(r"\s*([+-]?\d+)", str(value if value is not None else ""))
+    return int(match.group(1)) if match else 0
+
+
+def _date_key(value):
+    """Comparable form of a date field; unparsable dates sort before every real one"""
+    text = str(value or "").strip()
+    try:
+        return date.fromisoformat(text[:10]).isoformat()
+    except ValueError:
+        return ""
+
+
+def _text_key(value):
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return "" if value is None else str(value)
+
+
+DATASETS = {
+    "publications": {
+        "columns": ("id", "category", "authors", "title", "journal_book_conference_name", "volume", "issue",
+                    "location", "pages", "editors", "publisher", "year", "citations", "doi_link", "research_areas",
+                    "featured", "open_access", "ieee_formatted"),
+        "per_page": 20,
+        "sort_by": "year",
+        "exact": {"category_filter": _field("category"), "year_filter": _field("year"),
+                  "area_filter": _field("research_areas"), "featured_filter": _flag("featured")},
+        "text": {"title_filter": "title", "author_filter": "authors"},
+        "search": ("title", "authors", "year"),
+        "fulltext": {"title": 3, "authors": 2, "keywords": 2, "journal_book_conference_name": 1, "abstract": 1},
+        "sorts": {"year": _int_key, "citations": _int_key},
+    },
+    "projects": {
+        "columns": ("id", "title", "description", "status", "start_date", "end_date", "principal_investigator",
+                    "funding_agency", "research_areas", "image", "featured"),
+        "per_page": 20,
+        "sort_by": "start_date",
+        "exact": {"status_filter": _field("status"), "area_filter": _field("research_areas"),
+                  "featured_filter": _flag("featured")},
+        "text": {"title_filter": "title"},
+        "search": ("title", "status", "research_areas"),
+        "fulltext": {"title": 3, "principal_investigator": 2, "research_areas": 2, "keywords": 2,
+                     "funding_agency": 1, "description": 1},
+        "sorts": {"start_date": _date_key, "end_date": _date_key},
+    },
+    "achievements": {
+        "columns": ("id", "title", "short_description", "description", "full_content", "date", "category", "image",
+                    "featured"),
+        "per_page": 12,
+        "sort_by": "date",
+        "exact": {"category_filter": _field("category"), "year_filter": _year_of("date"),
+                  "featured_filter": _flag("featured")},
+        "text": {"title_filter": "title"},
+        "search": ("title",),
+        "sorts": {"date": _date_key},
+    },
+    "news_events": {
+        "columns": ("id", "title", "short_description", "description", "full_content", "date", "category",
+                    "location", "image", "featured"),
+        "per_page": 15,
+        "sort_by": "date",
+        "exact": {"category_filter": _field("category"), "featured_filter": _flag("featured")},
+        "text": {"title_filter": "title"},
+        "search": ("title",),
+        "sorts": {"date": _date_key},
+    },
+}
+
+SORT_ORDERS = ("asc", "desc")
+RELEVANCE = "relevance"  # sort_by of ranked full-text results, the default when `search` is given
+
+
+class QueryError(ValueError):
+    """Invalid list query parameter (rendered as a 400 response)"""
+
+
+def encode_cursor(sort_by, sort_order, key, record_id):
+    """Opaque cursor resuming a listing after the row with sort key `key` and id `record_id`"""
+    raw = json.dumps([sort_by, sort_order, key, record_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor):
+    """(sort_by, sort_order, key, record_id) of a cursor made by encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_by, sort_order, key, record_id = json.loads(raw)
+    except (ValueError, TypeError):
+        raise QueryError("Invalid cursor")
+    return sort_by, sort_order, key, record_id
+
+
+def _id_key(value):
+    """Row id as the tiebreaker of every sort ("" for rows without one)"""
+    return "" if value is None else str(value)
+
+
+def _text_of(record, field):
+    """Lower-cased searchable text of a field; list values are kept apart by newlines"""
+    value = record.get(field)
+    if isinstance(value, list):
+        return "\n".join(str(v) for v in value).lower()
+    return "" if value is None else str(value).lower()
+
+
+# =================== INDEXES ===================
+
+class SubstringIndex:
+    """Case-insensitive "contains" lookups over one text per row via trigram postings
+
+    Terms shorter than three characters have no trigram to look up and are
+    answered by scanning the pre-lowered texts.
+    """
+
+    def __init__(self, texts):
+        self.texts = texts
+        postings = {}
+        for position, text in enumerate(texts):
+            for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+                postings.setdefault(gram, []).append(position)
+        self.postings = postings
+
+    def search(self, term):
+        """Set of row positions whose text contains `term`"""
+        term = term.lower()
+        texts = self.texts
+        if len(term) < 3:
+            return {i for i, text in enumerate(texts) if term in text}
+        lists = []
+        for gram in {term[i:i + 3] for i in range(len(term) - 2)}:
+            posting = self.postings.get(gram)
+            if posting is None:
+                return set()
+            lists.append(posting)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for posting in lists[1:3]:
+            candidates.intersection_update(posting)
+        if len(term) == 3:
+            return candidates
+        return {i for i in candidates if term in texts[i]}
+
+
+class PublicationAggregates:
+    """Partial sums behind the publications statistics block
+
+    Publications are grouped into cells by (category, year) and, inside a
+    cell, by the set of research areas they carry; each group keeps its
+    publication count and citation sum. Statistics for any combination of
+    category_filter / year_filter / area_filter are composed from the
+    matching groups, so their cost depends on the number of distinct
+    (category, year, areas) groups rather than on the number of publications.
+    add() / remove() keep the sums current as rows change.
+    """
+
+    def __init__(self, records=()):
+        self.cells = {}
+        for record in records:
+            self.add(record)
+
+    @staticmethod
+    def _group(record):
+        category = _field("category")(record)
+        year = _field("year")(record)
+        areas = frozenset(record.get("research_areas") or [])
+        return (category[0] if category else "", year[0] if year else ""), areas
+
+    def _update(self, record, sign):
+        cell_key, areas = self._group(record)
+        cell = self.cells.setdefault(cell_key, {})
+        sums = cell.setdefault(areas, [0, 0])
+        sums[0] += sign
+        sums[1] += sign * _int_key(record.get("citations"))
+        if not sums[0]:
+            del cell[areas]
+            if not cell:
+                del self.cells[cell_key]
+
+    def add(self, record):
+        self._update(record, 1)
+
+    def copy(self):
+        clone = PublicationAggregates()
+        clone.cells = {key: {areas: list(sums) for areas, sums in cell.items()} for key, cell in self.cells.items()}
+        return clone
+
+    def remove(self, record):
+        self._update(record, -1)
+
+    def compose(self, category=None, year=None, area=None):
+        """Statistics of the publications matching the given exact filters"""
+        total = citations = latest = 0
+        areas = set()
+        for (cell_category, cell_year), groups in self.cells.items():
+            if (category is not None and cell_category != category) or (year is not None and cell_year != year):
+                continue
+            matched = False
+            for group_areas, (count, cited) in groups.items():
+                if area is not None and area not in group_areas:
+                    continue
+                total += count
+                citations += cited
+                areas |= group_areas
+                matched = True
+            if matched:
+                latest = max(latest, _int_key(cell_year))
+        return {
+            "total_publications": total,
+            "total_citations": citations,
+            "latest_year": latest if total else date.today().year,
+            "total_areas": len(areas),
+        }
+
+
+def _aggregate_key(record):
+    return PublicationAggregates._group(record), _int_key(record.get("citations"))
+
+
+def carry_over_aggregates(previous, records):
+    """Aggregates for `records`, updated from `previous` (an index of the same dataset) row by row
+
+    Rows are matched by id; only added, removed and changed rows touch the
+    sums. Falls back to a full build when ids are missing or repeated.
+    """
+    old = {r.get("id"): r for r in previous.records}
+    new = {r.get("id"): r for r in records}
+    if None in old or None in new or len(old) != len(previous.records) or len(new) != len(records):
+        return PublicationAggregates(records)
+    aggregates = previous.aggregates.copy()
+    for record_id, record in old.items():
+        replacement = new.get(record_id)
+        if replacement is None or _aggregate_key(replacement) != _aggregate_key(record):
+            aggregates.remove(record)
+    for record_id, record in new.items():
+        original = old.get(record_id)
+        if original is None or _aggregate_key(original) != _aggregate_key(record):
+            aggregates.add(record)
+    return aggregates
+
+
+class DatasetIndex:
+    """Rows of one dataset plus the exact, substring and sort indexes answering list queries"""
+
+    def __init__(self, dataset, records, previous=None):
+        if dataset not in DATASETS:
+            raise KeyError(f"Unknown dataset: {dataset}")
+        self.dataset = dataset
+        self.spec = DATASETS[dataset]
+        self.records = list(records)
+        self.version = 0
+        self.fingerprint = None  # content hash of the source rows, set by whoever loaded them
+        self.modified = None
+
+        start = time.perf_counter()
+        self.positions = {}
+        self._ids = [_id_key(record.get("id")) for record in self.records]
+        # columns of the sheet in first-seen order: the only other valid sort_by values
+        self.fields = dict.fromkeys(self.spec["columns"])
+        for position, record in enumerate(self.records):
+            self.positions.setdefault(self._ids[position], position)
+            if not self.fields.keys() >= record.keys():
+                self.fields.update(dict.fromkeys(record))
+        self.exact = {}
+        for param, values in self.spec["exact"].items():
+            postings = {}
+            for position, record in enumerate(self.records):
+                for value in values(record):
+                    postings.setdefault(value, []).append(position)
+            self.exact[param] = {value: frozenset(rows) for value, rows in postings.items()}
+        fields = set(self.spec["text"].values()) | set(self.spec["search"])
+        self.substring = {field: SubstringIndex([_text_of(r, field) for r in self.records]) for field in fields}
+        self.fulltext = FullTextIndex(self.records, self.spec["fulltext"]) if "fulltext" in self.spec else None
+        if self.dataset == "publications":
+            self.citations = [_int_key(r.get("citations")) for r in self.records]
+            self.years = [_int_key(r.get("year")) for r in self.records]
+            if previous is not None and getattr(previous, "aggregates", None) is not None:
+                self.aggregates = carry_over_aggregates(previous, self.records)
+            else:
+                self.aggregates = PublicationAggregates(self.records)
+        self._orders = {}
+        self.order(self.spec["sort_by"], "desc")
+        self.build_seconds = time.perf_counter() - start
+
+    def __len__(self):
+        return len(self.records)
+
+    def order(self, sort_by, sort_order):
+        """(permutation, rank) of the rows for a sort; ties are ordered by ascending id in either direction"""
+        cached = self._orders.get((sort_by, sort_order))
+        if cached is None:
+            convert = self.spec["sorts"].get(sort_by, _text_key)
+            keys = [convert(record.get(sort_by)) for record in self.records]
+            # Sorting by id first leaves ties in id order: the sort is stable, reverse=True included
+            permutation = sorted(range(len(keys)), key=self._ids.__getitem__)
+            permutation.sort(key=keys.__getitem__, reverse=sort_order == "desc")
+            rank = [0] * len(permutation)
+            for position, row in enumerate(permutation):
+                rank[row] = position
+            cached = self._orders[(sort_by, sort_order)] = (permutation, rank)
+        return cached
+
+    def sort_key(self, row, sort_by):
+        return self.spec["sorts"].get(sort_by, _text_key)(self.records[row].get(sort_by))
+
+    def cursor_for(self, row, sort_by, sort_order):
+        return encode_cursor(sort_by, sort_order, self.sort_key(row, sort_by), self._ids[row])
+
+    def resume(self, cursor, sort_by, sort_order):
+        """Position in the (sort_by, sort_order) permutation just after the row a cursor names"""
+        cursor_sort_by, cursor_sort_order, key, record_id = decode_cursor(cursor)
+        if (cursor_sort_by, cursor_sort_order) != (sort_by, sort_order):
+            raise QueryError("cursor was issued for a different sort_by / sort_order")
+        permutation, rank = self.order(sort_by, sort_order)
+        record_id = _id_key(record_id)
+        row = self.positions.get(record_id)
+        try:
+            if row is not None and self.sort_key(row, sort_by) == key:
+                return rank[row] + 1
+            # The row is gone or moved: resume at the first row sorting after (key, id),
+            # so rows tying with it on the key are neither skipped nor repeated
+            low, high = 0, len(permutation)
+            while low < high:
+                middle = (low + high) // 2
+                value, row_id = self.sort_key(permutation[middle], sort_by), self._ids[permutation[middle]]
+                after = (value > key) if sort_order == "asc" else (value < key)
+                if after or (value == key and row_id > record_id):
+                    high = middle
+                else:
+                    low = middle + 1
+        except TypeError:
+            raise QueryError("Invalid cursor")
+        return low
+
+    def filters(self, params):
+        """(filters, search term) of a query, with ApiService's search fan-out folded back"""
+        filters = {param: str(value) for param, value in params.items() if value is not None and value != ""}
+        search = filters.pop("search_filter", None)
+        if "featured_filter" in filters:
+            filters["featured_filter"] = flag_value(filters["featured_filter"])
+        # ApiService.getPublications fans one search box out into title_filter,
+        # author_filter and year_filter with the same value; that means "any of"
+        fanned = [filters.get(param) for param in ("title_filter", "author_filter", "year_filter")]
+        if self.dataset == "publications" and fanned[0] and fanned.count(fanned[0]) == 3:
+            search = search or fanned[0]
+            for param in ("title_filter", "author_filter", "year_filter"):
+                del filters[param]
+        return filters, search
+
+    def ranking(self, params):
+        """{row: relevance score} of the `search` parameter, or None without one"""
+        text = params.get("search")
+        if self.fulltext is None or text is None or str(text).strip() == "":
+            return None
+        return self.fulltext.search(str(text))
+
+    def matching(self, params, ranking=None):
+        """Row positions matching every filter in `params`, or None when nothing filters"""
+        filters, search = self.filters(params)
+        sets = [] if ranking is None else [set(ranking)]
+        for param, postings in self.exact.items():
+            if param in filters:
+                sets.append(postings.get(filters[param], frozenset()))
+        for param, field in self.spec["text"].items():
+            if param in filters:
+                sets.append(self.substring[field].search(filters[param]))
+        if search:
+            sets.append(set().union(*(self.substring[field].search(search) for field in self.spec["search"])))
+
+        if not sets:
+            return None
+        sets.sort(key=len)
+        result = sets[0]
+        for other in sets[1:]:
+            if not result:
+                break
+            result = result & other
+        return result
+
+    def page_rows(self, candidates, sort_by, sort_order, offset, limit, ranking=None, start=0):
+        """Positions of rows offset..offset+limit of the sorted candidates, counted from permutation position `start`"""
+        end = offset + limit
+        if sort_by == RELEVANCE:
+            scores = {row: ranking[row] for row in candidates}
+            return self.fulltext.ranked(None, end, scores)[offset:]
+        permutation, rank = self.order(sort_by, sort_order)
+        if candidates is None:
+            return permutation[start + offset:start + end]
+        if offset >= len(candidates):
+            return []
+        # Walking the permutation touches about end * n / |candidates| rows;
+        # a partial sort of the candidates costs about |candidates| * log(end)
+        if end * (len(permutation) - start) <= len(candidates) ** 2 * max(1.0, math.log2(end + 1)):
+            rows = []
+            for position in range(start, len(permutation)):
+                row = permutation[position]
+                if row in candidates:
+                    rows.append(row)
+                    if len(rows) == end:
+                        break
+            return rows[offset:]
+        if start:
+            candidates = [row for row in candidates if rank[row] >= start]
+        return heapq.nsmallest(end, candidates, key=rank.__getitem__)[offset:]
+
+    def parse(self, params):
+        """Validated (sort_by, sort_order, page, per_page) of a query"""
+        searching = self.fulltext is not None and str(params.get("search") or "").strip() != ""
+        sort_by = params.get("sort_by") or (RELEVANCE if searching else self.spec["sort_by"])
+        if sort_by == RELEVANCE and not searching:
+            raise QueryError("sort_by=relevance requires a search parameter")
+        # every (sort_by, sort_order) keeps a permutation of the whole dataset,
+        # so only real columns may create one
+        if sort_by != RELEVANCE and sort_by not in self.spec["sorts"] and sort_by not in self.fields:
+            raise QueryError(f"sort_by must be one of {', '.join(sorted({*self.spec['sorts'], *self.fields}))}")
+        sort_order = (params.get("sort_order") or "desc").lower()
+        if sort_order not in SORT_ORDERS:
+            raise QueryError(f"sort_order must be one of {', '.join(SORT_ORDERS)}")
+        try:
+            page = int(params.get("page") or 1)
+            per_page = int(params.get("per_page") or self.spec["per_page"])
+        except (TypeError, ValueError):
+            raise QueryError("page and per_page must be integers")
+        if page < 1 or per_page < 1:
+            raise QueryError("page and per_page must be at least 1")
+        return sort_by, sort_order, page, per_page
+
+    def validate(self, params):
+        """parse() plus the checks a cursor needs, without running the query"""
+        sort_by, sort_order, page, per_page = self.parse(params)
+        cursor = params.get("cursor")
+        if cursor:
+            if sort_by == RELEVANCE:
+                raise QueryError("cursor pagination needs an explicit sort_by")
+            if decode_cursor(str(cursor))[:2] != (sort_by, sort_order):
+                raise QueryError("cursor was issued for a different sort_by / sort_order")
+        return sort_by, sort_order, page, per_page
+
+    def statistics(self, params, candidates):
+        """Statistics block of a list response (None for datasets without one)
+
+        Publications statistics come from the aggregates whenever only the
+        category, year and area filters apply; other filters fall back to
+        summing over the matching rows.
+        """
+        if self.dataset == "publications":
+            filters, search = self.filters(params)
+            searching = str(filters.get("search") or "").strip() != ""  # a blank search matches everything
+            unaggregated = (*self.spec["text"], "featured_filter")
+            if candidates is None or (not search and not searching
+                                      and not any(param in filters for param in unaggregated)):
+                return self.aggregates.compose(filters.get("category_filter"), filters.get("year_filter"),
+                                               filters.get("area_filter"))
+            rows = candidates if isinstance(candidates, (set, frozenset)) else set(candidates)
+            areas = [area for area, members in self.exact["area_filter"].items() if not members.isdisjoint(rows)]
+            return {
+                "total_publications": len(rows),
+                "total_citations": sum(map(self.citations.__getitem__, rows)),
+                "latest_year": max(map(self.years.__getitem__, rows), default=date.today().year),
+                "total_areas": len(areas),
+            }
+        if self.dataset == "projects":
+            statuses = {status: len(rows) for status, rows in self.exact["status_filter"].items()}
+            return {
+                "total_projects": len(self.records),
+                "active_projects": statuses.get("Active", 0),
+                "completed_projects": statuses.get("Completed", 0),
+                "planning_projects": statuses.get("Planning", 0),
+            }
+        return None
+
+    def select(self, params):
+        """(row count, iterator over every matching row in sort order) of a query, ignoring pagination
+
+        Filters and sort are validated before this returns; the iterator then
+        walks the sort permutation lazily, so it never holds the rows it
+        yields.
+        """
+        sort_by, sort_order, _, _ = self.parse(params)
+        ranking = self.ranking(params)
+        candidates = self.matching(params, ranking)
+        if sort_by == RELEVANCE:
+            rows = self.fulltext.ranked(None, scores={row: ranking[row] for row in candidates})
+        else:
+            permutation, _ = self.order(sort_by, sort_order)
+            rows = permutation if candidates is None else (row for row in permutation if row in candidates)
+        total = len(self.records) if candidates is None else len(candidates)
+        return total, (self.records[row] for row in rows)
+
+    def query(self, params):
+        """List response for `params`: {<dataset>: [...], "pagination": {...}[, "statistics": {...}]}"""
+        sort_by, sort_order, page, per_page = self.validate(params)
+        ranking = self.ranking(params)
+        candidates = self.matching(params, ranking)
+        total = len(self.records) if candidates is None else len(candidates)
+        cursor = params.get("cursor")
+        if cursor:
+            start = self.resume(str(cursor), sort_by, sort_order)
+            rows = self.page_rows(candidates, sort_by, sort_order, 0, per_page + 1, start=start)
+            has_next = len(rows) > per_page
+            rows = rows[:per_page]
+            pagination = {"per_page": per_page, "total_items": total, "has_next": has_next}
+        else:
+            rows = self.page_rows(candidates, sort_by, sort_order, (page - 1) * per_page, per_page, ranking)
+            total_pages = -(-total // per_page)
+            has_next = page < total_pages
+            pagination = {
+                "current_page": page,
+                "per_page": per_page,
+                "total_items": total,
+                "total_pages": total_pages,
+                "has_prev": page > 1,
+                "has_next": has_next,
+            }
+        pagination["next_cursor"] = (self.cursor_for(rows[-1], sort_by, sort_order)
+                                     if has_next and rows and sort_by != RELEVANCE else None)
+        response = {self.dataset: [self.records[row] for row in rows], "pagination": pagination}
+        statistics = self.statistics(params, candidates)
+        if statistics is not None:
+            response["statistics"] = statistics
+        return response
+
+
+# =================== CLI ===================
+
+BENCH_QUERIES = [
+    {},
+    {"category_filter": "Journal Articles"},
+    {"category_filter": "Conference Proceedings", "year_filter": "2021", "sort_by": "citations"},
+    {"area_filter": "Smart Grid Technologies", "sort_order": "asc", "page": "50"},
+    {"title_filter": "grid"},
+    {"author_filter": "chen", "sort_by": "title", "sort_order": "asc"},
+    {"title_filter": "forecasting", "author_filter": "forecasting", "year_filter": "forecasting"},
+    {"search": "forecasting"},
+    {"search": "wind forecast"},
+    {"search": "rahman grid", "category_filter": "Journal Articles", "sort_by": "year"},
+    {"search": "microgr"},
+    {"category_filter": "Journal Articles", "page": "500"},
+    {"cursor": None, "category_filter": "Journal Articles", "page": "500"},
+]
+
+
+def main(argv=None):
+    from harness.bench import measure, summarize
+    from harness.sheets import synthetic_records
+
+    parser = argparse.ArgumentParser(prog="python -m harness.query", description="Benchmark the list query engine")
+    parser.add_argument("--dataset", default="publications", choices=sorted(DATASETS))
+    parser.add_argument("--rows", type=int, default=100000, help="Synthetic rows to index")
+    parser.add_argument("--samples", type=int, default=200, help="Timed runs per query")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    records = list(synthetic_records(args.dataset, args.rows, args.seed))
+    index = DatasetIndex(args.dataset, records)
+    print(f"📚 Indexed {len(index)} {args.dataset} in {index.build_seconds:.2f}s")
+    if index.fulltext is not None:
+        print(f"   full-text index: {len(index.fulltext)} tokens in {index.fulltext.build_seconds:.2f}s")
+    queries = BENCH_QUERIES if args.dataset == "publications" else [{}, {"title_filter": "grid"}, {"search": "grid"}]
+    for params in queries:
+        if "cursor" in params:  # the same deep page, reached by cursor instead of offset
+            before = dict(params, page=str(int(params["page"]) - 1), cursor=None)
+            params = dict(params, page=None, cursor=index.query(before)["pagination"]["next_cursor"])
+        stats = summarize(measure(lambda: index.query(params), args.samples, warmup=3))
+        total = index.query(params)["pagination"]["total_items"]
+        print(f"   {stats['median'] * 1e6:8.0f}µs median, {stats['p95'] * 1e6:8.0f}µs p95 "
+              f"({total} matches) {params or '(no filters)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Normalized query-result cache for the list endpoints
+
+The UI repeats the same handful of filter / sort / page combinations on
+publications, projects, achievements and news-events all day. ResultCache
+keeps the fully rendered JSON body of each list response, keyed on the
+dataset, the version of the dataset it was rendered from and the normalized
+query, bounded by the total size of the cached bodies with least-recently-used
+eviction.
+
+Normalization follows ApiService.get: parameters that are null / undefined /
+empty are dropped, the per-dataset defaults (page 1, per_page, sort_by,
+sort_order desc) are filled in, parameters the endpoint ignores are dropped
+and the rest is ordered, so "?page=1&category_filter=Books" and
+"?category_filter=Books&sort_order=desc&title_filter=" share one entry.
+
+Entries are Representations: the JSON body together with its strong ETag,
+Last-Modified time and gzip (and, when the optional brotli package is
+installed, br) variants compressed once when the body is rendered, so
+re-polls are answered with a 304 or a ready-made compressed body.
+
+Usage:
+    cache = ResultCache(max_bytes=32 * 1024 * 1024)
+    key = cache.key("publications", index.version, params)
+    response = cache.get(key)
+    if response is None:
+        response = cache.put(key, Representation(render(), etag, last_modified))
+    coding, body = response.select(request_headers.get("Accept-Encoding"))
+    cache.invalidate("publications", version=index.version)   # on refresh
+"""
+
+import gzip
+import threading
+from collections import OrderedDict
+
+from harness.query import DATASETS, RELEVANCE, flag_value
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+ENTRY_OVERHEAD = 256  # rough per-entry bookkeeping cost counted against max_bytes
+COMPRESS_MIN_BYTES = 1024  # smaller bodies are sent as they are
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+_ETAG_SUFFIXES = {"br": "-br", "gzip": "-gz", "identity": ""}
+_brotli = []
+
+
+def normalize_params(dataset, params):
+    """Canonical, hashable form of a list query as the endpoint will interpret it"""
+    spec = DATASETS[dataset]
+    known = set(spec["exact"]) | set(spec["text"]) | {"search_filter", "sort_by", "sort_order", "page", "per_page", "cursor"}
+    if "fulltext" in spec:
+        known.add("search")
+    values = {"page": "1", "per_page": str(spec["per_page"]), "sort_by": spec["sort_by"], "sort_order": "desc"}
+    for name, value in params.items():
+        if name in known and value is not None and str(value).strip() != "":
+            values[name] = str(value)
+    if "featured_filter" in values:
+        values["featured_filter"] = flag_value(values["featured_filter"])
+    if "search" in values and not params.get("sort_by"):
+        values["sort_by"] = RELEVANCE
+    if "cursor" in values:
+        del values["page"]  # ignored in cursor mode
+    values["sort_order"] = values["sort_order"].lower()
+    for name in ("page", "per_page"):
+        try:
+            values[name] = str(int(values[name]))
+        except ValueError:
+            pass  # left as given; the query engine rejects it
+    return tuple(sorted(values.items()))
+
+
+def brotli_module():
+    """The optional brotli package, or None when it is not installed"""
+    if not _brotli:
+        try:
+            import brotli
+        except ImportError:
+            brotli = None
+        _brotli.append(brotli)
+    return _brotli[0]
+
+
+def accepted_encodings(header):
+    """{coding: q} of an Accept-Encoding header; identity is acceptable unless refused"""
+    accepted = {}
+    for item in (header or "").split(","):
+        coding, _, parameters = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = parameters.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    star = accepted.pop("*", None)
+    for coding in ENCODING_PREFERENCE:
+        if coding not in accepted and star is not None:
+            accepted[coding] = star
+    accepted.setdefault("identity", 1.0)
+    return accepted
+
+
+class Representation:
+    """A rendered response body with its validators and precompressed variants
+
+    `etag` is the opaque tag of the identity body (without quotes); each
+    compressed variant carries the same tag with an encoding suffix so that
+    the tags stay strong.
+    """
+
+    def __init__(self, body, etag=None, last_modified=None, cache_control="no-cache"):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.cache_control = cache_control
+        self.variants = {"identity": body}
+        if len(body) >= COMPRESS_MIN_BYTES:
+            self.variants["gzip"] = gzip.compress(body, GZIP_LEVEL, mtime=0)
+            brotli = brotli_module()
+            if brotli is not None:
+                self.variants["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+
+    @property
+    def body(self):
+        return self.variants["identity"]
+
+    def __len__(self):
+        return sum(len(variant) for variant in self.variants.values())
+
+    def select(self, accept_encoding):
+        """(content coding, bytes) to send for an Accept-Encoding header"""
+        accepted = accepted_encodings(accept_encoding)
+        candidates = [coding for coding in ENCODING_PREFERENCE if coding in self.variants and accepted.get(coding, 0) > 0]
+        if not candidates:
+            return "identity", self.body
+        coding = max(candidates, key=lambda c: accepted[c])  # max keeps the first of equal q values
+        return coding, self.variants[coding]
+
+    def etag_for(self, coding):
+        """Quoted strong ETag of one variant"""
+        return f'"{self.etag}{_ETAG_SUFFIXES[coding]}"'
+
+
+def etag_matches(if_none_match, etag):
+    """The quoted tag of an If-None-Match header naming `etag` (unquoted) or one of its variants, else None"""
+    if not if_none_match or etag is None:
+        return None
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return f'"{etag}"'
+        opaque = (tag[2:] if tag.startswith("W/") else tag).strip('"')
+        base = opaque
+        for suffix in _ETAG_SUFFIXES.values():
+            if suffix and base.endswith(suffix):
+                base = base[:-len(suffix)]
+                break
+        if base == etag:
+            return f'"{opaque}"'
+    return None
+
+
+class ResultCache:
+    """Thread-safe LRU of rendered responses bounded by their total size in bytes
+
+    Values are bytes or Representations; a Representation counts all of its
+    variants against max_bytes.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._min_version = {}
+        self._floor = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    @staticmethod
+    def key(dataset, version, params):
+        return (dataset, version, normalize_params(dataset, params))
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        """Cache `body` under `key` and return it; bodies of superseded versions are not kept"""
+        size = len(body) + ENTRY_OVERHEAD
+        with self._lock:
+            dataset, version = key[0], key[1]
+            if version < max(self._floor, self._min_version.get(dataset, 0)) or size > self.max_bytes:
+                return body
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous) + ENTRY_OVERHEAD
+            self._entries[key] = body
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted) + ENTRY_OVERHEAD
+                self.evictions += 1
+        return body
+
+    def invalidate(self, dataset, version=None):
+        """Drop every body of `dataset`; with `version`, also refuse later puts of older versions"""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == dataset]
+            for key in stale:
+                self._bytes -= len(self._entries.pop(key)) + ENTRY_OVERHEAD
+            if version is not None:
+                self._min_version[dataset] = max(version, self._min_version.get(dataset, version))
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self, floor=None):
+        """Drop every body; with `floor`, refuse later puts of any version below it"""
+        with self._lock:
+            cleared = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            if floor is not None:
+                self._floor = max(self._floor, floor)
+            self.invalidations += cleared
+            return cleared
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
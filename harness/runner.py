@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Parallel Suite Runner for the root-level verification scripts
+
+Discovers every *_test.py / *_test_*.py / test_*.py script in the repository root, runs each
+one in its own interpreter with a bounded pool of worker processes, and merges
+the test_results / log_test output of all scripts into one JSON report.
+
+Usage:
+    python -m harness                      # run everything, one worker per core
+    python -m harness -j 8 --timeout 300   # 8 concurrent scripts
+    python -m harness backend_test.py gallery_backend_test.py
+    python -m harness --sheets google_sheets_api_test.py smooth_filtering_test.py
+    python -m harness --cassettes replay   # serve recorded responses, no network
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from harness.timings import DEFAULT_DB, TimingStore, endpoint_of, parse_seconds
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_PATTERN = re.compile(r"^(test_.+|.+_test(_.+)?)\.py$")
+DEFAULT_TIMEOUT = 600
+DEFAULT_REPORT = os.path.join(REPO_ROOT, "suite_report.json")
+
+# Attribute / global names the verification scripts use for their result stores
+RESULT_ATTRIBUTES = ("test_results", "results", "detailed_results")
+
+# "✅ Test name: details" / "❌ FAIL | Test name" lines printed by log_test helpers
+OUTPUT_LINE = re.compile(r"^\s*(✅|❌|⚠️)\s*(?:(?:PASS|FAIL|WARNING)\s*[|:]?\s*)?(.+?)\s*$")
+
+
+def discover_scripts(root=REPO_ROOT):
+    """Return the sorted paths of all verification scripts in the repository root"""
+    scripts = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if os.path.isfile(path) and SCRIPT_PATTERN.match(name):
+            scripts.append(path)
+    return scripts
+
+
+def _outcome(status):
+    """Map the many status conventions (bool, "PASS", "✅ PASS", "WARNING") onto one"""
+    if isinstance(status, bool):
+        return "passed" if status else "failed"
+    text = str(status).upper()
+    if "PASS" in text or "SUCCESS" in text or "✅" in text:
+        return "passed"
+    if "WARN" in text or "PARTIAL" in text or "⚠" in text:
+        return "warning"
+    if "PENDING" in text:
+        return "skipped"
+    return "failed"
+
+
+def _entry(item, name=None, category=None):
+    """Normalize one logged result dict into a report entry"""
+    if not isinstance(item, dict):
+        return {"name": name, "category": category, "outcome": _outcome(item), "details": ""}
+
+    if "success" in item:
+        status = item["success"]
+    elif "status" in item:
+        status = item["status"]
+    else:
+        status = item.get("passed", False)
+
+    details = item.get("details", "")
+    if isinstance(details, list):
+        details = "; ".join(str(d) for d in details)
+    error = item.get("error") or item.get("error_msg")
+    if error and not details:
+        details = str(error)
+
+    entry = {
+        "name": item.get("test") or item.get("name") or item.get("test_name") or name,
+        "category": item.get("category", category),
+        "outcome": _outcome(status),
+        "details": str(details),
+    }
+    # response_time strings ("0.23s") logged by the tester classes feed the timings store
+    seconds = parse_seconds(item.get("response_time")) if "response_time" in item else None
+    if seconds is not None:
+        entry["seconds"] = seconds
+        endpoint = item.get("endpoint") or item.get("url")
+        if isinstance(endpoint, str) and endpoint:
+            entry["endpoint"] = endpoint_of(endpoint) if "://" in endpoint else endpoint
+    return entry
+
+
+def normalize_results(results):
+    """Flatten a script's result store into a list of report entries
+
+    Handles the shapes used across the suite: lists of log_test dicts,
+    {"categories": {...}} and {"test_details": [...]} summaries, per-category
+    lists, and plain {test_name: bool} mappings.
+    """
+    if isinstance(results, list):
+        return [_entry(item) for item in results if isinstance(item, dict)]
+
+    if not isinstance(results, dict):
+        return []
+
+    if isinstance(results.get("categories"), dict):
+        entries = []
+        for category, data in results["categories"].items():
+            for item in data.get("tests", []) if isinstance(data, dict) else []:
+                entries.append(_entry(item, category=category))
+        return entries
+
+    for key in ("test_details", "tests"):
+        if isinstance(results.get(key), list):
+            return normalize_results(results[key])
+
+    entries = []
+    for key, value in results.items():
+        if isinstance(value, bool):
+            entries.append(_entry(value, name=key))
+        elif isinstance(value, dict) and "status" in value:
+            entries.append(_entry(value, name=key))
+        elif isinstance(value, list):
+            entries.extend(_entry(item, category=key) for item in value if isinstance(item, dict))
+    return entries
+
+
+def collect_results(namespace):
+    """Find tester objects and result dicts left in a script's globals"""
+    stores = []
+    for value in list(namespace.values()):
+        if isinstance(value, (type, types.ModuleType)) or callable(value):
+            continue
+        for attribute in RESULT_ATTRIBUTES:
+            store = getattr(value, attribute, None)
+            if isinstance(store, (dict, list)) and store:
+                stores.append(store)
+    for name in RESULT_ATTRIBUTES:
+        if isinstance(namespace.get(name), (dict, list)):
+            stores.append(namespace[name])
+
+    entries, seen = [], set()
+    for store in stores:
+        if id(store) not in seen:
+            seen.add(id(store))
+            entries.extend(normalize_results(store))
+    return entries
+
+
+def parse_output(output):
+    """Fallback: recover test outcomes from ✅/❌ lines printed by the script"""
+    entries = []
+    for line in output.splitlines():
+        match = OUTPUT_LINE.match(line)
+        if not match:
+            continue
+        icon, text = match.groups()
+        name, _, details = text.partition(":")
+        entries.append({
+            "name": name.strip(),
+            "category": None,
+            "outcome": {"✅": "passed", "❌": "failed"}.get(icon, "warning"),
+            "details": details.strip(),
+        })
+    return entries
+
+
+def _exit_code(code):
+    if code is None:
+        return 0
+    if isinstance(code, bool):  # bool is an int subclass: report sys.exit(True) as 1, not true
+        return int(code)
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_child(script, output_path):
+    """Execute one script as __main__ in this interpreter and dump its results
+
+    Runs in the worker process spawned by run_script(); keeping the globals
+    dict around (instead of runpy) lets us harvest tester objects even when
+    the script ends with sys.exit().
+    """
+    with open(script, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    namespace = {"__name__": "__main__", "__file__": script, "__builtins__": __builtins__}
+    sys.argv = [script]
+    sys.path.insert(0, os.path.dirname(script))
+
+    exit_code = 0
+    try:
+        exec(compile(source, script, "exec"), namespace)
+    except SystemExit as e:
+        exit_code = _exit_code(e.code)
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+
+    sys.stdout.flush()
+    try:
+        tests = collect_results(namespace)
+    except Exception:
+        traceback.print_exc()
+        tests = []
+
+    # Connection reuse counters of the shared pooled client, if the script used it
+    client = sys.modules.get("harness.client")
+    connections = client.http.stats() if client else None
+    timings = client.http.timings() if client else []
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump({"exit_code": exit_code, "tests": tests, "connections": connections, "timings": timings},
+                  f, default=str)
+    return exit_code
+
+
+def _summarize(tests):
+    counts = {"passed": 0, "failed": 0, "warning": 0, "skipped": 0}
+    for test in tests:
+        counts[test["outcome"]] = counts.get(test["outcome"], 0) + 1
+    return counts
+
+
+def run_script(script, timeout=DEFAULT_TIMEOUT, env=None):
+    """Run one verification script in a fresh interpreter and return its report entry
+
+    `env` holds extra environment variables for the script (e.g. the address
+    of an in-process stand-in service).
+    """
+    fd, output_path = tempfile.mkstemp(prefix="sesg-suite-", suffix=".json")
+    os.close(fd)
+
+    cmd = [sys.executable, "-m", "harness", "--child", script, "--child-output", output_path]
+    env = dict(os.environ, **(env or {}), PYTHONIOENCODING="utf-8", PYTHONUNBUFFERED="1")
+    start_time = time.perf_counter()
+    timed_out = False
+
+    try:
+        proc = subprocess.run(
+            cmd, cwd=REPO_ROOT, env=env, capture_output=True,
+            text=True, encoding="utf-8", errors="replace", timeout=timeout
+        )
+        exit_code, stdout, stderr = proc.returncode, proc.stdout, proc.stderr
+    except subprocess.TimeoutExpired as e:
+        timed_out = True
+        exit_code = None
+        stdout = e.stdout.decode("utf-8", "replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        stderr = e.stderr.decode("utf-8", "replace") if isinstance(e.stderr, bytes) else (e.stderr or "")
+
+    duration = time.perf_counter() - start_time
+
+    tests, connections, timings = [], None, []
+    try:
+        with open(output_path, "r", encoding="utf-8") as f:
+            child = json.load(f)
+        tests = child.get("tests", [])
+        connections = child.get("connections")
+        timings = child.get("timings", [])
+    except (OSError, ValueError):
+        pass
+    finally:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+    if not tests:
+        tests = parse_output(stdout)
+
+    counts = _summarize(tests)
+    if timed_out:
+        status = "timeout"
+    elif exit_code != 0 or counts["failed"]:
+        status = "failed"
+    else:
+        status = "passed"
+
+    return {
+        "script": os.path.relpath(script, REPO_ROOT),
+        "status": status,
+        "exit_code": exit_code,
+        "duration_seconds": round(duration, 3),
+        "counts": counts,
+        "connections": connections,
+        "timings": timings,
+        "tests": tests,
+        "stdout": stdout,
+        "stderr": stderr,
+    }
+
+
+def run_suite(scripts, workers=None, timeout=DEFAULT_TIMEOUT, on_result=None, env=None):
+    """Run scripts concurrently and return the merged report dict
+
+    Each script gets its own interpreter process; `workers` bounds how many
+    run at once (defaults to the number of CPU cores).
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    started_at = datetime.now().isoformat()
+    start_time = time.perf_counter()
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_script, script, timeout, env): script for script in scripts}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    results.sort(key=lambda r: r["script"])
+    totals = _summarize([t for r in results for t in r["tests"]])
+    connections = {"requests": 0, "connections_opened": 0, "connections_reused": 0,
+                   "cassette_hits": 0, "cassette_misses": 0, "cassette_recorded": 0}
+    for result in results:
+        for key in connections:
+            connections[key] += (result["connections"] or {}).get(key, 0)
+
+    return {
+        "started_at": started_at,
+        "finished_at": datetime.now().isoformat(),
+        "workers": workers,
+        "wall_time_seconds": round(time.perf_counter() - start_time, 3),
+        "cpu_time_seconds": round(sum(r["duration_seconds"] for r in results), 3),
+        "summary": {
+            "scripts": len(results),
+            "scripts_passed": sum(1 for r in results if r["status"] == "passed"),
+            "scripts_failed": sum(1 for r in results if r["status"] == "failed"),
+            "scripts_timed_out": sum(1 for r in results if r["status"] == "timeout"),
+            "tests": sum(totals.values()),
+            **totals,
+        },
+        "connections": connections,
+        "scripts": results,
+    }
+
+
+def _print_result(result):
+    icon = {"passed": "✅", "failed": "❌", "timeout": "⏰"}[result["status"]]
+    counts = result["counts"]
+    print(f"{icon} {result['script']} ({result['duration_seconds']:.1f}s) - "
+          f"{counts['passed']} passed, {counts['failed']} failed, {counts['warning']} warnings")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m harness", description="Run the verification scripts in parallel")
+    parser.add_argument("scripts", nargs="*", help="Scripts to run (default: discover all)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Concurrent scripts (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-script timeout in seconds")
+    parser.add_argument("--report", default=DEFAULT_REPORT, help="Path of the merged JSON report")
+    parser.add_argument("--list", action="store_true", help="List discovered scripts and exit")
+    parser.add_argument("--firestore", action="store_true",
+                        help="Start the in-process Firestore stand-in and export FIRESTORE_EMULATOR_HOST")
+    parser.add_argument("--firestore-latency", type=float, default=0.0,
+                        help="Latency injected per Firestore stand-in request, in seconds")
+    parser.add_argument("--sheets", action="store_true",
+                        help="Start the Apps Script stand-in and export the REACT_APP_*_API_URL variables")
+    parser.add_argument("--sheets-port", type=int, default=0,
+                        help="Port of the Apps Script stand-in (fix it to keep cassette keys stable)")
+    parser.add_argument("--sheets-delay", type=float, default=0.0,
+                        help="Delay added per Apps Script stand-in response, in seconds")
+    parser.add_argument("--sheets-multiplier", type=int, default=1,
+                        help="Repeat every Apps Script dataset N times to inflate payloads")
+    parser.add_argument("--sheets-error-rate", type=float, default=0.0,
+                        help="Fraction of Apps Script stand-in requests that fail (0..1)")
+    parser.add_argument("--api", action="store_true",
+                        help="Start the /api/* backend stand-in and export REACT_APP_BACKEND_URL")
+    parser.add_argument("--api-port", type=int, default=0, help="Port of the backend stand-in")
+    parser.add_argument("--cassettes", choices=["off", "record", "replay", "refresh"], default=None,
+                        help="Record HTTP responses to cassettes, replay them, or refresh stale ones")
+    parser.add_argument("--cassette-dir", default=None, help="Cassette directory (default: .cassettes/)")
+    parser.add_argument("--cassette-ttl", type=float, default=None,
+                        help="Age in seconds after which refresh mode re-records a cassette")
+    parser.add_argument("--timings-db", default=DEFAULT_DB,
+                        help="SQLite database the run's timings are appended to (default: suite_timings.db)")
+    parser.add_argument("--no-timings", action="store_true", help="Do not record timings for this run")
+    parser.add_argument("--label", default=None, help="Label stored with this run in the timings database")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--child-output", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.child:
+        return run_child(args.child, args.child_output)
+
+    scripts = [os.path.abspath(s) for s in args.scripts] or discover_scripts()
+    if args.list:
+        for script in scripts:
+            print(os.path.relpath(script, REPO_ROOT))
+        return 0
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"🚀 Running {len(scripts)} verification scripts with {workers} workers")
+    print("=" * 80)
+
+    env, services = {}, []
+    if args.cassettes:
+        env["SESG_CASSETTE_MODE"] = args.cassettes
+        if args.cassette_dir:
+            env["SESG_CASSETTE_DIR"] = os.path.abspath(args.cassette_dir)
+        if args.cassette_ttl is not None:
+            env["SESG_CASSETTE_TTL"] = str(args.cassette_ttl)
+        print(f"📼 Cassettes: {args.cassettes}")
+    if args.firestore:
+        from harness.firestore import FirestoreStandIn
+
+        firestore = FirestoreStandIn(latency=args.firestore_latency).start()
+        services.append(firestore)
+        env["FIRESTORE_EMULATOR_HOST"] = firestore.host
+        print(f"🔥 Firestore stand-in at {firestore.base_url}")
+    if args.sheets:
+        from harness.sheets import SheetsStandIn
+
+        sheets = SheetsStandIn(port=args.sheets_port, delay=args.sheets_delay, multiplier=args.sheets_multiplier,
+                               error_rate=args.sheets_error_rate, seed=0).start()
+        services.append(sheets)
+        env.update(sheets.environ())
+        print(f"📊 Apps Script stand-in at {sheets.base_url}")
+    if args.api:
+        from harness.api import ApiStandIn
+
+        api = ApiStandIn(port=args.api_port, urls=sheets.urls() if args.sheets else None).start()
+        services.append(api)
+        env.update(api.environ())
+        print(f"🧪 API stand-in at {api.api_url}")
+
+    try:
+        report = run_suite(scripts, workers=workers, timeout=args.timeout, on_result=_print_result, env=env)
+    finally:
+        for service in services:
+            service.stop()
+
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, default=str)
+
+    summary = report["summary"]
+    print("=" * 80)
+    print(f"📊 Scripts: {summary['scripts_passed']}/{summary['scripts']} passed, "
+          f"{summary['scripts_failed']} failed, {summary['scripts_timed_out']} timed out")
+    print(f"📊 Tests: {summary['passed']} passed, {summary['failed']} failed, {summary['warning']} warnings")
+    connections = report["connections"]
+    print(f"🔌 HTTP: {connections['requests']} requests, {connections['connections_opened']} connections opened, "
+          f"{connections['connections_reused']} reused")
+    if connections["cassette_hits"] or connections["cassette_misses"] or connections["cassette_recorded"]:
+        print(f"📼 Cassettes: {connections['cassette_hits']} replayed, {connections['cassette_misses']} missed, "
+              f"{connections['cassette_recorded']} recorded")
+    print(f"⏱️  Wall time: {report['wall_time_seconds']:.1f}s (script time: {report['cpu_time_seconds']:.1f}s)")
+    print(f"📄 Report written to {args.report}")
+
+    if not args.no_timings:
+        with TimingStore(args.timings_db) as store:
+            run_id = store.record_report(report, args.label)
+            degraded = store.degraded()
+        print(f"🗄️  Timings stored as run #{run_id} in {args.timings_db}")
+        for item in degraded:
+            print(f"⚠️  Slower than usual: {item['key']} {item['latest'] * 1000:.0f}ms "
+                  f"(median {item['baseline'] * 1000:.0f}ms, +{item['change']:.0%})")
+
+    return 0 if summary["scripts_failed"] == 0 and summary["scripts_timed_out"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
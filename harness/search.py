@@ -0,0 +1,116 @@
+"""
+Ranked full-text search for the list endpoints
+
+ApiService.getPublications fans one search box out into title_filter,
+author_filter and year_filter, which the query engine answers with three
+substring lookups and no notion of relevance. FullTextIndex is an inverted
+index over the text fields of a dataset (titles, authors, venues, abstracts,
+keywords for publications; titles, investigators, agencies, descriptions and
+research areas for projects):
+
+    tokenization   words of letters and digits, case folded, accents stripped
+                   ("Müller" and "muller" are the same token)
+    postings       token -> row positions and per-row weights; a row's weight
+                   is the sum over fields of field weight x occurrences
+    prefix match   every query token also matches the vocabulary entries it
+                   prefixes ("forecast" finds "forecasting"), at half weight
+    ranking        rows must match every query token; the score sums
+                   idf(token) x weight over the tokens
+
+Usage:
+    index = FullTextIndex(records, {"title": 3, "authors": 2, "abstract": 1})
+    scores = index.search("wind forecast")      # {row position: score}
+    best = index.ranked("wind forecast", 20)    # top positions, best first
+"""
+
+import heapq
+import math
+import re
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+PREFIX_WEIGHT = 0.5
+_TOKEN = re.compile(r"\w+")
+_PREFIX_END = "\U0010ffff"
+
+
+def tokenize(text):
+    """Case-folded, accent-stripped word tokens of a text"""
+    text = unicodedata.normalize("NFKD", str(text).casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _TOKEN.findall(text)
+
+
+def _field_text(value):
+    if isinstance(value, list):
+        return " ".join(str(v) for v in value)
+    return "" if value is None else str(value)
+
+
+class FullTextIndex:
+    """Inverted index with prefix expansion and tf-idf style ranking over weighted fields"""
+
+    def __init__(self, records, fields):
+        start = time.perf_counter()
+        postings = {}
+        rows = 0
+        for position, record in enumerate(records):
+            weights = {}
+            for field, weight in fields.items():
+                for token in tokenize(_field_text(record.get(field))):
+                    weights[token] = weights.get(token, 0) + weight
+            for token, weight in weights.items():
+                entry = postings.get(token)
+                if entry is None:
+                    entry = postings[token] = (array("I"), array("f"))
+                entry[0].append(position)
+                entry[1].append(weight)
+            rows += 1
+        self.rows = rows
+        self.postings = postings
+        self.vocabulary = sorted(postings)
+        self.build_seconds = time.perf_counter() - start
+
+    def __len__(self):
+        return len(self.vocabulary)
+
+    def expand(self, token):
+        """Vocabulary entries starting with `token` (the token itself included)"""
+        start = bisect_left(self.vocabulary, token)
+        end = bisect_left(self.vocabulary, token + _PREFIX_END, start)
+        return self.vocabulary[start:end]
+
+    def _token_scores(self, token, among=None):
+        scores = {}
+        for term in self.expand(token):
+            positions, weights = self.postings[term]
+            factor = math.log(1 + self.rows / len(positions)) * (1.0 if term == token else PREFIX_WEIGHT)
+            for position, weight in zip(positions, weights):
+                if among is None or position in among:
+                    scores[position] = max(scores.get(position, 0.0), factor * weight)
+        return scores
+
+    def search(self, text):
+        """{row position: score} of the rows matching every token of `text`"""
+        tokens = list(dict.fromkeys(tokenize(text)))
+        if not tokens:
+            return {}
+        # Start from the token with the fewest postings so later tokens only
+        # score rows that can still match
+        tokens.sort(key=lambda token: sum(len(self.postings[term][0]) for term in self.expand(token)))
+        scores = self._token_scores(tokens[0])
+        for token in tokens[1:]:
+            if not scores:
+                break
+            more = self._token_scores(token, scores)
+            scores = {position: score + more[position] for position, score in scores.items() if position in more}
+        return scores
+
+    def ranked(self, text, limit=None, scores=None):
+        """Row positions matching `text`, best first (ties in dataset order)"""
+        scores = self.search(text) if scores is None else scores
+        if limit is None:
+            return sorted(scores, key=lambda position: (-scores[position], position))
+        return heapq.nsmallest(limit, scores, key=lambda position: (-scores[position], position))
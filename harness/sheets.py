@@ -0,0 +1,354 @@
+"""
+Local Google Apps Script stand-in for the sheet6-sheet9 datasets
+
+google_sheets_api_test.py, smooth_filtering_test.py and research_areas_test.py
+fetch publications / projects / achievements / news_events straight from
+script.google.com, which takes 2-4 s per call and varies run to run. This
+server replays recorded payloads with the same JSON shapes and CORS headers as
+the deployed Apps Script web apps, so those checks are deterministic and can
+be run at scale without network access.
+
+Knobs:
+    delay        seconds added to every response (plus 0..jitter at random)
+    multiplier   repeat each dataset N times (ids suffixed) to inflate payloads
+    error_rate   fraction of requests answered with error_status (HTML body,
+                 like a failing Apps Script deployment); `seed` makes the
+                 sequence of failures reproducible
+
+URL surface (the deployment id segment is ignored):
+    GET /macros/s/<deployment>/exec?sheet=sheet6   publications (bare list)
+    GET /macros/s/<deployment>/exec?sheet=sheet7   {"projects": [...], "pagination": {...}}
+    GET /macros/s/<deployment>/exec?sheet=sheet8   {"achievements": [...]}
+    GET /macros/s/<deployment>/exec?sheet=sheet9   {"news_events": [...]}
+
+Usage:
+    with SheetsStandIn(delay=0.05, multiplier=10) as sheets:
+        os.environ.update(sheets.environ())
+        ...
+
+    python -m harness.sheets --port 8090 --delay 0.05 --multiplier 10 --error-rate 0.02
+"""
+
+import argparse
+import copy
+import json
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from harness.config import API_URL_VARS as ENV_VARS
+from harness.standin import StandInHandler
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "sheets"
+
+# sheet parameter -> dataset name, in the order the Apps Script deployments use
+SHEETS = {
+    "sheet6": "publications",
+    "sheet7": "projects",
+    "sheet8": "achievements",
+    "sheet9": "news_events",
+}
+
+DEPLOYMENT_ID = "sesg-local-stand-in"
+
+ERROR_PAGE = """<!DOCTYPE html><html><head><title>Error</title></head>
+<body><div>Script function not found: doGet</div></body></html>"""
+
+
+def load_datasets(data_dir=None):
+    """Read the recorded payload for every dataset from data_dir (defaults to the bundled fixtures)"""
+    data_dir = Path(data_dir) if data_dir else FIXTURES_DIR
+    datasets = {}
+    for name in SHEETS.values():
+        with open(data_dir / f"{name}.json", encoding="utf-8") as f:
+            datasets[name] = json.load(f)
+    return datasets
+
+
+def _items(dataset, payload):
+    """Return the record list inside a payload, whatever its envelope"""
+    if isinstance(payload, list):
+        return payload
+    return payload.get(dataset, [])
+
+
+def scale_payload(dataset, payload, multiplier):
+    """Repeat the records of a payload `multiplier` times, keeping ids unique"""
+    if multiplier <= 1:
+        return payload
+    base = _items(dataset, payload)
+    items = list(base)
+    for k in range(1, multiplier):
+        for item in base:
+            clone = copy.deepcopy(item)
+            if "id" in clone:
+                clone["id"] = f"{clone['id']}_{k}"
+            items.append(clone)
+
+    if isinstance(payload, list):
+        return items
+    scaled = dict(payload, **{dataset: items})
+    if "pagination" in scaled:
+        per_page = scaled["pagination"].get("per_page") or len(items) or 1
+        total_pages = max(1, -(-len(items) // per_page))
+        scaled["pagination"] = dict(
+            scaled["pagination"],
+            total_items=len(items),
+            total_pages=total_pages,
+            has_next=scaled["pagination"].get("current_page", 1) < total_pages,
+        )
+    return scaled
+
+
+_TOPICS = [
+    "Smart Grid", "Microgrid", "Wind Power", "Solar PV", "Battery Storage", "Demand Response",
+    "Power Quality", "Electric Vehicle Charging", "Distribution Network", "Frequency Control",
+    "Hydrogen Storage", "Load Forecasting", "Grid Resilience", "Transactive Energy",
+]
+_METHODS = [
+    "Deep Learning", "Reinforcement Learning", "Robust Optimization", "Model Predictive Control",
+    "Graph Neural Networks", "Stochastic Scheduling", "Federated Learning", "Digital Twins",
+]
+_SURNAMES = [
+    "Chen", "Thompson", "Rodriguez", "Rahman", "Ahmed", "Kim", "Hossain", "Garcia",
+    "Islam", "Novak", "Okafor", "Sato", "Müller", "Haque", "Silva", "Karim",
+]
+_RESEARCH_AREAS = [
+    "Smart Grid Technologies", "Microgrids & Distributed Energy Systems",
+    "Renewable Energy Integration", "Grid Optimization & Stability", "Energy Storage Systems",
+    "Power System Automation", "Cybersecurity and AI for Power Infrastructure",
+]
+_CATEGORIES = {
+    "publications": ["Journal Articles", "Conference Proceedings", "Book Chapters", "Books"],
+    "projects": ["Active", "Completed", "Planning"],
+    "achievements": ["Award", "Grant", "Recognition", "Publication"],
+    "news_events": ["News", "Events", "Upcoming Events"],
+}
+
+
+def synthetic_records(dataset, count, seed=0):
+    """Yield `count` varied records shaped like the recorded `dataset` rows
+
+    Titles, authors, years, dates, categories and research areas are drawn at
+    random (reproducibly for a given seed) around the bundled fixtures, for
+    benchmarks that need far more rows than the live sheets hold.
+    """
+    rng = random.Random(seed)
+    templates = _items(dataset, load_datasets()[dataset])
+    prefix = templates[0]["id"].rsplit("_", 1)[0]
+    categories = _CATEGORIES[dataset]
+    for n in range(1, count + 1):
+        record = copy.deepcopy(templates[n % len(templates)])
+        record["id"] = f"{prefix}_{n:07d}"
+        record["title"] = f"{rng.choice(_METHODS)} for {rng.choice(_TOPICS)} {rng.choice(['Planning', 'Operation', 'Analysis', 'Control'])}"
+        year = rng.randint(2005, 2025)
+        day = f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        if "research_areas" in record:
+            record["research_areas"] = rng.sample(_RESEARCH_AREAS, rng.randint(1, 3))
+        if dataset == "publications":
+            record["category"] = rng.choice(categories)
+            record["authors"] = [f"{chr(65 + rng.randrange(26))}. {rng.choice(_SURNAMES)}" for _ in range(rng.randint(1, 5))]
+            record["year"] = year
+            record["citations"] = int(rng.paretovariate(1.2)) - 1
+        elif dataset == "projects":
+            record["status"] = rng.choice(categories)
+            record["start_date"] = day
+            record["end_date"] = f"{year + rng.randint(1, 4)}{day[4:]}"
+        else:
+            record["category"] = rng.choice(categories)
+            record["date"] = day
+        yield record
+
+
+# =================== HTTP SERVER ===================
+
+class _SheetsHandler(StandInHandler):
+    server_version = "SESGSheetsStandIn/1.0"
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "no-cache, no-store, max-age=0, must-revalidate")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json; charset=utf-8")
+
+    def _handle(self):
+        self.server.inject_delay()
+        parsed = urlparse(self.path)
+        if not parsed.path.rstrip("/").endswith("/exec"):
+            self._send_json(404, {"error": f"Unknown resource: {parsed.path}"})
+            return
+
+        sheet = parse_qs(parsed.query).get("sheet", [None])[0]
+        if sheet not in SHEETS:
+            self._send_json(404, {"error": f"Unknown sheet: {sheet}", "sheets": sorted(SHEETS)})
+            return
+
+        if self.server.should_fail():
+            self._send(self.server.error_status, ERROR_PAGE.encode("utf-8"), "text/html; charset=utf-8")
+            return
+
+        self._send(200, self.server.body(SHEETS[sheet]), "application/json; charset=utf-8")
+
+    def do_GET(self):
+        self._handle()
+
+    def do_HEAD(self):
+        self._handle()
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, HEAD, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class _SheetsServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # keep load tests from stalling on SYN retries
+
+    def __init__(self, address, datasets, delay, jitter, multiplier, error_rate, error_status, seed, verbose):
+        super().__init__(address, _SheetsHandler)
+        self.datasets = datasets
+        self.delay = delay
+        self.jitter = jitter
+        self.multiplier = multiplier
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.verbose = verbose
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies = {}
+
+    def inject_delay(self):
+        with self._lock:
+            delay = self.delay + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def should_fail(self):
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def body(self, dataset):
+        """Serialized payload for a dataset, cached per multiplier"""
+        key = (dataset, self.multiplier)
+        body = self._bodies.get(key)
+        if body is None:
+            payload = scale_payload(dataset, self.datasets[dataset], self.multiplier)
+            body = self._bodies[key] = json.dumps(payload).encode("utf-8")
+        return body
+
+
+class SheetsStandIn:
+    """Background-thread Apps Script server replaying the sheet6-sheet9 payloads
+
+    `data_dir` points at a directory of {dataset}.json files recorded from the
+    live deployments; the bundled fixtures are used when it is omitted.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0, jitter=0.0, multiplier=1,
+                 error_rate=0.0, error_status=500, seed=None, data_dir=None, verbose=False):
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.datasets = load_datasets(data_dir)
+        self._address = (host, port)
+        self._options = {
+            "delay": delay, "jitter": jitter, "multiplier": multiplier,
+            "error_rate": error_rate, "error_status": error_status,
+            "seed": seed, "verbose": verbose,
+        }
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, dataset):
+        """Apps Script style URL serving `dataset` (publications, projects, ...)"""
+        sheet = next(s for s, name in SHEETS.items() if name == dataset)
+        return f"{self.base_url}/macros/s/{DEPLOYMENT_ID}/exec?sheet={sheet}"
+
+    def urls(self):
+        return {name: self.url_for(name) for name in SHEETS.values()}
+
+    def environ(self):
+        """REACT_APP_*_API_URL variables pointing the scripts at this server"""
+        return {ENV_VARS[name]: url for name, url in self.urls().items()}
+
+    def configure(self, **options):
+        """Change delay / jitter / multiplier / error_rate / error_status on a running server"""
+        unknown = set(options) - {"delay", "jitter", "multiplier", "error_rate", "error_status"}
+        if unknown:
+            raise TypeError(f"Unknown stand-in options: {sorted(unknown)}")
+        self._options.update(options)
+        if self._server:
+            for name, value in options.items():
+                setattr(self._server, name, value)
+
+    def start(self):
+        if self._server is None:
+            self._server = _SheetsServer(self._address, self.datasets, **self._options)
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(0.1,), name="sheets-stand-in", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.sheets", description="Run the Apps Script stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--delay", type=float, default=0.0, help="Added delay per response in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay (0..jitter) per response")
+    parser.add_argument("--multiplier", type=int, default=1, help="Repeat every dataset N times")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail (0..1)")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible jitter and failures")
+    parser.add_argument("--data-dir", default=None, help="Directory of recorded {dataset}.json payloads")
+    args = parser.parse_args(argv)
+
+    stand_in = SheetsStandIn(args.host, args.port, args.delay, args.jitter, args.multiplier,
+                             args.error_rate, args.error_status, args.seed, args.data_dir, verbose=True).start()
+    print(f"📊 Apps Script stand-in listening at {stand_in.base_url}")
+    for name, value in stand_in.environ().items():
+        print(f"   export {name}='{value}'")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stand_in.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    main()
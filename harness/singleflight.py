@@ -0,0 +1,89 @@
+"""
+Single-flight coalescing of concurrent upstream calls
+
+When a cached dataset expires or is cleared, every request arriving before
+the refetch completes used to start its own Google Sheets fetch. SingleFlight
+lets the first caller for a key run the call while everyone else asking for
+the same key waits for it and shares its result (or its exception), so a
+spike after invalidation costs one upstream call instead of hundreds.
+
+Usage:
+    flights = SingleFlight()
+    index = flights.do("publications", lambda: fetch("publications"))
+    print(flights.stats())   # {"publications": {"calls": 1, "coalesced": 99, "in_flight": 0, ...}}
+"""
+
+import threading
+import time
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """At most one in-flight call per (name, token); concurrent callers share its outcome
+
+    `name` groups the statistics (one upstream resource); `token` lets a
+    caller start a separate flight for the same resource, e.g. after a cache
+    clear made any call already in flight obsolete.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _counters(self, name):
+        return self._stats.setdefault(name, {"calls": 0, "coalesced": 0, "failures": 0, "max_waiters": 0,
+                                             "seconds": 0.0})
+
+    def do(self, name, fn, token=None):
+        """Result of fn(), run once for every caller that arrives while it is in flight"""
+        key = (name, token)
+        with self._lock:
+            call = self._calls.get(key)
+            counters = self._counters(name)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                counters["calls"] += 1
+            else:
+                call.waiters += 1
+                counters["coalesced"] += 1
+                counters["max_waiters"] = max(counters["max_waiters"], call.waiters)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        start = time.perf_counter()
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                counters["failures"] += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                counters["seconds"] += time.perf_counter() - start
+            call.done.set()
+
+    def stats(self):
+        """Per-name calls run, callers coalesced onto them, failures and the current in-flight count"""
+        with self._lock:
+            stats = {name: dict(counters) for name, counters in self._stats.items()}
+            for name, _ in self._calls:
+                stats[name]["in_flight"] = stats[name].get("in_flight", 0) + 1
+        for counters in stats.values():
+            counters.setdefault("in_flight", 0)
+            counters["seconds"] = round(counters["seconds"], 4)
+        return stats
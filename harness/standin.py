@@ -0,0 +1,29 @@
+"""
+Request handler base shared by the local HTTP stand-ins
+
+The Apps Script, Firestore and API stand-ins all speak keep-alive HTTP/1.1
+and write headers and body separately, which with Nagle's algorithm on costs
+a delayed-ACK stall (~40 ms) per response on loopback. StandInHandler holds
+those socket settings and the verbose-only request log in one place, so a
+new stand-in cannot forget one of them.
+
+Usage:
+    class _Handler(StandInHandler):
+        server_version = "SESGExampleStandIn/1.0"
+
+        def do_GET(self):
+            ...
+"""
+
+from http.server import BaseHTTPRequestHandler
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 handler with Nagle off, logging requests only when server.verbose"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
@@ -0,0 +1,298 @@
+"""
+SQLite time-series store of verification suite timings
+
+The tester classes collect response_time strings into in-memory dicts that
+are thrown away at exit. Every request sent through harness.client is now
+timed per endpoint, and `python -m harness` writes those timings - plus any
+response_time a script logged with its test results - to a local SQLite
+database keyed by run, script, test and endpoint. The report command shows
+latency trends across runs and flags endpoints whose timings degraded.
+
+Tables:
+    runs     one row per suite run (started_at, label, scripts, tests, wall time)
+    timings  run_id, script, test ('' for request-level rows), method, endpoint,
+             count, errors, mean / p50 / p95 / max seconds
+
+Usage:
+    python -m harness.timings                       # trends of the last 10 runs
+    python -m harness.timings --by test --runs 20
+    python -m harness.timings --threshold 0.5 --fail-on-degraded
+    python -m harness.timings runs
+"""
+
+import argparse
+import math
+import re
+import sqlite3
+import statistics
+import sys
+import threading
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_DB = Path(__file__).resolve().parent.parent / "suite_timings.db"
+DEFAULT_RUNS = 10
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    label TEXT,
+    scripts INTEGER,
+    tests INTEGER,
+    wall_time_seconds REAL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    script TEXT NOT NULL,
+    test TEXT NOT NULL DEFAULT '',
+    method TEXT NOT NULL DEFAULT '',
+    endpoint TEXT NOT NULL DEFAULT '',
+    count INTEGER NOT NULL,
+    errors INTEGER NOT NULL DEFAULT 0,
+    mean REAL,
+    p50 REAL,
+    p95 REAL,
+    max REAL
+);
+CREATE INDEX IF NOT EXISTS timings_endpoint ON timings (endpoint, method, run_id);
+CREATE INDEX IF NOT EXISTS timings_test ON timings (script, test, run_id);
+"""
+
+# Path segments that identify a record rather than a route (uuids, hex ids, numbers)
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{24,})$", re.I)
+
+# Query parameters that select a route rather than filter it (Apps Script's ?sheet=sheet6)
+ROUTING_PARAMS = ("sheet",)
+
+_SPARKS = "▁▂▃▄▅▆▇█"
+
+
+def endpoint_of(url):
+    """host/path of a URL with record ids collapsed to {id}, e.g. api.host/api/publications/{id}"""
+    parts = urlsplit(url)
+    segments = ["{id}" if _ID_SEGMENT.match(s) else s for s in parts.path.split("/")]
+    query = parse_qs(parts.query)
+    routing = "&".join(f"{p}={query[p][0]}" for p in ROUTING_PARAMS if p in query)
+    return f"{parts.netloc}{'/'.join(segments) or '/'}{'?' + routing if routing else ''}"
+
+
+def parse_seconds(value):
+    """Seconds from a logged response time: 0.23, "0.23s", "230ms"; None when not a duration"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.match(r"^\s*([\d.]+)\s*(ms|s)?\s*$", str(value))
+    if not match:
+        return None
+    try:
+        seconds = float(match.group(1))
+    except ValueError:
+        return None
+    return seconds / 1000 if match.group(2) == "ms" else seconds
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "count": n,
+        "mean": statistics.fmean(ordered),
+        "p50": statistics.median(ordered),
+        "p95": ordered[max(0, math.ceil(0.95 * n) - 1)],
+        "max": ordered[-1],
+    }
+
+
+class TimingRecorder:
+    """Thread-safe per-endpoint request durations collected by harness.client"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(list)
+        self._errors = defaultdict(int)
+
+    def record(self, method, url, status, seconds):
+        key = (method.upper(), endpoint_of(url))
+        with self._lock:
+            self._samples[key].append(seconds)
+            if not status or status >= 500:
+                self._errors[key] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return [
+                dict(_summary(samples), method=method, endpoint=endpoint, errors=self._errors[(method, endpoint)])
+                for (method, endpoint), samples in sorted(self._samples.items())
+            ]
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._errors.clear()
+
+
+class TimingStore:
+    """SQLite database of suite runs and their per-endpoint / per-test timings"""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else DEFAULT_DB
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record_report(self, report, label=None):
+        """Store a harness.runner suite report; returns the new run id"""
+        summary = report.get("summary", {})
+        with self._db:
+            run_id = self._db.execute(
+                "INSERT INTO runs (started_at, finished_at, label, scripts, tests, wall_time_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (report.get("started_at") or datetime.now().isoformat(), report.get("finished_at"), label,
+                 summary.get("scripts"), summary.get("tests"), report.get("wall_time_seconds")),
+            ).lastrowid
+            rows = []
+            for script in report.get("scripts", []):
+                name = script["script"]
+                for t in script.get("timings") or []:
+                    rows.append((run_id, name, "", t["method"], t["endpoint"], t["count"], t.get("errors", 0),
+                                 t["mean"], t["p50"], t["p95"], t["max"]))
+                for test in script.get("tests") or []:
+                    seconds = test.get("seconds")
+                    if seconds is not None:
+                        rows.append((run_id, name, test.get("name") or "", "", test.get("endpoint") or "", 1,
+                                     int(test.get("outcome") == "failed"), seconds, seconds, seconds, seconds))
+            self._db.executemany("INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return run_id
+
+    def runs(self, limit=DEFAULT_RUNS):
+        rows = self._db.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(r) for r in reversed(rows)]
+
+    def trends(self, by="endpoint", runs=DEFAULT_RUNS, match=None):
+        """Per-run latency series for every endpoint (or script/test) over the last `runs` runs
+
+        Returns {key: [{"run_id", "count", "errors", "mean", "p95", "max"}, ...]} oldest first;
+        the mean is weighted by request count, p95 / max are the worst seen in the run.
+        """
+        run_ids = [r["id"] for r in self.runs(runs)]
+        if not run_ids:
+            return {}
+        if by == "endpoint":
+            key_sql, where = "method || ' ' || endpoint", "test = '' AND endpoint != ''"
+        elif by == "test":
+            key_sql, where = "script || ' :: ' || test", "test != ''"
+        else:
+            raise ValueError(f"Unknown grouping {by!r}, expected 'endpoint' or 'test'")
+
+        placeholders = ",".join("?" * len(run_ids))
+        rows = self._db.execute(
+            f"SELECT {key_sql} AS key, run_id, SUM(count) AS count, SUM(errors) AS errors, "
+            f"SUM(mean * count) / SUM(count) AS mean, MAX(p95) AS p95, MAX(max) AS max "
+            f"FROM timings WHERE {where} AND run_id IN ({placeholders}) "
+            f"GROUP BY key, run_id ORDER BY key, run_id",
+            run_ids,
+        ).fetchall()
+
+        series = defaultdict(list)
+        for row in rows:
+            if match is None or match in row["key"]:
+                series[row["key"]].append({k: row[k] for k in ("run_id", "count", "errors", "mean", "p95", "max")})
+        return dict(series)
+
+    def degraded(self, by="endpoint", runs=DEFAULT_RUNS, threshold=DEFAULT_THRESHOLD,
+                 min_delta=DEFAULT_MIN_DELTA, match=None):
+        """Keys whose mean in the newest run exceeds the median of their earlier runs by more
+        than `threshold` (fraction) and `min_delta` seconds; keys absent from the newest run are skipped"""
+        newest = self.runs(1)
+        flagged = []
+        for key, points in self.trends(by, runs, match).items():
+            if len(points) < 2 or points[-1]["run_id"] != newest[0]["id"]:
+                continue
+            baseline = statistics.median(p["mean"] for p in points[:-1])
+            latest = points[-1]["mean"]
+            if latest > baseline * (1 + threshold) and latest - baseline > min_delta:
+                flagged.append({"key": key, "baseline": baseline, "latest": latest,
+                                "change": latest / baseline - 1 if baseline else math.inf})
+        return sorted(flagged, key=lambda f: f["change"], reverse=True)
+
+
+def sparkline(values):
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return _SPARKS[0] * len(values)
+    return "".join(_SPARKS[int((v - low) / (high - low) * (len(_SPARKS) - 1))] for v in values)
+
+
+def format_trends(store, by="endpoint", runs=DEFAULT_RUNS, threshold=DEFAULT_THRESHOLD,
+                  min_delta=DEFAULT_MIN_DELTA, match=None):
+    """Text report of latency trends with degraded keys marked"""
+    series = store.trends(by, runs, match)
+    if not series:
+        return "⚠️  No timings recorded yet - run the suite with python -m harness first"
+    flagged = {f["key"]: f for f in store.degraded(by, runs, threshold, min_delta, match)}
+
+    lines = [f"📊 Latency trends over the last {len(store.runs(runs))} runs (mean per run, oldest → newest)",
+             "=" * 80]
+    for key, points in sorted(series.items()):
+        means = [p["mean"] for p in points]
+        icon = "❌" if key in flagged else "✅"
+        change = f"  +{flagged[key]['change']:.0%} vs median" if key in flagged else ""
+        lines.append(f"{icon} {key}")
+        lines.append(f"     {sparkline(means)}  latest {means[-1] * 1000:.0f}ms, "
+                     f"p95 {points[-1]['p95'] * 1000:.0f}ms, {len(points)} runs{change}")
+    lines.append("=" * 80)
+    if flagged:
+        lines.append(f"❌ {len(flagged)} degraded (> +{threshold:.0%} and > {min_delta * 1000:.0f}ms over the run median)")
+    else:
+        lines.append("✅ No degraded timings")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.timings", description="Report suite timing trends")
+    parser.add_argument("command", nargs="?", choices=["report", "runs"], default="report")
+    parser.add_argument("--db", default=None, help="Timings database (default: suite_timings.db)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Number of recent runs to consider")
+    parser.add_argument("--by", choices=["endpoint", "test"], default="endpoint")
+    parser.add_argument("--match", default=None, help="Only keys containing this text")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown that counts as degraded (default 0.25)")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="Absolute slowdown in seconds below which changes are ignored (default 0.05)")
+    parser.add_argument("--fail-on-degraded", action="store_true", help="Exit 1 when anything degraded")
+    args = parser.parse_args(argv)
+
+    with TimingStore(args.db) as store:
+        if args.command == "runs":
+            for run in store.runs(args.runs):
+                wall = run["wall_time_seconds"]
+                print(f"#{run['id']:<5} {run['started_at']}  {run['scripts'] or 0} scripts, "
+                      f"{run['tests'] or 0} tests, {wall or 0:.1f}s  {run['label'] or ''}")
+            return 0
+        print(format_trends(store, args.by, args.runs, args.threshold, args.min_delta, args.match))
+        degraded = store.degraded(args.by, args.runs, args.threshold, args.min_delta, args.match)
+    return 1 if degraded and args.fail_on_degraded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,368 @@
+"""
+Resilient upstream client for the Apps Script dataset fetches
+
+test_result.md is a log of Google Sheets fetches timing out behind CORS
+proxies (timeouts tuned from 8 to 4 seconds, progressive proxy delays): the
+upstream is the API's dominant source of latency and failures. UpstreamClient
+wraps every dataset fetch in:
+
+    connection pool   a dedicated PooledClient, so keep-alive connections to
+                      script.google.com survive between refreshes
+    concurrency       at most `max_concurrency` requests in flight per
+                      upstream; a fetch waits for a slot, a hedge never does
+    hedging           when a request has not answered after `hedge_after`
+                      seconds a second one is sent and the first answer wins
+    retries           connection errors, timeouts, 408/429/5xx and non-JSON
+                      bodies are retried up to `retries` times after a full
+                      jitter backoff (uniform in 0..backoff * 2^n, capped)
+    circuit breaker   `breaker_failures` failed fetches in a row open the
+                      circuit for `breaker_seconds`; fetches then fail fast
+                      until one trial fetch (half-open) succeeds
+    last good copy    while the circuit is open, or when every attempt
+                      failed, the error raised is a SnapshotFallback carrying
+                      the last records fetched successfully and their age, so
+                      the caller can serve them while still seeing the failure
+
+Every decision is counted in the Metrics it is given (sesg_upstream_*) and
+summarized by stats().
+
+Configuration (environment variables, read when the client is created):
+    SESG_UPSTREAM_CONCURRENCY       requests in flight per upstream   (default 4)
+    SESG_UPSTREAM_HEDGE_SECONDS     hedge threshold, 0 disables       (default 2.5)
+    SESG_UPSTREAM_RETRIES           retries after the first attempt   (default 2)
+    SESG_UPSTREAM_BREAKER_FAILURES  failed fetches opening the circuit (default 5)
+    SESG_UPSTREAM_BREAKER_SECONDS   how long the circuit stays open   (default 30)
+
+Usage:
+    upstream = UpstreamClient(timeout=20)
+    records = upstream.fetch("publications", url, parse=lambda payload: payload["data"])
+    print(upstream.stats())   # {"upstreams": {"publications": {"state": "closed", "hedges": 1, ...}}, ...}
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from harness.client import PooledClient
+from harness.metrics import LATENCY_BUCKETS, Metrics
+
+DEFAULT_TIMEOUT = 20
+DEFAULT_CONCURRENCY = 4
+DEFAULT_HEDGE_SECONDS = 2.5
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.25
+DEFAULT_BACKOFF_CAP = 4.0
+DEFAULT_BREAKER_FAILURES = 5
+DEFAULT_BREAKER_SECONDS = 30
+WORKERS = 16
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+BREAKER_STATES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+RETRIABLE_STATUS = (408, 429)
+
+METRICS = (
+    ("sesg_upstream_attempts_total", "counter", "Upstream HTTP requests, by dataset, kind (primary, hedge) and outcome",
+     None),
+    ("sesg_upstream_attempt_duration_seconds", "histogram", "Time of one upstream HTTP request, by dataset",
+     LATENCY_BUCKETS),
+    ("sesg_upstream_retries_total", "counter", "Upstream requests retried after a backoff, by dataset", None),
+    ("sesg_upstream_hedges_total", "counter", "Hedged upstream requests, by dataset and result (sent, won)", None),
+    ("sesg_upstream_saturated_total", "counter", "Hedges skipped or fetches failed for want of a free slot", None),
+    ("sesg_upstream_requests_in_flight", "gauge", "Upstream HTTP requests holding a concurrency slot", None),
+    ("sesg_upstream_breaker_state", "gauge", "Circuit breaker state by dataset (0 closed, 1 half-open, 2 open)", None),
+    ("sesg_upstream_breaker_transitions_total", "counter", "Circuit breaker state changes, by dataset and state",
+     None),
+    ("sesg_upstream_rejected_total", "counter", "Fetches refused by an open circuit, by dataset", None),
+    ("sesg_upstream_fallbacks_total", "counter", "Fetches answered with the last good snapshot, by dataset", None),
+)
+
+
+def _env_number(name, default, kind=float):
+    value = os.environ.get(name)
+    return default if value is None or value.strip() == "" else kind(value)
+
+
+class UpstreamError(Exception):
+    """A failed upstream request; `retriable` says whether trying again may help"""
+
+    def __init__(self, message, retriable=True):
+        super().__init__(message)
+        self.retriable = retriable
+
+
+class CircuitOpen(UpstreamError):
+    """The circuit is open and there is no snapshot to fall back to"""
+
+    def __init__(self, name, seconds):
+        super().__init__(f"{name}: circuit open for another {seconds:.0f}s", retriable=False)
+
+
+class SnapshotFallback(UpstreamError):
+    """The fetch failed, but an earlier one succeeded: `records` is its result, fetched at `loaded`
+
+    `loaded` is a time.monotonic() reading and `fetched_at` the matching
+    time.time(); `error` is the failure behind the fallback.
+    """
+
+    def __init__(self, name, error, records, loaded, fetched_at):
+        super().__init__(f"{name}: serving the last good copy after {type(error).__name__}: {error}", retriable=False)
+        self.error = error
+        self.records = records
+        self.loaded = loaded
+        self.fetched_at = fetched_at
+
+
+class CircuitBreaker:
+    """Closed -> open after `failures` failed fetches in a row; open -> half-open after `seconds`
+
+    Half-open lets a single trial fetch through: its success closes the
+    circuit, its failure opens it again.
+    """
+
+    def __init__(self, failures=DEFAULT_BREAKER_FAILURES, seconds=DEFAULT_BREAKER_SECONDS, clock=time.monotonic):
+        self.failures = failures
+        self.seconds = seconds
+        self.clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def remaining(self):
+        """Seconds until an open circuit admits a trial (0 unless open)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.seconds - self.clock())
+
+    def allow(self):
+        """(allowed, new state or None) for a fetch about to start"""
+        with self._lock:
+            if self.state == OPEN and self.clock() - self.opened_at >= self.seconds:
+                self.state, self._trial = HALF_OPEN, True
+                return True, HALF_OPEN
+            if self.state == HALF_OPEN and not self._trial:
+                self._trial = True
+                return True, None
+            return self.state == CLOSED, None
+
+    def record(self, ok):
+        """Outcome of an allowed fetch; returns the new state when it changed, else None"""
+        with self._lock:
+            self._trial = False
+            if ok:
+                self.consecutive_failures = 0
+                if self.state != CLOSED:
+                    self.state = CLOSED
+                    return CLOSED
+                return None
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failures):
+                self.state, self.opened_at = OPEN, self.clock()
+                return OPEN
+            return None
+
+
+class _Upstream:
+    def __init__(self, name, concurrency, breaker):
+        self.name = name
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.breaker = breaker
+        self.snapshot = None  # (records, monotonic and epoch time fetched)
+        self.counters = {"fetches": 0, "failures": 0, "attempts": 0, "retries": 0, "hedges": 0, "hedges_won": 0,
+                         "rejected": 0, "fallbacks": 0}
+        self.last_error = None
+
+
+class UpstreamClient:
+    """Pooled HTTP fetches with bounded concurrency, hedging, retries and a circuit breaker per upstream"""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, max_concurrency=None, hedge_after=None, retries=None,
+                 backoff=DEFAULT_BACKOFF, backoff_cap=DEFAULT_BACKOFF_CAP, breaker_failures=None,
+                 breaker_seconds=None, client=None, metrics=None, sleep=time.sleep, rng=None):
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency or _env_number("SESG_UPSTREAM_CONCURRENCY", DEFAULT_CONCURRENCY, int)
+        self.hedge_after = _env_number("SESG_UPSTREAM_HEDGE_SECONDS", DEFAULT_HEDGE_SECONDS) \
+            if hedge_after is None else hedge_after
+        self.retries = _env_number("SESG_UPSTREAM_RETRIES", DEFAULT_RETRIES, int) if retries is None else retries
+        self.backoff = backoff
+        self.backoff_cap = backoff_cap
+        self.breaker_failures = breaker_failures or _env_number("SESG_UPSTREAM_BREAKER_FAILURES",
+                                                                DEFAULT_BREAKER_FAILURES, int)
+        self.breaker_seconds = _env_number("SESG_UPSTREAM_BREAKER_SECONDS", DEFAULT_BREAKER_SECONDS) \
+            if breaker_seconds is None else breaker_seconds
+        # primary plus hedge per slot, kept alive between refreshes
+        self.client = client or PooledClient(pool_maxsize=2 * self.max_concurrency)
+        self.metrics = metrics or Metrics()
+        for name, kind, help, buckets in METRICS:
+            self.metrics.describe(name, kind, help, buckets)
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._upstreams = {}
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _upstream(self, name):
+        with self._lock:
+            upstream = self._upstreams.get(name)
+            if upstream is None:
+                breaker = CircuitBreaker(self.breaker_failures, self.breaker_seconds)
+                upstream = self._upstreams[name] = _Upstream(name, self.max_concurrency, breaker)
+                self.metrics.set("sesg_upstream_breaker_state", 0, {"dataset": name})
+            return upstream
+
+    def _count(self, upstream, counter, metric=None, labels=None):
+        with self._lock:
+            upstream.counters[counter] += 1
+        if metric:
+            self.metrics.inc(metric, {"dataset": upstream.name, **(labels or {})})
+
+    def _transition(self, upstream, state):
+        if state is not None:
+            self.metrics.set("sesg_upstream_breaker_state", BREAKER_STATES[state], {"dataset": upstream.name})
+            self.metrics.inc("sesg_upstream_breaker_transitions_total", {"dataset": upstream.name, "state": state})
+
+    # =================== FETCH ===================
+
+    def fetch(self, name, url, parse=None):
+        """parse(JSON payload) of `url`
+
+        When the upstream is failing, raises SnapshotFallback with the last
+        good result of `name`, or the error itself (CircuitOpen when the
+        circuit refused the fetch) if nothing was ever fetched successfully.
+        """
+        upstream = self._upstream(name)
+        allowed, state = upstream.breaker.allow()
+        self._transition(upstream, state)
+        if not allowed:
+            self._count(upstream, "rejected", "sesg_upstream_rejected_total")
+            return self._fallback(upstream, CircuitOpen(name, upstream.breaker.remaining()))
+
+        self._count(upstream, "fetches")
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count(upstream, "retries", "sesg_upstream_retries_total")
+                self._sleep(self._rng.uniform(0, min(self.backoff_cap, self.backoff * 2 ** (attempt - 1))))
+            try:
+                payload = self._hedged(upstream, url)
+            except UpstreamError as e:
+                error = e
+                if e.retriable:
+                    continue
+                break
+            try:
+                result = parse(payload) if parse else payload
+            except Exception as e:  # a payload of the wrong shape will not improve on retry
+                error = e
+                break
+            self._transition(upstream, upstream.breaker.record(True))
+            with self._lock:
+                upstream.snapshot = (result, time.monotonic(), time.time())
+                upstream.last_error = None
+            return result
+
+        self._count(upstream, "failures")
+        self._transition(upstream, upstream.breaker.record(False))
+        return self._fallback(upstream, error)
+
+    def _fallback(self, upstream, error):
+        with self._lock:
+            upstream.last_error = f"{type(error).__name__}: {error}"
+            snapshot = upstream.snapshot
+        if snapshot is None:
+            raise error
+        self._count(upstream, "fallbacks", "sesg_upstream_fallbacks_total")
+        raise SnapshotFallback(upstream.name, error, *snapshot)
+
+    def _executor(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(WORKERS, thread_name_prefix="upstream")
+            return self._pool
+
+    def _hedged(self, upstream, url):
+        """JSON payload of the first of the primary request and its hedge to succeed"""
+        if not upstream.slots.acquire(timeout=self.timeout):
+            self.metrics.inc("sesg_upstream_saturated_total", {"dataset": upstream.name})
+            raise UpstreamError(f"{upstream.name}: {self.max_concurrency} requests already in flight")
+        pool = self._executor()
+        pending = {pool.submit(self._attempt, upstream, url, "primary")}
+        hedged, errors = False, []
+        while pending:
+            hedge_after = self.hedge_after if self.hedge_after and not hedged else None
+            done, pending = wait(pending, timeout=hedge_after, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                if upstream.slots.acquire(blocking=False):
+                    self._count(upstream, "hedges", "sesg_upstream_hedges_total", {"result": "sent"})
+                    pending.add(pool.submit(self._attempt, upstream, url, "hedge"))
+                else:
+                    self.metrics.inc("sesg_upstream_saturated_total", {"dataset": upstream.name})
+                continue
+            for future in done:
+                try:
+                    payload, kind = future.result()
+                except UpstreamError as e:
+                    errors.append(e)
+                    continue
+                if kind == "hedge":
+                    self._count(upstream, "hedges_won", "sesg_upstream_hedges_total", {"result": "won"})
+                return payload  # a request still pending finishes in the background
+        raise errors[0]
+
+    def _attempt(self, upstream, url, kind):
+        """(JSON payload, kind) of one HTTP request; releases the slot acquired for it"""
+        self.metrics.inc("sesg_upstream_requests_in_flight", {"dataset": upstream.name})
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            try:
+                response = self.client.get(url, timeout=self.timeout)
+            except Exception as e:  # connection errors and timeouts of either transport
+                raise UpstreamError(f"{upstream.name}: {type(e).__name__}: {e}") from e
+            status = response.status_code
+            if status >= 400:
+                raise UpstreamError(f"{upstream.name}: HTTP {status}",
+                                    retriable=status >= 500 or status in RETRIABLE_STATUS)
+            try:
+                payload = response.json()
+            except ValueError as e:  # Apps Script answers quota and script errors with HTML pages
+                raise UpstreamError(f"{upstream.name}: response is not JSON") from e
+            outcome = "ok"
+            return payload, kind
+        finally:
+            upstream.slots.release()
+            self._count(upstream, "attempts")
+            self.metrics.inc("sesg_upstream_requests_in_flight", {"dataset": upstream.name}, -1)
+            self.metrics.inc("sesg_upstream_attempts_total", {"dataset": upstream.name, "kind": kind,
+                                                             "outcome": outcome})
+            self.metrics.observe("sesg_upstream_attempt_duration_seconds", time.perf_counter() - start,
+                                 {"dataset": upstream.name})
+
+    # =================== STATUS ===================
+
+    def stats(self):
+        """Per-upstream breaker state, counters, snapshot age and last error, plus the pool's connection stats"""
+        now = time.monotonic()
+        with self._lock:
+            upstreams = list(self._upstreams.values())
+            stats = {}
+            for upstream in upstreams:
+                stats[upstream.name] = dict(
+                    upstream.counters,
+                    state=upstream.breaker.state,
+                    consecutive_failures=upstream.breaker.consecutive_failures,
+                    snapshot_age_seconds=round(now - upstream.snapshot[1], 3) if upstream.snapshot else None,
+                    last_error=upstream.last_error,
+                )
+        return {"upstreams": stats, "connections": self.client.stats()}
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        self.client.close()
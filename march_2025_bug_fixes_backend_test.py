@@ -15,7 +15,8 @@ This test suite verifies the backend functionality for the bug fixes implemented
 Testing Focus: Backend API endpoints, Firebase integration, and data consistency
 """
 
-import requests
+from harness.client import http
+from harness import config
 import json
 import time
 import sys
@@ -24,21 +25,11 @@ from urllib.parse import urljoin
 
 class March2025BugFixesBackendTest:
     def __init__(self):
-        # Get backend URL from frontend .env
-        try:
-            with open('/app/frontend/.env', 'r') as f:
-                env_content = f.read()
-                for line in env_content.split('\n'):
-                    if line.startswith('REACT_APP_BACKEND_URL='):
-                        self.base_url = line.split('=', 1)[1].strip()
-                        break
-                else:
-                    self.base_url = "https://admin-panel-repair-2.preview.emergentagent.com"
-        except:
-            self.base_url = "https://admin-panel-repair-2.preview.emergentagent.com"
+        # Get backend URL from the environment or frontend .env
+        self.base_url = config.backend_url("https://admin-panel-repair-2.preview.emergentagent.com")
         
         self.api_url = f"{self.base_url}/api"
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'March2025BugFixesTest/1.0'
@@ -9,7 +9,8 @@ This test suite specifically verifies the implementation of bug fixes by checkin
 3. Firebase integration and data consistency
 """
 
-import requests
+from harness.client import http
+from harness import config
 import json
 import time
 import sys
@@ -19,20 +20,10 @@ from urllib.parse import urljoin
 
 class March2025TargetedBackendTest:
     def __init__(self):
-        # Get backend URL from frontend .env
-        try:
-            with open('/app/frontend/.env', 'r') as f:
-                env_content = f.read()
-                for line in env_content.split('\n'):
-                    if line.startswith('REACT_APP_BACKEND_URL='):
-                        self.base_url = line.split('=', 1)[1].strip()
-                        break
-                else:
-                    self.base_url = "https://admin-panel-repair-2.preview.emergentagent.com"
-        except:
-            self.base_url = "https://admin-panel-repair-2.preview.emergentagent.com"
-        
-        self.session = requests.Session()
+        # Get backend URL from the environment or frontend .env
+        self.base_url = config.backend_url("https://admin-panel-repair-2.preview.emergentagent.com")
+        
+        self.session = http.session()
         self.session.headers.update({
             'User-Agent': 'March2025TargetedTest/1.0'
         })
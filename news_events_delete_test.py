@@ -6,7 +6,8 @@ Specifically focuses on the reported "Failed to delete news event. Please try ag
 This test will analyze the exact flow and identify potential root causes.
 """
 
-import requests
+from harness.client import http
+from harness import config
 import json
 import os
 import sys
@@ -172,14 +173,10 @@ def test_data_structure_compatibility():
     
     # Get News Events API URL
     try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    api_url = line.split('=', 1)[1].strip()
-                    break
+        api_url = config.require('REACT_APP_NEWS_EVENTS_API_URL')
         
         # Test API response
-        response = requests.get(api_url, timeout=10)
+        response = http.get(api_url, timeout=10)
         if response.status_code == 200:
             data = response.json()
             news_events = data if isinstance(data, list) else data.get('news_events', [])
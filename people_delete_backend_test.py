@@ -18,6 +18,7 @@ CRITICAL SUCCESS CRITERIA:
 """
 
 import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -105,7 +106,7 @@ class PeopleDeleteBackendTester:
     def test_frontend_service_status(self):
         """Test 1: Verify frontend service is running and accessible"""
         try:
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service Status", "PASS", 
                             f"Frontend accessible at {self.frontend_url} (Status: {response.status_code})")
@@ -207,7 +208,7 @@ class PeopleDeleteBackendTester:
             for route in admin_routes:
                 try:
                     url = f"{self.frontend_url}{route}"
-                    response = requests.get(url, timeout=5)
+                    response = http.get(url, timeout=5)
                     if response.status_code in [200, 302, 401]:  # 200=accessible, 302=redirect, 401=protected
                         auth_tests.append(f"Admin route {route} accessible (Status: {response.status_code})")
                     else:
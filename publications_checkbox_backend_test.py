@@ -16,7 +16,7 @@ Test Categories:
 Admin Credentials: admin/@dminsesg405
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -43,7 +43,7 @@ class PublicationsCheckboxTester:
         }
         
         # Session for maintaining cookies
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -79,7 +79,7 @@ class PublicationsCheckboxTester:
         
         try:
             start_time = time.time()
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             response_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -111,7 +111,7 @@ class PublicationsCheckboxTester:
         try:
             publications_url = f"{self.backend_url}/publications"
             start_time = time.time()
-            response = requests.get(publications_url, timeout=10)
+            response = self.session.get(publications_url, timeout=10)
             response_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -144,7 +144,7 @@ class PublicationsCheckboxTester:
         try:
             admin_login_url = f"{self.backend_url}/admin/login"
             start_time = time.time()
-            response = requests.get(admin_login_url, timeout=10)
+            response = self.session.get(admin_login_url, timeout=10)
             response_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -160,7 +160,7 @@ class PublicationsCheckboxTester:
         # Test admin panel main page
         try:
             admin_url = f"{self.backend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = self.session.get(admin_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Panel", "Admin Panel Main Access", True, 
                             f"Admin panel main page accessible")
@@ -323,7 +323,7 @@ class PublicationsCheckboxTester:
         # Test research areas page accessibility
         try:
             research_url = f"{self.backend_url}/research-areas"
-            response = requests.get(research_url, timeout=10)
+            response = self.session.get(research_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Research Areas", "Research Areas Page Access", True, 
                             f"Research areas page accessible, confirming checkbox compatibility")
@@ -376,7 +376,7 @@ class PublicationsCheckboxTester:
         for path, page_name in pages_to_test:
             try:
                 start_time = time.time()
-                response = requests.get(f"{self.backend_url}{path}", timeout=10)
+                response = self.session.get(f"{self.backend_url}{path}", timeout=10)
                 response_time = time.time() - start_time
                 total_response_time += response_time
                 
@@ -409,7 +409,7 @@ class PublicationsCheckboxTester:
         # Test static assets loading
         try:
             # Check for bundle.js or similar assets
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             content = response.text
             
             # Look for JavaScript bundle references
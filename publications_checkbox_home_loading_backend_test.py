@@ -11,7 +11,7 @@ Since this is a Firebase-based application, we test the Firebase service operati
 that support these frontend features.
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -59,7 +59,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
     def test_frontend_accessibility(self):
         """Test 1: Verify frontend service is accessible"""
         try:
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service Accessibility", True, f"Status: {response.status_code}")
                 return True
@@ -74,7 +74,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         """Test 2: Verify Firebase configuration is properly set up for publications and home data"""
         try:
             # Check if Firebase scripts are loaded in the frontend
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             html_content = response.text
             
             firebase_indicators = [
@@ -105,7 +105,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         try:
             # Test the publications page to see if it loads properly
             publications_url = f"{self.frontend_url}/publications"
-            response = requests.get(publications_url, timeout=10)
+            response = http.get(publications_url, timeout=10)
             
             if response.status_code == 200:
                 content = response.text
@@ -142,7 +142,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         try:
             # Test admin login page
             admin_url = f"{self.frontend_url}/admin/login"
-            response = requests.get(admin_url, timeout=10)
+            response = http.get(admin_url, timeout=10)
             
             if response.status_code == 200:
                 content = response.text
@@ -178,7 +178,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         """Test 5: Verify checkbox CSS fixes are properly implemented"""
         try:
             # Check if the main page loads the checkbox CSS
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             content = response.text
             
             # Look for checkbox-related CSS or styling
@@ -211,7 +211,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         try:
             # Test home page loading
             start_time = time.time()
-            response = requests.get(self.frontend_url, timeout=15)
+            response = http.get(self.frontend_url, timeout=15)
             load_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -250,7 +250,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         """Test 7: Verify Firebase home data structure supports loading states"""
         try:
             # Check if home page has proper data structure elements
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             content = response.text
             
             # Check for home data structure elements
@@ -283,12 +283,12 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         try:
             # Check admin panel for modal infrastructure
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = http.get(admin_url, timeout=10)
             
             if response.status_code in [200, 401, 403]:  # 401/403 means auth is working
                 # Check publications page for modal elements
                 publications_url = f"{self.frontend_url}/publications"
-                pub_response = requests.get(publications_url, timeout=10)
+                pub_response = http.get(publications_url, timeout=10)
                 
                 if pub_response.status_code == 200:
                     content = pub_response.text
@@ -330,7 +330,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         try:
             # Check research areas page
             research_url = f"{self.frontend_url}/research"
-            response = requests.get(research_url, timeout=10)
+            response = http.get(research_url, timeout=10)
             
             if response.status_code == 200:
                 content = response.text
@@ -366,7 +366,7 @@ class PublicationsCheckboxAndHomeLoadingBackendTest:
         """Test 10: Verify skeleton loading animations are implemented"""
         try:
             # Test home page for skeleton loading elements
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             content = response.text
             
             # Check for skeleton loading elements
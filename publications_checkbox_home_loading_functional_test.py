@@ -11,7 +11,7 @@ Since this is a React SPA with Firebase backend, we test the actual functionalit
 by checking page loads, response times, and basic functionality indicators.
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -59,7 +59,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
         """Test 1: Verify frontend service is running and responsive"""
         try:
             start_time = time.time()
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             response_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -88,7 +88,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
             load_times = []
             for i in range(3):
                 start_time = time.time()
-                response = requests.get(self.frontend_url, timeout=15)
+                response = http.get(self.frontend_url, timeout=15)
                 load_time = time.time() - start_time
                 load_times.append(load_time)
                 time.sleep(1)  # Brief pause between requests
@@ -112,7 +112,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
         try:
             publications_url = f"{self.frontend_url}/publications"
             start_time = time.time()
-            response = requests.get(publications_url, timeout=10)
+            response = http.get(publications_url, timeout=10)
             load_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -130,7 +130,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
         try:
             admin_url = f"{self.frontend_url}/admin/login"
             start_time = time.time()
-            response = requests.get(admin_url, timeout=10)
+            response = http.get(admin_url, timeout=10)
             load_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -148,7 +148,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
         try:
             research_url = f"{self.frontend_url}/research"
             start_time = time.time()
-            response = requests.get(research_url, timeout=10)
+            response = http.get(research_url, timeout=10)
             load_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -166,7 +166,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
         try:
             # Test the main bundle.js file
             bundle_url = f"{self.frontend_url}/static/js/bundle.js"
-            response = requests.get(bundle_url, timeout=10)
+            response = http.get(bundle_url, timeout=10)
             
             if response.status_code == 200:
                 # Check if it's a substantial JavaScript file
@@ -192,7 +192,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
                 'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1'
             }
             
-            response = requests.get(self.frontend_url, headers=mobile_headers, timeout=10)
+            response = http.get(self.frontend_url, headers=mobile_headers, timeout=10)
             
             if response.status_code == 200:
                 # Check for viewport meta tag (responsive design indicator)
@@ -226,7 +226,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
             
             for page in pages:
                 try:
-                    response = requests.get(page, timeout=8)
+                    response = http.get(page, timeout=8)
                     if response.status_code == 200:
                         successful_requests += 1
                     time.sleep(0.5)  # Brief pause between requests
@@ -250,7 +250,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
         try:
             # Test a non-existent page
             nonexistent_url = f"{self.frontend_url}/nonexistent-page-12345"
-            response = requests.get(nonexistent_url, timeout=10)
+            response = http.get(nonexistent_url, timeout=10)
             
             # For SPAs, this might return 200 with the main app, or 404
             if response.status_code in [200, 404]:
@@ -266,7 +266,7 @@ class PublicationsCheckboxHomeLoadingFunctionalTest:
     def test_security_headers(self):
         """Test 10: Verify basic security headers are present"""
         try:
-            response = requests.get(self.frontend_url, timeout=10)
+            response = http.get(self.frontend_url, timeout=10)
             headers = response.headers
             
             # Check for basic security headers
@@ -9,47 +9,32 @@ Tests the exact matching implementation for Research Areas page data filtering:
 """
 
 import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
 import sys
 import time
 
-# Get Google Sheets API URLs from frontend .env file
-def get_api_urls():
-    try:
-        urls = {}
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_PUBLICATIONS_API_URL='):
-                    urls['publications'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PROJECTS_API_URL='):
-                    urls['projects'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_ACHIEVEMENTS_API_URL='):
-                    urls['achievements'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    urls['news_events'] = line.split('=', 1)[1].strip()
-        return urls
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return {}
+# Google Sheets API URLs, resolved by configure() from the environment or the frontend .env file
+PUBLICATIONS_API_URL = PROJECTS_API_URL = ACHIEVEMENTS_API_URL = NEWS_EVENTS_API_URL = None
 
-API_URLS = get_api_urls()
-required_apis = ['publications', 'projects', 'achievements', 'news_events']
-for api in required_apis:
-    if not API_URLS.get(api):
-        print(f"ERROR: Could not get REACT_APP_{api.upper()}_API_URL from frontend/.env")
-        sys.exit(1)
+def configure():
+    """Resolve the API URLs and print the run banner"""
+    global PUBLICATIONS_API_URL, PROJECTS_API_URL, ACHIEVEMENTS_API_URL, NEWS_EVENTS_API_URL
+    API_URLS = config.api_urls(required=['publications', 'projects', 'achievements', 'news_events'])
 
-PUBLICATIONS_API_URL = API_URLS['publications']
-PROJECTS_API_URL = API_URLS['projects']
-ACHIEVEMENTS_API_URL = API_URLS['achievements']
-NEWS_EVENTS_API_URL = API_URLS['news_events']
+    PUBLICATIONS_API_URL = API_URLS['publications']
+    PROJECTS_API_URL = API_URLS['projects']
+    ACHIEVEMENTS_API_URL = API_URLS['achievements']
+    NEWS_EVENTS_API_URL = API_URLS['news_events']
 
-print(f"🎯 Research Areas Data Filtering Fix - Verification Testing")
-print(f"Publications API: {PUBLICATIONS_API_URL}")
-print(f"Projects API: {PROJECTS_API_URL}")
-print("=" * 80)
+    print(f"🎯 Research Areas Data Filtering Fix - Verification Testing")
+    print(f"Publications API: {PUBLICATIONS_API_URL}")
+    print(f"Projects API: {PROJECTS_API_URL}")
+    print("=" * 80)
 
 def test_data_accuracy_verification():
     """Test 1: Data Accuracy Verification - Verify research area counts match Google Sheets data"""
@@ -73,8 +58,8 @@ def test_data_accuracy_verification():
         print("   📊 Fetching all projects and publications from Google Sheets APIs...")
         start_time = time.time()
         
-        projects_response = requests.get(PROJECTS_API_URL, timeout=10)
-        publications_response = requests.get(PUBLICATIONS_API_URL, timeout=10)
+        projects_response = http.get(PROJECTS_API_URL, timeout=10)
+        publications_response = http.get(PUBLICATIONS_API_URL, timeout=10)
         
         end_time = time.time()
         fetch_time = end_time - start_time
@@ -177,7 +162,7 @@ def test_api_data_structure_validation():
         # Test Projects API structure
         print("   📊 Validating Projects API data structure...")
         
-        projects_response = requests.get(PROJECTS_API_URL, timeout=10)
+        projects_response = http.get(PROJECTS_API_URL, timeout=10)
         if projects_response.status_code == 200:
             projects_data = projects_response.json()
             projects = projects_data.get('projects', []) if isinstance(projects_data, dict) else projects_data
@@ -215,7 +200,7 @@ def test_api_data_structure_validation():
         # Test Publications API structure
         print("\n   📚 Validating Publications API data structure...")
         
-        publications_response = requests.get(PUBLICATIONS_API_URL, timeout=10)
+        publications_response = http.get(PUBLICATIONS_API_URL, timeout=10)
         if publications_response.status_code == 200:
             publications_data = publications_response.json()
             publications = publications_data.get('publications', []) if isinstance(publications_data, dict) else publications_data
@@ -264,8 +249,8 @@ def test_filtering_logic():
     
     try:
         # Fetch data
-        projects_response = requests.get(PROJECTS_API_URL, timeout=10)
-        publications_response = requests.get(PUBLICATIONS_API_URL, timeout=10)
+        projects_response = http.get(PROJECTS_API_URL, timeout=10)
+        publications_response = http.get(PUBLICATIONS_API_URL, timeout=10)
         
         if projects_response.status_code != 200 or publications_response.status_code != 200:
             print(f"   ❌ API access failed")
@@ -379,7 +364,7 @@ def test_performance_verification():
             for i in range(3):
                 try:
                     start_time = time.time()
-                    response = requests.get(api_url, timeout=10)
+                    response = http.get(api_url, timeout=10)
                     end_time = time.time()
                     response_time = end_time - start_time
                     
@@ -423,7 +408,7 @@ def test_performance_verification():
         def fetch_api(url, name):
             try:
                 start_time = time.time()
-                response = requests.get(url, timeout=10)
+                response = http.get(url, timeout=10)
                 end_time = time.time()
                 return {
                     'name': name,
@@ -536,5 +521,10 @@ def run_research_areas_filtering_tests():
 
 # Main execution
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     success = run_research_areas_filtering_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -12,6 +12,7 @@ Test Requirements:
 """
 
 import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -100,7 +101,7 @@ class ResearchAreasSyncBackendTester:
     def test_frontend_service_status(self):
         """Test 1: Verify frontend service is running and accessible"""
         try:
-            response = requests.get(self.backend_url, timeout=10)
+            response = http.get(self.backend_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Frontend Service Status", "PASS", 
                             f"Frontend accessible at {self.backend_url} (Status: {response.status_code})")
@@ -214,7 +215,7 @@ class ResearchAreasSyncBackendTester:
             
             for route in admin_routes:
                 try:
-                    response = requests.get(f"{self.backend_url}{route}", timeout=5)
+                    response = http.get(f"{self.backend_url}{route}", timeout=5)
                     if response.status_code in [200, 401, 403]:  # Expected responses for admin routes
                         auth_tests.append(f"Admin route {route} accessible")
                     else:
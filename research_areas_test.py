@@ -8,7 +8,9 @@ Tests the recent modifications to Research Areas page as requested in review:
 4. Real-time Data: Ensure Research Output section displays correct statistics
 """
 
-import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
@@ -16,39 +18,22 @@ import sys
 import time
 import concurrent.futures
 
-# Get Google Sheets API URLs from frontend .env file
-def get_api_urls():
-    try:
-        urls = {}
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_PUBLICATIONS_API_URL='):
-                    urls['publications'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PROJECTS_API_URL='):
-                    urls['projects'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_ACHIEVEMENTS_API_URL='):
-                    urls['achievements'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    urls['news_events'] = line.split('=', 1)[1].strip()
-        return urls
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return {}
+# Google Sheets API URLs, resolved by configure() from the environment (python -m harness --sheets)
+# or the frontend .env file
+PUBLICATIONS_API_URL = PROJECTS_API_URL = None
 
-API_URLS = get_api_urls()
-required_apis = ['publications', 'projects']
-for api in required_apis:
-    if not API_URLS.get(api):
-        print(f"ERROR: Could not get REACT_APP_{api.upper()}_API_URL from frontend/.env")
-        sys.exit(1)
+def configure():
+    """Resolve the API URLs and print the run banner"""
+    global PUBLICATIONS_API_URL, PROJECTS_API_URL
+    API_URLS = config.api_urls(required=['publications', 'projects'])
 
-PUBLICATIONS_API_URL = API_URLS['publications']
-PROJECTS_API_URL = API_URLS['projects']
+    PUBLICATIONS_API_URL = API_URLS['publications']
+    PROJECTS_API_URL = API_URLS['projects']
 
-print(f"🎯 Testing Research Areas Page Modifications (Review Request)")
-print(f"Publications API: {PUBLICATIONS_API_URL}")
-print(f"Projects API: {PROJECTS_API_URL}")
-print("=" * 80)
+    print(f"🎯 Testing Research Areas Page Modifications (Review Request)")
+    print(f"Publications API: {PUBLICATIONS_API_URL}")
+    print(f"Projects API: {PROJECTS_API_URL}")
+    print("=" * 80)
 
 def test_google_sheets_api_integration():
     """Test 1: Google Sheets API Integration for Research Areas"""
@@ -64,7 +49,7 @@ def test_google_sheets_api_integration():
         
         def fetch_api(url, name):
             try:
-                response = requests.get(url, timeout=8)
+                response = http.get(url, timeout=8)
                 return {
                     'name': name,
                     'status_code': response.status_code,
@@ -223,7 +208,7 @@ def test_loading_performance_optimization():
             for i in range(3):
                 start_time = time.time()
                 try:
-                    response = requests.get(api_url, timeout=6)
+                    response = http.get(api_url, timeout=6)
                     end_time = time.time()
                     response_time = end_time - start_time
                     
@@ -259,8 +244,8 @@ def test_loading_performance_optimization():
         start_time = time.time()
         with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
             futures = [
-                executor.submit(requests.get, PROJECTS_API_URL, timeout=6),
-                executor.submit(requests.get, PUBLICATIONS_API_URL, timeout=6)
+                executor.submit(http.get, PROJECTS_API_URL, timeout=6),
+                executor.submit(http.get, PUBLICATIONS_API_URL, timeout=6)
             ]
             concurrent_results = [future.result() for future in concurrent.futures.as_completed(futures)]
         end_time = time.time()
@@ -449,5 +434,10 @@ def run_research_areas_modifications_tests():
 
 # Main execution
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     success = run_research_areas_modifications_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
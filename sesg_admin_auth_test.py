@@ -12,7 +12,7 @@ This test suite verifies:
 Focus: User Management page showing blank despite Firebase working
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -65,7 +65,7 @@ class SESGAdminAuthTester:
         
         try:
             login_url = f"{self.frontend_url}/admin/login"
-            response = requests.get(login_url, timeout=15)
+            response = http.get(login_url, timeout=15)
             
             if response.status_code == 200:
                 content = response.text
@@ -124,7 +124,7 @@ class SESGAdminAuthTester:
             login_url = f"{self.frontend_url}/admin/login"
             
             # First get the login page to check form structure
-            response = requests.get(login_url, timeout=15)
+            response = http.get(login_url, timeout=15)
             
             if response.status_code == 200:
                 content = response.text
@@ -181,7 +181,7 @@ class SESGAdminAuthTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code in [200, 302]:
                 content = response.text
@@ -246,7 +246,7 @@ class SESGAdminAuthTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code in [200, 302]:
                 content = response.text
@@ -313,7 +313,7 @@ class SESGAdminAuthTester:
         try:
             # Test direct access to admin panel (User Management would be a tab/component)
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code in [200, 302]:
                 content = response.text
@@ -381,7 +381,7 @@ class SESGAdminAuthTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code in [200, 302]:
                 content = response.text
@@ -465,7 +465,7 @@ class SESGAdminAuthTester:
             
             for page_url in pages_to_check:
                 try:
-                    response = requests.get(page_url, timeout=15)
+                    response = http.get(page_url, timeout=15)
                     if response.status_code == 200:
                         content = response.text
                         
@@ -517,7 +517,7 @@ class SESGAdminAuthTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code in [200, 302]:
                 content = response.text
@@ -591,7 +591,7 @@ class SESGAdminAuthTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code in [200, 302]:
                 content = response.text
@@ -669,7 +669,7 @@ class SESGAdminAuthTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code in [200, 302]:
                 content = response.text
@@ -15,7 +15,7 @@ NEW SYSTEM FEATURES TO TEST:
 Admin Credentials: admin/@dminsesg705 (NEW)
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -42,7 +42,7 @@ class SESGAdminPanelTester:
         }
         
         # Session for maintaining cookies
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -79,7 +79,7 @@ class SESGAdminPanelTester:
         # Test admin login page accessibility
         try:
             login_url = f"{self.backend_url}/admin/login"
-            response = requests.get(login_url, timeout=10)
+            response = self.session.get(login_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("New Authentication", "Admin Login Page Access", True, 
                             f"Admin login page accessible at {login_url}")
@@ -117,7 +117,7 @@ class SESGAdminPanelTester:
         # Test admin dashboard accessibility
         try:
             admin_url = f"{self.backend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = self.session.get(admin_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("New Dashboard", "Admin Dashboard Access", True, 
                             f"NEW admin dashboard accessible at {admin_url}")
@@ -390,7 +390,7 @@ class SESGAdminPanelTester:
         # Test frontend service performance
         try:
             start_time = time.time()
-            response = requests.get(self.backend_url, timeout=10)
+            response = self.session.get(self.backend_url, timeout=10)
             end_time = time.time()
             response_time = end_time - start_time
             
@@ -407,7 +407,7 @@ class SESGAdminPanelTester:
         # Test admin panel performance
         try:
             start_time = time.time()
-            response = requests.get(f"{self.backend_url}/admin", timeout=10)
+            response = self.session.get(f"{self.backend_url}/admin", timeout=10)
             end_time = time.time()
             response_time = end_time - start_time
             
@@ -13,7 +13,7 @@ Review Request Testing:
 Admin Credentials: admin/@dminsesg405
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -40,7 +40,7 @@ class SESGAdminPanelTester:
         }
         
         # Session for maintaining cookies
-        self.session = requests.Session()
+        self.session = http.session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -125,7 +125,7 @@ class SESGAdminPanelTester:
         # Test admin login page
         try:
             login_url = f"{self.backend_url}/admin/login"
-            response = requests.get(login_url, timeout=10)
+            response = self.session.get(login_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Access", "Admin Login Page", True, 
                             f"Admin login accessible at /admin/login (Status: {response.status_code})")
@@ -139,7 +139,7 @@ class SESGAdminPanelTester:
         # Test admin panel dashboard
         try:
             admin_url = f"{self.backend_url}/admin"
-            response = requests.get(admin_url, timeout=10)
+            response = self.session.get(admin_url, timeout=10)
             if response.status_code == 200:
                 self.log_test("Admin Access", "Admin Panel Dashboard", True, 
                             f"Admin panel accessible at /admin (Status: {response.status_code})")
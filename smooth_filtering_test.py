@@ -9,6 +9,9 @@ Tests the backend infrastructure supporting smooth filtering improvements on:
 """
 
 import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
@@ -16,43 +19,26 @@ import sys
 import time
 from collections import defaultdict
 
-# Get Google Sheets API URLs from frontend .env file
-def get_api_urls():
-    try:
-        urls = {}
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_PUBLICATIONS_API_URL='):
-                    urls['publications'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_PROJECTS_API_URL='):
-                    urls['projects'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_ACHIEVEMENTS_API_URL='):
-                    urls['achievements'] = line.split('=', 1)[1].strip()
-                elif line.startswith('REACT_APP_NEWS_EVENTS_API_URL='):
-                    urls['news_events'] = line.split('=', 1)[1].strip()
-        return urls
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return {}
+# Google Sheets API URLs, resolved by configure() from the environment (python -m harness --sheets)
+# or the frontend .env file
+PUBLICATIONS_API_URL = PROJECTS_API_URL = ACHIEVEMENTS_API_URL = NEWS_EVENTS_API_URL = None
 
-API_URLS = get_api_urls()
-required_apis = ['publications', 'projects', 'achievements', 'news_events']
-for api in required_apis:
-    if not API_URLS.get(api):
-        print(f"ERROR: Could not get REACT_APP_{api.upper()}_API_URL from frontend/.env")
-        sys.exit(1)
+def configure():
+    """Resolve the API URLs and print the run banner"""
+    global PUBLICATIONS_API_URL, PROJECTS_API_URL, ACHIEVEMENTS_API_URL, NEWS_EVENTS_API_URL
+    API_URLS = config.api_urls(required=['publications', 'projects', 'achievements', 'news_events'])
 
-PUBLICATIONS_API_URL = API_URLS['publications']
-PROJECTS_API_URL = API_URLS['projects']
-ACHIEVEMENTS_API_URL = API_URLS['achievements']
-NEWS_EVENTS_API_URL = API_URLS['news_events']
+    PUBLICATIONS_API_URL = API_URLS['publications']
+    PROJECTS_API_URL = API_URLS['projects']
+    ACHIEVEMENTS_API_URL = API_URLS['achievements']
+    NEWS_EVENTS_API_URL = API_URLS['news_events']
 
-print(f"🎯 Testing Backend Infrastructure for Smooth Filtering Improvements")
-print(f"Publications API: {PUBLICATIONS_API_URL}")
-print(f"Projects API: {PROJECTS_API_URL}")
-print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
-print(f"News Events API: {NEWS_EVENTS_API_URL}")
-print("=" * 80)
+    print(f"🎯 Testing Backend Infrastructure for Smooth Filtering Improvements")
+    print(f"Publications API: {PUBLICATIONS_API_URL}")
+    print(f"Projects API: {PROJECTS_API_URL}")
+    print(f"Achievements API: {ACHIEVEMENTS_API_URL}")
+    print(f"News Events API: {NEWS_EVENTS_API_URL}")
+    print("=" * 80)
 
 def test_google_sheets_api_performance():
     """Test all 4 API endpoints for performance supporting smooth filtering"""
@@ -76,7 +62,7 @@ def test_google_sheets_api_performance():
             response_times = []
             for i in range(3):
                 start_time = time.time()
-                response = requests.get(api_url, timeout=6)
+                response = http.get(api_url, timeout=6)
                 end_time = time.time()
                 response_time = end_time - start_time
                 
@@ -131,7 +117,7 @@ def test_data_structure_for_independent_filtering():
     # Test Publications API for independent filtering support
     print("\n   📚 Testing Publications API Data Structure...")
     try:
-        response = requests.get(PUBLICATIONS_API_URL, timeout=6)
+        response = http.get(PUBLICATIONS_API_URL, timeout=6)
         if response.status_code == 200:
             data = response.json()
             publications = data.get('publications', []) if isinstance(data, dict) else data
@@ -190,7 +176,7 @@ def test_data_structure_for_independent_filtering():
     # Test Projects API for independent filtering support
     print("\n   📊 Testing Projects API Data Structure...")
     try:
-        response = requests.get(PROJECTS_API_URL, timeout=6)
+        response = http.get(PROJECTS_API_URL, timeout=6)
         if response.status_code == 200:
             data = response.json()
             projects = data.get('projects', []) if isinstance(data, dict) else data
@@ -255,7 +241,7 @@ def test_data_structure_for_independent_filtering():
     # Test Achievements API for filtering support
     print("\n   🏆 Testing Achievements API Data Structure...")
     try:
-        response = requests.get(ACHIEVEMENTS_API_URL, timeout=6)
+        response = http.get(ACHIEVEMENTS_API_URL, timeout=6)
         if response.status_code == 200:
             data = response.json()
             achievements = data.get('achievements', data.get('data', [])) if isinstance(data, dict) else data
@@ -305,7 +291,7 @@ def test_data_structure_for_independent_filtering():
     # Test News Events API for filtering support
     print("\n   📰 Testing News Events API Data Structure...")
     try:
-        response = requests.get(NEWS_EVENTS_API_URL, timeout=6)
+        response = http.get(NEWS_EVENTS_API_URL, timeout=6)
         if response.status_code == 200:
             data = response.json()
             news_events = data.get('news_events', data.get('data', [])) if isinstance(data, dict) else data
@@ -367,7 +353,7 @@ def test_response_time_for_smooth_ui():
         def fetch_api_with_timing(url, name):
             try:
                 start_time = time.time()
-                response = requests.get(url, timeout=8)
+                response = http.get(url, timeout=8)
                 end_time = time.time()
                 return {
                     'name': name,
@@ -449,7 +435,7 @@ def test_filter_data_completeness():
     # Test Publications filter completeness
     print("\n   📚 Testing Publications Filter Data Completeness...")
     try:
-        response = requests.get(PUBLICATIONS_API_URL, timeout=6)
+        response = http.get(PUBLICATIONS_API_URL, timeout=6)
         if response.status_code == 200:
             data = response.json()
             publications = data.get('publications', []) if isinstance(data, dict) else data
@@ -484,7 +470,7 @@ def test_filter_data_completeness():
     # Test Projects filter completeness
     print("\n   📊 Testing Projects Filter Data Completeness...")
     try:
-        response = requests.get(PROJECTS_API_URL, timeout=6)
+        response = http.get(PROJECTS_API_URL, timeout=6)
         if response.status_code == 200:
             data = response.json()
             projects = data.get('projects', []) if isinstance(data, dict) else data
@@ -524,7 +510,7 @@ def test_api_resilience_and_error_handling():
     print("\n   ⏱️  Testing Timeout Resilience...")
     try:
         # Test with very short timeout
-        response = requests.get(PUBLICATIONS_API_URL, timeout=0.001)
+        response = http.get(PUBLICATIONS_API_URL, timeout=0.001)
         print(f"      ⚠️  Unexpected success with short timeout")
     except requests.exceptions.Timeout:
         print(f"      ✅ Timeout properly handled - frontend should show loading state")
@@ -535,7 +521,7 @@ def test_api_resilience_and_error_handling():
     print("\n   🔗 Testing Invalid URL Resilience...")
     try:
         invalid_url = "https://invalid-google-sheets-url.com/exec"
-        response = requests.get(invalid_url, timeout=3)
+        response = http.get(invalid_url, timeout=3)
         print(f"      ⚠️  Unexpected response from invalid URL")
     except requests.exceptions.RequestException:
         print(f"      ✅ Invalid URL properly handled - frontend should show error state")
@@ -550,7 +536,7 @@ def test_api_resilience_and_error_handling():
     
     for i in range(rapid_requests):
         try:
-            response = requests.get(NEWS_EVENTS_API_URL, timeout=2)
+            response = http.get(NEWS_EVENTS_API_URL, timeout=2)
             if response.status_code == 200:
                 success_count += 1
             elif response.status_code == 429:
@@ -573,9 +559,9 @@ def test_api_resilience_and_error_handling():
     print("\n   🔄 Testing Data Consistency...")
     try:
         # Make two requests and compare
-        response1 = requests.get(PUBLICATIONS_API_URL, timeout=5)
+        response1 = http.get(PUBLICATIONS_API_URL, timeout=5)
         time.sleep(1)
-        response2 = requests.get(PUBLICATIONS_API_URL, timeout=5)
+        response2 = http.get(PUBLICATIONS_API_URL, timeout=5)
         
         if response1.status_code == 200 and response2.status_code == 200:
             data1 = response1.json()
@@ -673,5 +659,10 @@ def run_smooth_filtering_tests():
 
 # Main execution
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     success = run_smooth_filtering_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -9,32 +9,25 @@ Tests the featured items functionality specifically as per review request:
 - Sorting logic: featured first, then regular items sorted
 """
 
-import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
 import sys
 
-# Get backend URL from frontend .env file
-def get_backend_url():
-    try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    return line.split('=', 1)[1].strip()
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return None
-
-BACKEND_URL = get_backend_url()
-if not BACKEND_URL:
-    print("ERROR: Could not get REACT_APP_BACKEND_URL from frontend/.env")
-    sys.exit(1)
+# Backend URL, resolved by configure() from the environment or the frontend .env file
+BACKEND_URL = API_BASE_URL = None
 
-API_BASE_URL = f"{BACKEND_URL}/api"
+def configure():
+    """Resolve the backend URL and print the run banner"""
+    global BACKEND_URL, API_BASE_URL
+    BACKEND_URL = config.require('REACT_APP_BACKEND_URL')
+    API_BASE_URL = f"{BACKEND_URL}/api"
 
-print(f"Testing News & Events Featured Items at: {API_BASE_URL}")
-print("=" * 80)
+    print(f"Testing News & Events Featured Items at: {API_BASE_URL}")
+    print("=" * 80)
 
 def test_news_events_featured_items_functionality():
     """Test News & Events API featured items functionality as per review request"""
@@ -45,7 +38,7 @@ def test_news_events_featured_items_functionality():
     try:
         # Clear cache first to ensure fresh data
         print("   0.1 Clearing cache to ensure fresh data...")
-        cache_response = requests.post(f"{API_BASE_URL}/clear-cache", timeout=10)
+        cache_response = http.post(f"{API_BASE_URL}/clear-cache", timeout=10)
         if cache_response.status_code == 200:
             print("      ✅ Cache cleared successfully")
         else:
@@ -53,7 +46,7 @@ def test_news_events_featured_items_functionality():
         
         # 1. Test Basic Featured Items Functionality
         print("   1.1 Testing Basic Featured Items in News & Events API...")
-        response = requests.get(f"{API_BASE_URL}/news-events", timeout=15)
+        response = http.get(f"{API_BASE_URL}/news-events", timeout=15)
         if response.status_code != 200:
             print(f"      ❌ News-events API request failed with status: {response.status_code}")
             all_tests_passed = False
@@ -118,7 +111,7 @@ def test_news_events_featured_items_functionality():
         ]
         
         for sort_by, sort_order, description in sorting_tests:
-            response = requests.get(f"{API_BASE_URL}/news-events?sort_by={sort_by}&sort_order={sort_order}", timeout=10)
+            response = http.get(f"{API_BASE_URL}/news-events?sort_by={sort_by}&sort_order={sort_order}", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 news_events = data.get("news_events", [])
@@ -154,7 +147,7 @@ def test_news_events_featured_items_functionality():
         categories = ["News", "Events", "Upcoming Events", "Achievement"]
         
         for category in categories:
-            response = requests.get(f"{API_BASE_URL}/news-events?category_filter={category}", timeout=10)
+            response = http.get(f"{API_BASE_URL}/news-events?category_filter={category}", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 news_events = data.get("news_events", [])
@@ -183,7 +176,7 @@ def test_news_events_featured_items_functionality():
         
         page_sizes = [5, 10, 15]
         for page_size in page_sizes:
-            response = requests.get(f"{API_BASE_URL}/news-events?per_page={page_size}&page=1", timeout=10)
+            response = http.get(f"{API_BASE_URL}/news-events?per_page={page_size}&page=1", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 news_events = data.get("news_events", [])
@@ -209,7 +202,7 @@ def test_news_events_featured_items_functionality():
         print("   5.1 Testing Combined Filtering and Sorting with Featured Items...")
         
         # Test category + sorting combination
-        response = requests.get(f"{API_BASE_URL}/news-events?category_filter=News&sort_by=date&sort_order=desc", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events?category_filter=News&sort_by=date&sort_order=desc", timeout=10)
         if response.status_code == 200:
             data = response.json()
             news_events = data.get("news_events", [])
@@ -230,7 +223,7 @@ def test_news_events_featured_items_functionality():
                 print(f"      ⚠️  No items found in News category")
         
         # Test title filter + sorting combination
-        response = requests.get(f"{API_BASE_URL}/news-events?title_filter=Energy&sort_by=title&sort_order=asc", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events?title_filter=Energy&sort_by=title&sort_order=asc", timeout=10)
         if response.status_code == 200:
             data = response.json()
             news_events = data.get("news_events", [])
@@ -261,7 +254,7 @@ def test_news_events_featured_items_functionality():
         print("   6.1 Testing Detail Endpoint for Featured Items...")
         
         # Get a featured item ID for testing
-        response = requests.get(f"{API_BASE_URL}/news-events", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events", timeout=10)
         if response.status_code == 200:
             data = response.json()
             news_events = data.get("news_events", [])
@@ -272,7 +265,7 @@ def test_news_events_featured_items_functionality():
                 item_id = featured_item.get("id")
                 
                 # Test detail endpoint
-                detail_response = requests.get(f"{API_BASE_URL}/news-events/{item_id}", timeout=10)
+                detail_response = http.get(f"{API_BASE_URL}/news-events/{item_id}", timeout=10)
                 if detail_response.status_code == 200:
                     detail_data = detail_response.json()
                     
@@ -292,7 +285,7 @@ def test_news_events_featured_items_functionality():
         # 7. Test Sorting Logic: Featured First, Then Regular Items Sorted
         print("   7.1 Testing Sorting Logic: Featured Items First, Then Regular Items Sorted...")
         
-        response = requests.get(f"{API_BASE_URL}/news-events?sort_by=title&sort_order=asc&per_page=20", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events?sort_by=title&sort_order=asc&per_page=20", timeout=10)
         if response.status_code == 200:
             data = response.json()
             news_events = data.get("news_events", [])
@@ -346,7 +339,7 @@ def test_news_events_featured_items_functionality():
         
         # This tests the specific fix mentioned in the review request
         # The backend should handle 'featured ' (with trailing space) from Google Sheets
-        response = requests.get(f"{API_BASE_URL}/news-events", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events", timeout=10)
         if response.status_code == 200:
             data = response.json()
             news_events = data.get("news_events", [])
@@ -379,6 +372,11 @@ def test_news_events_featured_items_functionality():
         return False
 
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     print("Starting News & Events Featured Items Testing...")
     print("=" * 80)
     
@@ -0,0 +1,315 @@
+import json
+import threading
+import time
+
+import pytest
+
+from harness.api import ApiBackend, ApiStandIn, CitationFormatter, ieee_citation, prepare_records
+from harness.blog import render_content
+from harness.client import PooledClient
+from harness.sheets import SheetsStandIn, synthetic_records
+
+
+@pytest.fixture
+def http():
+    client = PooledClient(http2=False)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def api():
+    with SheetsStandIn() as sheets, ApiStandIn(urls=sheets.urls()) as api:
+        yield api
+
+
+def _titles(backend):
+    return [row["title"] for row in json.loads(backend.list_response("news_events", {}).body)["news_events"]]
+
+
+def test_publications_contract(api, http):
+    response = http.get(f"{api.api_url}/publications", params={"category_filter": "Journal Articles"}, timeout=5)
+    assert response.status_code == 200
+    data = response.json()
+    assert {"publications", "pagination", "statistics"} <= set(data)
+    assert all(p["category"] == "Journal Articles" for p in data["publications"])
+    assert data["statistics"]["total_publications"] == len(data["publications"])
+    first = data["publications"][0]
+    assert first["year"].isdigit() and "vol." in first["ieee_formatted"] and first["year"] in first["ieee_formatted"]
+
+    assert http.get(f"{api.api_url}/news-events", timeout=5).json()["news_events"]
+    assert http.get(f"{api.api_url}/publications", params={"page": "x"}, timeout=5).status_code == 400
+    assert http.get(f"{api.api_url}/publications", params={"sort_by": "nope"}, timeout=5).status_code == 400
+    assert http.get(f"{api.api_url}/nothing", timeout=5).json() == {"detail": "Not Found"}
+
+
+def test_cache_status_and_clear(api, http):
+    http.get(f"{api.api_url}/publications", timeout=5)
+    http.get(f"{api.api_url}/projects", timeout=5)
+    status = http.get(f"{api.api_url}/cache-status", timeout=5).json()
+    assert status["cached_items"] == 2
+    assert set(status["last_fetch_times"]) == {"publications", "projects"}
+    assert http.post(f"{api.api_url}/clear-cache", timeout=5).json()["cleared_items"] == 2
+    assert http.get(f"{api.api_url}/cache-status", timeout=5).json()["cached_items"] == 0
+
+
+def test_ieee_citation_per_category():
+    chapter = {"category": "Book Chapters", "authors": ["A. Rahman"], "title": "Storage", "year": "2022",
+               "journal_book_conference_name": "Energy Handbook", "editors": "K. Lee", "publisher": "Springer",
+               "location": "Cham", "pages": "10-20"}
+    assert ieee_citation(chapter) == 'A. Rahman, "Storage", in Energy Handbook, K. Lee, Ed(s). Springer, Cham, pp. 10-20, 2022.'
+    assert ieee_citation({"category": "Books", "authors": "B. Kim", "title": "Grids", "year": "2020"}) == \
+        'B. Kim, "Grids", 2020.'
+
+
+def test_conditional_requests_and_compression(api, http):
+    url = f"{api.api_url}/publications"
+    first = http.get(url, params={"category_filter": "Journal Articles"}, headers={"Accept-Encoding": "gzip"}, timeout=5)
+    assert first.headers["Content-Encoding"] == "gzip" and first.headers["Vary"] == "Accept-Encoding"
+    etag, last_modified = first.headers["ETag"], first.headers["Last-Modified"]
+    assert etag.endswith('-gz"')
+
+    plain = http.get(url, params={"category_filter": "Journal Articles", "page": "1"},
+                     headers={"Accept-Encoding": "identity"}, timeout=5)
+    assert "Content-Encoding" not in plain.headers and plain.content == first.content
+    assert plain.headers["ETag"] == etag.replace("-gz", "")
+
+    for headers in ({"If-None-Match": etag}, {"If-None-Match": plain.headers["ETag"]},
+                    {"If-Modified-Since": last_modified}):
+        cached = http.get(url, params={"category_filter": "Journal Articles"}, headers=headers, timeout=5)
+        assert cached.status_code == 304 and cached.content == b""
+    assert http.get(url, params={"category_filter": "Books"}, headers={"If-None-Match": etag}, timeout=5).status_code == 200
+    for params in ({"sort_order": "sideways"}, {"per_page": "0"}, {"cursor": "not-a-cursor"}):
+        invalid = http.get(url, params=params, headers={"If-None-Match": "*"}, timeout=5)
+        assert invalid.status_code == 400, params  # validated before any 304
+
+    http.post(f"{api.api_url}/clear-cache", timeout=5)
+    refetched = http.get(url, params={"category_filter": "Journal Articles"}, headers={"If-None-Match": etag}, timeout=5)
+    assert refetched.status_code == 304  # same rows upstream, same ETag
+
+
+def test_concurrent_misses_share_one_upstream_fetch():
+    calls = []
+    gate = threading.Event()
+
+    def source():
+        calls.append(1)
+        gate.wait(5)
+        return list(synthetic_records("projects", 50))
+
+    backend = ApiBackend({"projects": source})
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(backend.list_response("projects", {}))) for _ in range(40)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while backend.flights.stats().get("projects", {}).get("coalesced", 0) < 39 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    gate.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 1 and len(results) == 40
+    upstream = backend.cache_status()["upstream"]["projects"]
+    assert (upstream["calls"], upstream["coalesced"], upstream["in_flight"]) == (1, 39, 0)
+
+    backend.clear_cache()
+    backend.list_response("projects", {})
+    assert len(calls) == 2
+
+
+def test_research_stats_are_materialized_per_dataset_version(api, http):
+    url = f"{api.api_url}/research-stats"
+    stats = http.get(url, timeout=5)
+    body = stats.json()
+    publications = http.get(f"{api.api_url}/publications", timeout=5).json()
+    assert body["total_publications"] == publications["pagination"]["total_items"]
+    assert body["total_citations"] == publications["statistics"]["total_citations"]
+    assert sum(body["publications_by_category"].values()) == body["total_publications"]
+    assert {"total_projects", "active_projects", "total_achievements", "total_news_events"} <= set(body)
+    assert stats.headers["Cache-Control"].startswith("public, max-age=")
+    assert http.get(url, headers={"If-None-Match": stats.headers["ETag"]}, timeout=5).status_code == 304
+
+    backend = api.backend
+    summary = backend._summary
+    backend.research_stats()
+    assert backend._summary is summary  # unchanged versions: served from the materialized copy
+    backend.clear_cache()
+    backend.research_stats()
+    assert backend._summary is not summary and backend._summary[1].etag == summary[1].etag
+
+
+def test_detail_lookups_render_the_post_once(api, http):
+    listing = http.get(f"{api.api_url}/news-events", timeout=5).json()["news_events"]
+    item = listing[0]
+    detail = http.get(f"{api.api_url}/news-events/{item['id']}", timeout=5)
+    body = detail.json()
+    assert body["id"] == item["id"] and body["title"] == item["title"]
+    assert body["content_html"] and isinstance(body["table_of_contents"], list)
+    again = http.get(f"{api.api_url}/news-events/{item['id']}", headers={"If-None-Match": detail.headers["ETag"]}, timeout=5)
+    assert again.status_code == 304
+
+    achievement = http.get(f"{api.api_url}/achievements", timeout=5).json()["achievements"][0]
+    rendered = http.get(f"{api.api_url}/achievements/{achievement['id']}", timeout=5).json()["content_html"]
+    assert rendered == render_content(achievement["description"] or achievement["full_content"], "achievement")[0]
+    missing = http.get(f"{api.api_url}/achievements/no-such-id", timeout=5)
+    assert missing.status_code == 404 and missing.json() == {"detail": "Achievement not found"}
+    assert http.get(f"{api.api_url}/cache-status", timeout=5).json()["blog"]["rendered"] == 2
+
+
+def test_export_streams_every_matching_row(api, http):
+    response = http.get(f"{api.api_url}/publications/export", params={"category_filter": "Journal Articles",
+                                                                       "sort_by": "citations"}, timeout=5)
+    assert response.headers["Transfer-Encoding"] == "chunked"
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    listing = http.get(f"{api.api_url}/publications", params={"category_filter": "Journal Articles",
+                                                              "sort_by": "citations", "per_page": "1000"}, timeout=5).json()
+    assert [r["id"] for r in rows] == [r["id"] for r in listing["publications"]]
+    assert int(response.headers["X-Total-Count"]) == len(rows)
+
+    exported = http.get(f"{api.api_url}/news-events/export", params={"format": "csv"}, timeout=5)
+    assert exported.headers["Content-Type"].startswith("text/csv") and exported.text.startswith("id,")
+    assert http.get(f"{api.api_url}/projects/export", params={"format": "xml"}, timeout=5).status_code == 400
+    empty = http.get(f"{api.api_url}/news-events/export", params={"format": "csv", "title_filter": "no such title"},
+                     timeout=5)
+    assert empty.headers["X-Total-Count"] == "0" and empty.text.splitlines() == [exported.text.splitlines()[0]]
+
+
+def test_batch_answers_the_home_page_in_one_round_trip(api, http):
+    queries = [
+        {"id": "publications", "path": "/api/publications?featured_filter=true&per_page=5"},
+        {"id": "projects", "path": "/projects", "params": {"featured_filter": "1", "per_page": 5}},
+        {"id": "news", "path": "/api/news-events", "params": {"featured_filter": "true", "per_page": 3}},
+        {"id": "stats", "path": "/api/research-stats"},
+        {"id": "missing", "path": "/api/achievements/none"},
+        {"id": "export", "path": "/api/news-events/export"},
+    ]
+    response = http.post(f"{api.api_url}/batch", json={"queries": queries}, timeout=5)
+    assert response.status_code == 200
+    results = {r["id"]: r for r in response.json()["results"]}
+    assert list(results) == [q["id"] for q in queries]
+
+    featured = results["publications"]["body"]["publications"]
+    assert featured and all(str(p["featured"]) in ("1", "true", "True") for p in featured)
+    assert results["publications"]["body"] == http.get(
+        f"{api.api_url}/publications", params={"featured_filter": "true", "per_page": "5"}, timeout=5).json()
+    assert results["publications"]["body"]["statistics"]["total_publications"] == len(featured)
+    assert results["projects"]["body"]["projects"] and results["news"]["status"] == 200
+    assert results["stats"]["body"] == http.get(f"{api.api_url}/research-stats", timeout=5).json()
+    assert results["missing"] == {"id": "missing", "status": 404, "body": {"detail": "Achievement not found"}}
+    assert results["export"]["status"] == 400
+
+    again = http.post(f"{api.api_url}/batch", json={"queries": queries[:3]}, timeout=5)
+    assert http.post(f"{api.api_url}/batch", json=queries[:3], timeout=5,
+                     headers={"If-None-Match": again.headers["ETag"]}).status_code == 412
+    assert http.post(f"{api.api_url}/batch", data=b"{", timeout=5).status_code == 400
+    assert http.post(f"{api.api_url}/batch", json=["/api/projects"] * 21, timeout=5).status_code == 400
+
+
+def test_batch_isolates_a_failing_sub_query(monkeypatch, capsys):
+    backend = ApiBackend({"projects": lambda: list(synthetic_records("projects", 20))})
+
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(backend, "research_stats", broken)
+    body = json.dumps({"queries": [{"id": "stats", "path": "/research-stats"}, {"id": "projects", "path": "/projects"}]})
+    results = json.loads(backend.batch(body.encode()).body)["results"]
+    assert results[0] == {"id": "stats", "status": 500, "body": {"detail": "Internal server error"}}
+    assert results[1]["status"] == 200 and len(results[1]["body"]["projects"]) == 20
+    assert "Unhandled error serving batch sub-query /api/research-stats" in capsys.readouterr().err
+
+    logged = []
+    backend.batch(body.encode(), log_error=lambda format, *args: logged.append(format % args))
+    assert len(logged) == 1 and "RuntimeError: boom" in logged[0]
+
+
+def test_unexpected_errors_answer_500(api, http, monkeypatch, capsys):
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(api.backend, "research_stats", broken)
+    response = http.get(f"{api.api_url}/research-stats", timeout=5)
+    assert response.status_code == 500 and response.json() == {"detail": "Internal server error"}
+    assert http.get(f"{api.api_url}/projects", timeout=5).status_code == 200
+    assert "RuntimeError: boom" in capsys.readouterr().err
+
+    batch = http.post(f"{api.api_url}/batch", json=["/api/research-stats"], timeout=5)
+    assert batch.status_code == 200 and batch.json()["results"][0]["status"] == 500
+    logged = capsys.readouterr().err  # through the handler's log_error: client address and timestamp first
+    assert "127.0.0.1 - - [" in logged and "batch sub-query /api/research-stats" in logged
+
+
+def test_metrics_endpoint(api, http):
+    http.get(f"{api.api_url}/publications", timeout=5)
+    http.get(f"{api.api_url}/publications", timeout=5)
+    http.get(f"{api.api_url}/achievements/none", timeout=5)
+    response = http.get(f"{api.api_url}/metrics", timeout=5)
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert 'sesg_http_requests_total{method="GET",route="/api/publications",status="200"} 2' in lines
+    assert 'sesg_http_requests_total{method="GET",route="/api/achievements/{id}",status="404"} 1' in lines
+    assert 'sesg_http_request_duration_seconds_count{method="GET",route="/api/publications"} 2' in lines
+    assert 'sesg_dataset_cache_total{dataset="publications",result="hit"} 1' in lines
+    assert 'sesg_dataset_cache_total{dataset="publications",result="miss"} 1' in lines
+    assert 'sesg_upstream_fetch_duration_seconds_count{dataset="publications",outcome="ok"} 1' in lines
+    assert 'sesg_upstream_attempts_total{dataset="publications",kind="primary",outcome="ok"} 1' in lines
+    assert 'sesg_upstream_breaker_state{dataset="publications"} 0' in lines
+    assert 'sesg_http_requests_in_flight{route="/api/metrics"} 1' in lines  # the scrape itself
+    assert any(line.startswith('sesg_http_response_size_bytes_sum{method="GET",route="/api/publications"}')
+               for line in lines)
+
+
+def test_citations_are_reformatted_only_for_changed_rows():
+    formatter = CitationFormatter()
+    rows = list(synthetic_records("publications", 300, seed=3))
+    first = prepare_records("publications", rows, formatter)
+    assert [r["ieee_formatted"] for r in first] == [ieee_citation(r) for r in first]
+    rows[5] = dict(rows[5], title="Retitled")
+    second = prepare_records("publications", rows, formatter)
+    assert second[5]["ieee_formatted"] == ieee_citation(second[5]) and "Retitled" in second[5]["ieee_formatted"]
+    assert formatter.stats()["formatted"] == len({r["ieee_formatted"] for r in first}) + 1
+    assert formatter.stats()["memoized"] == len({r["ieee_formatted"] for r in second})
+
+
+def test_stale_while_revalidate():
+    versions = iter(range(1, 100))
+    release = threading.Event()
+
+    def source():
+        version = next(versions)
+        if version > 1:
+            release.wait(5)
+        return [{"id": f"news_{version}", "title": f"v{version}", "date": "2024-01-01", "category": "News"}]
+
+    backend = ApiBackend({"news_events": source}, cache_minutes=0.3 / 60, max_stale_minutes=1)
+    assert _titles(backend)[0] == "v1"
+    time.sleep(0.35)
+
+    start = time.perf_counter()
+    assert _titles(backend)[0] == "v1"  # stale, refresh started
+    assert _titles(backend)[0] == "v1"
+    assert time.perf_counter() - start < 0.5
+    status = backend.cache_status()
+    assert status["entries"]["news_events"]["state"] == "stale"
+    assert status["entries"]["news_events"]["refresh_in_flight"] is True
+    assert (status["cache_misses"], status["stale_hits"]) == (1, 2)
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while backend.cache_status()["entries"]["news_events"]["refresh_in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _titles(backend)[0] == "v2"
+    assert backend.cache_status()["cache_hits"] == 1
+
+
+def test_rendered_responses_are_cached_per_dataset_version(api, http):
+    first = http.get(f"{api.api_url}/publications", params={"category_filter": "Books"}, timeout=5)
+    again = http.get(f"{api.api_url}/publications", params={"sort_order": "desc", "category_filter": "Books", "title_filter": ""}, timeout=5)
+    assert first.content == again.content
+    assert http.get(f"{api.api_url}/cache-status", timeout=5).json()["response_cache"]["hits"] == 1
+
+    http.post(f"{api.api_url}/clear-cache", timeout=5)
+    http.get(f"{api.api_url}/publications", params={"category_filter": "Books"}, timeout=5)
+    results = http.get(f"{api.api_url}/cache-status", timeout=5).json()["response_cache"]
+    assert (results["hits"], results["misses"], results["entries"]) == (1, 2, 1)
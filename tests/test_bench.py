@@ -0,0 +1,87 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from harness.bench import BaselineStore, benchmark_publications_cache, check_regression, run_gate, summarize
+
+
+class _CachedApiHandler(BaseHTTPRequestHandler):
+    """Slow on the first /publications after a cache clear, fast afterwards"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    cache = {}
+
+    def _send(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/api/publications"):
+            if "publications" not in self.cache:
+                time.sleep(0.03)
+                self.cache["publications"] = {"publications": [{"id": "pub_001"}]}
+            self._send(self.cache["publications"])
+        else:
+            self._send({"cached_items": len(self.cache)})
+
+    def do_POST(self):
+        self.cache.clear()
+        self._send({"message": "Cache cleared"})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CachedApiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api"
+    server.shutdown()
+    server.server_close()
+
+
+def _stats(median, spread=0.001, n=30):
+    return summarize([median - spread, median, median + spread] * (n // 3))
+
+
+def test_summarize_confidence_interval_narrows_with_samples():
+    few = summarize([0.010, 0.012, 0.011, 0.013])
+    many = summarize([0.010, 0.012, 0.011, 0.013] * 25)
+    assert few["ci95"][0] < few["mean"] < few["ci95"][1]
+    assert (many["ci95"][1] - many["ci95"][0]) < (few["ci95"][1] - few["ci95"][0])
+    assert summarize([0.5])["ci95"] == [0.5, 0.5]
+
+
+def test_cold_vs_warm_benchmark(api_base_url):
+    result = benchmark_publications_cache(api_base_url, samples=20, warmup=2, cold_samples=3)
+    assert result["cold"]["samples"] == 3
+    assert result["warm"]["samples"] == 20
+    assert result["speedup"] > 1
+    assert result["hit_ratio"] == 1.0
+    assert result["hit_ratio_source"] == "latency"
+
+
+def test_regression_gate(tmp_path):
+    baseline = {"benchmark": "publications_cache", "warm": _stats(0.010), "hit_ratio": 0.95}
+    assert check_regression({"warm": _stats(0.011), "hit_ratio": 0.94}, baseline) == []
+
+    slower = check_regression({"warm": _stats(0.020), "hit_ratio": 0.95}, baseline)
+    assert [r.split()[1] for r in slower] == ["median", "p95"]
+    assert check_regression({"warm": _stats(0.010), "hit_ratio": 0.80}, baseline)[0].startswith("hit ratio")
+    assert check_regression({"warm": _stats(0.020), "hit_ratio": 0.95}, baseline, latency_margin=1.5) == []
+
+    store = BaselineStore(tmp_path)
+    assert run_gate(baseline, store) == []
+    run_gate(baseline, store, save_baseline=True)
+    assert store.load("publications_cache")["hit_ratio"] == 0.95
+    assert run_gate(dict(baseline, warm=_stats(0.020)), store)
@@ -0,0 +1,28 @@
+from harness.blog import BlogRenderer, render_content, render_table
+
+
+def test_render_content_follows_parse_description():
+    html, toc = render_content("## Results\n- **fast** path\n1. one\n\n> quote\nplain `x`", "achievement")
+    assert html.startswith('<h2 class="text-3xl font-bold text-gray-900 mt-12 mb-6 border-b-2 border-emerald-200')
+    assert '<strong class="font-semibold text-gray-900">fast</strong>' in html
+    assert html.count("<ul") == html.count("</ul>") == 1 and html.count("<ol") == html.count("</ol>") == 1
+    assert "border-emerald-400 bg-gradient-to-r from-emerald-50" in html
+    assert html.endswith('<p class="mb-6 text-gray-700 leading-relaxed text-lg">plain <code class="bg-gray-100 '
+                         'text-gray-800 px-2 py-1 rounded text-sm font-mono">x</code></p>')
+    assert toc == [{"level": 2, "text": "Results"}]
+
+    math, _ = render_content("$$\nx_{ij} ≤ α\n$$", "news")
+    assert 'x<sub class="text-sm">ij</sub> <span class="text-red-600 font-bold">≤</span>' in math
+    assert render_content("", "news") == ("", [])
+
+
+def test_tables_skip_the_separator_row_and_renderer_memoizes():
+    table = render_table(["| A | B |", "|---|:-:|", "| 1 | 2 |"])
+    assert table.count("<th ") == 2 and table.count("<td ") == 2 and "---" not in table
+
+    renderer = BlogRenderer(max_entries=2)
+    post = {"description": "## Title\ntext"}
+    assert renderer.render(post, "news") is renderer.render(dict(post, id="other"), "news")
+    assert renderer.render(post, "achievement") != renderer.render(post, "news")
+    assert renderer.render({"full_content": "fallback"}, "news")[0].endswith(">fallback</p>")
+    assert renderer.stats() == {"memoized": 2, "rendered": 3, "reused": 2}
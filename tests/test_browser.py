@@ -0,0 +1,109 @@
+import threading
+import time
+
+import pytest
+
+from harness.browser import BrowserPool, BrowserPoolTimeout, BrowserUnavailable, origin_of
+
+
+class _FakeDriver:
+    """Just enough of a Chrome webdriver to exercise the pool"""
+
+    launches = 0
+
+    def __init__(self, launch_delay=0.0):
+        time.sleep(launch_delay)
+        type(self).launches += 1
+        self.current_url = "about:blank"
+        self.window_handles = ["main"]
+        self.cookies = {}
+        self.storage = {}
+        self.cdp_calls = []
+        self.quit_called = False
+        self.broken = False
+        self.switch_to = self
+
+    def window(self, handle):
+        self.current = handle
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def get(self, url):
+        if self.broken:
+            raise RuntimeError("chrome not reachable")
+        self.current_url = url
+        if origin_of(url):
+            self.cookies[origin_of(url)] = "session"
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append((command, params.get("origin")))
+        if command == "Storage.clearDataForOrigin":
+            self.storage.pop(params["origin"], None)
+        elif command == "Network.clearBrowserCookies":
+            self.cookies.clear()
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_warm_start_reuses_browsers_with_a_clean_context():
+    pool = BrowserPool(size=2, factory=lambda: _FakeDriver(launch_delay=0.1))
+    start = time.perf_counter()
+    pool.start()
+    assert time.perf_counter() - start < 0.19  # launched in parallel
+
+    with pool.session() as driver:
+        driver.get("https://sesg.example.org/admin/login")
+        driver.storage["https://sesg.example.org"] = {"sesg_users": "[]"}
+        driver.window_handles.append("popup")
+        first = driver
+    assert first.cookies == {} and first.storage == {}
+    assert first.window_handles == ["main"] and first.current_url == "about:blank"
+
+    with pool.session() as driver:
+        driver.get("https://other.example.org/")
+    with pool.session() as driver:
+        assert driver.cookies == {}
+    cleared = {origin for command, origin in driver.cdp_calls if command == "Storage.clearDataForOrigin"}
+    assert cleared == {"https://sesg.example.org", "https://other.example.org"}
+
+    stats = pool.stats()
+    assert (stats["launched"], stats["checkouts"], stats["reused"], stats["recycled"]) == (2, 3, 3, 0)
+    pool.close()
+    assert first.quit_called
+
+
+def test_recycles_worn_out_and_broken_browsers():
+    pool = BrowserPool(size=1, max_uses=2, factory=_FakeDriver)
+    with pool.session() as first:
+        pass
+    with pool.session() as driver:
+        assert driver is first
+    assert first.quit_called  # second checkout reached max_uses
+
+    with pool.session() as driver:
+        assert driver is not first
+        driver.broken = True
+    with pool.session() as replacement:
+        assert replacement is not driver
+    assert pool.stats()["recycled"] == 2
+    assert pool.stats()["reset_failures"] == 1
+
+
+def test_acquire_blocks_until_a_browser_is_released():
+    pool = BrowserPool(size=1, factory=_FakeDriver)
+    driver = pool.acquire()
+    with pytest.raises(BrowserPoolTimeout):
+        pool.acquire(timeout=0.05)
+
+    threading.Timer(0.05, pool.release, args=(driver,)).start()
+    assert pool.acquire(timeout=2) is driver
+
+    def unavailable():
+        raise BrowserUnavailable("no chrome")
+
+    empty = BrowserPool(size=1, factory=unavailable)
+    with pytest.raises(BrowserUnavailable):
+        empty.start()
+    assert empty.stats()["alive"] == 0
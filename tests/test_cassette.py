@@ -0,0 +1,65 @@
+import json
+
+import pytest
+import requests
+
+from harness.cassette import CassetteMiss, CassetteStore, cassette_key
+from harness.client import PooledClient
+from harness.sheets import SheetsStandIn
+
+
+@pytest.fixture
+def sheets():
+    with SheetsStandIn() as stand_in:
+        yield stand_in
+
+
+def _client(tmp_path, mode, ttl=3600):
+    return PooledClient(http2=False, cassettes=CassetteStore(tmp_path, mode, ttl))
+
+
+def test_key_covers_method_url_and_body():
+    assert cassette_key("get", "http://x/a") == cassette_key("GET", "http://x/a", b"")
+    assert cassette_key("GET", "http://x/a") != cassette_key("POST", "http://x/a")
+    assert cassette_key("POST", "http://x/a", '{"a": 1}') != cassette_key("POST", "http://x/a", '{"a": 2}')
+
+
+def test_record_then_replay_without_network(tmp_path, sheets):
+    url = sheets.url_for("publications")
+    recorder = _client(tmp_path, "record")
+    recorded = recorder.get(url, timeout=5)
+    assert recorder.stats()["cassette_recorded"] == 1
+
+    sheets.stop()
+    player = _client(tmp_path, "replay")
+    replayed = player.get(url, timeout=5)
+    assert replayed.status_code == 200
+    assert replayed.json() == recorded.json()
+    assert replayed.headers["Access-Control-Allow-Origin"] == "*"
+    assert player.stats()["requests"] == 0
+    assert player.stats()["cassette_hits"] == 1
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        player.post(url, json={"not": "recorded"}, timeout=5)
+    assert issubclass(CassetteMiss, requests.exceptions.ConnectionError)
+
+
+def test_refresh_rerecords_stale_cassettes(tmp_path, sheets):
+    url = sheets.url_for("projects")
+    _client(tmp_path, "record").get(url, timeout=5)
+
+    fresh = _client(tmp_path, "refresh", ttl=3600)
+    fresh.get(url, timeout=5)
+    assert fresh.stats()["cassette_hits"] == 1
+    assert fresh.stats()["requests"] == 0
+
+    path = CassetteStore(tmp_path).path_for(cassette_key("GET", url))
+    entry = json.loads(path.read_text())
+    entry["recorded_at"] -= 7200
+    path.write_text(json.dumps(entry))
+
+    stale = _client(tmp_path, "refresh", ttl=3600)
+    stale.get(url, timeout=5)
+    assert stale.stats()["cassette_misses"] == 1
+    assert stale.stats()["requests"] == 1
+    assert json.loads(path.read_text())["recorded_at"] > entry["recorded_at"]
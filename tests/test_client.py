@@ -0,0 +1,63 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from harness.client import PooledClient
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_one_keep_alive_connection(server_url):
+    client = PooledClient(http2=False)
+
+    for _ in range(5):
+        assert client.get(server_url, timeout=5).json() == {"ok": True}
+
+    stats = client.stats()
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+    assert stats["hosts"]["127.0.0.1"]["connections_reused"] == 4
+    client.close()
+
+
+def test_sessions_share_the_pool_but_not_headers(server_url):
+    client = PooledClient(http2=False)
+    first, second = client.session(), client.session()
+    first.headers["X-Tester"] = "first"
+
+    first.get(server_url, timeout=5)
+    second.get(server_url, timeout=5)
+
+    assert "X-Tester" not in second.headers
+    assert client.stats()["connections_opened"] == 1
+    client.close()
+
+
+def test_configure_rejects_unknown_options():
+    with pytest.raises(TypeError):
+        PooledClient().configure(pool_size=4)
@@ -0,0 +1,59 @@
+import contextlib
+import importlib.util
+import io
+import os
+
+import pytest
+
+from harness import config
+from harness.config import ConfigError
+from harness.runner import discover_scripts
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    path = tmp_path / ".env"
+    path.write_text(
+        "# frontend settings\n"
+        "REACT_APP_BACKEND_URL='https://sesg.example.org'\n"
+        "\n"
+        'REACT_APP_PUBLICATIONS_API_URL="https://script.google.com/macros/s/x/exec?sheet=sheet6"\n'
+    )
+    monkeypatch.setenv("SESG_FRONTEND_ENV", str(path))
+    for name in config.API_URL_VARS.values():
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.delenv("REACT_APP_BACKEND_URL", raising=False)
+    config.reset()
+    yield path
+    config.reset()
+
+
+def test_environment_overrides_env_file(env_file, monkeypatch):
+    assert config.backend_url() == "https://sesg.example.org"
+    assert config.get("REACT_APP_PROJECTS_API_URL", "fallback") == "fallback"
+    monkeypatch.setenv("REACT_APP_BACKEND_URL", "http://127.0.0.1:8001")
+    assert config.require("REACT_APP_BACKEND_URL") == "http://127.0.0.1:8001"
+    with pytest.raises(ConfigError, match="REACT_APP_PROJECTS_API_URL"):
+        config.require("REACT_APP_PROJECTS_API_URL")
+
+
+def test_api_urls(env_file):
+    assert config.api_urls() == {"publications": "https://script.google.com/macros/s/x/exec?sheet=sheet6"}
+    with pytest.raises(ConfigError, match="REACT_APP_NEWS_EVENTS_API_URL"):
+        config.api_urls(required=["publications", "news_events"])
+
+
+def test_scripts_import_without_side_effects(tmp_path, monkeypatch):
+    monkeypatch.setenv("SESG_FRONTEND_ENV", str(tmp_path / "missing.env"))
+    config.reset()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for path in discover_scripts():
+            name = os.path.splitext(os.path.basename(path))[0]
+            spec = importlib.util.spec_from_file_location(f"_sesg_script_{name}", path)
+            try:  # optional browser drivers (selenium) may be absent here
+                spec.loader.exec_module(importlib.util.module_from_spec(spec))
+            except ModuleNotFoundError as e:
+                if e.name.split(".")[0] == "harness":
+                    raise
+    assert output.getvalue() == ""
@@ -0,0 +1,34 @@
+import csv
+import io
+import json
+
+import pytest
+
+from harness.export import ExportError, export_chunks
+from harness.query import DATASETS
+from harness.sheets import synthetic_records
+
+
+def test_ndjson_and_csv_are_streamed_in_bounded_chunks():
+    rows = synthetic_records("publications", 2000, seed=5)  # a generator: nothing is materialized up front
+    chunks = list(export_chunks(rows, "ndjson", chunk_bytes=4096))
+    assert len(chunks) > 10 and all(len(chunk) < 4096 + 2048 for chunk in chunks)
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert len(lines) == 2000 and json.loads(lines[0])["id"] == "pub_0000001"
+
+    columns = DATASETS["publications"]["columns"]
+    rows = synthetic_records("publications", 50, seed=5)
+    text = b"".join(export_chunks(rows, "csv", columns=columns)).decode("utf-8")
+    parsed = list(csv.DictReader(io.StringIO(text)))
+    assert tuple(parsed[0]) == columns
+    assert len(parsed) == 50 and parsed[0]["id"] == "pub_0000001"
+    assert "; " in parsed[0]["research_areas"] or "[" not in parsed[0]["research_areas"]
+
+    with pytest.raises(ExportError):
+        next(export_chunks([], "xml"))
+
+
+def test_csv_export_of_no_rows_still_has_its_header():
+    columns = DATASETS["news_events"]["columns"]
+    assert b"".join(export_chunks([], "csv", columns=columns)).decode("utf-8") == ",".join(columns) + "\r\n"
+    assert list(export_chunks([], "ndjson")) == []
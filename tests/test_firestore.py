@@ -0,0 +1,99 @@
+import pytest
+
+from harness.client import PooledClient
+from harness.firestore import COLLECTIONS, FirestoreStandIn, FirestoreStore, decode_fields, encode_fields
+
+
+@pytest.fixture
+def firestore():
+    with FirestoreStandIn() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def http():
+    client = PooledClient(http2=False)
+    yield client
+    client.close()
+
+
+def _query(http, firestore, structured_query):
+    response = http.post(f"{firestore.base_url}:runQuery", json={"structuredQuery": structured_query}, timeout=5)
+    assert response.status_code == 200
+    return [decode_fields(r["document"]["fields"]) for r in response.json() if "document" in r]
+
+
+def test_admin_panel_collections_start_empty(firestore, http):
+    assert len(COLLECTIONS) == 11
+    for collection in COLLECTIONS:
+        response = http.get(f"{firestore.base_url}/{collection}", timeout=5)
+        assert response.status_code == 200
+        assert response.json() == {}
+
+
+def test_crud_round_trip(firestore, http):
+    url = f"{firestore.base_url}/publications"
+    created = http.post(url, json={"fields": encode_fields({"title": "Smart Grid", "year": 2024})}, timeout=5).json()
+    doc_id = created["name"].rsplit("/", 1)[1]
+
+    updated = http.patch(
+        f"{url}/{doc_id}?updateMask.fieldPaths=year&currentDocument.exists=true",
+        json={"fields": encode_fields({"year": 2025})}, timeout=5
+    )
+    assert decode_fields(updated.json()["fields"]) == {"title": "Smart Grid", "year": 2025}
+
+    assert http.delete(f"{url}/{doc_id}", timeout=5).status_code == 200
+    missing = http.get(f"{url}/{doc_id}", timeout=5)
+    assert missing.status_code == 404
+    assert missing.json()["error"]["status"] == "NOT_FOUND"
+
+
+def test_update_of_missing_document_fails_precondition(firestore, http):
+    response = http.patch(
+        f"{firestore.base_url}/people/ghost?updateMask.fieldPaths=name&currentDocument.exists=true",
+        json={"fields": encode_fields({"name": "Nobody"})}, timeout=5
+    )
+    assert response.status_code == 404
+
+
+def test_run_query_supports_where_order_by_limit_and_start_after(firestore, http):
+    firestore.store.seed("publications", [
+        {"id": "a", "title": "A", "year": 2021, "featured": True},
+        {"id": "b", "title": "B", "year": 2024, "featured": True},
+        {"id": "c", "title": "C", "year": 2023, "featured": False},
+        {"id": "d", "title": "D", "year": 2022, "featured": True},
+    ])
+    base = {
+        "from": [{"collectionId": "publications"}],
+        "where": {"fieldFilter": {"field": {"fieldPath": "featured"}, "op": "EQUAL", "value": {"booleanValue": True}}},
+        "orderBy": [{"field": {"fieldPath": "year"}, "direction": "DESCENDING"}],
+    }
+
+    assert [d["title"] for d in _query(http, firestore, base)] == ["B", "D", "A"]
+    assert [d["title"] for d in _query(http, firestore, dict(base, limit=2))] == ["B", "D"]
+
+    after_d = dict(base, startAt={"values": [{"integerValue": "2022"}], "before": False})
+    assert [d["title"] for d in _query(http, firestore, after_d)] == ["A"]
+
+
+def test_commit_applies_server_timestamps_atomically():
+    store = FirestoreStore()
+    name = f"{store.root}/footer/main"
+    store.commit([{
+        "update": {"name": name, "fields": encode_fields({"labName": "SESG"})},
+        "updateTransforms": [{"fieldPath": "updatedAt", "setToServerValue": "REQUEST_TIME"}],
+    }])
+    assert "timestampValue" in store.get("footer", "main")["fields"]["updatedAt"]
+
+    with pytest.raises(Exception):
+        store.commit([
+            {"update": {"name": name, "fields": encode_fields({"labName": "Changed"})}},
+            {"delete": f"{store.root}/footer/missing", "currentDocument": {"exists": True}},
+        ])
+    assert decode_fields(store.get("footer", "main")["fields"])["labName"] == "SESG"
+
+
+def test_latency_injection(http):
+    with FirestoreStandIn(latency=0.05) as firestore:
+        response = http.get(f"{firestore.base_url}/home", timeout=5)
+    assert response.elapsed.total_seconds() >= 0.05
@@ -0,0 +1,49 @@
+import pytest
+
+from harness.load import LoadGenerator, arrival_offsets, format_report, percentile
+from harness.sheets import SheetsStandIn
+
+
+@pytest.fixture
+def sheets():
+    with SheetsStandIn() as stand_in:
+        yield stand_in
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 95) == 0.0
+
+
+def test_open_loop_schedule_ramps_then_holds_rate():
+    offsets = list(arrival_offsets(rate=100, duration=2, ramp=1))
+    # 50 arrivals during the linear ramp, then 100/s for the remaining second
+    assert len(offsets) == 150
+    assert offsets == sorted(offsets)
+    assert sum(1 for o in offsets if o < 0.5) < sum(1 for o in offsets if 0.5 <= o < 1)
+
+
+def test_closed_loop_reports_latency_and_status_codes(sheets):
+    report = LoadGenerator(sheets.url_for("publications")).run("closed", concurrency=4, duration=0.5)
+    assert report["requests"] > 0
+    assert report["failed"] == 0
+    assert report["status_codes"] == {"200": report["requests"]}
+    latency = report["latency_ms"]
+    assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert sum(b["count"] for b in report["histogram"]) == report["requests"]
+    assert "p99" in format_report(report)
+
+
+def test_open_loop_breaks_down_errors(sheets):
+    sheets.configure(error_rate=1.0)
+    report = LoadGenerator(sheets.base_url, paths=["/macros/s/x/exec?sheet=sheet9"]).run(
+        "open", rate=200, duration=0.5)
+    assert report["requests"] == 100
+    assert report["errors"] == {"HTTP 500": 100}
+
+    refused = LoadGenerator("http://127.0.0.1:1", timeout=1).run("closed", concurrency=1, duration=0.1)
+    assert refused["successful"] == 0
+    assert "connection refused" in refused["errors"]
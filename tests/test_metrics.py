@@ -0,0 +1,27 @@
+from harness.metrics import Metrics
+
+
+def test_text_exposition_format():
+    metrics = Metrics()
+    metrics.describe("requests_total", "counter", "Requests served")
+    metrics.describe("latency_seconds", "histogram", "Latency", (0.1, 1.0))
+    metrics.inc("requests_total", {"route": "/api/x", "status": "200"})
+    metrics.inc("requests_total", {"status": "200", "route": "/api/x"}, 2)
+    metrics.inc("requests_total", {"route": 'a "b"\n', "status": "500"})
+    for value in (0.05, 0.1, 0.5, 3.0):
+        metrics.observe("latency_seconds", value, {"route": "/api/x"})
+
+    assert metrics.value("requests_total", {"route": "/api/x", "status": "200"}) == 3
+    assert metrics.render().splitlines() == [
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/api/x",le="0.1"} 2',
+        'latency_seconds_bucket{route="/api/x",le="1.0"} 3',
+        'latency_seconds_bucket{route="/api/x",le="+Inf"} 4',
+        'latency_seconds_sum{route="/api/x"} 3.65',
+        'latency_seconds_count{route="/api/x"} 4',
+        "# HELP requests_total Requests served",
+        "# TYPE requests_total counter",
+        'requests_total{route="/api/x",status="200"} 3',
+        'requests_total{route="a \\"b\\"\\n",status="500"} 1',
+    ]
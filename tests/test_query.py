@@ -0,0 +1,142 @@
+import pytest
+
+from harness.query import DatasetIndex, QueryError
+from harness.sheets import synthetic_records
+
+
+def _scan(records, params):
+    """Reference filter + sort straight from googleSheetsApi.js getPublications"""
+    rows = list(records)
+    if params.get("category_filter"):
+        rows = [r for r in rows if r["category"] == params["category_filter"]]
+    if params.get("year_filter"):
+        rows = [r for r in rows if str(r["year"]) == params["year_filter"]]
+    if params.get("area_filter"):
+        rows = [r for r in rows if params["area_filter"] in r["research_areas"]]
+    if params.get("author_filter"):
+        rows = [r for r in rows if any(params["author_filter"].lower() in a.lower() for a in r["authors"])]
+    if params.get("title_filter"):
+        rows = [r for r in rows if params["title_filter"].lower() in r["title"].lower()]
+    sort_by = params.get("sort_by", "year")
+    key = (lambda r: int(r[sort_by])) if sort_by in ("year", "citations") else (lambda r: str(r[sort_by]))
+    rows = sorted(rows, key=lambda r: r["id"])  # ties are ordered by id, in either direction
+    return sorted(rows, key=key, reverse=params.get("sort_order", "desc") == "desc")
+
+
+@pytest.fixture(scope="module")
+def publications():
+    records = list(synthetic_records("publications", 3000, seed=7))
+    return records, DatasetIndex("publications", records)
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"category_filter": "Books", "page": "3", "per_page": "7"},
+    {"category_filter": "Journal Articles", "year_filter": "2019", "sort_by": "citations"},
+    {"area_filter": "Energy Storage Systems", "sort_order": "asc", "page": "40"},
+    {"title_filter": "Wind Power", "author_filter": "ch", "sort_by": "title", "sort_order": "asc"},
+    {"author_filter": "müller", "per_page": "500"},
+    {"title_filter": "no such title"},
+])
+def test_index_matches_full_scan(publications, params):
+    records, index = publications
+    expected = _scan(records, params)
+    page, per_page = int(params.get("page", 1)), int(params.get("per_page", 20))
+    response = index.query(params)
+    assert [r["id"] for r in response["publications"]] == [r["id"] for r in expected[(page - 1) * per_page:page * per_page]]
+    assert response["pagination"]["total_items"] == len(expected)
+    assert response["pagination"]["has_next"] == (page * per_page < len(expected))
+    stats = response["statistics"]
+    assert stats["total_publications"] == len(expected)
+    assert stats["total_citations"] == sum(r["citations"] for r in expected)
+    assert stats["total_areas"] == len({a for r in expected for a in r["research_areas"]})
+    if expected:
+        assert stats["latest_year"] == max(r["year"] for r in expected)
+
+
+def test_fanned_out_search_matches_any_field(publications):
+    records, index = publications
+    term = "2014"
+    fanned = index.query({"title_filter": term, "author_filter": term, "year_filter": term, "per_page": "5000"})
+    expected = {r["id"] for r in records if str(r["year"]) == term}
+    assert {r["id"] for r in fanned["publications"]} == expected
+    assert index.query({"search_filter": "rahman", "per_page": "5000"})["pagination"]["total_items"] == \
+        sum(1 for r in records if any("rahman" in a.lower() for a in r["authors"]))
+
+
+def test_aggregates_follow_incremental_changes(publications):
+    records, index = publications
+    changed = [dict(r) for r in records[100:]]  # first 100 rows removed
+    changed[0]["citations"] += 1000
+    changed[1]["category"] = "Books"
+    changed[2]["research_areas"] = ["Microgrids"]
+    changed += list(synthetic_records("publications", 50, seed=8))
+    for i, record in enumerate(changed[-50:]):
+        record["id"] = f"new_{i}"
+    updated = DatasetIndex("publications", changed, previous=index)
+    for params in ({}, {"category_filter": "Books"}, {"year_filter": "2019", "area_filter": "Microgrids"}):
+        assert updated.query(params)["statistics"] == DatasetIndex("publications", changed).query(params)["statistics"]
+    assert index.query({})["statistics"]["total_publications"] == len(records)
+
+
+def test_other_datasets_and_invalid_parameters():
+    projects = DatasetIndex("projects", synthetic_records("projects", 200))
+    active = projects.query({"status_filter": "Active", "sort_by": "start_date", "sort_order": "asc"})
+    dates = [p["start_date"] for p in active["projects"]]
+    assert dates == sorted(dates) and all(p["status"] == "Active" for p in active["projects"])
+    assert active["statistics"]["total_projects"] == 200
+
+    news = DatasetIndex("news_events", synthetic_records("news_events", 40)).query({})
+    assert news["pagination"]["per_page"] == 15 and "statistics" not in news
+    achievements = DatasetIndex("achievements", synthetic_records("achievements", 40))
+    assert all(a["date"].startswith("2020") for a in achievements.query({"year_filter": "2020"})["achievements"])
+
+    with pytest.raises(QueryError):
+        projects.query({"page": "0"})
+    with pytest.raises(QueryError):
+        projects.query({"sort_order": "sideways"})
+    for junk in range(50):
+        with pytest.raises(QueryError):
+            projects.query({"sort_by": f"junk{junk}"})
+    assert projects.query({"sort_by": "title", "sort_order": "asc"})["projects"]
+    assert len(projects._orders) == 3  # default, start_date asc, title asc: junk built nothing
+
+
+def test_cursor_survives_deleting_its_row_inside_a_run_of_ties():
+    records = [{"id": f"p{n}", "title": f"T{n}", "year": 2020 if n < 6 else 2019, "category": "Books",
+                "authors": [], "research_areas": [], "citations": 0} for n in range(10)]
+    params = {"sort_by": "year", "sort_order": "desc", "per_page": "2"}
+    first = DatasetIndex("publications", records).query(params)
+    assert [r["id"] for r in first["publications"]] == ["p0", "p1"]
+
+    remaining = DatasetIndex("publications", [r for r in records if r["id"] != "p1"])
+    seen, cursor = [], first["pagination"]["next_cursor"]
+    while cursor:
+        page = remaining.query(dict(params, cursor=cursor))
+        seen += [r["id"] for r in page["publications"]]
+        cursor = page["pagination"]["next_cursor"]
+    assert seen == ["p2", "p3", "p4", "p5", "p6", "p7", "p8", "p9"]
+
+
+def test_cursor_pagination_is_stable_under_inserts(publications):
+    records, index = publications
+    params = {"category_filter": "Journal Articles", "sort_by": "citations", "per_page": "25"}
+    first = index.query(params)
+    assert first["pagination"]["next_cursor"]
+
+    seen, cursor = [r["id"] for r in first["publications"]], first["pagination"]["next_cursor"]
+    inserted = [dict(r, id=f"ins_{i}") for i, r in enumerate(records[:300])]
+    current = DatasetIndex("publications", inserted + records)  # rows land before and after the cursor
+    while cursor:
+        page = current.query(dict(params, cursor=cursor))
+        seen += [r["id"] for r in page["publications"] if not r["id"].startswith("ins_")]
+        cursor = page["pagination"]["next_cursor"]
+    assert seen == [r["id"] for r in _scan(records, params)]
+
+    deleted = DatasetIndex("publications", [r for r in records if r["id"] != first["publications"][-1]["id"]])
+    resumed = deleted.query(dict(params, cursor=first["pagination"]["next_cursor"]))["publications"]
+    assert resumed == index.query(dict(params, cursor=first["pagination"]["next_cursor"]))["publications"]
+    with pytest.raises(QueryError):
+        index.query(dict(params, sort_by="year", cursor=first["pagination"]["next_cursor"]))
+    with pytest.raises(QueryError):
+        index.query(dict(params, cursor="not a cursor"))
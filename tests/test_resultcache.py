@@ -0,0 +1,56 @@
+import gzip
+
+from harness.resultcache import ENTRY_OVERHEAD, Representation, ResultCache, etag_matches, normalize_params
+
+
+def test_normalization_matches_api_service_defaults():
+    explicit = {"page": "1", "per_page": "20", "sort_by": "year", "sort_order": "DESC", "category_filter": "Books"}
+    sparse = {"category_filter": "Books", "title_filter": "", "author_filter": None, "utm_source": "mail"}
+    assert normalize_params("publications", explicit) == normalize_params("publications", sparse)
+    assert normalize_params("publications", {"page": "02"}) == normalize_params("publications", {"page": 2})
+    assert normalize_params("news_events", {}) != normalize_params("achievements", {})
+    assert dict(normalize_params("achievements", {}))["per_page"] == "12"
+
+
+def test_lru_eviction_is_bounded_by_bytes():
+    body = b"x" * 100
+    cache = ResultCache(max_bytes=3 * (len(body) + ENTRY_OVERHEAD))
+    keys = [cache.key("publications", 1, {"page": n}) for n in range(1, 5)]
+    for key in keys[:3]:
+        cache.put(key, body)
+    assert cache.get(keys[0]) == body  # keys[0] becomes most recently used
+    cache.put(keys[3], body)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == body and cache.get(keys[3]) == body
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["hits"], stats["misses"]) == (3, 1, 3, 1)
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+def test_invalidation_rejects_superseded_versions():
+    cache = ResultCache()
+    old = cache.key("projects", 1, {})
+    cache.put(old, b"old")
+    cache.put(cache.key("publications", 1, {}), b"pubs")
+    assert cache.invalidate("projects", version=2) == 1
+    cache.put(old, b"late render of version 1")
+    assert cache.get(old) is None
+    assert cache.get(cache.key("publications", 1, {})) == b"pubs"
+
+    cache.clear(floor=3)
+    cache.put(cache.key("publications", 2, {}), b"late")
+    assert cache.stats()["entries"] == 0
+    cache.put(cache.key("publications", 3, {}), b"new")
+    assert cache.stats()["entries"] == 1
+
+
+def test_representation_variants_and_validators():
+    body = b'{"publications": []}' * 100
+    response = Representation(body, "abc-123")
+    assert gzip.decompress(response.variants["gzip"]) == body
+    assert response.select("gzip, deflate")[0] == "gzip"
+    assert response.select("gzip;q=0, identity")[0] == "identity"
+    assert response.select(None) == ("identity", body)
+    assert Representation(b"{}", "small").select("gzip") == ("identity", b"{}")
+    assert etag_matches('"other", W/"abc-123-gz"', "abc-123") == '"abc-123-gz"'
+    assert etag_matches("*", "abc-123") == '"abc-123"' and etag_matches('"abc-1234"', "abc-123") is None
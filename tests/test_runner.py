@@ -0,0 +1,79 @@
+import json
+import textwrap
+
+from harness import runner
+
+
+def test_discover_scripts_matches_suite_naming_patterns(tmp_path):
+    names = ("backend_test.py", "backend_test_ieee_caching.py", "test_featured_items.py", "helper.py", "notes_test.txt")
+    for name in names:
+        (tmp_path / name).write_text("")
+
+    scripts = [p.split("/")[-1] for p in runner.discover_scripts(str(tmp_path))]
+
+    assert scripts == ["backend_test.py", "backend_test_ieee_caching.py", "test_featured_items.py"]
+
+
+def test_normalize_results_handles_suite_result_shapes():
+    categories = {"total_tests": 2, "categories": {"Auth": {"tests": [
+        {"name": "Login", "status": True, "details": "ok"},
+        {"name": "Logout", "status": False, "details": "boom"},
+    ]}}}
+    details = {"test_details": [{"test": "Footer", "status": "PASS"}]}
+    per_category = {"admin_login": [{"test": "Admin Page", "status": "⚠️ WARNING"}]}
+    flat = {"ieee_format": True, "statistics": False}
+
+    assert [e["outcome"] for e in runner.normalize_results(categories)] == ["passed", "failed"]
+    assert runner.normalize_results(categories)[0]["category"] == "Auth"
+    assert runner.normalize_results(details)[0]["name"] == "Footer"
+    assert runner.normalize_results(per_category)[0]["outcome"] == "warning"
+    assert {e["name"]: e["outcome"] for e in runner.normalize_results(flat)} == {
+        "ieee_format": "passed", "statistics": "failed"
+    }
+
+
+def test_parse_output_recovers_log_test_lines():
+    output = "✅ PASS | Frontend Service\n❌ Gallery CRUD: status 500\nplain line\n"
+
+    entries = runner.parse_output(output)
+
+    assert [(e["name"], e["outcome"]) for e in entries] == [
+        ("Frontend Service", "passed"), ("Gallery CRUD", "failed")
+    ]
+
+
+def test_exit_codes_follow_sys_exit_conventions(capsys):
+    assert [runner._exit_code(code) for code in (None, 0, 3, False, True)] == [0, 0, 3, 0, 1]
+    assert type(runner._exit_code(True)) is int
+    assert runner._exit_code("fatal: no backend") == 1 and "fatal: no backend" in capsys.readouterr().err
+
+
+def test_run_suite_merges_results_from_scripts(tmp_path):
+    passing = tmp_path / "passing_test.py"
+    passing.write_text(textwrap.dedent("""
+        import sys
+
+        class Tester:
+            def __init__(self):
+                self.test_results = []
+
+            def log_test(self, name, status):
+                self.test_results.append({"test": name, "status": status})
+
+        tester = Tester()
+        tester.log_test("One", "PASS")
+        tester.log_test("Two", "PASS")
+        sys.exit(0)
+    """))
+    failing = tmp_path / "failing_test.py"
+    failing.write_text("print('❌ Broken: nope')\nraise SystemExit(1)\n")
+
+    report = runner.run_suite([str(passing), str(failing)], workers=2, timeout=60)
+
+    by_script = {r["script"].split("/")[-1]: r for r in report["scripts"]}
+    assert by_script["passing_test.py"]["status"] == "passed"
+    assert by_script["passing_test.py"]["counts"]["passed"] == 2
+    assert by_script["failing_test.py"]["status"] == "failed"
+    assert by_script["failing_test.py"]["tests"][0]["name"] == "Broken"
+    assert report["summary"]["scripts"] == 2
+    json.dumps(report)
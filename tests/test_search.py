@@ -0,0 +1,49 @@
+import pytest
+
+from harness.query import DatasetIndex, QueryError
+from harness.resultcache import normalize_params
+from harness.search import FullTextIndex, tokenize
+from harness.sheets import synthetic_records
+
+RECORDS = [
+    {"title": "Wind Power Forecasting", "authors": ["A. Müller"], "abstract": "short-term wind forecasts"},
+    {"title": "Solar Forecast Models", "authors": ["B. Rahman"], "abstract": ""},
+    {"title": "Grid Storage", "authors": ["C. Chen"], "abstract": "wind and storage"},
+]
+
+
+def test_tokenize_folds_case_and_accents():
+    assert tokenize("Müller's  WIND-power, 2024") == ["muller", "s", "wind", "power", "2024"]
+
+
+def test_ranked_prefix_search():
+    index = FullTextIndex(RECORDS, {"title": 3, "authors": 2, "abstract": 1})
+    assert index.ranked("wind") == [0, 2]  # title match outranks abstract match
+    assert index.ranked("forecast") == [1, 0]  # exact token outranks the prefix match
+    assert index.ranked("MULLER forec") == [0]
+    assert index.search("") == {} and index.ranked("nothing") == []
+
+
+def test_search_parameter_on_list_queries():
+    records = list(synthetic_records("publications", 2000, seed=11))
+    index = DatasetIndex("publications", records)
+    response = index.query({"search": "forecasting", "per_page": "2000"})
+    expected = {r["id"] for r in records if "forecasting" in tokenize(" ".join([r["title"], *r["authors"]]))}
+    assert {r["id"] for r in response["publications"]} == expected
+    assert response["statistics"]["total_publications"] == len(expected)
+
+    by_year = index.query({"search": "forecasting", "sort_by": "year", "category_filter": "Books"})["publications"]
+    assert [r["year"] for r in by_year] == sorted((r["year"] for r in by_year), reverse=True)
+    assert all(r["category"] == "Books" for r in by_year)
+    with pytest.raises(QueryError):
+        index.query({"sort_by": "relevance"})
+
+    assert dict(normalize_params("publications", {"search": "grid"}))["sort_by"] == "relevance"
+    assert "search" not in dict(normalize_params("news_events", {"search": "grid"}))
+
+
+def test_blank_search_is_no_search():
+    index = DatasetIndex("publications", list(synthetic_records("publications", 200, seed=5)))
+    blank = index.query({"search": " ", "category_filter": "Books"})
+    assert blank == index.query({"category_filter": "Books"})
+    assert index.query({"search": " "})["statistics"] == index.query({})["statistics"]
@@ -0,0 +1,63 @@
+import pytest
+
+from harness.client import PooledClient
+from harness.sheets import ENV_VARS, SHEETS, SheetsStandIn
+
+
+@pytest.fixture
+def http():
+    client = PooledClient(http2=False)
+    yield client
+    client.close()
+
+
+def test_datasets_keep_apps_script_shapes_and_cors(http):
+    with SheetsStandIn() as sheets:
+        publications = http.get(sheets.url_for("publications"), timeout=5)
+        assert publications.status_code == 200
+        assert publications.headers["Access-Control-Allow-Origin"] == "*"
+        assert isinstance(publications.json(), list)
+        assert {"id", "title", "authors", "year", "category", "research_areas"} <= set(publications.json()[0])
+
+        projects = http.get(sheets.url_for("projects"), timeout=5).json()
+        assert projects["pagination"]["total_items"] == len(projects["projects"])
+        assert "achievements" in http.get(sheets.url_for("achievements"), timeout=5).json()
+        assert "news_events" in http.get(sheets.url_for("news_events"), timeout=5).json()
+
+        assert http.get(f"{sheets.base_url}/macros/s/x/exec?sheet=sheet1", timeout=5).status_code == 404
+        assert set(sheets.environ()) == set(ENV_VARS.values())
+        assert len(sheets.urls()) == len(SHEETS)
+
+
+def test_multiplier_inflates_payload_with_unique_ids(http):
+    with SheetsStandIn(multiplier=5) as sheets:
+        base = len(sheets.datasets["publications"])
+        publications = http.get(sheets.url_for("publications"), timeout=5).json()
+        assert len(publications) == base * 5
+        assert len({p["id"] for p in publications}) == base * 5
+
+        projects = http.get(sheets.url_for("projects"), timeout=5).json()
+        assert projects["pagination"]["total_items"] == len(projects["projects"])
+
+
+def test_error_rate_is_reproducible_with_seed(http):
+    def statuses():
+        with SheetsStandIn(error_rate=0.3, error_status=503, seed=7) as sheets:
+            return [http.get(sheets.url_for("news_events"), timeout=5).status_code for _ in range(30)]
+
+    first = statuses()
+    assert first == statuses()
+    assert set(first) == {200, 503}
+
+    with SheetsStandIn(error_rate=1.0) as sheets:
+        response = http.get(sheets.url_for("projects"), timeout=5)
+        assert response.status_code == 500
+        assert response.headers["Content-Type"].startswith("text/html")
+
+
+def test_delay_is_applied_per_response(http):
+    with SheetsStandIn(delay=0.05) as sheets:
+        response = http.get(sheets.url_for("achievements"), timeout=5)
+        assert response.elapsed.total_seconds() >= 0.05
+        sheets.configure(delay=0.0)
+        assert http.get(sheets.url_for("achievements"), timeout=5).elapsed.total_seconds() < 0.05
@@ -0,0 +1,43 @@
+import threading
+import time
+
+import pytest
+
+from harness.singleflight import SingleFlight
+
+
+def test_waiters_share_the_leaders_failure_and_tokens_split_flights():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("upstream down")
+
+    def call():
+        try:
+            flights.do("news", failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    waiters = [threading.Thread(target=call) for _ in range(3)]
+    for thread in waiters:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flights.stats()["news"]["coalesced"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert flights.do("news", lambda: "fresh", token=2) == "fresh"  # separate flight, not coalesced
+    release.set()
+    for thread in [leader, *waiters]:
+        thread.join(5)
+
+    assert len(errors) == 4 and all(e is errors[0] for e in errors)
+    stats = flights.stats()["news"]
+    assert (stats["calls"], stats["coalesced"], stats["failures"], stats["in_flight"]) == (2, 3, 1, 0)
+    with pytest.raises(ValueError):
+        flights.do("news", lambda: int("x"))
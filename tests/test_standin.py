@@ -0,0 +1,33 @@
+import socket
+
+import pytest
+
+from harness.api import ApiStandIn
+from harness.client import PooledClient
+from harness.firestore import FirestoreStandIn
+from harness.sheets import SheetsStandIn
+from harness.standin import StandInHandler
+
+
+@pytest.mark.parametrize("standin, path", [
+    (SheetsStandIn, "/macros/s/x/exec?sheet=sheet9"),
+    (FirestoreStandIn, "/news"),
+    (ApiStandIn, "/api/"),
+])
+def test_every_standin_keeps_connections_alive_with_nagle_off(monkeypatch, standin, path):
+    nodelay = []
+    setup = StandInHandler.setup
+
+    def recording_setup(self):
+        setup(self)
+        nodelay.append(self.connection.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+    monkeypatch.setattr(StandInHandler, "setup", recording_setup)
+    client = PooledClient(http2=False)
+    try:
+        with standin() as server:
+            for _ in range(3):
+                assert client.get(server.base_url + path, timeout=5).status_code == 200
+    finally:
+        client.close()
+    assert len(nodelay) == 1 and nodelay[0]  # one keep-alive connection, TCP_NODELAY set
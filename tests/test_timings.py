@@ -0,0 +1,62 @@
+from harness.client import PooledClient
+from harness.runner import normalize_results
+from harness.sheets import SheetsStandIn
+from harness.timings import TimingStore, endpoint_of, parse_seconds
+
+
+def _report(means, test_seconds=0.2):
+    return {
+        "started_at": "2026-01-01T00:00:00",
+        "summary": {"scripts": 1, "tests": 1},
+        "scripts": [{
+            "script": "backend_test.py",
+            "timings": [{"method": "GET", "endpoint": endpoint, "count": 3, "errors": 0,
+                         "mean": mean, "p50": mean, "p95": mean, "max": mean}
+                        for endpoint, mean in means.items()],
+            "tests": [{"name": "API Health Check", "outcome": "passed", "seconds": test_seconds}],
+        }],
+    }
+
+
+def test_endpoint_and_response_time_normalization():
+    assert endpoint_of("https://x.dev/api/publications/42?page=2") == "x.dev/api/publications/{id}"
+    assert endpoint_of("https://s.google.com/macros/s/AKfy/exec?sheet=sheet6&t=1") == "s.google.com/macros/s/AKfy/exec?sheet=sheet6"
+    assert parse_seconds("0.23s") == 0.23
+    assert parse_seconds("230ms") == 0.23
+    assert parse_seconds("N/A") is None
+
+    entries = normalize_results([{"test": "Health", "success": True, "response_time": "1.50s"}])
+    assert entries[0]["seconds"] == 1.5
+
+
+def test_client_times_requests_per_endpoint():
+    client = PooledClient(http2=False)
+    with SheetsStandIn() as sheets:
+        for _ in range(3):
+            client.get(sheets.url_for("publications"), timeout=5)
+        client.get(sheets.url_for("projects"), timeout=5)
+    timings = {t["endpoint"].split("?")[1]: t for t in client.timings()}
+    assert timings["sheet=sheet6"]["count"] == 3
+    assert timings["sheet=sheet7"]["count"] == 1
+    assert timings["sheet=sheet6"]["p50"] <= timings["sheet=sheet6"]["max"]
+    client.close()
+
+
+def test_store_trends_and_degradation(tmp_path):
+    with TimingStore(tmp_path / "timings.db") as store:
+        for mean in (0.20, 0.21, 0.19, 0.20):
+            store.record_report(_report({"api/publications": mean, "api/projects": 0.1}))
+        store.record_report(_report({"api/publications": 0.60, "api/projects": 0.11}), label="slow")
+
+        trends = store.trends()
+        assert [round(p["mean"], 2) for p in trends["GET api/publications"]] == [0.2, 0.21, 0.19, 0.2, 0.6]
+        assert list(store.trends(by="test")) == ["backend_test.py :: API Health Check"]
+
+        degraded = store.degraded()
+        assert [d["key"] for d in degraded] == ["GET api/publications"]
+        assert degraded[0]["change"] > 1.9
+        assert store.degraded(threshold=5) == []
+        assert store.runs()[-1]["label"] == "slow"
+
+        store.record_report(_report({"api/projects": 0.1}), label="partial")  # publications not exercised
+        assert store.degraded() == []  # its 0.60 is no longer the newest run
@@ -0,0 +1,123 @@
+import json
+import time
+
+import pytest
+
+from harness.api import ApiBackend, ApiError, records_from_payload, upstream_sources
+from harness.client import PooledClient
+from harness.sheets import SheetsStandIn
+from harness.upstream import CLOSED, OPEN, CircuitOpen, SnapshotFallback, UpstreamClient, UpstreamError
+
+
+def _rows(backend, dataset):
+    return json.loads(backend.list_response(dataset, {}).body)[dataset]
+
+
+def _parse(payload):
+    return records_from_payload("publications", payload)
+
+
+def test_retries_breaker_and_last_good_snapshot():
+    with SheetsStandIn() as sheets:
+        url = sheets.urls()["publications"]
+        upstream = UpstreamClient(timeout=5, retries=1, hedge_after=0, breaker_failures=2, breaker_seconds=0.3,
+                                  sleep=lambda seconds: None)
+        try:
+            records = upstream.fetch("publications", url, _parse)
+            assert records
+
+            sheets.configure(error_rate=1.0, error_status=503)
+            for _ in range(2):
+                with pytest.raises(SnapshotFallback) as fallback:  # retried, then the snapshot
+                    upstream.fetch("publications", url, _parse)
+                assert fallback.value.records == records and "HTTP 503" in str(fallback.value.error)
+            stats = upstream.stats()["upstreams"]["publications"]
+            assert stats["state"] == OPEN and stats["attempts"] == 5 and stats["retries"] == 2
+            with pytest.raises(SnapshotFallback) as fallback:  # refused without a request
+                upstream.fetch("publications", url, _parse)
+            assert isinstance(fallback.value.error, CircuitOpen) and fallback.value.records == records
+            assert upstream.stats()["upstreams"]["publications"]["attempts"] == 5
+            assert upstream.stats()["upstreams"]["publications"]["fallbacks"] == 3
+
+            with pytest.raises(UpstreamError):
+                upstream.fetch("projects", sheets.urls()["projects"])  # never fetched: no snapshot
+            sheets.configure(error_status=404)
+            with pytest.raises(UpstreamError):
+                upstream.fetch("achievements", sheets.urls()["achievements"])
+            assert upstream.stats()["upstreams"]["achievements"]["attempts"] == 1  # 4xx is not retried
+
+            sheets.configure(error_rate=0.0)
+            time.sleep(0.3)
+            assert upstream.fetch("publications", url, _parse) == records  # half-open trial closes it
+            assert upstream.stats()["upstreams"]["publications"]["state"] == CLOSED
+            text = upstream.metrics.render()
+            assert 'sesg_upstream_breaker_transitions_total{dataset="publications",state="open"} 1' in text
+            assert 'sesg_upstream_fallbacks_total{dataset="publications"} 3' in text
+        finally:
+            upstream.close()
+
+    refused = UpstreamClient(timeout=1, retries=0, breaker_failures=1, breaker_seconds=60)
+    with pytest.raises(UpstreamError):
+        refused.fetch("news_events", "http://127.0.0.1:9/exec")
+    with pytest.raises(CircuitOpen):
+        refused.fetch("news_events", "http://127.0.0.1:9/exec")
+    refused.close()
+
+
+class _SlowFirstRequest:
+    """Delays the first request it sends, like one stuck Apps Script execution"""
+
+    def __init__(self, delay):
+        self.client = PooledClient(http2=False)
+        self.delay = delay
+        self.sent = 0
+
+    def get(self, url, **kwargs):
+        self.sent += 1
+        if self.sent == 1:
+            time.sleep(self.delay)
+        return self.client.get(url, **kwargs)
+
+    def stats(self):
+        return self.client.stats()
+
+    def close(self):
+        self.client.close()
+
+
+def test_hedged_request_answers_first():
+    with SheetsStandIn() as sheets:
+        upstream = UpstreamClient(timeout=5, hedge_after=0.05, client=_SlowFirstRequest(1.0))
+        try:
+            start = time.perf_counter()
+            assert upstream.fetch("projects", sheets.urls()["projects"], lambda p: records_from_payload("projects", p))
+            assert time.perf_counter() - start < 0.8
+            stats = upstream.stats()["upstreams"]["projects"]
+            assert stats["hedges"] == 1 and stats["hedges_won"] == 1
+        finally:
+            upstream.close()
+
+
+def test_backend_keeps_staleness_while_falling_back():
+    with SheetsStandIn() as sheets:
+        upstream = UpstreamClient(timeout=5, retries=0, hedge_after=0, breaker_failures=1, breaker_seconds=60)
+        backend = ApiBackend(upstream_sources(sheets.urls(), upstream=upstream), cache_minutes=0.2 / 60,
+                             max_stale_minutes=1 / 60, metrics=upstream.metrics, upstream=upstream)
+        try:
+            rows = _rows(backend, "news_events")
+            sheets.configure(error_rate=1.0, error_status=503)
+            time.sleep(0.25)
+            backend.clear_cache()  # nothing cached: the fetch must come back from the snapshot
+            assert _rows(backend, "news_events") == rows
+            entry = backend.cache_status()["entries"]["news_events"]
+            assert "HTTP 503" in entry["last_error"] and entry["state"] == "stale" and entry["age_seconds"] >= 0.25
+            assert backend.metrics.value("sesg_upstream_fetch_failures_total", {"dataset": "news_events"}) == 1
+            assert upstream.stats()["upstreams"]["news_events"]["state"] == OPEN
+
+            time.sleep(1.0)  # past max_stale_minutes: the last good copy is too old to serve
+            with pytest.raises(ApiError) as refused:
+                backend.list_response("news_events", {})
+            assert refused.value.code == 502
+            assert "circuit open" in backend.cache_status()["entries"]["news_events"]["last_error"]
+        finally:
+            upstream.close()
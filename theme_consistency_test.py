@@ -5,34 +5,27 @@ Specifically tests News & Events and Achievements APIs after frontend theme cons
 Focus on "Read More" functionality data structure requirements
 """
 
-import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
 import sys
 
-# Get backend URL from frontend .env file
-def get_backend_url():
-    try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    return line.split('=', 1)[1].strip()
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return None
-
-BACKEND_URL = get_backend_url()
-if not BACKEND_URL:
-    print("ERROR: Could not get REACT_APP_BACKEND_URL from frontend/.env")
-    sys.exit(1)
+# Backend URL, resolved by configure() from the environment or the frontend .env file
+BACKEND_URL = API_BASE_URL = None
 
-API_BASE_URL = f"{BACKEND_URL}/api"
+def configure():
+    """Resolve the backend URL and print the run banner"""
+    global BACKEND_URL, API_BASE_URL
+    BACKEND_URL = config.require('REACT_APP_BACKEND_URL')
+    API_BASE_URL = f"{BACKEND_URL}/api"
 
-print(f"Testing backend at: {API_BASE_URL}")
-print("=" * 80)
-print("THEME CONSISTENCY BACKEND TESTING - NEWS & EVENTS AND ACHIEVEMENTS")
-print("=" * 80)
+    print(f"Testing backend at: {API_BASE_URL}")
+    print("=" * 80)
+    print("THEME CONSISTENCY BACKEND TESTING - NEWS & EVENTS AND ACHIEVEMENTS")
+    print("=" * 80)
 
 def test_news_events_api_structure():
     """Test GET /api/news-events endpoint for Read More functionality support"""
@@ -40,7 +33,7 @@ def test_news_events_api_structure():
     
     try:
         # Test basic endpoint
-        response = requests.get(f"{API_BASE_URL}/news-events", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events", timeout=10)
         if response.status_code != 200:
             print(f"   ❌ Basic request failed with status: {response.status_code}")
             return False, {}
@@ -78,7 +71,7 @@ def test_news_events_api_structure():
         category_results = {}
         
         for category in categories:
-            response = requests.get(f"{API_BASE_URL}/news-events?category_filter={category}", timeout=10)
+            response = http.get(f"{API_BASE_URL}/news-events?category_filter={category}", timeout=10)
             if response.status_code == 200:
                 cat_data = response.json()
                 count = len(cat_data.get("news_events", []))
@@ -89,7 +82,7 @@ def test_news_events_api_structure():
                 return False
         
         # Test pagination
-        response = requests.get(f"{API_BASE_URL}/news-events?per_page=5", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events?per_page=5", timeout=10)
         if response.status_code == 200:
             pag_data = response.json()
             pagination = pag_data.get("pagination", {})
@@ -114,7 +107,7 @@ def test_news_events_details_api():
     
     try:
         # First get a valid news event ID
-        response = requests.get(f"{API_BASE_URL}/news-events?per_page=1", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events?per_page=1", timeout=10)
         if response.status_code != 200:
             print("   ❌ Could not get news events list")
             return False
@@ -128,7 +121,7 @@ def test_news_events_details_api():
         news_title = news_events[0]["title"]
         
         # Test details endpoint
-        response = requests.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
         if response.status_code != 200:
             print(f"   ❌ Details request failed with status: {response.status_code}")
             return False
@@ -176,7 +169,7 @@ def test_achievements_api_structure():
     
     try:
         # Test basic endpoint
-        response = requests.get(f"{API_BASE_URL}/achievements", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements", timeout=10)
         if response.status_code != 200:
             print(f"   ❌ Basic request failed with status: {response.status_code}")
             return False
@@ -210,7 +203,7 @@ def test_achievements_api_structure():
         print(f"   ✅ Optional fields present: {present_optional}")
         
         # Test category filtering - check available categories
-        response = requests.get(f"{API_BASE_URL}/achievements?per_page=50", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements?per_page=50", timeout=10)
         if response.status_code == 200:
             all_data = response.json()
             all_achievements = all_data.get("achievements", [])
@@ -220,7 +213,7 @@ def test_achievements_api_structure():
             # Test each category
             category_results = {}
             for category in available_categories:
-                response = requests.get(f"{API_BASE_URL}/achievements?category_filter={category}", timeout=10)
+                response = http.get(f"{API_BASE_URL}/achievements?category_filter={category}", timeout=10)
                 if response.status_code == 200:
                     cat_data = response.json()
                     count = len(cat_data.get("achievements", []))
@@ -231,7 +224,7 @@ def test_achievements_api_structure():
                     return False
         
         # Test pagination
-        response = requests.get(f"{API_BASE_URL}/achievements?per_page=6", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements?per_page=6", timeout=10)
         if response.status_code == 200:
             pag_data = response.json()
             pagination = pag_data.get("pagination", {})
@@ -256,7 +249,7 @@ def test_achievements_details_api():
     
     try:
         # First get a valid achievement ID
-        response = requests.get(f"{API_BASE_URL}/achievements?per_page=1", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements?per_page=1", timeout=10)
         if response.status_code != 200:
             print("   ❌ Could not get achievements list")
             return False
@@ -270,7 +263,7 @@ def test_achievements_details_api():
         achievement_title = achievements[0]["title"]
         
         # Test details endpoint
-        response = requests.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
         if response.status_code != 200:
             print(f"   ❌ Details request failed with status: {response.status_code}")
             return False
@@ -318,8 +311,8 @@ def test_theme_consistency_requirements():
     
     try:
         # Get sample data from both APIs
-        news_response = requests.get(f"{API_BASE_URL}/news-events?per_page=1", timeout=10)
-        achievements_response = requests.get(f"{API_BASE_URL}/achievements?per_page=1", timeout=10)
+        news_response = http.get(f"{API_BASE_URL}/news-events?per_page=1", timeout=10)
+        achievements_response = http.get(f"{API_BASE_URL}/achievements?per_page=1", timeout=10)
         
         if news_response.status_code != 200 or achievements_response.status_code != 200:
             print("   ❌ Could not fetch sample data from both APIs")
@@ -371,8 +364,8 @@ def test_theme_consistency_requirements():
         news_id = news_item["id"]
         achievement_id = achievement_item["id"]
         
-        news_details_response = requests.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
-        achievement_details_response = requests.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
+        news_details_response = http.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
+        achievement_details_response = http.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
         
         if news_details_response.status_code != 200 or achievement_details_response.status_code != 200:
             print("   ❌ Could not fetch details from both APIs")
@@ -461,5 +454,10 @@ def run_theme_consistency_tests():
     return results, all_passed
 
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     results, all_passed = run_theme_consistency_tests()
     sys.exit(0 if all_passed else 1)
\ No newline at end of file
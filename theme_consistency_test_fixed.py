@@ -5,34 +5,27 @@ Specifically tests News & Events and Achievements APIs after frontend theme cons
 Focus on "Read More" functionality data structure requirements
 """
 
-import requests
+from harness.client import http
+from harness import config
+from harness.config import ConfigError
 import json
 import os
 from datetime import datetime
 import sys
 
-# Get backend URL from frontend .env file
-def get_backend_url():
-    try:
-        with open('/app/frontend/.env', 'r') as f:
-            for line in f:
-                if line.startswith('REACT_APP_BACKEND_URL='):
-                    return line.split('=', 1)[1].strip()
-    except Exception as e:
-        print(f"Error reading frontend .env: {e}")
-        return None
-
-BACKEND_URL = get_backend_url()
-if not BACKEND_URL:
-    print("ERROR: Could not get REACT_APP_BACKEND_URL from frontend/.env")
-    sys.exit(1)
+# Backend URL, resolved by configure() from the environment or the frontend .env file
+BACKEND_URL = API_BASE_URL = None
 
-API_BASE_URL = f"{BACKEND_URL}/api"
+def configure():
+    """Resolve the backend URL and print the run banner"""
+    global BACKEND_URL, API_BASE_URL
+    BACKEND_URL = config.require('REACT_APP_BACKEND_URL')
+    API_BASE_URL = f"{BACKEND_URL}/api"
 
-print(f"Testing backend at: {API_BASE_URL}")
-print("=" * 80)
-print("THEME CONSISTENCY BACKEND TESTING - NEWS & EVENTS AND ACHIEVEMENTS")
-print("=" * 80)
+    print(f"Testing backend at: {API_BASE_URL}")
+    print("=" * 80)
+    print("THEME CONSISTENCY BACKEND TESTING - NEWS & EVENTS AND ACHIEVEMENTS")
+    print("=" * 80)
 
 def test_news_events_comprehensive():
     """Comprehensive test of News & Events API for Read More functionality"""
@@ -44,7 +37,7 @@ def test_news_events_comprehensive():
     try:
         # 1. Basic API Structure Test
         print("   1.1 Testing basic API structure...")
-        response = requests.get(f"{API_BASE_URL}/news-events", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events", timeout=10)
         if response.status_code != 200:
             print(f"      ❌ Basic request failed with status: {response.status_code}")
             return False, {}
@@ -77,7 +70,7 @@ def test_news_events_comprehensive():
         categories = ["News", "Events", "Upcoming Events", "Achievement"]
         
         for category in categories:
-            response = requests.get(f"{API_BASE_URL}/news-events?category_filter={category}", timeout=10)
+            response = http.get(f"{API_BASE_URL}/news-events?category_filter={category}", timeout=10)
             if response.status_code == 200:
                 cat_data = response.json()
                 count = len(cat_data.get("news_events", []))
@@ -89,7 +82,7 @@ def test_news_events_comprehensive():
         
         # 3. Pagination Test
         print("   1.3 Testing pagination structure...")
-        response = requests.get(f"{API_BASE_URL}/news-events?per_page=5", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events?per_page=5", timeout=10)
         if response.status_code == 200:
             pag_data = response.json()
             pagination = pag_data.get("pagination", {})
@@ -104,7 +97,7 @@ def test_news_events_comprehensive():
         # 4. Details Endpoint Test
         print("   1.4 Testing details endpoint for Read More content...")
         news_id = first_item["id"]
-        response = requests.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
+        response = http.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
         if response.status_code == 200:
             details = response.json()
             required_detail_fields = ["id", "title", "full_content", "date", "category"]
@@ -141,7 +134,7 @@ def test_achievements_comprehensive():
     try:
         # 1. Basic API Structure Test
         print("   2.1 Testing basic API structure...")
-        response = requests.get(f"{API_BASE_URL}/achievements", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements", timeout=10)
         if response.status_code != 200:
             print(f"      ❌ Basic request failed with status: {response.status_code}")
             return False, {}
@@ -171,7 +164,7 @@ def test_achievements_comprehensive():
         
         # 2. Category Filtering Test - Get available categories first
         print("   2.2 Testing category filtering...")
-        response = requests.get(f"{API_BASE_URL}/achievements?per_page=50", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements?per_page=50", timeout=10)
         if response.status_code == 200:
             all_data = response.json()
             all_achievements = all_data.get("achievements", [])
@@ -180,7 +173,7 @@ def test_achievements_comprehensive():
             
             # Test each available category
             for category in available_categories:
-                response = requests.get(f"{API_BASE_URL}/achievements?category_filter={category}", timeout=10)
+                response = http.get(f"{API_BASE_URL}/achievements?category_filter={category}", timeout=10)
                 if response.status_code == 200:
                     cat_data = response.json()
                     count = len(cat_data.get("achievements", []))
@@ -192,7 +185,7 @@ def test_achievements_comprehensive():
         
         # 3. Pagination Test
         print("   2.3 Testing pagination structure...")
-        response = requests.get(f"{API_BASE_URL}/achievements?per_page=6", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements?per_page=6", timeout=10)
         if response.status_code == 200:
             pag_data = response.json()
             pagination = pag_data.get("pagination", {})
@@ -207,7 +200,7 @@ def test_achievements_comprehensive():
         # 4. Details Endpoint Test
         print("   2.4 Testing details endpoint for Read More content...")
         achievement_id = first_item["id"]
-        response = requests.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
+        response = http.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
         if response.status_code == 200:
             details = response.json()
             required_detail_fields = ["id", "title", "full_content", "date", "category"]
@@ -240,8 +233,8 @@ def test_theme_consistency():
     
     try:
         # Get sample data from both APIs
-        news_response = requests.get(f"{API_BASE_URL}/news-events?per_page=1", timeout=10)
-        achievements_response = requests.get(f"{API_BASE_URL}/achievements?per_page=1", timeout=10)
+        news_response = http.get(f"{API_BASE_URL}/news-events?per_page=1", timeout=10)
+        achievements_response = http.get(f"{API_BASE_URL}/achievements?per_page=1", timeout=10)
         
         if news_response.status_code != 200 or achievements_response.status_code != 200:
             print("   ❌ Could not fetch sample data from both APIs")
@@ -274,8 +267,8 @@ def test_theme_consistency():
         news_id = news_item["id"]
         achievement_id = achievement_item["id"]
         
-        news_details_response = requests.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
-        achievement_details_response = requests.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
+        news_details_response = http.get(f"{API_BASE_URL}/news-events/{news_id}", timeout=10)
+        achievement_details_response = http.get(f"{API_BASE_URL}/achievements/{achievement_id}", timeout=10)
         
         if news_details_response.status_code == 200 and achievement_details_response.status_code == 200:
             news_details = news_details_response.json()
@@ -367,5 +360,10 @@ def run_theme_consistency_tests():
     return all_passed
 
 if __name__ == "__main__":
+    try:
+        configure()
+    except ConfigError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
     all_passed = run_theme_consistency_tests()
     sys.exit(0 if all_passed else 1)
\ No newline at end of file
@@ -10,7 +10,7 @@ This test will:
 4. Debug the blank page issue
 """
 
-import requests
+from harness.client import http
 import json
 import time
 import sys
@@ -46,7 +46,7 @@ class UserManagementDebugTester:
         print("🌐 Testing Frontend Accessibility...")
         
         try:
-            response = requests.get(self.frontend_url, timeout=15)
+            response = http.get(self.frontend_url, timeout=15)
             
             if response.status_code == 200:
                 self.log_result(
@@ -76,7 +76,7 @@ class UserManagementDebugTester:
         
         try:
             login_url = f"{self.frontend_url}/admin/login"
-            response = requests.get(login_url, timeout=15)
+            response = http.get(login_url, timeout=15)
             
             if response.status_code == 200:
                 content = response.text
@@ -126,7 +126,7 @@ class UserManagementDebugTester:
         
         try:
             admin_url = f"{self.frontend_url}/admin"
-            response = requests.get(admin_url, timeout=15)
+            response = http.get(admin_url, timeout=15)
             
             if response.status_code == 200:
                 content = response.text
@@ -176,7 +176,7 @@ class UserManagementDebugTester:
         
         try:
             # Check main page for Firebase references
-            response = requests.get(self.frontend_url, timeout=15)
+            response = http.get(self.frontend_url, timeout=15)
             
             if response.status_code == 200:
                 content = response.text